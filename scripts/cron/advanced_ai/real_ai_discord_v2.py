@@ -88,16 +88,10 @@ class RealAIDiscordReporter:
         self.console.print("📊 Yahoo Finance から実データ取得中...")
 
         try:
-            # Yahoo Finance から現在レート取得
-            rates_data = await self.yahoo_client.get_multiple_rates([currency_pair])
-
-            if (
-                rates_data
-                and "rates" in rates_data
-                and currency_pair in rates_data["rates"]
-            ):
-                rate_info = rates_data["rates"][currency_pair]
+            # Yahoo Finance から現在レート取得（ビッド・アスクを含むクォート）
+            rate_info = await self.yahoo_client.get_current_rate(currency_pair)
 
+            if rate_info:
                 market_data = {
                     "rate": rate_info.get("rate", 0),
                     "bid": rate_info.get("bid"),
@@ -122,6 +122,7 @@ class BaseDataRestorer:
                         close_price=float(row['close_price']),
                         volume=int(row['volume']) if pd.notna(row['volume']) else None,
                         data_source=row['data_source'],
+                        timeframe=row.get('timeframe'),
                     )
 
                     # PostgreSQLに保存
@@ -20,6 +20,7 @@ from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from tqdm import tqdm
 
+from src.infrastructure.cache.bar_store import get_bar_store
 from src.infrastructure.database.models.price_data_model import PriceDataModel
 from src.infrastructure.database.repositories.price_data_repository_impl import (
     PriceDataRepositoryImpl,
@@ -167,10 +168,6 @@ class DataLoader:
                 logger.error("DataLoader初期化に失敗しました")
                 return pd.DataFrame()
 
-            # 時間足マッピング（現在は使用していないが将来の拡張用）
-            # timeframe_mapping = {"M5": "5m", "H1": "1h", "H4": "4h", "D1": "1d"}
-            # mapped_timeframe = timeframe_mapping.get(timeframe, timeframe)
-
             # 最新のデータを取得
             end_date = datetime.now()
             # 時間足に応じて取得期間を調整（テスト用により長期間取得）
@@ -181,60 +178,21 @@ class DataLoader:
             else:
                 start_date = end_date - timedelta(days=60)  # 2ヶ月分を取得
 
-            if self.price_repo:
-                data = await self.price_repo.find_by_date_range(
-                    start_date, end_date, currency_pair
+            if self.session:
+                # 共有バーストアから時間足のバーを取得（差分同期のみSQLを発行）
+                df = await get_bar_store().get_frame(
+                    self.session,
+                    currency_pair,
+                    timeframe,
+                    start=start_date,
+                    end=end_date,
+                    limit=limit,
                 )
 
-                if data:
-                    # 時間足に応じたデータソースでフィルタリング
-                    data_source_mapping = {
-                        "M5": "yahoo_finance_5m",
-                        "H1": "yahoo_finance_1h",
-                        "H4": "yahoo_finance_4h",
-                        "D1": "yahoo_finance_1d",
-                    }
-
-                    target_data_source = data_source_mapping.get(
-                        timeframe, "yahoo_finance_5m"
-                    )
-                    filtered_data = [
-                        record
-                        for record in data
-                        if record.data_source == target_data_source
-                    ]
-
-                    # DataFrameに変換
-                    df_data = []
-                    for record in filtered_data:
-                        df_data.append(
-                            {
-                                "open": record.open_price,
-                                "high": record.high_price,
-                                "low": record.low_price,
-                                "close": record.close_price,
-                                "volume": record.volume,
-                                "timestamp": record.timestamp,
-                            }
-                        )
-
-                    df = pd.DataFrame(df_data)
-                    if not df.empty:
-                        # timestampをインデックスに設定するが、カラムとしても保持
-                        df.set_index("timestamp", inplace=True)
-                        df.sort_index(inplace=True)
-                        # timestampカラムを復元
-                        df["timestamp"] = df.index
-                        
-                        # limitが指定されている場合は制限を適用
-                        has_limit = limit is not None
-                        if has_limit:
-                            exceeds_limit = len(df) > limit
-                            if exceeds_limit:
-                                df = df.tail(limit)
-                                print("   📊 データ件数を制限")
-                        
-                        return df
+                if not df.empty:
+                    # timestampをインデックスに設定するが、カラムとしても保持
+                    df["timestamp"] = df.index
+                    return df
 
             logger.warning(f"{timeframe}のデータが見つかりませんでした")
             return pd.DataFrame()
@@ -176,21 +176,13 @@ class DifferentialUpdater:
             Optional[datetime]: 最新タイムスタンプ
         """
         try:
-            # 各時間足のデータソース名を定義（差分更新では差分データを優先）
-            data_sources = {
-                "5m": ["yahoo_finance_5m_differential", "yahoo_finance_5m"],
-                "1h": ["yahoo_finance_1h_differential", "yahoo_finance_1h"],
-                "4h": ["yahoo_finance_4h_differential", "yahoo_finance_4h"],
-                "1d": ["yahoo_finance_1d_differential", "yahoo_finance_1d"],
-            }
-
-            # 指定された時間足のデータソースを取得
-            target_sources = data_sources.get(timeframe, [])
-
-            # 該当するデータソースから最新タイムスタンプを取得
+            # 時間足カラムから最新タイムスタンプを取得
             query = (
                 select(PriceDataModel.timestamp)
-                .where(PriceDataModel.data_source.in_(target_sources))
+                .where(
+                    PriceDataModel.currency_pair == self.currency_pair,
+                    PriceDataModel.timeframe == timeframe,
+                )
                 .order_by(PriceDataModel.timestamp.desc())
                 .limit(1)
             )
@@ -0,0 +1,66 @@
+"""
+Price Snapshot
+価格データスナップショットの書き出し・復元
+
+責任:
+- 全時間軸の価格データを Parquet/CSV スナップショットに書き出し
+- スナップショットからの価格データ復元（ネットワーク不要）
+
+使用例:
+    python scripts/cron/advanced_data/price_snapshot.py export \\
+        /app/data/price_seed.parquet
+    python scripts/cron/advanced_data/price_snapshot.py load \\
+        /app/data/price_seed.parquet
+
+復元したスナップショットは PRICE_DATA_SEED_PATH に設定することで
+InitialDataLoaderService / SystemInitializationManager の初期化にも使用できる。
+"""
+
+import sys
+
+sys.path.append("/app")
+
+from src.infrastructure.database.connection import get_async_session  # noqa: E402
+from src.infrastructure.database.services.price_history_bootstrap_service import (  # noqa: E402,E501
+    PriceHistoryBootstrapService,
+)
+
+
+async def main(argv) -> int:
+    """
+    メイン実行関数
+
+    Args:
+        argv: コマンドライン引数（export|load パス）
+
+    Returns:
+        int: 終了コード
+    """
+    if len(argv) != 3 or argv[1] not in ("export", "load"):
+        print("使用方法: price_snapshot.py export|load <path>")
+        return 2
+
+    command, path = argv[1], argv[2]
+    session = await get_async_session()
+    try:
+        service = PriceHistoryBootstrapService(session)
+        if command == "export":
+            count = await service.export_snapshot(path)
+            print(f"💾 スナップショット書き出し完了: {count}件 → {path}")
+        else:
+            counts = await service.load_snapshot(path)
+            print(f"✅ スナップショット復元完了: {counts}")
+        return 0
+
+    except Exception as e:
+        print(f"❌ スナップショット処理エラー: {e}")
+        return 1
+    finally:
+        await session.close()
+
+
+if __name__ == "__main__":
+    import asyncio
+
+    exit_code = asyncio.run(main(sys.argv))
+    exit(exit_code)
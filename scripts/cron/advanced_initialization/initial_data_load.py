@@ -81,6 +81,7 @@ class InitialDataLoader:
                         close_price=float(row["Close"]),
                         volume=int(row["Volume"]) if row["Volume"] > 0 else 1000000,
                         data_source="Yahoo Finance",
+                        timeframe="5m",
                     )
 
                     # 重複チェック
@@ -25,7 +25,6 @@ from src.infrastructure.database.connection import (
     get_async_session,
     init_database,
 )
-from src.infrastructure.database.models.price_data_model import PriceDataModel
 from src.infrastructure.database.models.technical_indicator_model import (
     TechnicalIndicatorModel,
 )
@@ -35,6 +34,9 @@ from src.infrastructure.database.repositories.price_data_repository_impl import
 from src.infrastructure.database.repositories.technical_indicator_repository_impl import (
     TechnicalIndicatorRepositoryImpl,
 )
+from src.infrastructure.database.services.price_history_bootstrap_service import (  # noqa: E402,E501
+    PriceHistoryBootstrapService,
+)
 from src.infrastructure.external_apis.yahoo_finance_client import YahooFinanceClient
 from src.utils.logging_config import get_infrastructure_logger
 
@@ -119,22 +121,24 @@ class UnifiedInitializer:
             return False
 
     async def load_multi_timeframe_data(self):
-        """マルチタイムフレームデータ取得"""
+        """マルチタイムフレームデータ取得（PRICE_DATA_SEED_PATH 設定時はスナップショットから復元）"""
         try:
             logger.info("=== マルチタイムフレーム初回データ取得開始 ===")
 
-            total_saved = 0
-
-            for timeframe, config in self.timeframes.items():
-                logger.info(f"📊 {config['description']}データ取得中...")
-
-                saved_count = await self._load_timeframe_data(
-                    timeframe, config["period"], config["interval"]
-                )
+            bootstrap_service = PriceHistoryBootstrapService(
+                self.session,
+                yahoo_client=self.yahoo_client,
+                currency_pair=self.currency_pair,
+                timeframe_config=self.timeframes,
+            )
+            saved_counts = await bootstrap_service.bootstrap(
+                os.getenv("PRICE_DATA_SEED_PATH"), skip_existing=False
+            )
 
-                total_saved += saved_count
-                logger.info(f"✅ {config['description']}: {saved_count}件保存")
+            for timeframe, saved_count in saved_counts.items():
+                logger.info(f"✅ {timeframe}: {saved_count}件保存")
 
+            total_saved = sum(saved_counts.values())
             logger.info(f"🎉 全タイムフレーム完了: 合計{total_saved}件")
             return total_saved
 
@@ -142,82 +146,6 @@ class UnifiedInitializer:
             logger.error(f"❌ マルチタイムフレームデータ取得エラー: {e}")
             return 0
 
-    async def _load_timeframe_data(
-        self, timeframe: str, period: str, interval: str
-    ) -> int:
-        """特定タイムフレームのデータを読み込み"""
-        try:
-            logger.info(f"  📈 {self.currency_pair} {timeframe}履歴データ取得中...")
-            logger.info(f"    期間: {period}, 間隔: {interval}")
-
-            # Yahoo Financeから履歴データ取得
-            df = await self.yahoo_client.get_historical_data(
-                self.currency_pair, period, interval
-            )
-
-            if df is None or df.empty:
-                logger.warning(f"  ❌ {timeframe}データが取得できませんでした")
-                return 0
-
-            logger.info(f"  ✅ {timeframe}: {len(df)}件のデータ取得")
-            logger.info(f"    期間: {df.index[0]} ～ {df.index[-1]}")
-            logger.info(f"    最新価格: {df['Close'].iloc[-1]:.4f}")
-
-            # データベースに保存
-            saved_count = 0
-            for timestamp, row in df.iterrows():
-                try:
-                    # タイムスタンプの処理
-                    if hasattr(timestamp, "to_pydatetime"):
-                        dt = timestamp.to_pydatetime()
-                    else:
-                        dt = datetime.now()
-
-                    # 価格データモデル作成
-                    price_data = PriceDataModel(
-                        currency_pair=self.currency_pair,
-                        timestamp=dt,
-                        open_price=float(row["Open"]),
-                        high_price=float(row["High"]),
-                        low_price=float(row["Low"]),
-                        close_price=float(row["Close"]),
-                        volume=int(row["Volume"]) if row["Volume"] > 0 else 1000000,
-                        data_source=f"Yahoo Finance ({timeframe})",
-                    )
-
-                    # データバリデーション
-                    if not price_data.validate():
-                        logger.debug(
-                            f"    ⚠️ 無効なデータをスキップ: {timestamp} - O:{row['Open']}, H:{row['High']}, L:{row['Low']}, C:{row['Close']}"
-                        )
-                        continue
-
-                    # 重複チェック
-                    existing = await self.price_repo.find_by_timestamp(
-                        dt, self.currency_pair
-                    )
-                    if existing:
-                        continue
-
-                    # 保存
-                    await self.price_repo.save(price_data)
-                    saved_count += 1
-
-                    # 100件ごとにログ出力
-                    if saved_count % 100 == 0:
-                        logger.info(f"    💾 保存済み: {saved_count}件")
-
-                except Exception as e:
-                    logger.warning(f"    ⚠️ 保存エラー (timestamp: {timestamp}): {e}")
-                    continue
-
-            logger.info(f"  ✅ {timeframe}完了: {saved_count}件保存")
-            return saved_count
-
-        except Exception as e:
-            logger.error(f"  ❌ {timeframe}データ取得エラー: {e}")
-            return 0
-
     async def calculate_technical_indicators(self):
         """EnhancedUnifiedTechnicalCalculator統合テクニカル指標計算"""
         try:
@@ -56,16 +56,28 @@ class EnhancedUnifiedTechnicalCalculator:
         indicator_repo: 技術指標リポジトリ
         indicators_config (dict): 指標設定
         progress_config (dict): プログレス設定
+        write_mode (str): 保存方式（"columnar" または "row"）
+        overwrite_existing (bool): 既存データの上書き有無
     """
 
-    def __init__(self, currency_pair: str = "USD/JPY"):
+    def __init__(
+        self,
+        currency_pair: str = "USD/JPY",
+        write_mode: str = "columnar",
+        overwrite_existing: bool = False,
+    ):
         """
         EnhancedUnifiedTechnicalCalculatorを初期化
 
         Args:
             currency_pair: 通貨ペア（デフォルト: "USD/JPY"）
+            write_mode: 保存方式（"columnar": 指標配列ごとのバルク保存、
+                "row": 1件ずつ保存）
+            overwrite_existing: 既存の指標値を上書きする場合True
         """
         self.currency_pair = currency_pair
+        self.write_mode = write_mode
+        self.overwrite_existing = overwrite_existing
         self.session = None
         self.indicator_repo = None
 
@@ -645,44 +657,42 @@ class EnhancedUnifiedTechnicalCalculator:
             for period_type, config in self.indicators_config["RSI"].items():
                 rsi_values = talib.RSI(close_values, timeperiod=config["period"])
 
-                # 有効な値のみを保存（期間分のデータがある場合のみ）
-                valid_count = 0
-                for i, (timestamp, rsi_value) in enumerate(zip(df.index, rsi_values)):
-                    if not np.isnan(rsi_value) and i >= config["period"] - 1:
-                        # 状態判定
-                        state = self._analyze_rsi_state(rsi_value, config)
-
-                        # 統合データ構造
-                        additional_data = {
-                            "period_type": period_type,
-                            "period": config["period"],
-                            "state": state,
-                            "overbought": config["overbought"],
-                            "oversold": config["oversold"],
-                            "description": config["description"],
-                            "analysis": {
-                                "trend": "single_point",  # 単一点での分析
-                                "momentum": "neutral",  # デフォルト値
-                            },
-                        }
-
-                        # 統合データ保存
-                        unified_data = {
-                            "indicator_type": "RSI",
-                            "timeframe": timeframe,
-                            "value": float(rsi_value),
-                            "timestamp": timestamp,
-                            "additional_data": additional_data,
-                            "parameters": {
-                                "period": config["period"],
-                                "period_type": period_type,
-                                "source": "enhanced_unified_technical_calculator",
-                            },
-                        }
+                # 状態判定（列単位）
+                states = np.select(
+                    [
+                        rsi_values >= config["overbought"],
+                        rsi_values <= config["oversold"],
+                    ],
+                    ["overbought", "oversold"],
+                    default="neutral",
+                )
 
-                        if await self._save_unified_indicator_optimized(unified_data):
-                            saved_count += 1
-                            valid_count += 1
+                # 有効な値のみを保存（期間分のデータがある場合のみ）
+                valid_count = await self._save_indicator_columns(
+                    indicator_type="RSI",
+                    timeframe=timeframe,
+                    timestamps=df.index,
+                    values=rsi_values,
+                    parameters={
+                        "period": config["period"],
+                        "period_type": period_type,
+                        "source": "enhanced_unified_technical_calculator",
+                    },
+                    static_data={
+                        "period_type": period_type,
+                        "period": config["period"],
+                        "overbought": config["overbought"],
+                        "oversold": config["oversold"],
+                        "description": config["description"],
+                        "analysis": {
+                            "trend": "single_point",  # 単一点での分析
+                            "momentum": "neutral",  # デフォルト値
+                        },
+                    },
+                    column_data={"state": states},
+                    min_index=config["period"] - 1,
+                )
+                saved_count += valid_count
 
                 print(
                     f"    📊 RSI {period_type} ({config['period']}期間): {valid_count}件"
@@ -717,7 +727,7 @@ class EnhancedUnifiedTechnicalCalculator:
 
             config = self.indicators_config["MACD"]
 
-            # TA-LibでMACD計算
+            # TA-LibでMACD計算（全期間を一度に計算）
             close_series = pd.to_numeric(df["close"], errors="coerce")
             close_values = close_series.values.astype(np.float64)
             macd, signal, hist = talib.MACD(
@@ -727,93 +737,68 @@ class EnhancedUnifiedTechnicalCalculator:
                 signalperiod=config["signal_period"],
             )
 
-            # 最新値を取得
-            current_macd = macd[-1] if not np.isnan(macd[-1]) else None
-            current_signal = signal[-1] if not np.isnan(signal[-1]) else None
-            current_hist = hist[-1] if not np.isnan(hist[-1]) else None
-
-            if current_macd is not None and current_signal is not None:
-                # 状態判定
-                state = self._analyze_macd_state(
-                    current_macd, current_signal, current_hist
-                )
-
-                # クロス分析
-                cross_signal = self._analyze_macd_cross(macd, signal)
-
-                # ゼロライン位置
-                zero_line_position = self._analyze_zero_line_position(current_macd)
-
-                # 統合データ
-                additional_data = {
-                    "signal_line": round(current_signal, 4) if current_signal else None,
-                    "histogram": round(current_hist, 4) if current_hist else None,
-                    "state": state,
-                    "analysis": {
-                        "cross_signal": cross_signal,
-                        "zero_line_position": zero_line_position,
-                    },
-                }
-
-                # 全データポイントで計算・保存
-            saved_count = 0
-            for i in range(len(df)):
-                if i < 26:  # MACD計算に必要な最小期間
-                    continue
-
-                # MACD計算
-                close_series = pd.to_numeric(df["close"], errors="coerce")
-                close_values = close_series.values[: i + 1].astype(np.float64)
-                macd, signal, hist = talib.MACD(
-                    close_values,
-                    fastperiod=config["fast_period"],
-                    slowperiod=config["slow_period"],
-                    signalperiod=config["signal_period"],
-                )
-
-                current_macd = macd[-1] if not np.isnan(macd[-1]) else None
-                current_signal = signal[-1] if not np.isnan(signal[-1]) else None
-                current_hist = hist[-1] if not np.isnan(hist[-1]) else None
-
-                if current_macd is not None:
-                    # 状態判定
-                    state = self._analyze_macd_state(
-                        current_macd, current_signal, current_hist
-                    )
-
-                    # クロス分析
-                    cross_signal = self._analyze_macd_cross(macd, signal)
+            # 状態判定（列単位）
+            states = np.select(
+                [(macd > signal) & (hist > 0), (macd < signal) & (hist < 0)],
+                ["bullish", "bearish"],
+                default="neutral",
+            )
 
-                    # ゼロライン位置
-                    zero_line_position = self._analyze_zero_line_position(current_macd)
+            # クロス分析（1本前との比較）
+            prev_macd = np.concatenate(([np.nan], macd[:-1]))
+            prev_signal = np.concatenate(([np.nan], signal[:-1]))
+            cross_signals = np.select(
+                [
+                    (macd > signal) & (prev_macd <= prev_signal),
+                    (macd < signal) & (prev_macd >= prev_signal),
+                ],
+                ["bullish_cross", "bearish_cross"],
+                default="no_cross",
+            )
 
-                    # 統合データ
-                    point_additional_data = {
-                        "signal_line": (
-                            round(current_signal, 4) if current_signal else None
-                        ),
-                        "histogram": round(current_hist, 4) if current_hist else None,
-                        "state": state,
-                        "analysis": {
-                            "cross_signal": cross_signal,
-                            "zero_line_position": zero_line_position,
-                        },
-                    }
+            # ゼロライン位置
+            zero_line_positions = np.select(
+                [macd > 0, macd < 0], ["above", "below"], default="at_zero"
+            )
 
-                    # 統合データ保存
-                    timestamp = df.index[i]
-                    await self._save_unified_indicator(
-                        "MACD",
-                        timeframe,
-                        current_macd,
-                        point_additional_data,
-                    )
-                    saved_count += 1
+            # 統合データ保存
+            saved_count = await self._save_indicator_columns(
+                indicator_type="MACD",
+                timeframe=timeframe,
+                timestamps=df.index,
+                values=macd,
+                parameters={
+                    "fast_period": config["fast_period"],
+                    "slow_period": config["slow_period"],
+                    "signal_period": config["signal_period"],
+                    "source": "enhanced_unified_technical_calculator",
+                },
+                column_data={
+                    "signal_line": np.round(signal, 4),
+                    "histogram": np.round(hist, 4),
+                    "state": states,
+                    "analysis.cross_signal": cross_signals,
+                    "analysis.zero_line_position": zero_line_positions,
+                },
+                min_index=config["slow_period"],
+            )
 
             if saved_count == 0:
                 print(f"⚠️ MACD計算失敗: 保存件数が0件")
                 return {"error": "MACD計算失敗: 保存件数が0件", "count": 0}
 
+            # 最新値
+            current_macd = macd[-1]
+            additional_data = {
+                "signal_line": round(signal[-1], 4),
+                "histogram": round(hist[-1], 4),
+                "state": str(states[-1]),
+                "analysis": {
+                    "cross_signal": str(cross_signals[-1]),
+                    "zero_line_position": str(zero_line_positions[-1]),
+                },
+            }
+
             return {
                 "indicator": "MACD",
                 "timeframe": timeframe,
@@ -843,7 +828,7 @@ class EnhancedUnifiedTechnicalCalculator:
 
             config = self.indicators_config["BB"]
 
-            # TA-Libでボリンジャーバンド計算
+            # TA-Libでボリンジャーバンド計算（全期間を一度に計算）
             close_series = pd.to_numeric(df["close"], errors="coerce")
             close_values = close_series.values.astype(np.float64)
             upper, middle, lower = talib.BBANDS(
@@ -854,72 +839,58 @@ class EnhancedUnifiedTechnicalCalculator:
                 matype=0,
             )
 
-            # 最新値を取得
-            current_upper = upper[-1] if not np.isnan(upper[-1]) else None
-            current_middle = middle[-1] if not np.isnan(middle[-1]) else None
-            current_lower = lower[-1] if not np.isnan(lower[-1]) else None
-            current_close = df["close"].iloc[-1]
-
-            # 全データポイントで計算・保存
-            saved_count = 0
-            for i in range(len(df)):
-                if i < config["period"]:  # BB計算に必要な最小期間
-                    continue
-
-                # BB計算
-                close_series = pd.to_numeric(df["close"], errors="coerce")
-                close_values = close_series.values[: i + 1].astype(np.float64)
-                upper, middle, lower = talib.BBANDS(
-                    close_values,
-                    timeperiod=config["period"],
-                    nbdevup=config["std_dev"],
-                    nbdevdn=config["std_dev"],
-                    matype=0,
-                )
-
-                current_upper = upper[-1] if not np.isnan(upper[-1]) else None
-                current_middle = middle[-1] if not np.isnan(middle[-1]) else None
-                current_lower = lower[-1] if not np.isnan(lower[-1]) else None
-                current_close = df["close"].iloc[i]
-
-                if current_middle is not None:
-                    # バンド位置分析
-                    band_position = self._analyze_bb_position(
-                        current_close, current_upper, current_middle, current_lower
-                    )
+            # バンド位置分析（列単位）
+            band_positions = np.select(
+                [
+                    close_values > upper,
+                    close_values < lower,
+                    close_values > middle,
+                ],
+                ["above_upper", "below_lower", "above_middle"],
+                default="below_middle",
+            )
 
-                    # バンド幅分析
-                    band_width = self._analyze_bb_width(upper, middle, lower)
-
-                    # 統合データ
-                    point_additional_data = {
-                        "upper_band": (
-                            round(current_upper, 4) if current_upper else None
-                        ),
-                        "middle_band": (
-                            round(current_middle, 4) if current_middle else None
-                        ),
-                        "lower_band": (
-                            round(current_lower, 4) if current_lower else None
-                        ),
-                        "band_position": band_position,
-                        "band_width": band_width,
-                    }
+            # バンド幅分析
+            band_width = self._analyze_bb_width(upper, middle, lower)
 
-                    # 統合データ保存
-                    await self._save_unified_indicator(
-                        "BB", timeframe, current_middle, point_additional_data
-                    )
-                    saved_count += 1
+            # 統合データ保存
+            saved_count = await self._save_indicator_columns(
+                indicator_type="BB",
+                timeframe=timeframe,
+                timestamps=df.index,
+                values=middle,
+                parameters={
+                    "period": config["period"],
+                    "std_dev": config["std_dev"],
+                    "source": "enhanced_unified_technical_calculator",
+                },
+                static_data={"band_width": band_width},
+                column_data={
+                    "upper_band": np.round(upper, 4),
+                    "middle_band": np.round(middle, 4),
+                    "lower_band": np.round(lower, 4),
+                    "band_position": band_positions,
+                },
+                min_index=config["period"],
+            )
 
             if saved_count == 0:
                 print(f"⚠️ BB計算失敗: 保存件数が0件")
                 return {"error": "BB計算失敗: 保存件数が0件", "count": 0}
 
+            # 最新値
+            point_additional_data = {
+                "upper_band": round(upper[-1], 4),
+                "middle_band": round(middle[-1], 4),
+                "lower_band": round(lower[-1], 4),
+                "band_position": str(band_positions[-1]),
+                "band_width": band_width,
+            }
+
             return {
                 "indicator": "BB",
                 "timeframe": timeframe,
-                "value": round(current_middle, 4),
+                "value": round(middle[-1], 4),
                 "additional_data": point_additional_data,
                 "count": saved_count,  # 実際の保存件数を返す
             }
@@ -949,83 +920,44 @@ class EnhancedUnifiedTechnicalCalculator:
             close_series = pd.to_numeric(df["close"], errors="coerce")
             close_values = close_series.values.astype(np.float64)
 
-            # SMA計算
-            for period in [
-                self.indicators_config["SMA"]["short"],
-                self.indicators_config["SMA"]["medium"],
-                self.indicators_config["SMA"]["long"],
-            ]:
-                if isinstance(period, int):
-                    sma_values = talib.SMA(close_values, timeperiod=period)
+            ma_functions = [
+                ("SMA", talib.SMA, "移動平均"),
+                ("EMA", talib.EMA, "指数移動平均"),
+            ]
 
-                    # 有効な値のみを保存（期間分のデータがある場合のみ）
-                    valid_count = 0
-                    for i, (timestamp, value) in enumerate(zip(df.index, sma_values)):
-                        if not np.isnan(value) and i >= period - 1:
-                            additional_data = {
-                                "ma_type": "SMA",
-                                "period": period,
-                                "description": self.indicators_config["SMA"].get(
-                                    "description", "移動平均"
-                                ),
-                            }
-
-                            indicator = TechnicalIndicatorModel(
-                                currency_pair=self.currency_pair,
-                                timestamp=timestamp,
-                                indicator_type=f"SMA_{period}",
-                                timeframe=timeframe,
-                                value=float(value),
-                                additional_data=additional_data,
-                                parameters={
-                                    "period": period,
-                                    "source": "enhanced_unified_technical_calculator",
-                                },
-                            )
-                            await self.indicator_repo.save(indicator)
-                            saved_count += 1
-                            valid_count += 1
-
-                    print(f"    📊 SMA {period}期間: {valid_count}件")
-
-            # EMA計算
-            for period in [
-                self.indicators_config["EMA"]["short"],
-                self.indicators_config["EMA"]["medium"],
-                self.indicators_config["EMA"]["long"],
-            ]:
-                if isinstance(period, int):
-                    ema_values = talib.EMA(close_values, timeperiod=period)
+            for ma_type, ma_function, default_description in ma_functions:
+                for period in [
+                    self.indicators_config[ma_type]["short"],
+                    self.indicators_config[ma_type]["medium"],
+                    self.indicators_config[ma_type]["long"],
+                ]:
+                    if not isinstance(period, int):
+                        continue
+
+                    ma_values = ma_function(close_values, timeperiod=period)
 
                     # 有効な値のみを保存（期間分のデータがある場合のみ）
-                    valid_count = 0
-                    for i, (timestamp, value) in enumerate(zip(df.index, ema_values)):
-                        if not np.isnan(value) and i >= period - 1:
-                            additional_data = {
-                                "ma_type": "EMA",
-                                "period": period,
-                                "description": self.indicators_config["EMA"].get(
-                                    "description", "指数移動平均"
-                                ),
-                            }
-
-                            indicator = TechnicalIndicatorModel(
-                                currency_pair=self.currency_pair,
-                                timestamp=timestamp,
-                                indicator_type=f"EMA_{period}",
-                                timeframe=timeframe,
-                                value=float(value),
-                                additional_data=additional_data,
-                                parameters={
-                                    "period": period,
-                                    "source": "enhanced_unified_technical_calculator",
-                                },
-                            )
-                            await self.indicator_repo.save(indicator)
-                            saved_count += 1
-                            valid_count += 1
+                    valid_count = await self._save_indicator_columns(
+                        indicator_type=f"{ma_type}_{period}",
+                        timeframe=timeframe,
+                        timestamps=df.index,
+                        values=ma_values,
+                        parameters={
+                            "period": period,
+                            "source": "enhanced_unified_technical_calculator",
+                        },
+                        static_data={
+                            "ma_type": ma_type,
+                            "period": period,
+                            "description": self.indicators_config[ma_type].get(
+                                "description", default_description
+                            ),
+                        },
+                        min_index=period - 1,
+                    )
+                    saved_count += valid_count
 
-                    print(f"    📊 EMA {period}期間: {valid_count}件")
+                    print(f"    📊 {ma_type} {period}期間: {valid_count}件")
 
             print(f"  📊 移動平均計算完了: {saved_count}件")
             return {
@@ -1056,7 +988,7 @@ class EnhancedUnifiedTechnicalCalculator:
 
             config = self.indicators_config["STOCH"]
 
-            # TA-Libでストキャスティクス計算
+            # TA-Libでストキャスティクス計算（全期間を一度に計算）
             high_series = pd.to_numeric(df["high"], errors="coerce")
             low_series = pd.to_numeric(df["low"], errors="coerce")
             close_series = pd.to_numeric(df["close"], errors="coerce")
@@ -1074,62 +1006,51 @@ class EnhancedUnifiedTechnicalCalculator:
                 slowd_matype=0,
             )
 
-            # 最新値を取得
-            current_k = slowk[-1] if not np.isnan(slowk[-1]) else None
-            current_d = slowd[-1] if not np.isnan(slowd[-1]) else None
-
-            # 全データポイントで計算・保存
-            saved_count = 0
-            for i in range(len(df)):
-                if i < config["fastk_period"]:  # STOCH計算に必要な最小期間
-                    continue
-
-                # STOCH計算
-                high_series = pd.to_numeric(df["high"], errors="coerce")
-                low_series = pd.to_numeric(df["low"], errors="coerce")
-                close_series = pd.to_numeric(df["close"], errors="coerce")
-                high_values = high_series.values[: i + 1].astype(np.float64)
-                low_values = low_series.values[: i + 1].astype(np.float64)
-                close_values = close_series.values[: i + 1].astype(np.float64)
-                slowk, slowd = talib.STOCH(
-                    high_values,
-                    low_values,
-                    close_values,
-                    fastk_period=config["fastk_period"],
-                    slowk_period=config["slowk_period"],
-                    slowk_matype=0,
-                    slowd_period=config["slowd_period"],
-                    slowd_matype=0,
-                )
-
-                current_k = slowk[-1] if not np.isnan(slowk[-1]) else None
-                current_d = slowd[-1] if not np.isnan(slowd[-1]) else None
+            # 状態分析（列単位）
+            states = np.select(
+                [(slowk > 80) & (slowd > 80), (slowk < 20) & (slowd < 20)],
+                ["overbought", "oversold"],
+                default="neutral",
+            )
 
-                if current_k is not None and current_d is not None:
-                    # 状態分析
-                    state = self._analyze_stoch_state(current_k, current_d)
+            # %Dが未確定の足は保存対象外
+            k_values = np.where(np.isnan(slowd), np.nan, slowk)
 
-                    # 統合データ
-                    point_additional_data = {
-                        "k_line": round(current_k, 2),
-                        "d_line": round(current_d, 2),
-                        "state": state,
-                    }
-
-                    # 統合データ保存
-                    await self._save_unified_indicator(
-                        "STOCH", timeframe, current_k, point_additional_data
-                    )
-                    saved_count += 1
+            # 統合データ保存
+            saved_count = await self._save_indicator_columns(
+                indicator_type="STOCH",
+                timeframe=timeframe,
+                timestamps=df.index,
+                values=k_values,
+                parameters={
+                    "fastk_period": config["fastk_period"],
+                    "slowk_period": config["slowk_period"],
+                    "slowd_period": config["slowd_period"],
+                    "source": "enhanced_unified_technical_calculator",
+                },
+                column_data={
+                    "k_line": np.round(slowk, 2),
+                    "d_line": np.round(slowd, 2),
+                    "state": states,
+                },
+                min_index=config["fastk_period"],
+            )
 
             if saved_count == 0:
                 print(f"⚠️ STOCH計算失敗: 保存件数が0件")
                 return {"error": "STOCH計算失敗: 保存件数が0件", "count": 0}
 
+            # 最新値
+            point_additional_data = {
+                "k_line": round(slowk[-1], 2),
+                "d_line": round(slowd[-1], 2),
+                "state": str(states[-1]),
+            }
+
             return {
                 "indicator": "STOCH",
                 "timeframe": timeframe,
-                "value": round(current_k, 2),
+                "value": round(slowk[-1], 2),
                 "additional_data": point_additional_data,
                 "count": saved_count,  # 実際の保存件数を返す
             }
@@ -1154,7 +1075,6 @@ class EnhancedUnifiedTechnicalCalculator:
             import talib
 
             config = self.indicators_config["ATR"]
-            saved_count = 0
 
             # データ型を確実に数値型に変換（既に変換済みだが念のため）
             high_series = pd.to_numeric(df["high"], errors="coerce")
@@ -1172,33 +1092,25 @@ class EnhancedUnifiedTechnicalCalculator:
                 timeperiod=config["period"],
             )
 
-            # 有効な値のみを保存
-            for i, (timestamp, atr_value) in enumerate(zip(df.index, atr_values)):
-                if not np.isnan(atr_value):
-                    # ボラティリティ分析
-                    volatility_analysis = self._analyze_atr_volatility(atr_values)
+            # ボラティリティ分析（系列全体で一度だけ実行）
+            volatility_analysis = self._analyze_atr_volatility(atr_values)
 
-                    additional_data = {
-                        "period": config["period"],
-                        "volatility_analysis": volatility_analysis,
-                        "description": "平均真の範囲によるボラティリティ測定",
-                    }
-
-                    indicator = TechnicalIndicatorModel(
-                        currency_pair=self.currency_pair,
-                        timestamp=timestamp,
-                        indicator_type="ATR",
-                        timeframe=timeframe,
-                        value=float(atr_value),
-                        additional_data=additional_data,
-                        parameters={
-                            "period": config["period"],
-                            "source": "enhanced_unified_technical_calculator",
-                        },
-                    )
-
-                    await self.indicator_repo.save(indicator)
-                    saved_count += 1
+            # 有効な値のみを保存
+            saved_count = await self._save_indicator_columns(
+                indicator_type="ATR",
+                timeframe=timeframe,
+                timestamps=df.index,
+                values=atr_values,
+                parameters={
+                    "period": config["period"],
+                    "source": "enhanced_unified_technical_calculator",
+                },
+                static_data={
+                    "period": config["period"],
+                    "volatility_analysis": volatility_analysis,
+                    "description": "平均真の範囲によるボラティリティ測定",
+                },
+            )
 
             print(f"  📊 ATR計算完了: {saved_count}件")
             return {
@@ -1415,9 +1327,9 @@ class EnhancedUnifiedTechnicalCalculator:
                 logger.warning("valueが無効な値です")
                 return False
 
-            # 指標タイプの妥当性チェック
+            # 指標タイプの妥当性チェック（期間サフィックスは除外して判定）
             valid_indicators = ["RSI", "MACD", "BB", "SMA", "EMA", "STOCH", "ATR"]
-            if indicator_data["indicator_type"] not in valid_indicators:
+            if indicator_data["indicator_type"].split("_")[0] not in valid_indicators:
                 logger.warning(f"無効な指標タイプ: {indicator_data['indicator_type']}")
                 return False
 
@@ -1484,6 +1396,165 @@ class EnhancedUnifiedTechnicalCalculator:
             logger.error(f"データ圧縮エラー: {e}")
             return data
 
+    def _validate_indicator_columns(
+        self, indicator_type: str, timeframe: str, values: np.ndarray
+    ) -> np.ndarray:
+        """
+        データ整合性検証（列単位）
+
+        _validate_data_integrity と同じ規則を、スカラー項目は1回だけ、
+        値は配列全体に対して一括で適用する。
+
+        Args:
+            indicator_type: 指標タイプ（SMA_20 等の期間付きも可）
+            timeframe: 時間足
+            values: 指標値の配列
+
+        Returns:
+            np.ndarray: 有効な行を示すブールマスク
+        """
+        invalid = np.zeros(len(values), dtype=bool)
+
+        # 指標タイプの妥当性チェック（期間サフィックスは除外して判定）
+        valid_indicators = ["RSI", "MACD", "BB", "SMA", "EMA", "STOCH", "ATR"]
+        if indicator_type.split("_")[0] not in valid_indicators:
+            logger.warning(f"無効な指標タイプ: {indicator_type}")
+            return invalid
+
+        # 時間足の妥当性チェック
+        valid_timeframes = ["M5", "M15", "H1", "H4", "D1"]
+        if timeframe not in valid_timeframes:
+            logger.warning(f"無効な時間足: {timeframe}")
+            return invalid
+
+        # 値の範囲チェック（NaN/infを除外）
+        return np.isfinite(np.asarray(values, dtype=np.float64))
+
+    def _compress_additional_columns(
+        self, columns: Dict[str, np.ndarray]
+    ) -> Dict[str, list]:
+        """
+        追加データの圧縮（列単位）
+
+        数値列は小数点以下4桁に一括で丸め、Pythonのリストに変換する。
+
+        Args:
+            columns: 列名→値配列の辞書
+
+        Returns:
+            Dict[str, list]: 圧縮された列データ
+        """
+        compressed_columns = {}
+        for key, column in columns.items():
+            column = np.asarray(column)
+            if np.issubdtype(column.dtype, np.number):
+                column = np.round(column.astype(np.float64), 4)
+            compressed_columns[key] = column.tolist()
+        return compressed_columns
+
+    async def _save_indicator_columns(
+        self,
+        indicator_type: str,
+        timeframe: str,
+        timestamps: pd.Index,
+        values: np.ndarray,
+        parameters: Dict[str, Any],
+        static_data: Optional[Dict[str, Any]] = None,
+        column_data: Optional[Dict[str, np.ndarray]] = None,
+        min_index: int = 0,
+    ) -> int:
+        """
+        TA-Lib出力配列を列単位で保存
+
+        1指標・1時間足・1期間ごとに、検証・圧縮を配列演算で行った上で
+        1回のバルク INSERT ... ON CONFLICT で書き込む。
+        write_mode が "row" の場合は従来通り _save_unified_indicator_optimized で
+        1件ずつ保存する。
+
+        Args:
+            indicator_type: 指標タイプ
+            timeframe: 時間足
+            timestamps: 価格データのタイムスタンプ（values と同じ長さ）
+            values: 指標の主要値の配列
+            parameters: 計算パラメータ
+            static_data: 全行共通の追加データ
+            column_data: 行ごとの追加データ（"analysis.cross_signal" のように
+                "." 区切りのキーはネストした辞書に展開）
+            min_index: 保存を開始する最小インデックス
+
+        Returns:
+            int: 保存件数（既存データのスキップを含む）
+        """
+        mask = self._validate_indicator_columns(indicator_type, timeframe, values)
+        mask[:min_index] = False
+        positions = np.flatnonzero(mask)
+        if len(positions) == 0:
+            return 0
+
+        # 追加データを列単位で圧縮
+        static_data = await self._compress_additional_data(static_data or {})
+        columns = self._compress_additional_columns(
+            {
+                key: np.asarray(column)[positions]
+                for key, column in (column_data or {}).items()
+            }
+        )
+
+        # 列データを行データに展開
+        if isinstance(timestamps, pd.DatetimeIndex):
+            timestamp_list = timestamps[positions].to_pydatetime().tolist()
+        else:
+            timestamp_list = [timestamps[i] for i in positions]
+        value_list = np.asarray(values, dtype=np.float64)[positions].tolist()
+
+        rows = []
+        for row_index, (timestamp, value) in enumerate(
+            zip(timestamp_list, value_list)
+        ):
+            additional_data = {
+                key: dict(item) if isinstance(item, dict) else item
+                for key, item in static_data.items()
+            }
+            for key, column in columns.items():
+                target = additional_data
+                *parents, leaf = key.split(".")
+                for parent in parents:
+                    target = target.setdefault(parent, {})
+                target[leaf] = column[row_index]
+
+            rows.append(
+                {
+                    "currency_pair": self.currency_pair,
+                    "timestamp": timestamp,
+                    "indicator_type": indicator_type,
+                    "timeframe": timeframe,
+                    "value": value,
+                    "additional_data": additional_data,
+                    "parameters": parameters,
+                }
+            )
+
+        if self.write_mode == "row":
+            # 従来の保存経路（1件ずつ検証・圧縮して保存）
+            saved_count = 0
+            for row in rows:
+                row.pop("currency_pair")
+                if await self._save_unified_indicator_optimized(row):
+                    saved_count += 1
+            return saved_count
+
+        saved_count = await self.indicator_repo.upsert_batch(
+            rows, overwrite=self.overwrite_existing
+        )
+        if saved_count < len(rows):
+            logger.debug(
+                f"{indicator_type} {timeframe}: 既存データ"
+                f"{len(rows) - saved_count}件をスキップ"
+            )
+
+        # 従来の1件ずつ保存と同様に、既存行も処理済みとして数える
+        return len(rows)
+
     async def _analyze_existing_data(self) -> Dict[str, Any]:
         """
         既存データの分析
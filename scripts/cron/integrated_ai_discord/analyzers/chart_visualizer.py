@@ -4,10 +4,17 @@ Chart Visualizer Module
 1時間足特化のチャート描写システム
 
 既存のデータ取得機能を活用して、移動平均線とフィボナッチレベルを表示
+
+描画の高速化:
+- ローソク足はヒゲを1つの LineCollection、実体を1つの PolyCollection で描画
+- フィギュアは時間軸ごとに1度だけ作成し、以降は軸をクリアしてデータのみ再描画
+- create_chart_async は常駐ワーカープロセスで描画し、H1/H4 を並列に生成できる
 """
 
+import asyncio
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -16,6 +23,7 @@ import mplfinance as mpf
 import numpy as np
 import pandas as pd
 import pytz
+from matplotlib.collections import LineCollection, PolyCollection
 from rich.console import Console
 
 # プロジェクトパスを追加
@@ -25,16 +33,45 @@ from src.utils.logging_config import get_infrastructure_logger
 
 logger = get_infrastructure_logger()
 
+# チャート描画ワーカープロセス数（H1とH4を並列描画）
+RENDER_WORKERS = 2
+
+_render_executor: Optional[ProcessPoolExecutor] = None
+_worker_visualizers: Dict[str, "ChartVisualizer"] = {}
+
+
+def get_render_executor() -> ProcessPoolExecutor:
+    """チャート描画用の常駐ワーカープロセスプールを取得"""
+    global _render_executor
+    if _render_executor is None:
+        _render_executor = ProcessPoolExecutor(max_workers=RENDER_WORKERS)
+    return _render_executor
+
+
+def _render_chart_in_worker(
+    chart_dir: str,
+    data: pd.DataFrame,
+    currency_pair: str,
+    indicators_data: Dict[str, Any],
+    timeframe: str,
+) -> Optional[str]:
+    """ワーカープロセスでチャートを描画（フィギュアはプロセス内で再利用）"""
+    visualizer = _worker_visualizers.get(chart_dir)
+    if visualizer is None:
+        visualizer = ChartVisualizer(chart_dir)
+        _worker_visualizers[chart_dir] = visualizer
+    return visualizer._create_chart(data, currency_pair, indicators_data, timeframe)
+
 
 class ChartVisualizer:
     """1時間足特化チャート描写クラス"""
 
-    def __init__(self):
+    def __init__(self, chart_dir: Optional[str] = None):
         self.console = Console()
         self.jst = pytz.timezone("Asia/Tokyo")
 
         # チャート保存ディレクトリ
-        self.chart_dir = "/app/scripts/cron/integrated_ai_discord/charts"
+        self.chart_dir = chart_dir or "/app/scripts/cron/integrated_ai_discord/charts"
         self.setup_chart_directory()
 
         # Discord最適化設定（横サイズを拡張してフィボナッチラベル用のスペースを確保）
@@ -55,6 +92,9 @@ class ChartVisualizer:
             "rsi_oversold": "#74b9ff",
         }
 
+        # 時間軸ごとのフィギュア（2回目以降はデータのみ再描画）
+        self._figures: Dict[str, Tuple[plt.Figure, List[plt.Axes]]] = {}
+
         logger.info("Initialized Chart Visualizer")
 
     def setup_chart_directory(self):
@@ -112,6 +152,49 @@ class ChartVisualizer:
             data, currency_pair, indicators_data, "H4", save_chart
         )
 
+    async def create_chart_async(
+        self,
+        data: pd.DataFrame,
+        currency_pair: str,
+        indicators_data: Dict[str, Any],
+        timeframe: str,
+    ) -> Optional[str]:
+        """
+        ワーカープロセスでチャート作成（保存のみ）
+
+        H1/H4 を同時に呼び出すと別々のプロセスで並列に描画される。
+        ワーカープロセスが使えない場合はこのプロセスで描画する。
+
+        Args:
+            data: OHLCVデータ
+            currency_pair: 通貨ペア
+            indicators_data: テクニカル指標データ
+            timeframe: 時間軸（H1/H4）
+
+        Returns:
+            str: 保存されたファイルパス（Noneの場合は失敗）
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(
+                get_render_executor(),
+                _render_chart_in_worker,
+                self.chart_dir,
+                data,
+                currency_pair,
+                indicators_data,
+                timeframe,
+            )
+        except Exception as e:
+            logger.warning(f"Chart worker unavailable, rendering in process: {str(e)}")
+            return self._create_chart(data, currency_pair, indicators_data, timeframe)
+
+    def close(self):
+        """再利用中のフィギュアを解放"""
+        for fig, _ in self._figures.values():
+            plt.close(fig)
+        self._figures.clear()
+
     def _create_chart(
         self,
         data: pd.DataFrame,
@@ -144,8 +227,9 @@ class ChartVisualizer:
             # データ形式をmplfinance用に変換
             chart_data = self._prepare_data_for_chart(data, timeframe)
 
-            # チャート作成
-            fig, axes = self._create_chart_layout()
+            # チャート作成（時間軸ごとのフィギュアを再利用）
+            reused = timeframe in self._figures
+            fig, axes = self._get_chart_layout(timeframe)
 
             # ローソク足プロット
             self._plot_candlesticks(axes[0], chart_data)
@@ -160,16 +244,13 @@ class ChartVisualizer:
             self._add_current_price(axes[0], chart_data, indicators_data)
 
             # チャート装飾
-            self._decorate_chart(fig, axes, currency_pair, timeframe)
+            self._decorate_chart(fig, axes, currency_pair, timeframe, reused)
 
             # チャート保存
             if save_chart:
-                file_path = self._save_chart(fig, currency_pair, timeframe)
-                plt.close(fig)
-                return file_path
+                return self._save_chart(fig, currency_pair, timeframe)
             else:
                 plt.show()
-                plt.close(fig)
                 return None
 
         except Exception as e:
@@ -266,6 +347,17 @@ class ChartVisualizer:
 
         return fig, [ax]
 
+    def _get_chart_layout(self, timeframe: str) -> Tuple[plt.Figure, List[plt.Axes]]:
+        """時間軸ごとのチャートレイアウトを取得（作成済みなら軸をクリアして再利用）"""
+        if timeframe not in self._figures:
+            self._figures[timeframe] = self._create_chart_layout()
+            return self._figures[timeframe]
+
+        fig, axes = self._figures[timeframe]
+        for ax in axes:
+            ax.cla()
+        return fig, axes
+
     def _plot_candlesticks(self, ax: plt.Axes, data: pd.DataFrame):
         """ローソク足プロット（1週間表示）"""
         try:
@@ -282,43 +374,58 @@ class ChartVisualizer:
             else:
                 display_data = data
 
-            # シンプルなローソク足プロット
-            for i in range(len(display_data)):
-                open_price = display_data["Open"].iloc[i]
-                high_price = display_data["High"].iloc[i]
-                low_price = display_data["Low"].iloc[i]
-                close_price = display_data["Close"].iloc[i]
+            # ローソク足をまとめて描画（ヒゲ・実体・十字線をそれぞれ1つのコレクションで描画）
+            x = np.arange(len(display_data), dtype=float)
+            open_prices = display_data["Open"].to_numpy(dtype=float)
+            high_prices = display_data["High"].to_numpy(dtype=float)
+            low_prices = display_data["Low"].to_numpy(dtype=float)
+            close_prices = display_data["Close"].to_numpy(dtype=float)
+
+            # ローソク足の色を決定（日本式：陽線：赤、陰線：緑）
+            colors = np.where(
+                close_prices >= open_prices,
+                self.colors["candle_down"],
+                self.colors["candle_up"],
+            )
 
-                # ローソク足の色を決定（日本式：陽線：赤、陰線：緑）
-                if close_price >= open_price:
-                    color = self.colors["candle_down"]  # 陽線（赤）
-                else:
-                    color = self.colors["candle_up"]  # 陰線（緑）
-
-                # ヒゲ（上下の線）
-                ax.plot([i, i], [low_price, high_price], color=color, linewidth=1)
-
-                # 実体（四角形）
-                body_height = abs(close_price - open_price)
-                if body_height > 0:
-                    if close_price >= open_price:
-                        # 陽線
-                        ax.bar(
-                            i, body_height, bottom=open_price, color=color, width=0.8
-                        )
-                    else:
-                        # 陰線
-                        ax.bar(
-                            i, body_height, bottom=close_price, color=color, width=0.8
-                        )
-                else:
-                    # 十字線
-                    ax.plot(
-                        [i - 0.4, i + 0.4],
-                        [open_price, open_price],
-                        color=color,
-                        linewidth=1,
-                    )
+            # ヒゲ（上下の線）
+            wicks = np.stack(
+                [np.column_stack([x, low_prices]), np.column_stack([x, high_prices])],
+                axis=1,
+            )
+            ax.add_collection(LineCollection(wicks, colors=colors, linewidths=1))
+
+            # 実体（四角形）
+            bottoms = np.minimum(open_prices, close_prices)
+            tops = np.maximum(open_prices, close_prices)
+            has_body = tops > bottoms
+            left, right = x[has_body] - 0.4, x[has_body] + 0.4
+            bodies = np.stack(
+                [
+                    np.column_stack([left, bottoms[has_body]]),
+                    np.column_stack([right, bottoms[has_body]]),
+                    np.column_stack([right, tops[has_body]]),
+                    np.column_stack([left, tops[has_body]]),
+                ],
+                axis=1,
+            )
+            ax.add_collection(
+                PolyCollection(bodies, facecolors=colors[has_body], linewidths=0)
+            )
+
+            # 十字線
+            doji = ~has_body
+            crosses = np.stack(
+                [
+                    np.column_stack([x[doji] - 0.4, open_prices[doji]]),
+                    np.column_stack([x[doji] + 0.4, open_prices[doji]]),
+                ],
+                axis=1,
+            )
+            ax.add_collection(
+                LineCollection(crosses, colors=colors[doji], linewidths=1)
+            )
+            ax.autoscale_view()
 
             # 軸の設定（時間軸に応じて右側マージンを動的に調整）
             # H1: 1週間分（168時間）→ マージン5、H4: 1ヶ月分（180時間）→ マージン10
@@ -733,9 +840,14 @@ class ChartVisualizer:
             logger.error(f"RSI subplot error: {str(e)}")
 
     def _decorate_chart(
-        self, fig: plt.Figure, axes: List[plt.Axes], currency_pair: str, timeframe: str
+        self,
+        fig: plt.Figure,
+        axes: List[plt.Axes],
+        currency_pair: str,
+        timeframe: str,
+        reused: bool = False,
     ):
-        """チャート装飾"""
+        """チャート装飾（再利用したフィギュアはレイアウト計算を省略）"""
         try:
             # タイトル設定
             current_time = datetime.now(self.jst).strftime("%Y-%m-%d %H:%M:%S JST")
@@ -746,8 +858,11 @@ class ChartVisualizer:
                 fontweight="bold",
             )
 
+            if reused:
+                return
+
             # レイアウト調整（グラフエリアの幅を制御しつつ右側マージンを確保）
-            plt.tight_layout(pad=1.0, h_pad=0.5, w_pad=0.5)
+            fig.tight_layout(pad=1.0, h_pad=0.5, w_pad=0.5)
 
             # 時間軸に応じてグラフエリアの幅を調整
             if timeframe == "H4":
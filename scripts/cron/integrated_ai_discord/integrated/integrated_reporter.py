@@ -4,6 +4,7 @@ Integrated Reporter Module
 統合AI分析Discord配信システム（最適化版）
 """
 
+import asyncio
 import sys
 from datetime import datetime
 from typing import Any, Dict, Optional
@@ -642,8 +643,11 @@ class IntegratedAIDiscordReporter:
             # 相関分析結果を表示
             self.correlation_analyzer.display_correlation_analysis(correlation_data)
 
-            # Step 2.5: H1チャート生成
-            chart_file_path = await self._generate_h1_chart("USD/JPY", technical_data)
+            # Step 2.5: H1/H4チャート生成（別プロセスで並列描画）
+            chart_file_path, h4_chart_file_path = await asyncio.gather(
+                self._generate_h1_chart("USD/JPY", technical_data),
+                self._generate_h4_chart("USD/JPY", technical_data),
+            )
 
             # Step 3: 統合AI分析生成
             analysis_result = (
@@ -682,11 +686,8 @@ class IntegratedAIDiscordReporter:
                     "⚠️ H1チャートファイルが生成されていないため、H1チャート配信をスキップ"
                 )
 
-            # Step 6: H4チャート生成・配信
+            # Step 6: H4チャート配信
             h4_chart_success = False
-            h4_chart_file_path = await self._generate_h4_chart(
-                "USD/JPY", technical_data
-            )
             if h4_chart_file_path:
                 h4_chart_success = await self.discord_sender.send_chart_to_discord(
                     h4_chart_file_path, "USD/JPY H4"
@@ -764,8 +765,8 @@ class IntegratedAIDiscordReporter:
                         )
 
                     # チャート生成
-                    chart_file_path = self.chart_visualizer.create_h1_chart(
-                        hist_data, currency_pair, technical_data
+                    chart_file_path = await self.chart_visualizer.create_chart_async(
+                        hist_data, currency_pair, technical_data, "H1"
                     )
 
                     if chart_file_path:
@@ -841,8 +842,8 @@ class IntegratedAIDiscordReporter:
                         self.console.print(f"📊 H4フィボナッチデータ取得: {fib_result}")
 
                     # チャート生成
-                    chart_file_path = self.chart_visualizer.create_h4_chart(
-                        hist_data, currency_pair, h4_fib_data
+                    chart_file_path = await self.chart_visualizer.create_chart_async(
+                        hist_data, currency_pair, h4_fib_data, "H4"
                     )
 
                     if chart_file_path:
@@ -24,7 +24,6 @@ import sys
 from datetime import datetime, timedelta
 from pathlib import Path
 
-import pandas as pd
 import pytz
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
@@ -33,7 +32,6 @@ from sqlalchemy.orm import sessionmaker
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.infrastructure.database.models.price_data_model import PriceDataModel
 from src.infrastructure.database.repositories.price_data_repository_impl import (
     PriceDataRepositoryImpl,
 )
@@ -190,47 +188,26 @@ class SimpleDataFetcher:
                 logger.info(f"🧪 最新データ: {data.iloc[-1].to_dict()}")
                 return len(data)  # 取得件数を返す
 
-            # データを保存
-            saved_count = 0
-            for _, row in data.iterrows():
-                try:
-                    # 重複チェック（タイムスタンプとデータソースで判定）
-                    existing = await self.price_repo.find_by_timestamp_and_source(
-                        row.name, self.currency_pair, "yahoo_finance_5m_continuous"
-                    )
-
-                    if existing:
-                        logger.debug(f"⏭️ 重複データをスキップ: {row.name}")
-                        continue
-
-                    # 日本時間での保存
-                    jst = pytz.timezone("Asia/Tokyo")
-                    current_time = datetime.now(jst)
-
-                    # 新しいデータを保存
-                    price_data = PriceDataModel(
-                        currency_pair=self.currency_pair,
-                        timestamp=row.name,
-                        data_timestamp=row.name,  # データの実際のタイムスタンプ
-                        fetched_at=current_time,  # 日本時間での取得時刻
-                        open_price=float(row["Open"]),
-                        high_price=float(row["High"]),
-                        low_price=float(row["Low"]),
-                        close_price=float(row["Close"]),
-                        volume=(
-                            int(row["Volume"])
-                            if "Volume" in row and not pd.isna(row["Volume"])
-                            else 0
-                        ),
-                        data_source="yahoo_finance_5m_continuous",  # 継続的データ取得用
-                    )
-
-                    await self.price_repo.save(price_data)
-                    saved_count += 1
-
-                except Exception as e:
-                    logger.error(f"❌ データ保存エラー: {e}")
-                    continue
+            # 確定済みの足のみ保存（形成中の足は次回以降の実行で確定後に保存）
+            bar_durations = {
+                "5m": timedelta(minutes=5),
+                "1h": timedelta(hours=1),
+                "4h": timedelta(hours=4),
+                "1d": timedelta(days=1),
+            }
+            frame = PriceDataRepositoryImpl.ohlcv_to_ingest_frame(
+                data,
+                self.currency_pair,
+                "yahoo_finance_5m_continuous",  # 継続的データ取得用
+                bar_duration=bar_durations.get(timeframe),
+            )
+
+            # 既存キーとの差分のみ一括保存（重複チェックは1クエリ）
+            counts = await self.price_repo.ingest_batch(frame)
+            saved_count = counts["inserted"]
+            if counts["failed"]:
+                logger.error(f"❌ データ保存エラー: {counts['failed']}件")
+            logger.debug(f"⏭️ 重複データをスキップ: {counts['skipped']}件")
 
             logger.info(f"✅ {timeframe}データ保存完了: {saved_count}件")
             return saved_count
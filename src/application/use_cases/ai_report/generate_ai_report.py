@@ -11,6 +11,9 @@ from src.domain.services.ai_analysis import AIAnalysisService
 from src.domain.repositories.ai_report_repository import AIReportRepository
 from src.domain.entities.economic_event import EconomicEvent, Importance
 from src.domain.entities.ai_report import AIReport, ReportType
+from src.application.use_cases.notification.send_ai_report_notifications import (
+    SendAIReportNotificationsUseCase,
+)
 
 
 class GenerateAIReportUseCase:
@@ -19,10 +22,12 @@ class GenerateAIReportUseCase:
     def __init__(
         self,
         ai_analysis_service: AIAnalysisService,
-        ai_report_repository: AIReportRepository
+        ai_report_repository: AIReportRepository,
+        report_notifier: Optional[SendAIReportNotificationsUseCase] = None
     ):
         self.ai_analysis_service = ai_analysis_service
         self.ai_report_repository = ai_report_repository
+        self.report_notifier = report_notifier
         self.logger = logging.getLogger(self.__class__.__name__)
     
     async def execute(
@@ -59,24 +64,45 @@ class GenerateAIReportUseCase:
                     "reports_generated": 0
                 }
             
-            # AIレポート生成
-            generated_reports = []
-            for event in high_importance_events:
-                try:
-                    report = await self._generate_report_for_event(event, report_type)
-                    if report:
-                        generated_reports.append(report)
-                except Exception as e:
-                    self.logger.error(f"Error generating report for event {event.event_id}: {e}")
-            
-            # レポートの保存
+            # 新たに生成したレポートから順に保存・通知
+            # （キャッシュや保存済みのレポートは保存・通知済みのため対象外）
             saved_reports = []
-            for report in generated_reports:
+
+            async def handle_report(report: AIReport) -> None:
                 try:
                     saved_report = await self.ai_report_repository.save(report)
                     saved_reports.append(saved_report)
                 except Exception as e:
                     self.logger.error(f"Error saving report {report.id}: {e}")
+                    return
+                if self.report_notifier:
+                    await self.report_notifier.send_ai_report_notifications(
+                        [saved_report]
+                    )
+            
+            # AIレポート生成（事前・事後レポートは並行生成）
+            if report_type in (ReportType.PRE_EVENT, ReportType.POST_EVENT):
+                service = self.ai_analysis_service
+                generated_reports = await service.generate_bulk_reports(
+                    high_importance_events,
+                    report_type.value,
+                    on_report=handle_report,
+                    find_existing=self.ai_report_repository.find_by_content_hash,
+                )
+            else:
+                generated_reports = []
+                for event in high_importance_events:
+                    try:
+                        report = await self._generate_report_for_event(
+                            event, report_type
+                        )
+                        if report:
+                            generated_reports.append(report)
+                            await handle_report(report)
+                    except Exception as e:
+                        self.logger.error(
+                            f"Error generating report for event {event.event_id}: {e}"
+                        )
             
             result = {
                 "success": True,
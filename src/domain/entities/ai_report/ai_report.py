@@ -43,6 +43,10 @@ class AIReport(BaseEntity):
     # 信頼度
     confidence_score: Decimal = field(default_factory=lambda: Decimal("0.5"))
     
+    # 生成時の入力（レポートタイプ・イベント・予想値・結果値・テンプレート）のハッシュ
+    # 同じ入力のレポートを再生成しないために使用（フォールバックレポートはNone）
+    content_hash: Optional[str] = None
+    
     # メタデータ
     generated_at: datetime = field(default_factory=datetime.utcnow)
     created_at: datetime = field(default_factory=datetime.utcnow)
@@ -109,6 +113,7 @@ class AIReport(BaseEntity):
             "report_content": self.report_content,
             "summary": self.summary,
             "confidence_score": float(self.confidence_score),
+            "content_hash": self.content_hash,
             "generated_at": self.generated_at.isoformat(),
             "created_at": self.created_at.isoformat(),
             "updated_at": self.updated_at.isoformat()
@@ -139,7 +144,7 @@ class AIReport(BaseEntity):
         """文字列表現"""
         confidence_pct = float(self.confidence_score) * 100
         return f"AIReport({self.report_type.value}, confidence={confidence_pct:.1f}%)"
-    
+
     def __repr__(self) -> str:
         """詳細な文字列表現"""
         return (
@@ -58,6 +58,19 @@ class AIReportRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    async def find_by_content_hash(self, content_hash: str) -> Optional[AIReport]:
+        """
+        生成時の入力のハッシュでAIレポートを検索
+        
+        Args:
+            content_hash: AIReport.content_hash
+            
+        Returns:
+            Optional[AIReport]: 見つかったAIレポート（最新のもの）
+        """
+        pass
+    
     @abstractmethod
     async def find_by_report_type(
         self, 
@@ -245,17 +258,17 @@ class AIReportRepository(ABC):
         Args:
             start_date: 開始日（オプション）
             end_date: 終了日（オプション）
-            
+
         Returns:
             Dict[str, Any]: 統計情報
         """
         pass
-    
+
     @abstractmethod
     async def health_check(self) -> bool:
         """
         ヘルスチェック
-        
+
         Returns:
             bool: 正常フラグ
         """
@@ -2,19 +2,32 @@
 AI分析サービス
 
 ChatGPTを使用したドル円予測分析のメインサービス
+
+一括生成では同時実行数（セマフォ）と1分あたりのトークン数で OpenAI の
+利用枠に合わせて並行生成し、(レポートタイプ, event_id, 予想値, 結果値,
+プロンプトテンプレートのバージョン) が同じイベントは再生成しない
+（プロセス内のキャッシュに加え、保存済みレポートを content_hash で検索する）。
 """
 
+import asyncio
+import hashlib
+import json
 import logging
-from typing import Dict, Any, List, Optional
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 from datetime import datetime
 
 from src.domain.entities import EconomicEvent, AIReport, USDJPYPrediction
 from src.infrastructure.external.openai import OpenAIClient
+from src.utils.rate_limit_utils import SlidingWindowRateLimiter
 from .openai_prompt_builder import OpenAIPromptBuilder
 from .usd_jpy_prediction_parser import USDJPYPredictionParser
 from .confidence_score_calculator import ConfidenceScoreCalculator
 from .ai_report_generator import AIReportGenerator
 
+# プロンプトの概算トークン数（出力トークンの上限は OpenAIClient.max_tokens）
+PROMPT_TOKENS_ESTIMATE = 1000
+
 
 class AIAnalysisService:
     """
@@ -30,6 +43,9 @@ class AIAnalysisService:
         prediction_parser: Optional[USDJPYPredictionParser] = None,
         confidence_calculator: Optional[ConfidenceScoreCalculator] = None,
         report_generator: Optional[AIReportGenerator] = None,
+        max_concurrency: int = 4,
+        tokens_per_minute: Optional[int] = None,
+        report_cache_size: int = 256,
     ):
         """
         初期化
@@ -40,6 +56,9 @@ class AIAnalysisService:
             prediction_parser: 予測データ解析器（オプション）
             confidence_calculator: 信頼度計算器（オプション）
             report_generator: レポート生成器（オプション）
+            max_concurrency: 一括生成の最大同時リクエスト数
+            tokens_per_minute: 1分あたりのトークン上限（Noneで制限なし）
+            report_cache_size: 生成済みレポートのキャッシュ件数
         """
         self.logger = logging.getLogger(self.__class__.__name__)
         self.openai_client = openai_client
@@ -55,6 +74,19 @@ class AIAnalysisService:
         self._successful_analyses = 0
         self._total_confidence_score = 0.0
 
+        # 一括生成の同時実行制御とレポートキャッシュ
+        self.max_concurrency = max(1, max_concurrency)
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._token_limiter = (
+            SlidingWindowRateLimiter([(tokens_per_minute, 60.0)], name="openai_tokens")
+            if tokens_per_minute
+            else None
+        )
+        self.report_cache_size = report_cache_size
+        self._report_cache: "OrderedDict[str, AIReport]" = OrderedDict()
+        self._in_flight: Dict[str, "asyncio.Future[AIReport]"] = {}
+        self._cache_hits = 0
+
     async def generate_pre_event_report(self, event: EconomicEvent) -> AIReport:
         """
         イベント前のドル円予測レポート生成
@@ -66,69 +98,75 @@ class AIAnalysisService:
             AIReport: 生成されたAIレポート
         """
         try:
-            self.logger.info(f"事前レポート生成開始: {event.event_id}")
-            self._analysis_count += 1
-            
-            # プロンプトの構築
-            prompt = await self.prompt_builder.build_pre_event_prompt(event)
-            
-            # OpenAI API呼び出し
-            ai_response = await self.openai_client.generate_text(prompt)
-            
-            if not ai_response:
-                raise Exception("OpenAI APIからの応答が空です")
-            
-            # 予測データの解析
-            prediction_data = await self.prediction_parser.parse_prediction_data(ai_response)
-            
-            # 信頼度スコアの計算
-            confidence_score = await self.confidence_calculator.calculate_confidence(
-                event, prediction_data
-            )
-            
-            # USD/JPY予測オブジェクトの作成
-            usd_jpy_prediction = USDJPYPrediction(
-                direction=prediction_data.get("direction", "neutral"),
-                strength=prediction_data.get("strength", 0.0),
-                timeframe=prediction_data.get("timeframe", "1-4 hours"),
-                confidence_score=confidence_score,
-                reasons=prediction_data.get("reasons", []),
-                technical_factors=prediction_data.get("technical_factors", []),
-                fundamental_factors=prediction_data.get("fundamental_factors", []),
-                risk_factors=prediction_data.get("risk_factors", [])
-            )
-            
-            # レポートの生成
-            report_content = await self.report_generator.generate_pre_event_content(
-                event, usd_jpy_prediction, ai_response
-            )
-            
-            # AIReportオブジェクトの作成
-            ai_report = AIReport(
-                event_id=event.event_id,
-                report_type="pre_event",
-                report_content=report_content,
-                usd_jpy_prediction=usd_jpy_prediction,
-                confidence_score=confidence_score,
-                generated_at=datetime.utcnow()
-            )
-            
-            # 統計更新
-            self._successful_analyses += 1
-            self._total_confidence_score += confidence_score
-            
-            self.logger.info(
-                f"事前レポート生成完了: {event.event_id}, "
-                f"信頼度: {confidence_score:.2f}"
-            )
-            
-            return ai_report
+            return await self._build_pre_event_report(event)
 
         except Exception as e:
             self.logger.error(f"事前レポート生成エラー: {e}")
             # エラー時のフォールバックレポート
             return await self._create_fallback_report(event, "pre_event", str(e))
 
+    async def _build_pre_event_report(self, event: EconomicEvent) -> AIReport:
+        """事前レポート生成（失敗時は例外を送出）"""
+        self.logger.info(f"事前レポート生成開始: {event.event_id}")
+        self._analysis_count += 1
+
+        # プロンプトの構築
+        prompt = await self.prompt_builder.build_pre_event_prompt(event)
+
+        # OpenAI API呼び出し
+        ai_response = await self.openai_client.generate_text(prompt)
+
+        if not ai_response:
+            raise Exception("OpenAI APIからの応答が空です")
+
+        # 予測データの解析
+        prediction_data = await self.prediction_parser.parse_prediction_data(
+            ai_response
+        )
+
+        # 信頼度スコアの計算
+        confidence_score = await self.confidence_calculator.calculate_confidence(
+            event, prediction_data
+        )
+
+        # USD/JPY予測オブジェクトの作成
+        usd_jpy_prediction = USDJPYPrediction(
+            direction=prediction_data.get("direction", "neutral"),
+            strength=prediction_data.get("strength", 0.0),
+            timeframe=prediction_data.get("timeframe", "1-4 hours"),
+            confidence_score=confidence_score,
+            reasons=prediction_data.get("reasons", []),
+            technical_factors=prediction_data.get("technical_factors", []),
+            fundamental_factors=prediction_data.get("fundamental_factors", []),
+            risk_factors=prediction_data.get("risk_factors", [])
+        )
+
+        # レポートの生成
+        report_content = await self.report_generator.generate_pre_event_content(
+            event, usd_jpy_prediction, ai_response
+        )
+
+        # AIReportオブジェクトの作成
+        ai_report = AIReport(
+            event_id=event.event_id,
+            report_type="pre_event",
+            report_content=report_content,
+            usd_jpy_prediction=usd_jpy_prediction,
+            confidence_score=confidence_score,
+            generated_at=datetime.utcnow()
+        )
+
+        # 統計更新
+        self._successful_analyses += 1
+        self._total_confidence_score += confidence_score
+
+        self.logger.info(
+            f"事前レポート生成完了: {event.event_id}, "
+            f"信頼度: {confidence_score:.2f}"
+        )
+
+        return ai_report
+
     async def generate_post_event_report(self, event: EconomicEvent) -> AIReport:
         """
         イベント後のドル円分析レポート生成
@@ -140,69 +178,75 @@ class AIAnalysisService:
             AIReport: 生成されたAIレポート
         """
         try:
-            self.logger.info(f"事後レポート生成開始: {event.event_id}")
-            self._analysis_count += 1
-            
-            # プロンプトの構築
-            prompt = await self.prompt_builder.build_post_event_prompt(event)
-            
-            # OpenAI API呼び出し
-            ai_response = await self.openai_client.generate_text(prompt)
-            
-            if not ai_response:
-                raise Exception("OpenAI APIからの応答が空です")
-            
-            # 予測データの解析
-            prediction_data = await self.prediction_parser.parse_prediction_data(ai_response)
-            
-            # 信頼度スコアの計算
-            confidence_score = await self.confidence_calculator.calculate_confidence(
-                event, prediction_data
-            )
-            
-            # USD/JPY予測オブジェクトの作成
-            usd_jpy_prediction = USDJPYPrediction(
-                direction=prediction_data.get("direction", "neutral"),
-                strength=prediction_data.get("strength", 0.0),
-                timeframe=prediction_data.get("timeframe", "1-4 hours"),
-                confidence_score=confidence_score,
-                reasons=prediction_data.get("reasons", []),
-                technical_factors=prediction_data.get("technical_factors", []),
-                fundamental_factors=prediction_data.get("fundamental_factors", []),
-                risk_factors=prediction_data.get("risk_factors", [])
-            )
-            
-            # レポートの生成
-            report_content = await self.report_generator.generate_post_event_content(
-                event, usd_jpy_prediction, ai_response
-            )
-            
-            # AIReportオブジェクトの作成
-            ai_report = AIReport(
-                event_id=event.event_id,
-                report_type="post_event",
-                report_content=report_content,
-                usd_jpy_prediction=usd_jpy_prediction,
-                confidence_score=confidence_score,
-                generated_at=datetime.utcnow()
-            )
-            
-            # 統計更新
-            self._successful_analyses += 1
-            self._total_confidence_score += confidence_score
-            
-            self.logger.info(
-                f"事後レポート生成完了: {event.event_id}, "
-                f"信頼度: {confidence_score:.2f}"
-            )
-            
-            return ai_report
+            return await self._build_post_event_report(event)
 
         except Exception as e:
             self.logger.error(f"事後レポート生成エラー: {e}")
             # エラー時のフォールバックレポート
             return await self._create_fallback_report(event, "post_event", str(e))
 
+    async def _build_post_event_report(self, event: EconomicEvent) -> AIReport:
+        """事後レポート生成（失敗時は例外を送出）"""
+        self.logger.info(f"事後レポート生成開始: {event.event_id}")
+        self._analysis_count += 1
+
+        # プロンプトの構築
+        prompt = await self.prompt_builder.build_post_event_prompt(event)
+
+        # OpenAI API呼び出し
+        ai_response = await self.openai_client.generate_text(prompt)
+
+        if not ai_response:
+            raise Exception("OpenAI APIからの応答が空です")
+
+        # 予測データの解析
+        prediction_data = await self.prediction_parser.parse_prediction_data(
+            ai_response
+        )
+
+        # 信頼度スコアの計算
+        confidence_score = await self.confidence_calculator.calculate_confidence(
+            event, prediction_data
+        )
+
+        # USD/JPY予測オブジェクトの作成
+        usd_jpy_prediction = USDJPYPrediction(
+            direction=prediction_data.get("direction", "neutral"),
+            strength=prediction_data.get("strength", 0.0),
+            timeframe=prediction_data.get("timeframe", "1-4 hours"),
+            confidence_score=confidence_score,
+            reasons=prediction_data.get("reasons", []),
+            technical_factors=prediction_data.get("technical_factors", []),
+            fundamental_factors=prediction_data.get("fundamental_factors", []),
+            risk_factors=prediction_data.get("risk_factors", [])
+        )
+
+        # レポートの生成
+        report_content = await self.report_generator.generate_post_event_content(
+            event, usd_jpy_prediction, ai_response
+        )
+
+        # AIReportオブジェクトの作成
+        ai_report = AIReport(
+            event_id=event.event_id,
+            report_type="post_event",
+            report_content=report_content,
+            usd_jpy_prediction=usd_jpy_prediction,
+            confidence_score=confidence_score,
+            generated_at=datetime.utcnow()
+        )
+
+        # 統計更新
+        self._successful_analyses += 1
+        self._total_confidence_score += confidence_score
+
+        self.logger.info(
+            f"事後レポート生成完了: {event.event_id}, "
+            f"信頼度: {confidence_score:.2f}"
+        )
+
+        return ai_report
+
     async def generate_forecast_change_report(
         self, old_event: EconomicEvent, new_event: EconomicEvent
     ) -> AIReport:
@@ -283,7 +327,13 @@ class AIAnalysisService:
             return await self._create_fallback_report(new_event, "forecast_change", str(e))
 
     async def generate_bulk_reports(
-        self, events: List[EconomicEvent], report_type: str = "pre_event"
+        self,
+        events: List[EconomicEvent],
+        report_type: str = "pre_event",
+        on_report: Optional[Callable[[AIReport], Awaitable[None]]] = None,
+        find_existing: Optional[
+            Callable[[str], Awaitable[Optional[AIReport]]]
+        ] = None,
     ) -> List[AIReport]:
         """
         複数イベントの一括レポート生成
@@ -291,43 +341,149 @@ class AIAnalysisService:
         Args:
             events: 経済イベントリスト
             report_type: レポートタイプ
+            on_report: 新たに生成したレポートの完了時に呼び出すコールバック
+                （完了順。キャッシュや保存済みのレポートでは呼び出さない）
+            find_existing: content_hash で保存済みレポートを検索する関数
+                （例: AIReportRepository.find_by_content_hash）
             
         Returns:
-            List[AIReport]: 生成されたAIレポートのリスト
+            List[AIReport]: 生成されたAIレポートのリスト（イベント順）
         """
-        try:
-            self.logger.info(f"一括レポート生成開始: {len(events)}件, タイプ: {report_type}")
-            
-            reports = []
-            successful_count = 0
-            
-            for event in events:
+        if report_type not in ("pre_event", "post_event"):
+            self.logger.warning(f"不明なレポートタイプ: {report_type}")
+            return []
+
+        self.logger.info(
+            f"一括レポート生成開始: {len(events)}件, タイプ: {report_type}, "
+            f"同時実行数: {self.max_concurrency}"
+        )
+
+        async def generate(event: EconomicEvent) -> AIReport:
+            report, generated = await self._generate_cached_report(
+                event, report_type, find_existing
+            )
+            if generated and on_report is not None:
                 try:
+                    await on_report(report)
+                except Exception as e:
+                    self.logger.error(f"イベント {event.event_id} のレポート通知エラー: {e}")
+            return report
+
+        results = await asyncio.gather(
+            *(generate(event) for event in events), return_exceptions=True
+        )
+
+        reports = []
+        for event, result in zip(events, results):
+            if isinstance(result, BaseException):
+                self.logger.error(f"イベント {event.event_id} のレポート生成エラー: {result}")
+                continue
+            reports.append(result)
+
+        self.logger.info(f"一括レポート生成完了: {len(reports)}/{len(events)}件成功")
+        return reports
+
+    def _report_cache_key(self, event: EconomicEvent, report_type: str) -> str:
+        """レポートキャッシュのキー（入力が変わらなければ同じ値）"""
+        payload = json.dumps(
+            [
+                report_type,
+                event.event_id,
+                None if event.forecast_value is None else str(event.forecast_value),
+                None if event.actual_value is None else str(event.actual_value),
+                self.prompt_builder.TEMPLATE_VERSION,
+            ]
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def _generate_cached_report(
+        self,
+        event: EconomicEvent,
+        report_type: str,
+        find_existing: Optional[
+            Callable[[str], Awaitable[Optional[AIReport]]]
+        ] = None,
+    ) -> Tuple[AIReport, bool]:
+        """
+        キャッシュを使ったレポート生成
+
+        同じ内容のイベントはキャッシュ・実行中の生成結果・保存済みレポートを返す。
+        失敗時のフォールバックレポートはキャッシュしない。
+
+        Returns:
+            Tuple[AIReport, bool]: レポートと、この呼び出しで新たに生成したか
+                （False のレポートは保存・通知済み）
+        """
+        key = self._report_cache_key(event, report_type)
+        cached = self._report_cache.get(key)
+        if cached is not None:
+            self._report_cache.move_to_end(key)
+            self._cache_hits += 1
+            self.logger.debug(f"レポートキャッシュ使用: {event.event_id}")
+            return cached, False
+
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            self._cache_hits += 1
+            return await asyncio.shield(in_flight), False
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            existing = await self._find_existing_report(key, find_existing)
+            if existing is not None:
+                self._cache_hits += 1
+                self.logger.debug(f"保存済みレポート使用: {event.event_id}")
+                self._cache_report(key, existing)
+                future.set_result(existing)
+                return existing, False
+
+            try:
+                async with self._semaphore:
+                    if self._token_limiter is not None:
+                        await self._token_limiter.acquire(self._estimate_tokens())
                     if report_type == "pre_event":
-                        report = await self.generate_pre_event_report(event)
-                    elif report_type == "post_event":
-                        report = await self.generate_post_event_report(event)
+                        report = await self._build_pre_event_report(event)
                     else:
-                        self.logger.warning(f"不明なレポートタイプ: {report_type}")
-                        continue
-                    
-                    reports.append(report)
-                    successful_count += 1
-                    
-                except Exception as e:
-                    self.logger.error(f"イベント {event.event_id} のレポート生成エラー: {e}")
-                    # エラー時はスキップして続行
-                    continue
-            
-            self.logger.info(
-                f"一括レポート生成完了: {successful_count}/{len(events)}件成功"
-            )
-            
-            return reports
+                        report = await self._build_post_event_report(event)
+            except Exception as e:
+                self.logger.error(f"イベント {event.event_id} のレポート生成エラー: {e}")
+                report = await self._create_fallback_report(event, report_type, str(e))
+            else:
+                report.content_hash = key
+                self._cache_report(key, report)
+            future.set_result(report)
+            return report, True
+        except BaseException:
+            future.cancel()
+            raise
+        finally:
+            self._in_flight.pop(key, None)
 
+    async def _find_existing_report(
+        self,
+        key: str,
+        find_existing: Optional[Callable[[str], Awaitable[Optional[AIReport]]]],
+    ) -> Optional[AIReport]:
+        """保存済みレポートを検索（検索に失敗した場合は生成する）"""
+        if find_existing is None:
+            return None
+        try:
+            return await find_existing(key)
         except Exception as e:
-            self.logger.error(f"一括レポート生成エラー: {e}")
-            return []
+            self.logger.warning(f"保存済みレポートの検索エラー: {e}")
+            return None
+
+    def _cache_report(self, key: str, report: AIReport) -> None:
+        """レポートをキャッシュ（古いものから削除）"""
+        self._report_cache[key] = report
+        while len(self._report_cache) > self.report_cache_size:
+            self._report_cache.popitem(last=False)
+
+    def _estimate_tokens(self) -> int:
+        """1リクエストで消費するトークン数の見積もり（プロンプト + 出力上限）"""
+        max_tokens = getattr(self.openai_client, "max_tokens", 2000)
+        return PROMPT_TOKENS_ESTIMATE + int(max_tokens)
 
     async def analyze_market_sentiment(
         self, events: List[EconomicEvent]
@@ -440,6 +596,12 @@ class AIAnalysisService:
             "successful_analyses": self._successful_analyses,
             "success_rate": self._successful_analyses / max(1, self._analysis_count),
             "avg_confidence_score": avg_confidence,
+            "report_cache_size": len(self._report_cache),
+            "report_cache_hits": self._cache_hits,
+            "max_concurrency": self.max_concurrency,
+            "token_limiter": (
+                self._token_limiter.get_statistics() if self._token_limiter else None
+            ),
             "components": {
                 "prompt_builder": self.prompt_builder.get_stats(),
                 "prediction_parser": self.prediction_parser.get_stats(),
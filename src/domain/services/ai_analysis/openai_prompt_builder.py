@@ -18,6 +18,10 @@ class OpenAIPromptBuilder:
     ChatGPT用のプロンプトを構築する
     """
 
+    # プロンプトテンプレートのバージョン（テンプレート変更時に更新すると
+    # AIAnalysisService のレポートキャッシュが無効になる）
+    TEMPLATE_VERSION = "1"
+
     def __init__(self):
         """初期化"""
         self.logger = logging.getLogger(self.__class__.__name__)
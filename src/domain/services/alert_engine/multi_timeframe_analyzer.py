@@ -11,6 +11,7 @@ from typing import Dict, List, Optional, Any, Tuple
 from sqlalchemy import select, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.infrastructure.cache.bar_store import get_bar_store
 from src.infrastructure.database.models.technical_indicator_model import TechnicalIndicatorModel
 from src.infrastructure.database.models.entry_signal_model import EntrySignalModel
 
@@ -42,6 +43,7 @@ class MultiTimeframeAnalyzer:
         self.db_session = db_session
         self.currency_pair = "USD/JPY"
         self.timeframes = ["M5", "M15", "H1", "H4", "D1"]
+        self.bar_store = get_bar_store()
         
         # タイムフレーム重み付け（短時間軸ほど重みが高い）
         self.timeframe_weights = {
@@ -721,6 +723,13 @@ class MultiTimeframeAnalyzer:
                 if indicator.additional_data:
                     indicators_dict.update(indicator.additional_data)
 
+            # 現在価格は共有バーストアの最新バーから取得
+            latest_bar = await self.bar_store.get_latest_bar(
+                self.db_session, self.currency_pair, timeframe
+            )
+            if latest_bar:
+                indicators_dict["close"] = latest_bar["close"]
+
             return indicators_dict
 
         except Exception as e:
@@ -11,6 +11,7 @@ from typing import Any, Dict, List, Optional
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.infrastructure.cache.bar_store import get_bar_store
 from src.infrastructure.database.models.entry_signal_model import EntrySignalModel
 from src.infrastructure.database.models.technical_indicator_model import (
     TechnicalIndicatorModel,
@@ -42,6 +43,7 @@ class RSIEntryDetector:
         """
         self.db_session = db_session
         self.currency_pair = "USD/JPY"
+        self.bar_store = get_bar_store()
 
     async def detect_rsi_entry_signals(
         self, timeframe: str = "M5"
@@ -77,7 +79,7 @@ class RSIEntryDetector:
             return signals
 
         # 現在価格を取得
-        current_price = await self._get_current_price()
+        current_price = await self._get_current_price(timeframe)
         if not current_price:
             return signals
 
@@ -461,17 +463,21 @@ class RSIEntryDetector:
             print(f"Error getting latest indicators: {e}")
             return {}
 
-    async def _get_current_price(self) -> Optional[float]:
+    async def _get_current_price(self, timeframe: str = "M5") -> Optional[float]:
         """
         現在価格を取得
 
+        Args:
+            timeframe: タイムフレーム
+
         Returns:
-            Optional[float]: 現在価格
+            Optional[float]: 現在価格（共有バーストアの最新終値）
         """
         try:
-            # 最新の価格データを取得（簡易実装）
-            # 実際の実装では価格データテーブルから取得
-            return 150.000  # 仮の価格
+            latest_bar = await self.bar_store.get_latest_bar(
+                self.db_session, self.currency_pair, timeframe
+            )
+            return latest_bar["close"] if latest_bar else None
         except Exception as e:
             print(f"Error getting current price: {e}")
             return None
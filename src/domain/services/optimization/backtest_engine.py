@@ -6,12 +6,25 @@
 """
 
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Any, Callable, Dict, List, Optional, Union
 
 import numpy as np
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.domain.services.optimization.backtest_kernel import (
+    EXIT_REASONS,
+    BacktestArrays,
+    equity_returns,
+    max_drawdown,
+    run_backtest_kernel,
+    sharpe_ratio,
+)
+from src.domain.services.optimization.parameter_optimizer import (
+    SEARCH_STRATEGIES,
+    ParameterOptimizer,
+    SearchStrategy,
+)
 from src.infrastructure.database.models.technical_indicator_model import (
     TechnicalIndicatorModel,
 )
@@ -162,6 +175,9 @@ class BacktestEngine:
         """
         バックテストを実行
 
+        売買判定とポジション管理は配列ベースのカーネル（run_backtest_kernel）で
+        行い、取引記録とエクイティカーブを従来の辞書形式に展開する。
+
         Args:
             historical_data: 過去データ
             strategy_params: 戦略パラメータ
@@ -169,284 +185,69 @@ class BacktestEngine:
         Returns:
             Dict[str, Any]: バックテスト結果
         """
-        # デフォルトパラメータ
-        default_params = {
-            "rsi_oversold": 30,
-            "rsi_overbought": 70,
-            "volume_multiplier": 1.5,
-            "risk_reward_ratio": 2.0,
-            "max_position_size": 0.1,  # 10%
-        }
-
-        # パラメータをマージ
-        params = {**default_params, **strategy_params}
+        arrays = BacktestArrays.from_records(historical_data)
+        kernel = run_backtest_kernel(
+            arrays, strategy_params, self.initial_balance, self.commission_rate
+        )
+        timestamps = [data["timestamp"] for data in historical_data]
 
-        # バックテスト状態
-        current_balance = self.initial_balance
-        equity_curve = []
         trades = []
-        open_position = None
-
-        for i, data in enumerate(historical_data):
-            current_price = data["close"]
-            current_time = data["timestamp"]
-
-            # エクイティカーブを更新
-            equity_curve.append({
-                "timestamp": current_time,
-                "balance": current_balance,
-                "open_position_value": open_position["value"] if open_position else 0,
-                "total_equity": current_balance + (open_position["value"] if open_position else 0),
-            })
-
-            # オープンポジションのチェック
-            if open_position:
-                # 決済条件チェック
-                exit_signal = self._check_exit_conditions(
-                    open_position, data, params
-                )
-
-                if exit_signal:
-                    # ポジション決済
-                    exit_price = self._calculate_exit_price(
-                        open_position, data, exit_signal
-                    )
-                    
-                    # 損益計算
-                    pnl = self._calculate_pnl(
-                        open_position["type"], open_position["entry_price"], exit_price
-                    )
-                    
-                    # 手数料計算
-                    commission = (
-                        open_position["position_size"] * exit_price * self.commission_rate
-                    )
-                    
-                    net_pnl = pnl - commission
-                    current_balance += net_pnl
-
-                    # 取引記録
-                    trade = {
-                        "entry_time": open_position["entry_time"],
-                        "exit_time": current_time,
-                        "type": open_position["type"],
-                        "entry_price": open_position["entry_price"],
-                        "exit_price": exit_price,
-                        "position_size": open_position["position_size"],
-                        "pnl": pnl,
-                        "commission": commission,
-                        "net_pnl": net_pnl,
-                        "exit_reason": exit_signal,
-                        "duration_minutes": int(
-                            (current_time - open_position["entry_time"]).total_seconds() / 60
-                        ),
-                    }
-                    trades.append(trade)
-                    open_position = None
-
-            # 新規エントリーシグナルチェック
-            if not open_position and i > 20:  # 初期データをスキップ
-                entry_signal = self._check_entry_conditions(data, params)
-
-                if entry_signal:
-                    # ポジションサイズ計算
-                    position_size = self._calculate_position_size(
-                        current_balance, current_price, params
-                    )
-
-                    # オープンポジション作成
-                    open_position = {
-                        "type": entry_signal["type"],
-                        "entry_price": current_price,
-                        "entry_time": current_time,
-                        "position_size": position_size,
-                        "value": position_size * current_price,
-                        "stop_loss": entry_signal["stop_loss"],
-                        "take_profit": entry_signal["take_profit"],
-                    }
-
-        # 最後のポジションを決済
-        if open_position and historical_data:
-            last_data = historical_data[-1]
-            exit_price = last_data["close"]
-            
-            pnl = self._calculate_pnl(
-                open_position["type"], open_position["entry_price"], exit_price
-            )
-            commission = (
-                open_position["position_size"] * exit_price * self.commission_rate
-            )
-            net_pnl = pnl - commission
-            current_balance += net_pnl
-
-            trade = {
-                "entry_time": open_position["entry_time"],
-                "exit_time": last_data["timestamp"],
-                "type": open_position["type"],
-                "entry_price": open_position["entry_price"],
+        for (
+            entry, exit_at, is_buy, entry_price, exit_price,
+            size, pnl, commission, net_pnl, reason,
+        ) in zip(
+            kernel.entry_index.tolist(),
+            kernel.exit_index.tolist(),
+            kernel.is_buy.tolist(),
+            kernel.entry_price.tolist(),
+            kernel.exit_price.tolist(),
+            kernel.position_size.tolist(),
+            kernel.pnl.tolist(),
+            kernel.commission.tolist(),
+            kernel.net_pnl.tolist(),
+            kernel.exit_reason.tolist(),
+        ):
+            trades.append({
+                "entry_time": timestamps[entry],
+                "exit_time": timestamps[exit_at],
+                "type": "BUY" if is_buy else "SELL",
+                "entry_price": entry_price,
                 "exit_price": exit_price,
-                "position_size": open_position["position_size"],
+                "position_size": size,
                 "pnl": pnl,
                 "commission": commission,
                 "net_pnl": net_pnl,
-                "exit_reason": "end_of_period",
+                "exit_reason": EXIT_REASONS[reason],
                 "duration_minutes": int(
-                    (last_data["timestamp"] - open_position["entry_time"]).total_seconds() / 60
+                    (timestamps[exit_at] - timestamps[entry]).total_seconds() / 60
                 ),
+            })
+
+        equity_curve = [
+            {
+                "timestamp": timestamp,
+                "balance": balance,
+                "open_position_value": position_value,
+                "total_equity": total_equity,
             }
-            trades.append(trade)
+            for timestamp, balance, position_value, total_equity in zip(
+                timestamps,
+                kernel.balance.tolist(),
+                kernel.position_value.tolist(),
+                kernel.equity.tolist(),
+            )
+        ]
 
         return {
             "trades": trades,
             "equity_curve": equity_curve,
-            "final_balance": current_balance,
-            "total_return": ((current_balance - self.initial_balance) / self.initial_balance) * 100,
+            "equity": kernel.equity,
+            "final_balance": kernel.final_balance,
+            "total_return": (
+                (kernel.final_balance - self.initial_balance) / self.initial_balance
+            ) * 100,
         }
 
-    def _check_entry_conditions(
-        self, data: Dict[str, Any], params: Dict[str, Any]
-    ) -> Optional[Dict[str, Any]]:
-        """
-        エントリー条件をチェック
-
-        Args:
-            data: 市場データ
-            params: 戦略パラメータ
-
-        Returns:
-            Optional[Dict[str, Any]]: エントリーシグナル
-        """
-        rsi = data.get("RSI")
-        sma_20 = data.get("SMA_20")
-        macd_hist = data.get("MACD_histogram")
-        volume = data.get("volume")
-        current_price = data["close"]
-
-        if not all([rsi, sma_20, macd_hist, volume]):
-            return None
-
-        # 買いシグナル
-        if (
-            rsi < params["rsi_oversold"]
-            and current_price > sma_20
-            and macd_hist > 0
-        ):
-            stop_loss = sma_20 * 0.995
-            take_profit = current_price * (1 + params["risk_reward_ratio"] * 0.01)
-            
-            return {
-                "type": "BUY",
-                "stop_loss": stop_loss,
-                "take_profit": take_profit,
-                "confidence": 70,
-            }
-
-        # 売りシグナル
-        elif (
-            rsi > params["rsi_overbought"]
-            and current_price < sma_20
-            and macd_hist < 0
-        ):
-            stop_loss = sma_20 * 1.005
-            take_profit = current_price * (1 - params["risk_reward_ratio"] * 0.01)
-            
-            return {
-                "type": "SELL",
-                "stop_loss": stop_loss,
-                "take_profit": take_profit,
-                "confidence": 70,
-            }
-
-        return None
-
-    def _check_exit_conditions(
-        self, position: Dict[str, Any], data: Dict[str, Any], params: Dict[str, Any]
-    ) -> Optional[str]:
-        """
-        決済条件をチェック
-
-        Args:
-            position: オープンポジション
-            data: 市場データ
-            params: 戦略パラメータ
-
-        Returns:
-            Optional[str]: 決済理由
-        """
-        current_price = data["close"]
-        position_type = position["type"]
-
-        # ストップロス
-        if position_type == "BUY" and current_price <= position["stop_loss"]:
-            return "stop_loss"
-        elif position_type == "SELL" and current_price >= position["stop_loss"]:
-            return "stop_loss"
-
-        # 利益確定
-        if position_type == "BUY" and current_price >= position["take_profit"]:
-            return "take_profit"
-        elif position_type == "SELL" and current_price <= position["take_profit"]:
-            return "take_profit"
-
-        return None
-
-    def _calculate_exit_price(
-        self, position: Dict[str, Any], data: Dict[str, Any], exit_reason: str
-    ) -> float:
-        """
-        決済価格を計算
-
-        Args:
-            position: オープンポジション
-            data: 市場データ
-            exit_reason: 決済理由
-
-        Returns:
-            float: 決済価格
-        """
-        if exit_reason == "stop_loss":
-            return position["stop_loss"]
-        elif exit_reason == "take_profit":
-            return position["take_profit"]
-        else:
-            return data["close"]
-
-    def _calculate_position_size(
-        self, balance: float, price: float, params: Dict[str, Any]
-    ) -> float:
-        """
-        ポジションサイズを計算
-
-        Args:
-            balance: 現在の残高
-            price: 現在価格
-            params: 戦略パラメータ
-
-        Returns:
-            float: ポジションサイズ
-        """
-        max_size = balance * params["max_position_size"]
-        return max_size / price
-
-    def _calculate_pnl(self, position_type: str, entry_price: float, exit_price: float) -> float:
-        """
-        損益を計算
-
-        Args:
-            position_type: ポジションタイプ
-            entry_price: エントリー価格
-            exit_price: 決済価格
-
-        Returns:
-            float: 損益
-        """
-        if position_type == "BUY":
-            return exit_price - entry_price
-        elif position_type == "SELL":
-            return entry_price - exit_price
-        else:
-            return 0.0
-
     def _analyze_backtest_results(self, results: Dict[str, Any]) -> Dict[str, Any]:
         """
         バックテスト結果を分析
@@ -476,10 +277,10 @@ class BacktestEngine:
         max_loss = min(t["net_pnl"] for t in trades) if trades else 0
 
         # ドローダウン計算
-        max_drawdown = self._calculate_max_drawdown(equity_curve)
+        max_drawdown = self._calculate_max_drawdown(results.get("equity", equity_curve))
 
         # シャープレシオ計算
-        returns = self._calculate_returns(equity_curve)
+        returns = self._calculate_returns(results.get("equity", equity_curve))
         sharpe_ratio = self._calculate_sharpe_ratio(returns)
 
         return {
@@ -518,7 +319,9 @@ class BacktestEngine:
         monthly_returns = self._calculate_monthly_returns(trades)
 
         # ボラティリティ
-        returns = self._calculate_returns(results["equity_curve"])
+        returns = self._calculate_returns(
+            results.get("equity", results["equity_curve"])
+        )
         volatility = np.std(returns) * np.sqrt(252) if len(returns) > 1 else 0
 
         # 最大連続損失
@@ -538,72 +341,65 @@ class BacktestEngine:
             "profit_factor": profit_factor,
         }
 
-    def _calculate_max_drawdown(self, equity_curve: List[Dict[str, Any]]) -> float:
+    def _equity_array(
+        self, equity_curve: Union[np.ndarray, List[Dict[str, Any]]]
+    ) -> np.ndarray:
         """
-        最大ドローダウンを計算
+        エクイティカーブを配列に変換
 
         Args:
-            equity_curve: エクイティカーブ
+            equity_curve: エクイティ配列またはエクイティカーブ
 
         Returns:
-            float: 最大ドローダウン
+            np.ndarray: エクイティ配列
+        """
+        if isinstance(equity_curve, np.ndarray):
+            return equity_curve
+        return np.fromiter(
+            (point["total_equity"] for point in equity_curve),
+            dtype=np.float64,
+            count=len(equity_curve),
+        )
+
+    def _calculate_max_drawdown(
+        self, equity_curve: Union[np.ndarray, List[Dict[str, Any]]]
+    ) -> float:
         """
-        if not equity_curve:
-            return 0.0
-
-        peak = equity_curve[0]["total_equity"]
-        max_drawdown = 0.0
+        最大ドローダウンを計算
 
-        for point in equity_curve:
-            equity = point["total_equity"]
-            if equity > peak:
-                peak = equity
-            else:
-                drawdown = (peak - equity) / peak * 100
-                max_drawdown = max(max_drawdown, drawdown)
+        Args:
+            equity_curve: エクイティ配列またはエクイティカーブ
 
-        return max_drawdown
+        Returns:
+            float: 最大ドローダウン
+        """
+        return max_drawdown(self._equity_array(equity_curve))
 
-    def _calculate_returns(self, equity_curve: List[Dict[str, Any]]) -> List[float]:
+    def _calculate_returns(
+        self, equity_curve: Union[np.ndarray, List[Dict[str, Any]]]
+    ) -> np.ndarray:
         """
         リターンを計算
 
         Args:
-            equity_curve: エクイティカーブ
+            equity_curve: エクイティ配列またはエクイティカーブ
 
         Returns:
-            List[float]: リターンリスト
+            np.ndarray: リターン配列
         """
-        returns = []
-        for i in range(1, len(equity_curve)):
-            prev_equity = equity_curve[i-1]["total_equity"]
-            curr_equity = equity_curve[i]["total_equity"]
-            if prev_equity > 0:
-                ret = (curr_equity - prev_equity) / prev_equity
-                returns.append(ret)
-        return returns
-
-    def _calculate_sharpe_ratio(self, returns: List[float]) -> float:
+        return equity_returns(self._equity_array(equity_curve))
+
+    def _calculate_sharpe_ratio(self, returns: np.ndarray) -> float:
         """
         シャープレシオを計算
 
         Args:
-            returns: リターンリスト
+            returns: リターン配列
 
         Returns:
             float: シャープレシオ
         """
-        if len(returns) < 2:
-            return 0.0
-
-        avg_return = np.mean(returns)
-        std_return = np.std(returns)
-        risk_free_rate = 0.02 / 252  # 年2%を日次に変換
-
-        if std_return > 0:
-            return (avg_return - risk_free_rate) / std_return * np.sqrt(252)
-        else:
-            return 0.0
+        return sharpe_ratio(np.asarray(returns, dtype=np.float64))
 
     def _calculate_monthly_returns(self, trades: List[Dict[str, Any]]) -> Dict[str, float]:
         """
@@ -653,15 +449,29 @@ class BacktestEngine:
         end_date: datetime,
         timeframe: str = "H1",
         param_ranges: Optional[Dict[str, List[Any]]] = None,
+        search: Union[str, SearchStrategy] = "grid",
+        max_workers: Optional[int] = None,
+        early_stopping_rounds: Optional[int] = None,
+        on_result: Optional[Callable[[Dict[str, Any]], None]] = None,
+        **search_options: Any,
     ) -> Dict[str, Any]:
         """
         パラメータ最適化を実行
 
+        過去データは一度だけ読み込み、各パラメータセットのバックテストは
+        ParameterOptimizer がプロセスプールで並列に評価する。
+
         Args:
             start_date: 開始日
             end_date: 終了日
             timeframe: タイムフレーム
             param_ranges: パラメータ範囲
+            search: 探索戦略（"grid", "random", "successive_halving" または
+                SearchStrategy インスタンス）
+            max_workers: ワーカープロセス数（1で逐次実行）
+            early_stopping_rounds: 最良値がこの件数続けて更新されなければ打ち切る
+            on_result: 評価結果ごとに呼び出すコールバック
+            **search_options: 探索戦略の引数（n_iter, eta, seed など）
 
         Returns:
             Dict[str, Any]: 最適化結果
@@ -676,50 +486,37 @@ class BacktestEngine:
         }
 
         ranges = param_ranges or default_ranges
-        best_result = None
-        best_sharpe = -999
-        optimization_results = []
-
-        # グリッドサーチ
-        for rsi_oversold in ranges["rsi_oversold"]:
-            for rsi_overbought in ranges["rsi_overbought"]:
-                for volume_multiplier in ranges["volume_multiplier"]:
-                    for risk_reward_ratio in ranges["risk_reward_ratio"]:
-                        for max_position_size in ranges["max_position_size"]:
-                            params = {
-                                "rsi_oversold": rsi_oversold,
-                                "rsi_overbought": rsi_overbought,
-                                "volume_multiplier": volume_multiplier,
-                                "risk_reward_ratio": risk_reward_ratio,
-                                "max_position_size": max_position_size,
-                            }
-
-                            # バックテスト実行
-                            result = await self.run_backtest(
-                                start_date, end_date, timeframe, params
-                            )
-
-                            if "error" not in result:
-                                analysis = result.get("analysis", {})
-                                sharpe_ratio = analysis.get("sharpe_ratio", 0)
-
-                                optimization_results.append({
-                                    "params": params,
-                                    "sharpe_ratio": sharpe_ratio,
-                                    "total_return": result.get("total_return", 0),
-                                    "max_drawdown": analysis.get("max_drawdown", 0),
-                                })
-
-                                if sharpe_ratio > best_sharpe:
-                                    best_sharpe = sharpe_ratio
-                                    best_result = {
-                                        "params": params,
-                                        "result": result,
-                                    }
 
-        return {
-            "best_parameters": best_result["params"] if best_result else {},
-            "best_sharpe_ratio": best_sharpe,
-            "optimization_results": optimization_results,
-            "total_combinations": len(optimization_results),
-        }
+        try:
+            historical_data = await self._get_historical_data(
+                start_date, end_date, timeframe
+            )
+            if not historical_data:
+                return {
+                    "best_parameters": {},
+                    "best_sharpe_ratio": -999,
+                    "optimization_results": [],
+                    "total_combinations": 0,
+                }
+
+            strategy = (
+                search
+                if isinstance(search, SearchStrategy)
+                else SEARCH_STRATEGIES[search](**search_options)
+            )
+            optimizer = ParameterOptimizer(
+                BacktestArrays.from_records(historical_data),
+                initial_balance=self.initial_balance,
+                commission_rate=self.commission_rate,
+                max_workers=max_workers,
+            )
+            return await optimizer.optimize(
+                ranges,
+                strategy=strategy,
+                early_stopping_rounds=early_stopping_rounds,
+                on_result=on_result,
+            )
+
+        except Exception as e:
+            print(f"Error optimizing parameters: {e}")
+            return {"error": str(e)}
@@ -0,0 +1,399 @@
+"""
+バックテストカーネル
+
+プロトレーダー向け為替アラートシステム用の配列ベースのバックテスト計算
+設計書参照: /app/note/2025-01-15_実装計画_Phase3_パフォーマンス最適化.yaml
+
+BacktestEngine の売買ルールを NumPy 配列上で実行する。
+- エントリー条件は指標列からベクトル演算でマスク化
+- ポジション管理はエントリー/決済イベント間をジャンプするループで処理し、
+  取引記録は事前確保した配列に書き込む
+- エクイティ・ドローダウン・リターン・シャープレシオは累積配列演算で算出
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Sequence
+
+import numpy as np
+
+# エントリーを許可する最小バー（初期データをスキップ）
+MIN_ENTRY_INDEX = 21
+
+DEFAULT_STRATEGY_PARAMS = {
+    "rsi_oversold": 30,
+    "rsi_overbought": 70,
+    "volume_multiplier": 1.5,
+    "risk_reward_ratio": 2.0,
+    "max_position_size": 0.1,  # 10%
+}
+
+# 決済理由コード
+EXIT_STOP_LOSS = 0
+EXIT_TAKE_PROFIT = 1
+EXIT_END_OF_PERIOD = 2
+EXIT_REASONS = ("stop_loss", "take_profit", "end_of_period")
+
+RISK_FREE_RATE = 0.02 / 252  # 年2%を日次に変換
+
+
+@dataclass
+class BacktestArrays:
+    """
+    バックテスト用の列指向データ
+
+    欠損値は NaN で保持し、欠損・ゼロの指標をエントリー不可として扱う。
+    """
+
+    close: np.ndarray
+    rsi: np.ndarray
+    sma_20: np.ndarray
+    macd_histogram: np.ndarray
+    volume: np.ndarray
+    valid: np.ndarray = field(init=False)
+
+    def __post_init__(self) -> None:
+        valid = np.ones(len(self.close), dtype=bool)
+        for values in (self.rsi, self.sma_20, self.macd_histogram, self.volume):
+            valid &= ~np.isnan(values) & (values != 0)
+        self.valid = valid
+
+    def __len__(self) -> int:
+        return len(self.close)
+
+    @classmethod
+    def from_records(
+        cls, historical_data: Sequence[Dict[str, Any]]
+    ) -> "BacktestArrays":
+        """
+        BacktestEngine._get_historical_data の結果から作成
+
+        Args:
+            historical_data: 過去データ
+
+        Returns:
+            BacktestArrays: 列指向データ
+        """
+
+        def column(name: str) -> np.ndarray:
+            return np.array(
+                [
+                    np.nan if row.get(name) is None else float(row[name])
+                    for row in historical_data
+                ],
+                dtype=np.float64,
+            )
+
+        return cls(
+            close=column("close"),
+            rsi=column("RSI"),
+            sma_20=column("SMA_20"),
+            macd_histogram=column("MACD_histogram"),
+            volume=column("volume"),
+        )
+
+    def head(self, length: int) -> "BacktestArrays":
+        """
+        先頭 length 本のビューを作成
+
+        Args:
+            length: バー数
+
+        Returns:
+            BacktestArrays: 先頭部分
+        """
+        return BacktestArrays(
+            close=self.close[:length],
+            rsi=self.rsi[:length],
+            sma_20=self.sma_20[:length],
+            macd_histogram=self.macd_histogram[:length],
+            volume=self.volume[:length],
+        )
+
+
+@dataclass
+class KernelResult:
+    """
+    バックテストカーネルの結果
+
+    取引は1取引1要素の配列、エクイティはバー単位の配列で保持する。
+    """
+
+    entry_index: np.ndarray
+    exit_index: np.ndarray
+    is_buy: np.ndarray
+    entry_price: np.ndarray
+    exit_price: np.ndarray
+    position_size: np.ndarray
+    pnl: np.ndarray
+    commission: np.ndarray
+    net_pnl: np.ndarray
+    exit_reason: np.ndarray
+    balance: np.ndarray
+    position_value: np.ndarray
+    equity: np.ndarray
+    final_balance: float
+
+    @property
+    def total_trades(self) -> int:
+        return len(self.entry_index)
+
+
+def entry_masks(arrays: BacktestArrays, params: Dict[str, Any]):
+    """
+    エントリー条件をベクトル演算でマスク化
+
+    Args:
+        arrays: 列指向データ
+        params: 戦略パラメータ
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (買いマスク, 売りマスク)
+    """
+    close, sma_20, macd_histogram = arrays.close, arrays.sma_20, arrays.macd_histogram
+    buy = (
+        arrays.valid
+        & (arrays.rsi < params["rsi_oversold"])
+        & (close > sma_20)
+        & (macd_histogram > 0)
+    )
+    sell = (
+        arrays.valid
+        & ~buy
+        & (arrays.rsi > params["rsi_overbought"])
+        & (close < sma_20)
+        & (macd_histogram < 0)
+    )
+    buy[:MIN_ENTRY_INDEX] = False
+    sell[:MIN_ENTRY_INDEX] = False
+    return buy, sell
+
+
+def _first_exit(
+    close: np.ndarray, start: int, stop_loss: float, take_profit: float, is_buy: bool
+) -> int:
+    """
+    start 以降で最初に決済条件を満たすバーを探索（見つからなければ -1）
+
+    保有期間は通常短いため、窓を倍々に広げながら探索する。
+    """
+    n = len(close)
+    window = 64
+    while start < n:
+        segment = close[start : start + window]
+        if is_buy:
+            hit = (segment <= stop_loss) | (segment >= take_profit)
+        else:
+            hit = (segment >= stop_loss) | (segment <= take_profit)
+        if hit.any():
+            return start + int(hit.argmax())
+        start += window
+        window *= 2
+    return -1
+
+
+def run_backtest_kernel(
+    arrays: BacktestArrays,
+    params: Dict[str, Any],
+    initial_balance: float = 10000.0,
+    commission_rate: float = 0.0001,
+) -> KernelResult:
+    """
+    バックテストを実行
+
+    Args:
+        arrays: 列指向データ
+        params: 戦略パラメータ（未指定の項目はデフォルト値）
+        initial_balance: 初期資金
+        commission_rate: 手数料率
+
+    Returns:
+        KernelResult: 取引配列とエクイティ配列
+    """
+    params = {**DEFAULT_STRATEGY_PARAMS, **params}
+    close, sma_20 = arrays.close, arrays.sma_20
+    n = len(close)
+
+    buy, sell = entry_masks(arrays, params)
+    entries = np.flatnonzero(buy | sell)
+
+    # 取引数はエントリー候補数を超えないため、その長さで事前確保する
+    capacity = len(entries)
+    entry_index = np.empty(capacity, dtype=np.int64)
+    exit_index = np.empty(capacity, dtype=np.int64)
+    is_buy_arr = np.empty(capacity, dtype=bool)
+    entry_price_arr = np.empty(capacity, dtype=np.float64)
+    exit_price_arr = np.empty(capacity, dtype=np.float64)
+    size_arr = np.empty(capacity, dtype=np.float64)
+    pnl_arr = np.empty(capacity, dtype=np.float64)
+    commission_arr = np.empty(capacity, dtype=np.float64)
+    net_pnl_arr = np.empty(capacity, dtype=np.float64)
+    reason_arr = np.empty(capacity, dtype=np.int8)
+
+    position_value = np.zeros(n, dtype=np.float64)
+    balance_change = np.zeros(n + 1, dtype=np.float64)
+    balance_change[0] = initial_balance
+
+    risk_reward = params["risk_reward_ratio"] * 0.01
+    max_position_size = params["max_position_size"]
+    balance = initial_balance
+    trades = 0
+    k = 0
+
+    while k < capacity:
+        entry = int(entries[k])
+        is_buy = bool(buy[entry])
+        entry_price = float(close[entry])
+        if is_buy:
+            stop_loss = float(sma_20[entry]) * 0.995
+            take_profit = entry_price * (1 + risk_reward)
+        else:
+            stop_loss = float(sma_20[entry]) * 1.005
+            take_profit = entry_price * (1 - risk_reward)
+        position_size = balance * max_position_size / entry_price
+        value = position_size * entry_price
+
+        exit_at = _first_exit(close, entry + 1, stop_loss, take_profit, is_buy)
+        if exit_at < 0:
+            exit_at = n - 1
+            exit_price = float(close[-1])
+            reason = EXIT_END_OF_PERIOD
+        else:
+            price = close[exit_at]
+            stopped = price <= stop_loss if is_buy else price >= stop_loss
+            exit_price = stop_loss if stopped else take_profit
+            reason = EXIT_STOP_LOSS if stopped else EXIT_TAKE_PROFIT
+
+        pnl = exit_price - entry_price if is_buy else entry_price - exit_price
+        commission = position_size * exit_price * commission_rate
+        net_pnl = pnl - commission
+        balance += net_pnl
+
+        entry_index[trades] = entry
+        exit_index[trades] = exit_at
+        is_buy_arr[trades] = is_buy
+        entry_price_arr[trades] = entry_price
+        exit_price_arr[trades] = exit_price
+        size_arr[trades] = position_size
+        pnl_arr[trades] = pnl
+        commission_arr[trades] = commission
+        net_pnl_arr[trades] = net_pnl
+        reason_arr[trades] = reason
+        trades += 1
+
+        # エクイティはバー処理前に記録されるため、保有はエントリー翌バーから
+        # 決済バーまで、残高の変化は決済バーの翌バーから反映される
+        position_value[entry + 1 : exit_at + 1] += value
+        balance_change[exit_at + 1] += net_pnl
+
+        if reason == EXIT_END_OF_PERIOD:
+            break
+        # 決済したバーで再エントリー可能
+        k = int(np.searchsorted(entries, exit_at))
+
+    balance_curve = np.cumsum(balance_change[:n])
+    return KernelResult(
+        entry_index=entry_index[:trades],
+        exit_index=exit_index[:trades],
+        is_buy=is_buy_arr[:trades],
+        entry_price=entry_price_arr[:trades],
+        exit_price=exit_price_arr[:trades],
+        position_size=size_arr[:trades],
+        pnl=pnl_arr[:trades],
+        commission=commission_arr[:trades],
+        net_pnl=net_pnl_arr[:trades],
+        exit_reason=reason_arr[:trades],
+        balance=balance_curve,
+        position_value=position_value,
+        equity=balance_curve + position_value,
+        final_balance=balance,
+    )
+
+
+def max_drawdown(equity: np.ndarray) -> float:
+    """
+    最大ドローダウン（%）を計算
+
+    Args:
+        equity: エクイティ配列
+
+    Returns:
+        float: 最大ドローダウン
+    """
+    if len(equity) == 0:
+        return 0.0
+    peak = np.maximum.accumulate(equity)
+    return float(np.max((peak - equity) / peak * 100))
+
+
+def equity_returns(equity: np.ndarray) -> np.ndarray:
+    """
+    バー間リターンを計算（直前のエクイティが正のバーのみ）
+
+    Args:
+        equity: エクイティ配列
+
+    Returns:
+        np.ndarray: リターン配列
+    """
+    previous = equity[:-1]
+    positive = previous > 0
+    return (equity[1:][positive] - previous[positive]) / previous[positive]
+
+
+def sharpe_ratio(returns: np.ndarray) -> float:
+    """
+    シャープレシオを計算
+
+    Args:
+        returns: リターン配列
+
+    Returns:
+        float: シャープレシオ
+    """
+    if len(returns) < 2:
+        return 0.0
+    std_return = np.std(returns)
+    if std_return > 0:
+        return float((np.mean(returns) - RISK_FREE_RATE) / std_return * np.sqrt(252))
+    return 0.0
+
+
+def simulate_backtest(
+    arrays: BacktestArrays,
+    params: Dict[str, Any],
+    initial_balance: float = 10000.0,
+    commission_rate: float = 0.0001,
+) -> Dict[str, Any]:
+    """
+    パラメータセット1件のバックテスト指標を計算
+
+    Args:
+        arrays: 列指向データ
+        params: 戦略パラメータ
+        initial_balance: 初期資金
+        commission_rate: 手数料率
+
+    Returns:
+        Dict[str, Any]: sharpe_ratio, total_return, max_drawdown, total_trades,
+        final_balance
+    """
+    result = run_backtest_kernel(arrays, params, initial_balance, commission_rate)
+    total_return = (result.final_balance - initial_balance) / initial_balance * 100
+
+    # 取引がない場合は BacktestEngine の分析結果と同様に指標を0とする
+    if result.total_trades == 0:
+        return {
+            "sharpe_ratio": 0.0,
+            "total_return": total_return,
+            "max_drawdown": 0.0,
+            "total_trades": 0,
+            "final_balance": result.final_balance,
+        }
+
+    return {
+        "sharpe_ratio": sharpe_ratio(equity_returns(result.equity)),
+        "total_return": total_return,
+        "max_drawdown": max_drawdown(result.equity),
+        "total_trades": result.total_trades,
+        "final_balance": result.final_balance,
+    }
@@ -0,0 +1,370 @@
+"""
+パラメータ最適化エンジン
+
+BacktestEngine.optimize_parameters 用の並列パラメータ探索
+設計書参照: /app/note/2025-01-15_実装計画_Phase3_パフォーマンス最適化.yaml
+
+過去データを一度だけ NumPy 配列に読み込み、各パラメータセットの
+バックテスト（backtest_kernel）をプロセスプールへ分散する。
+"""
+
+import asyncio
+import itertools
+import math
+import os
+import random
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Generator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from src.domain.services.optimization.backtest_kernel import (
+    BacktestArrays,
+    simulate_backtest,
+)
+
+Trial = Tuple[Dict[str, Any], float]
+SearchGenerator = Generator[List[Trial], List[Dict[str, Any]], None]
+
+# ワーカープロセスごとに一度だけ受け取る過去データ
+_worker_state: Dict[str, Any] = {}
+
+
+def _init_worker(
+    arrays: BacktestArrays, initial_balance: float, commission_rate: float
+) -> None:
+    _worker_state["arrays"] = arrays
+    _worker_state["initial_balance"] = initial_balance
+    _worker_state["commission_rate"] = commission_rate
+
+
+def _evaluate_chunk(trials: List[Trial]) -> List[Dict[str, Any]]:
+    arrays: BacktestArrays = _worker_state["arrays"]
+    results = []
+    for params, budget in trials:
+        data = arrays
+        if budget < 1.0:
+            data = arrays.head(max(1, int(len(arrays) * budget)))
+        metrics = simulate_backtest(
+            data,
+            params,
+            _worker_state["initial_balance"],
+            _worker_state["commission_rate"],
+        )
+        results.append({"params": params, "budget": budget, **metrics})
+    return results
+
+
+class SearchStrategy(ABC):
+    """
+    探索戦略の基底クラス
+
+    rounds() はパラメータセットと予算（使用するデータの割合）の組を
+    ラウンド単位で yield し、send() でそのラウンドの評価結果を受け取る。
+    """
+
+    name = "base"
+
+    @abstractmethod
+    def rounds(self, param_ranges: Dict[str, List[Any]]) -> SearchGenerator:
+        """
+        評価するパラメータセットをラウンド単位で生成
+
+        Args:
+            param_ranges: パラメータ範囲
+
+        Returns:
+            SearchGenerator: (パラメータセット, 予算) のリストを yield し、
+                send() でそのラウンドの評価結果を受け取るジェネレーター
+        """
+
+    @staticmethod
+    def _grid(param_ranges: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+        keys = list(param_ranges)
+        return [
+            dict(zip(keys, values))
+            for values in itertools.product(*(param_ranges[key] for key in keys))
+        ]
+
+
+class GridSearch(SearchStrategy):
+    """全組み合わせを評価するグリッドサーチ"""
+
+    name = "grid"
+
+    def rounds(self, param_ranges: Dict[str, List[Any]]) -> SearchGenerator:
+        yield [(params, 1.0) for params in self._grid(param_ranges)]
+
+
+class RandomSearch(SearchStrategy):
+    """組み合わせから重複なしで n_iter 件を抽出するランダムサーチ"""
+
+    name = "random"
+
+    def __init__(self, n_iter: int = 100, seed: Optional[int] = None):
+        """
+        初期化
+
+        Args:
+            n_iter: 評価件数
+            seed: 乱数シード
+        """
+        self.n_iter = n_iter
+        self.seed = seed
+
+    def rounds(self, param_ranges: Dict[str, List[Any]]) -> SearchGenerator:
+        grid = self._grid(param_ranges)
+        sample = random.Random(self.seed).sample(grid, min(self.n_iter, len(grid)))
+        yield [(params, 1.0) for params in sample]
+
+
+class SuccessiveHalvingSearch(SearchStrategy):
+    """
+    逐次半減探索
+
+    全候補をデータの一部で評価し、上位 1/eta を残して予算を eta 倍にする
+    ことを全データに達するまで繰り返す。
+    """
+
+    name = "successive_halving"
+
+    def __init__(
+        self,
+        n_candidates: Optional[int] = None,
+        eta: int = 3,
+        min_budget: float = 0.25,
+        seed: Optional[int] = None,
+    ):
+        """
+        初期化
+
+        Args:
+            n_candidates: 初期候補数（Noneで全組み合わせ）
+            eta: 各ラウンドで残す割合の逆数
+            min_budget: 初回ラウンドで使うデータの割合
+            seed: 乱数シード
+        """
+        self.n_candidates = n_candidates
+        self.eta = max(2, eta)
+        self.min_budget = min(max(min_budget, 0.01), 1.0)
+        self.seed = seed
+
+    def rounds(self, param_ranges: Dict[str, List[Any]]) -> SearchGenerator:
+        candidates = self._grid(param_ranges)
+        if self.n_candidates and self.n_candidates < len(candidates):
+            candidates = random.Random(self.seed).sample(candidates, self.n_candidates)
+
+        budget = self.min_budget
+        while candidates:
+            results = yield [(params, budget) for params in candidates]
+            if budget >= 1.0 or len(candidates) <= 1:
+                return
+            ranked = sorted(
+                results or [], key=lambda r: r["sharpe_ratio"], reverse=True
+            )
+            keep = max(1, len(ranked) // self.eta)
+            candidates = [r["params"] for r in ranked[:keep]]
+            budget = min(1.0, budget * self.eta)
+
+
+SEARCH_STRATEGIES: Dict[str, Callable[..., SearchStrategy]] = {
+    GridSearch.name: GridSearch,
+    RandomSearch.name: RandomSearch,
+    SuccessiveHalvingSearch.name: SuccessiveHalvingSearch,
+}
+
+
+class ParameterOptimizer:
+    """
+    並列パラメータ最適化
+
+    責任:
+    - 過去データの一括読み込み結果（BacktestArrays）の共有
+    - パラメータセットのプロセスプールへの分散
+    - 結果のストリーミングと早期終了
+
+    特徴:
+    - グリッド・ランダム・逐次半減探索の差し替え
+    - ワーカーへのデータ転送はプール生成時の1回のみ
+    """
+
+    def __init__(
+        self,
+        arrays: BacktestArrays,
+        initial_balance: float = 10000.0,
+        commission_rate: float = 0.0001,
+        max_workers: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+    ):
+        """
+        初期化
+
+        Args:
+            arrays: 列指向の過去データ
+            initial_balance: 初期資金
+            commission_rate: 手数料率
+            max_workers: ワーカープロセス数（1でプロセスを使わず逐次実行）
+            chunk_size: 1タスクあたりのパラメータセット数（Noneで自動）
+        """
+        self.arrays = arrays
+        self.initial_balance = initial_balance
+        self.commission_rate = commission_rate
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+        self.stopped_early = False
+
+    def _chunks(self, trials: List[Trial], workers: int) -> List[List[Trial]]:
+        size = self.chunk_size or max(1, math.ceil(len(trials) / (workers * 4)))
+        return [trials[i : i + size] for i in range(0, len(trials), size)]
+
+    async def stream(
+        self,
+        param_ranges: Dict[str, List[Any]],
+        strategy: Optional[SearchStrategy] = None,
+        early_stopping_rounds: Optional[int] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        評価結果を完了順に返す
+
+        Args:
+            param_ranges: パラメータ範囲
+            strategy: 探索戦略（Noneでグリッドサーチ）
+            early_stopping_rounds: 全データでの評価がこの件数続けて最良値を
+                更新しなければ打ち切る
+
+        Yields:
+            Dict[str, Any]: params, budget と各指標
+        """
+        strategy = strategy or GridSearch()
+        rounds = strategy.rounds(param_ranges)
+        best_sharpe = -math.inf
+        since_improvement = 0
+        self.stopped_early = False
+
+        workers = self.max_workers or os.cpu_count() or 1
+        executor = None
+        if workers > 1:
+            executor = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(self.arrays, self.initial_balance, self.commission_rate),
+            )
+        else:
+            _init_worker(self.arrays, self.initial_balance, self.commission_rate)
+
+        loop = asyncio.get_running_loop()
+        try:
+            trials = next(rounds, None)
+            while trials:
+                round_results: List[Dict[str, Any]] = []
+                pending: List[asyncio.Future] = []
+                if executor is None:
+                    # 逐次実行もイベントループを塞がないようスレッドで1件ずつ評価
+                    # （早期終了時に残りを評価しない）
+                    batches = (
+                        asyncio.to_thread(_evaluate_chunk, [trial]) for trial in trials
+                    )
+                else:
+                    pending = [
+                        loop.run_in_executor(executor, _evaluate_chunk, chunk)
+                        for chunk in self._chunks(trials, workers)
+                    ]
+                    batches = asyncio.as_completed(pending)
+
+                stopped = False
+                for batch in batches:
+                    for result in await batch:
+                        round_results.append(result)
+                        yield result
+
+                        if result["budget"] < 1.0 or early_stopping_rounds is None:
+                            continue
+                        if result["sharpe_ratio"] > best_sharpe:
+                            best_sharpe = result["sharpe_ratio"]
+                            since_improvement = 0
+                        else:
+                            since_improvement += 1
+                            if since_improvement >= early_stopping_rounds:
+                                stopped = True
+                                break
+                    if stopped:
+                        break
+
+                if stopped:
+                    self.stopped_early = True
+                    for future in pending:
+                        future.cancel()
+                    return
+                try:
+                    trials = rounds.send(round_results)
+                except StopIteration:
+                    trials = None
+        finally:
+            if executor is not None:
+                # 実行中のワーカーの終了待ちでイベントループを塞がない
+                await asyncio.to_thread(
+                    executor.shutdown, wait=True, cancel_futures=True
+                )
+
+    async def optimize(
+        self,
+        param_ranges: Dict[str, List[Any]],
+        strategy: Optional[SearchStrategy] = None,
+        early_stopping_rounds: Optional[int] = None,
+        on_result: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> Dict[str, Any]:
+        """
+        最適化を実行
+
+        Args:
+            param_ranges: パラメータ範囲
+            strategy: 探索戦略（Noneでグリッドサーチ）
+            early_stopping_rounds: 早期終了までの非改善件数
+            on_result: 評価結果ごとに呼び出すコールバック
+
+        Returns:
+            Dict[str, Any]: 最適化結果
+        """
+        strategy = strategy or GridSearch()
+        started = time.perf_counter()
+        evaluated = 0
+        best: Optional[Dict[str, Any]] = None
+        optimization_results = []
+
+        async for result in self.stream(param_ranges, strategy, early_stopping_rounds):
+            evaluated += 1
+            if on_result:
+                on_result(result)
+            if result["budget"] < 1.0:
+                continue
+            optimization_results.append(
+                {
+                    "params": result["params"],
+                    "sharpe_ratio": result["sharpe_ratio"],
+                    "total_return": result["total_return"],
+                    "max_drawdown": result["max_drawdown"],
+                    "total_trades": result["total_trades"],
+                }
+            )
+            if best is None or result["sharpe_ratio"] > best["sharpe_ratio"]:
+                best = result
+
+        return {
+            "best_parameters": best["params"] if best else {},
+            "best_sharpe_ratio": best["sharpe_ratio"] if best else -999,
+            "optimization_results": optimization_results,
+            "total_combinations": len(optimization_results),
+            "search": strategy.name,
+            "evaluated_trials": evaluated,
+            "stopped_early": self.stopped_early,
+            "elapsed_seconds": time.perf_counter() - started,
+        }
@@ -43,20 +43,21 @@ class CurrencyCorrelationAnalyzer:
         for group_pairs in self.currency_groups.values():
             all_pairs.extend(group_pairs)
 
-        currency_data = {}
+        # 全通貨ペアを1回のリクエストで取得
+        try:
+            rates_data = await self.yahoo_client.get_multiple_rates(all_pairs)
+            rates = rates_data.get("rates", {}) if rates_data else {}
+        except Exception as e:
+            self.console.print(f"❌ データ一括取得エラー - {str(e)}")
+            rates = {}
 
+        currency_data = {}
         for pair in all_pairs:
-            try:
-                rates_data = await self.yahoo_client.get_multiple_rates([pair])
-                if rates_data and "rates" in rates_data and pair in rates_data["rates"]:
-                    currency_data[pair] = rates_data["rates"][pair]
-                    self.console.print(f"✅ {pair}: {currency_data[pair]['rate']:.4f}")
-                else:
-                    self.console.print(f"❌ {pair}: データ取得失敗")
-                    currency_data[pair] = None
-            except Exception as e:
-                self.console.print(f"❌ {pair}: エラー - {str(e)}")
-                currency_data[pair] = None
+            currency_data[pair] = rates.get(pair)
+            if currency_data[pair]:
+                self.console.print(f"✅ {pair}: {currency_data[pair]['rate']:.4f}")
+            else:
+                self.console.print(f"❌ {pair}: データ取得失敗")
 
         return currency_data
 
@@ -0,0 +1,335 @@
+"""
+パターン検出器エグゼキューター
+
+複数のパターン検出器を同じマルチタイムフレームデータに対して並列実行する
+
+特徴:
+- 検出器ごとにタイムアウトを設定し、遅い検出器が他の検出器を待たせない
+- thread モード（デフォルト）はエグゼキューターごとに1つのスレッドプールで実行する。
+  タイムアウトしたスレッドは停止できないため、その検出器は実行中の間は新たに
+  実行せず（スレッド数は検出器数まで）、タイムアウトとして扱う
+- process モードでは検出器ごとに fork した子プロセスで実行し、入力データは
+  fork 時のメモリ共有（コピーオンライト）で一度だけ渡す。タイムアウトした
+  子プロセスは終了させ、例外・異常終了も他の検出器に影響しない。
+  マルチスレッドのプロセスからの fork はロックを保持したまま複製される
+  おそれがあるため、明示的に指定した場合のみ使用する
+- inline モードは逐次実行（デバッグ用）
+- 検出器ごとの実行時間・検出件数・タイムアウト・エラーを記録
+"""
+
+import asyncio
+import multiprocessing
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from multiprocessing.connection import Connection, wait
+from typing import Any, Dict, List, Optional, Tuple
+
+from ...utils.logging_config import get_infrastructure_logger
+
+logger = get_infrastructure_logger()
+
+EXECUTION_MODES = ("process", "thread", "inline")
+DEFAULT_EXECUTION_MODE = "thread"
+
+STATUS_OK = "ok"
+STATUS_ERROR = "error"
+STATUS_TIMEOUT = "timeout"
+
+
+@dataclass
+class DetectorOutcome:
+    """
+    検出器1回分の実行結果
+
+    Attributes:
+        result: 検出結果（未検出・失敗時はNone）
+        status: ok / error / timeout
+        seconds: 実行時間（秒）
+        error: エラー内容
+    """
+
+    result: Optional[Dict[str, Any]]
+    status: str
+    seconds: float
+    error: Optional[str] = None
+
+
+def _run_detector_in_child(detector: Any, data: Dict, conn: Connection) -> None:
+    """子プロセスで検出器を実行し、結果をパイプで返す"""
+    started = time.perf_counter()
+    try:
+        result = detector.detect(data)
+        message: Tuple = (STATUS_OK, result or None, time.perf_counter() - started)
+    except Exception as e:
+        message = (STATUS_ERROR, repr(e), time.perf_counter() - started)
+    try:
+        conn.send(message)
+    except Exception as e:
+        # 検出結果を pickle できない場合
+        conn.send((STATUS_ERROR, repr(e), time.perf_counter() - started))
+    finally:
+        conn.close()
+
+
+class DetectorExecutor:
+    """
+    パターン検出器の並列実行
+
+    責任:
+    - 検出器の並列実行とタイムアウト管理
+    - 検出器単位の障害分離
+    - 検出器ごとの実行統計の記録
+    """
+
+    def __init__(
+        self,
+        detectors: Dict[int, Any],
+        timeout_seconds: float = 30.0,
+        mode: Optional[str] = None,
+    ):
+        """
+        初期化
+
+        Args:
+            detectors: パターン番号と検出器（detect(multi_timeframe_data) を持つ）
+            timeout_seconds: 検出器ごとのタイムアウト（秒）
+            mode: 実行方式（process / thread / inline、Noneで thread）
+        """
+        mode = mode or DEFAULT_EXECUTION_MODE
+        if mode not in EXECUTION_MODES:
+            raise ValueError(f"Unsupported detector execution mode: {mode}")
+        if mode == "process" and "fork" not in multiprocessing.get_all_start_methods():
+            raise ValueError("Detector execution mode 'process' requires fork")
+
+        self.detectors = detectors
+        self.timeout_seconds = timeout_seconds
+        self.mode = mode
+        # thread モードのスレッドプール（初回実行時に作成）と検出器ごとの実行中タスク
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._running: Dict[int, Future] = {}
+        self._statistics: Dict[int, Dict[str, Any]] = {
+            pattern_number: self._empty_statistics() for pattern_number in detectors
+        }
+
+    @staticmethod
+    def _empty_statistics() -> Dict[str, Any]:
+        return {
+            "runs": 0,
+            "hits": 0,
+            "errors": 0,
+            "timeouts": 0,
+            "last_seconds": 0.0,
+            "max_seconds": 0.0,
+            "total_seconds": 0.0,
+        }
+
+    async def run(self, multi_timeframe_data: Dict) -> Dict[int, DetectorOutcome]:
+        """
+        全検出器を実行
+
+        Args:
+            multi_timeframe_data: マルチタイムフレームデータ（検出器からは読み取り専用）
+
+        Returns:
+            Dict[int, DetectorOutcome]: パターン番号別の実行結果
+        """
+        started = time.perf_counter()
+        if self.mode == "process":
+            outcomes = await asyncio.to_thread(
+                self._run_processes, multi_timeframe_data
+            )
+        elif self.mode == "thread":
+            outcomes = await self._run_threads(multi_timeframe_data)
+        else:
+            outcomes = self._run_inline(multi_timeframe_data)
+
+        for pattern_number, outcome in outcomes.items():
+            self._record(pattern_number, outcome)
+
+        logger.info(
+            f"Ran {len(outcomes)} detectors ({self.mode}) in "
+            f"{time.perf_counter() - started:.3f}s: "
+            + ", ".join(
+                f"{n}={o.status}/{o.seconds:.3f}s" for n, o in sorted(outcomes.items())
+            )
+        )
+        return outcomes
+
+    def _run_inline(self, data: Dict) -> Dict[int, DetectorOutcome]:
+        return {
+            pattern_number: self._call(detector, data)
+            for pattern_number, detector in self.detectors.items()
+        }
+
+    @staticmethod
+    def _call(detector: Any, data: Dict) -> DetectorOutcome:
+        started = time.perf_counter()
+        try:
+            result = detector.detect(data)
+            seconds = time.perf_counter() - started
+            return DetectorOutcome(result or None, STATUS_OK, seconds)
+        except Exception as e:
+            return DetectorOutcome(
+                None, STATUS_ERROR, time.perf_counter() - started, repr(e)
+            )
+
+    async def _run_threads(self, data: Dict) -> Dict[int, DetectorOutcome]:
+        """
+        スレッドプールで実行
+
+        タイムアウトしたスレッドは停止できないため、結果を待たずに破棄する。
+        そのスレッドが終わるまで同じ検出器は実行せず、スレッドを増やさない。
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=max(1, len(self.detectors)),
+                thread_name_prefix="pattern-detector",
+            )
+
+        outcomes: Dict[int, DetectorOutcome] = {}
+        futures = {}
+        for pattern_number, detector in self.detectors.items():
+            previous = self._running.get(pattern_number)
+            if previous is not None and not previous.done():
+                outcomes[pattern_number] = DetectorOutcome(
+                    None, STATUS_TIMEOUT, 0.0, "previous run is still in progress"
+                )
+                continue
+            future = self._executor.submit(self._call, detector, data)
+            self._running[pattern_number] = future
+            futures[pattern_number] = asyncio.wrap_future(future)
+
+        results = await asyncio.gather(
+            *(
+                asyncio.wait_for(future, self.timeout_seconds)
+                for future in futures.values()
+            ),
+            return_exceptions=True,
+        )
+
+        for pattern_number, result in zip(futures, results):
+            if isinstance(result, DetectorOutcome):
+                outcomes[pattern_number] = result
+            elif isinstance(result, asyncio.TimeoutError):
+                outcomes[pattern_number] = DetectorOutcome(
+                    None, STATUS_TIMEOUT, self.timeout_seconds
+                )
+            else:
+                outcomes[pattern_number] = DetectorOutcome(
+                    None, STATUS_ERROR, 0.0, repr(result)
+                )
+        return outcomes
+
+    def _run_processes(self, data: Dict) -> Dict[int, DetectorOutcome]:
+        """
+        検出器ごとに fork した子プロセスで実行
+
+        fork 方式では Process の引数は pickle されないため、入力データは
+        子プロセスへコピーされずメモリを共有する。
+        """
+        context = multiprocessing.get_context("fork")
+        started = time.perf_counter()
+        deadline = started + self.timeout_seconds
+
+        running: Dict[Connection, Tuple[int, Any]] = {}
+        outcomes: Dict[int, DetectorOutcome] = {}
+        for pattern_number, detector in self.detectors.items():
+            receiver, sender = context.Pipe(duplex=False)
+            process = context.Process(
+                target=_run_detector_in_child,
+                args=(detector, data, sender),
+                name=f"pattern-detector-{pattern_number}",
+                daemon=True,
+            )
+            try:
+                process.start()
+            except Exception as e:
+                receiver.close()
+                outcomes[pattern_number] = DetectorOutcome(
+                    None, STATUS_ERROR, 0.0, repr(e)
+                )
+                continue
+            finally:
+                sender.close()
+            running[receiver] = (pattern_number, process)
+
+        while running:
+            remaining = deadline - time.perf_counter()
+            ready: List[Connection] = (
+                wait(list(running), timeout=remaining) if remaining > 0 else []
+            )
+            if not ready:
+                break
+            for conn in ready:
+                pattern_number, process = running.pop(conn)
+                try:
+                    status, payload, seconds = conn.recv()
+                except EOFError:
+                    # 結果を返さずに異常終了した場合
+                    process.join()
+                    status, payload = STATUS_ERROR, (
+                        f"detector process exited with code {process.exitcode}"
+                    )
+                    seconds = time.perf_counter() - started
+                finally:
+                    conn.close()
+                process.join()
+                if status == STATUS_OK:
+                    outcomes[pattern_number] = DetectorOutcome(payload, status, seconds)
+                else:
+                    outcomes[pattern_number] = DetectorOutcome(
+                        None, status, seconds, payload
+                    )
+
+        # タイムアウトした子プロセスを終了
+        for conn, (pattern_number, process) in running.items():
+            process.kill()
+            process.join()
+            conn.close()
+            outcomes[pattern_number] = DetectorOutcome(
+                None, STATUS_TIMEOUT, time.perf_counter() - started
+            )
+        return outcomes
+
+    def close(self) -> None:
+        """スレッドプールを停止（実行中の検出器の終了は待たない）"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._running.clear()
+
+    def _record(self, pattern_number: int, outcome: DetectorOutcome) -> None:
+        stats = self._statistics.setdefault(pattern_number, self._empty_statistics())
+        stats["runs"] += 1
+        stats["last_seconds"] = outcome.seconds
+        stats["max_seconds"] = max(stats["max_seconds"], outcome.seconds)
+        stats["total_seconds"] += outcome.seconds
+        if outcome.status == STATUS_TIMEOUT:
+            stats["timeouts"] += 1
+            logger.warning(
+                f"Pattern {pattern_number} detector timed out "
+                f"after {self.timeout_seconds}s"
+            )
+        elif outcome.status == STATUS_ERROR:
+            stats["errors"] += 1
+            logger.error(f"❌ パターン{pattern_number}検出エラー: {outcome.error}")
+        elif outcome.result:
+            stats["hits"] += 1
+
+    def get_statistics(self) -> Dict[int, Dict[str, Any]]:
+        """
+        検出器ごとの実行統計を取得
+
+        Returns:
+            Dict[int, Dict[str, Any]]: パターン番号別の統計（平均実行時間を含む）
+        """
+        return {
+            pattern_number: {
+                **stats,
+                "avg_seconds": (
+                    stats["total_seconds"] / stats["runs"] if stats["runs"] else 0.0
+                ),
+            }
+            for pattern_number, stats in self._statistics.items()
+        }
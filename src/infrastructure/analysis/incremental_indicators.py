@@ -0,0 +1,788 @@
+"""
+Incremental Technical Indicators
+インクリメンタル（ストリーミング状態）テクニカル指標エンジン
+
+機能:
+- 新しい足1本ごとに O(1) で全指標を更新
+- RSI (Wilder) / SMA / EMA / ボリンジャーバンド / MACD / ATR / ストキャスティクス
+- 通貨ペア・時間足・指標・期間ごとの状態を保持し、実行間で永続化
+- リプレイモードによる TA-Lib バッチ計算との一致検証
+
+各状態クラスは TA-Lib の C 実装と同じ順序で浮動小数点演算を行うが、
+TA-Lib のビルドによっては乗算と加算が FMA 命令に縮約され、
+RSI・ボリンジャーバンド・MACD シグナル・ATR などは下位ビットがずれる
+（USD/JPY の価格帯で最大 1e-12 程度）。そのため verify_parity は
+PARITY_TOLERANCE（絶対誤差）以内を一致とみなす。
+状態の保存・復元は往復で値が変わらないため、復元後の更新結果は
+中断せずに更新した場合とビット単位で一致する。
+"""
+
+import json
+import math
+import os
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ...utils.logging_config import get_infrastructure_logger
+
+logger = get_infrastructure_logger()
+
+# TA-Lib の TA_IS_ZERO と同じ閾値
+TA_EPSILON = 0.00000000000001
+
+# verify_parity の既定の許容誤差（FMA 縮約による下位ビットのずれを許容）
+PARITY_TOLERANCE = 1e-9
+
+DEFAULT_INDICATOR_CONFIG: Dict[str, Dict[str, Any]] = {
+    "RSI": {"periods": [14]},
+    "SMA": {"periods": [20]},
+    "EMA": {"periods": [20]},
+    "BB": {"period": 20, "std_dev": 2.0},
+    "MACD": {"fast_period": 12, "slow_period": 26, "signal_period": 9},
+    "STOCH": {"fastk_period": 14, "slowk_period": 3, "slowd_period": 3},
+    "ATR": {"period": 14},
+}
+
+
+class _SMAState:
+    """単純移動平均（TA_INT_SMA と同じ累積和の更新順序）"""
+
+    fields = ("value",)
+
+    def __init__(self, period: int):
+        self.period = period
+        self.window: deque = deque()
+        self.total = 0.0
+
+    def update(self, value: float) -> Optional[float]:
+        self.window.append(value)
+        self.total += value
+        if len(self.window) < self.period:
+            return None
+
+        result = self.total / self.period
+        self.total -= self.window.popleft()
+        return result
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"window": list(self.window), "total": self.total}
+
+    def load_dict(self, data: Dict[str, Any]) -> None:
+        self.window = deque(data["window"])
+        self.total = data["total"]
+
+
+class _EMAState:
+    """指数移動平均（初期値は最初の period 本の SMA）"""
+
+    fields = ("value",)
+
+    def __init__(self, period: int):
+        self.period = period
+        self.k = 2.0 / (period + 1)
+        self.seed_total = 0.0
+        self.seed_count = 0
+        self.value: Optional[float] = None
+
+    def update(self, value: float) -> Optional[float]:
+        if self.value is None:
+            self.seed_total += value
+            self.seed_count += 1
+            if self.seed_count < self.period:
+                return None
+            self.value = self.seed_total / self.period
+            return self.value
+
+        self.value = ((value - self.value) * self.k) + self.value
+        return self.value
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "seed_total": self.seed_total,
+            "seed_count": self.seed_count,
+            "value": self.value,
+        }
+
+    def load_dict(self, data: Dict[str, Any]) -> None:
+        self.seed_total = data["seed_total"]
+        self.seed_count = data["seed_count"]
+        self.value = data["value"]
+
+
+class _RSIState:
+    """Wilder RSI（平均上昇幅・平均下落幅を保持）"""
+
+    fields = ("value",)
+
+    def __init__(self, period: int):
+        self.period = period
+        self.reciprocal = 1.0 / period
+        self.prev_close: Optional[float] = None
+        self.count = 0
+        self.avg_gain = 0.0
+        self.avg_loss = 0.0
+
+    def update(self, close: float) -> Optional[float]:
+        if self.prev_close is None:
+            self.prev_close = close
+            return None
+
+        change = close - self.prev_close
+        self.prev_close = close
+
+        if self.count < self.period:
+            # 初期期間は単純平均
+            if change < 0:
+                self.avg_loss -= change
+            else:
+                self.avg_gain += change
+            self.count += 1
+            if self.count < self.period:
+                return None
+            self.avg_loss /= self.period
+            self.avg_gain /= self.period
+        else:
+            # Wilder平滑化（TA-Lib と同じく逆数の乗算で割る）
+            self.avg_loss *= self.period - 1
+            self.avg_gain *= self.period - 1
+            if change < 0:
+                self.avg_loss -= change
+            else:
+                self.avg_gain += change
+            self.avg_loss *= self.reciprocal
+            self.avg_gain *= self.reciprocal
+
+        total = self.avg_gain + self.avg_loss
+        if -TA_EPSILON < total < TA_EPSILON:
+            return 0.0
+        return 100.0 * (self.avg_gain / total)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "prev_close": self.prev_close,
+            "count": self.count,
+            "avg_gain": self.avg_gain,
+            "avg_loss": self.avg_loss,
+        }
+
+    def load_dict(self, data: Dict[str, Any]) -> None:
+        self.prev_close = data["prev_close"]
+        self.count = data["count"]
+        self.avg_gain = data["avg_gain"]
+        self.avg_loss = data["avg_loss"]
+
+
+class _BollingerBandsState:
+    """
+    ボリンジャーバンド（中心線は SMA、分散は最初の値でシフトした二乗和）
+
+    シフトにより価格水準が大きい場合の桁落ちを抑える（TA-Lib の VAR と同じ）。
+    """
+
+    fields = ("upper", "middle", "lower")
+
+    def __init__(self, period: int, std_dev: float):
+        self.period = period
+        self.reciprocal = 1.0 / period
+        self.std_dev = std_dev
+        self.middle_sma = _SMAState(period)
+        self.shift: Optional[float] = None
+        self.window: deque = deque()
+        self.total = 0.0
+        self.total_sq = 0.0
+
+    def update(self, value: float) -> Optional[Tuple[float, float, float]]:
+        middle = self.middle_sma.update(value)
+        if self.shift is None:
+            self.shift = value
+
+        shifted = value - self.shift
+        self.window.append(shifted)
+        self.total += shifted
+        self.total_sq += shifted * shifted
+        if middle is None:
+            return None
+
+        mean = self.total * self.reciprocal
+        variance = self.total_sq * self.reciprocal - mean * mean
+        oldest = self.window.popleft()
+        self.total -= oldest
+        self.total_sq -= oldest * oldest
+
+        std = math.sqrt(variance) if variance > 0.0 else 0.0
+        deviation = std * self.std_dev
+        return middle + deviation, middle, middle - deviation
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "middle_sma": self.middle_sma.to_dict(),
+            "shift": self.shift,
+            "window": list(self.window),
+            "total": self.total,
+            "total_sq": self.total_sq,
+        }
+
+    def load_dict(self, data: Dict[str, Any]) -> None:
+        self.middle_sma.load_dict(data["middle_sma"])
+        self.shift = data["shift"]
+        self.window = deque(data["window"])
+        self.total = data["total"]
+        self.total_sq = data["total_sq"]
+
+
+class _MACDState:
+    """MACD（短期EMAは長期EMAと同じ足で初期化が完了するよう遅れて開始）"""
+
+    fields = ("macd", "signal", "histogram")
+
+    def __init__(self, fast_period: int, slow_period: int, signal_period: int):
+        if slow_period < fast_period:
+            fast_period, slow_period = slow_period, fast_period
+        self.fast_period = fast_period
+        self.slow_period = slow_period
+        self.signal_period = signal_period
+        self.bar_count = 0
+        self.fast_ema = _EMAState(fast_period)
+        self.slow_ema = _EMAState(slow_period)
+        self.signal_ema = _EMAState(signal_period)
+
+    def update(self, close: float) -> Optional[Tuple[float, float, float]]:
+        self.bar_count += 1
+        slow_value = self.slow_ema.update(close)
+        fast_value = None
+        if self.bar_count > self.slow_period - self.fast_period:
+            fast_value = self.fast_ema.update(close)
+        if slow_value is None:
+            return None
+
+        macd = fast_value - slow_value
+        signal = self.signal_ema.update(macd)
+        if signal is None:
+            return None
+        return macd, signal, macd - signal
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "bar_count": self.bar_count,
+            "fast_ema": self.fast_ema.to_dict(),
+            "slow_ema": self.slow_ema.to_dict(),
+            "signal_ema": self.signal_ema.to_dict(),
+        }
+
+    def load_dict(self, data: Dict[str, Any]) -> None:
+        self.bar_count = data["bar_count"]
+        self.fast_ema.load_dict(data["fast_ema"])
+        self.slow_ema.load_dict(data["slow_ema"])
+        self.signal_ema.load_dict(data["signal_ema"])
+
+
+class _ATRState:
+    """ATR（True Range の Wilder平滑化）"""
+
+    fields = ("value",)
+
+    def __init__(self, period: int):
+        self.period = period
+        self.prev_close: Optional[float] = None
+        self.seed_total = 0.0
+        self.seed_count = 0
+        self.value: Optional[float] = None
+
+    def update(self, high: float, low: float, close: float) -> Optional[float]:
+        if self.prev_close is None:
+            self.prev_close = close
+            return None
+
+        true_range = high - low
+        high_gap = abs(self.prev_close - high)
+        if high_gap > true_range:
+            true_range = high_gap
+        low_gap = abs(self.prev_close - low)
+        if low_gap > true_range:
+            true_range = low_gap
+        self.prev_close = close
+
+        if self.value is None:
+            self.seed_total += true_range
+            self.seed_count += 1
+            if self.seed_count < self.period:
+                return None
+            self.value = self.seed_total / self.period
+            return self.value
+
+        self.value *= self.period - 1
+        self.value += true_range
+        self.value /= self.period
+        return self.value
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "prev_close": self.prev_close,
+            "seed_total": self.seed_total,
+            "seed_count": self.seed_count,
+            "value": self.value,
+        }
+
+    def load_dict(self, data: Dict[str, Any]) -> None:
+        self.prev_close = data["prev_close"]
+        self.seed_total = data["seed_total"]
+        self.seed_count = data["seed_count"]
+        self.value = data["value"]
+
+
+class _StochasticState:
+    """スローストキャスティクス（高値・安値は単調デックで O(1) 償却）"""
+
+    fields = ("k", "d")
+
+    def __init__(self, fastk_period: int, slowk_period: int, slowd_period: int):
+        self.fastk_period = fastk_period
+        self.bar_count = 0
+        self.highs: deque = deque()
+        self.lows: deque = deque()
+        self.slowk_sma = _SMAState(slowk_period)
+        self.slowd_sma = _SMAState(slowd_period)
+
+    def update(
+        self, high: float, low: float, close: float
+    ) -> Optional[Tuple[float, float]]:
+        index = self.bar_count
+        self.bar_count += 1
+
+        while self.highs and self.highs[-1][1] <= high:
+            self.highs.pop()
+        self.highs.append((index, high))
+        while self.lows and self.lows[-1][1] >= low:
+            self.lows.pop()
+        self.lows.append((index, low))
+
+        window_start = index - self.fastk_period + 1
+        while self.highs[0][0] < window_start:
+            self.highs.popleft()
+        while self.lows[0][0] < window_start:
+            self.lows.popleft()
+        if window_start < 0:
+            return None
+
+        highest = self.highs[0][1]
+        lowest = self.lows[0][1]
+        diff = highest - lowest
+        fast_k = 100.0 * ((close - lowest) / diff) if diff != 0.0 else 0.0
+
+        slow_k = self.slowk_sma.update(fast_k)
+        if slow_k is None:
+            return None
+        slow_d = self.slowd_sma.update(slow_k)
+        if slow_d is None:
+            return None
+        return slow_k, slow_d
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "bar_count": self.bar_count,
+            "highs": [list(item) for item in self.highs],
+            "lows": [list(item) for item in self.lows],
+            "slowk_sma": self.slowk_sma.to_dict(),
+            "slowd_sma": self.slowd_sma.to_dict(),
+        }
+
+    def load_dict(self, data: Dict[str, Any]) -> None:
+        self.bar_count = data["bar_count"]
+        self.highs = deque(tuple(item) for item in data["highs"])
+        self.lows = deque(tuple(item) for item in data["lows"])
+        self.slowk_sma.load_dict(data["slowk_sma"])
+        self.slowd_sma.load_dict(data["slowd_sma"])
+
+
+class IncrementalIndicatorEngine:
+    """
+    インクリメンタル指標エンジン
+
+    責任:
+    - 通貨ペア・時間足ごとの指標状態の保持
+    - 新しい足1本ごとの O(1) 更新
+    - 状態のシリアライズ
+    - バッチ計算（TA-Lib）とのリプレイ検証
+    """
+
+    def __init__(
+        self,
+        currency_pair: str = "USD/JPY",
+        timeframe: str = "5m",
+        config: Optional[Dict[str, Dict[str, Any]]] = None,
+    ):
+        """
+        初期化
+
+        Args:
+            currency_pair: 通貨ペア
+            timeframe: 時間足
+            config: 指標設定（Noneの場合は DEFAULT_INDICATOR_CONFIG）
+        """
+        self.currency_pair = currency_pair
+        self.timeframe = timeframe
+        self.config = config or DEFAULT_INDICATOR_CONFIG
+        self.states = self._build_states(self.config)
+        self.last_timestamp: Optional[datetime] = None
+        self.bar_count = 0
+
+    @staticmethod
+    def _build_states(config: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        設定から指標状態を生成
+
+        Args:
+            config: 指標設定
+
+        Returns:
+            Dict[str, Any]: 状態キー（"RSI_14" 等）→状態オブジェクト
+        """
+        states: Dict[str, Any] = {}
+        for period in config.get("RSI", {}).get("periods", []):
+            states[f"RSI_{period}"] = _RSIState(period)
+        for period in config.get("SMA", {}).get("periods", []):
+            states[f"SMA_{period}"] = _SMAState(period)
+        for period in config.get("EMA", {}).get("periods", []):
+            states[f"EMA_{period}"] = _EMAState(period)
+        if "BB" in config:
+            bb = config["BB"]
+            states[f"BB_{bb['period']}"] = _BollingerBandsState(
+                bb["period"], float(bb["std_dev"])
+            )
+        if "MACD" in config:
+            macd = config["MACD"]
+            key = (
+                f"MACD_{macd['fast_period']}_{macd['slow_period']}"
+                f"_{macd['signal_period']}"
+            )
+            states[key] = _MACDState(
+                macd["fast_period"], macd["slow_period"], macd["signal_period"]
+            )
+        if "STOCH" in config:
+            stoch = config["STOCH"]
+            key = (
+                f"STOCH_{stoch['fastk_period']}_{stoch['slowk_period']}"
+                f"_{stoch['slowd_period']}"
+            )
+            states[key] = _StochasticState(
+                stoch["fastk_period"], stoch["slowk_period"], stoch["slowd_period"]
+            )
+        if "ATR" in config:
+            states[f"ATR_{config['ATR']['period']}"] = _ATRState(
+                config["ATR"]["period"]
+            )
+        return states
+
+    @staticmethod
+    def _normalize_timestamp(timestamp: Any) -> datetime:
+        """タイムスタンプをタイムゾーンなしの datetime に揃える"""
+        if isinstance(timestamp, pd.Timestamp):
+            timestamp = timestamp.to_pydatetime()
+        if isinstance(timestamp, str):
+            timestamp = datetime.fromisoformat(timestamp)
+        if timestamp.tzinfo is not None:
+            timestamp = timestamp.replace(tzinfo=None)
+        return timestamp
+
+    def update(
+        self, timestamp: Any, high: float, low: float, close: float
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        新しい足で全指標を更新（O(1)）
+
+        Args:
+            timestamp: 足のタイムスタンプ
+            high: 高値
+            low: 安値
+            close: 終値
+
+        Returns:
+            Dict[str, Dict[str, float]]: 状態キー→出力値（ウォームアップ中の
+            指標は含まない。既に適用済みの足の場合は空）
+        """
+        timestamp = self._normalize_timestamp(timestamp)
+        if self.last_timestamp is not None and timestamp <= self.last_timestamp:
+            logger.debug(
+                f"Skip already applied bar {timestamp} "
+                f"({self.currency_pair} {self.timeframe})"
+            )
+            return {}
+
+        high, low, close = float(high), float(low), float(close)
+        outputs: Dict[str, Dict[str, float]] = {}
+        for key, state in self.states.items():
+            if isinstance(state, (_ATRState, _StochasticState)):
+                result = state.update(high, low, close)
+            else:
+                result = state.update(close)
+            if result is None:
+                continue
+            if len(state.fields) == 1:
+                outputs[key] = {"value": result}
+            else:
+                outputs[key] = dict(zip(state.fields, result))
+
+        self.last_timestamp = timestamp
+        self.bar_count += 1
+        return outputs
+
+    def output_columns(self) -> List[str]:
+        """リプレイ結果の列名一覧"""
+        columns = []
+        for key, state in self.states.items():
+            if len(state.fields) == 1:
+                columns.append(key)
+            else:
+                columns.extend(f"{key}_{field}" for field in state.fields)
+        return columns
+
+    def replay(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        価格データを1本ずつ流して指標系列を生成（リプレイモード）
+
+        Args:
+            df: タイムスタンプをインデックスに持つ high/low/close 列のデータ
+
+        Returns:
+            pd.DataFrame: df と同じインデックスの指標列（未確定部分は NaN）
+        """
+        columns = self.output_columns()
+        result = np.full((len(df), len(columns)), np.nan)
+        column_index = {column: i for i, column in enumerate(columns)}
+
+        highs = df["high"].to_numpy(dtype=np.float64)
+        lows = df["low"].to_numpy(dtype=np.float64)
+        closes = df["close"].to_numpy(dtype=np.float64)
+
+        for row, timestamp in enumerate(df.index):
+            outputs = self.update(timestamp, highs[row], lows[row], closes[row])
+            for key, values in outputs.items():
+                if len(values) == 1:
+                    result[row, column_index[key]] = values["value"]
+                else:
+                    for field, value in values.items():
+                        result[row, column_index[f"{key}_{field}"]] = value
+
+        return pd.DataFrame(result, index=df.index, columns=columns)
+
+    def batch_reference(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        TA-Lib によるバッチ計算結果（replay と同じ列構成）
+
+        Args:
+            df: タイムスタンプをインデックスに持つ high/low/close 列のデータ
+
+        Returns:
+            pd.DataFrame: 指標列
+        """
+        import talib
+
+        highs = df["high"].to_numpy(dtype=np.float64)
+        lows = df["low"].to_numpy(dtype=np.float64)
+        closes = df["close"].to_numpy(dtype=np.float64)
+
+        reference: Dict[str, np.ndarray] = {}
+        for key, state in self.states.items():
+            if isinstance(state, _RSIState):
+                reference[key] = talib.RSI(closes, timeperiod=state.period)
+            elif isinstance(state, _BollingerBandsState):
+                upper, middle, lower = talib.BBANDS(
+                    closes,
+                    timeperiod=state.period,
+                    nbdevup=state.std_dev,
+                    nbdevdn=state.std_dev,
+                    matype=0,
+                )
+                reference[f"{key}_upper"] = upper
+                reference[f"{key}_middle"] = middle
+                reference[f"{key}_lower"] = lower
+            elif isinstance(state, _SMAState):
+                reference[key] = talib.SMA(closes, timeperiod=state.period)
+            elif isinstance(state, _EMAState):
+                reference[key] = talib.EMA(closes, timeperiod=state.period)
+            elif isinstance(state, _MACDState):
+                macd, signal, histogram = talib.MACD(
+                    closes,
+                    fastperiod=state.fast_period,
+                    slowperiod=state.slow_period,
+                    signalperiod=state.signal_period,
+                )
+                reference[f"{key}_macd"] = macd
+                reference[f"{key}_signal"] = signal
+                reference[f"{key}_histogram"] = histogram
+            elif isinstance(state, _StochasticState):
+                slow_k, slow_d = talib.STOCH(
+                    highs,
+                    lows,
+                    closes,
+                    fastk_period=state.fastk_period,
+                    slowk_period=state.slowk_sma.period,
+                    slowk_matype=0,
+                    slowd_period=state.slowd_sma.period,
+                    slowd_matype=0,
+                )
+                reference[f"{key}_k"] = slow_k
+                reference[f"{key}_d"] = slow_d
+            elif isinstance(state, _ATRState):
+                reference[key] = talib.ATR(highs, lows, closes, timeperiod=state.period)
+
+        return pd.DataFrame(reference, index=df.index)[self.output_columns()]
+
+    @classmethod
+    def verify_parity(
+        cls,
+        df: pd.DataFrame,
+        currency_pair: str = "USD/JPY",
+        timeframe: str = "5m",
+        config: Optional[Dict[str, Dict[str, Any]]] = None,
+        tolerance: float = PARITY_TOLERANCE,
+    ) -> Dict[str, bool]:
+        """
+        リプレイ結果と TA-Lib バッチ計算が一致するか検証
+
+        Args:
+            df: タイムスタンプをインデックスに持つ high/low/close 列のデータ
+            currency_pair: 通貨ペア
+            timeframe: 時間足
+            config: 指標設定
+            tolerance: 許容する絶対誤差（0ならビット単位の完全一致）
+
+        Returns:
+            Dict[str, bool]: 列名→一致したかどうか
+        """
+        engine = cls(currency_pair, timeframe, config)
+        replayed = engine.replay(df)
+        reference = engine.batch_reference(df)
+
+        results = {}
+        for column in replayed.columns:
+            actual = replayed[column].to_numpy()
+            expected = reference[column].to_numpy()
+            if not np.array_equal(np.isnan(actual), np.isnan(expected)):
+                results[column] = False
+            else:
+                valid = ~np.isnan(expected)
+                errors = np.abs(actual[valid] - expected[valid])
+                max_error = float(errors.max()) if errors.size else 0.0
+                results[column] = max_error <= tolerance
+                if not results[column]:
+                    logger.warning(
+                        f"Incremental/batch mismatch: {column} "
+                        f"(max error {max_error:.3e})"
+                    )
+        return results
+
+    def to_dict(self) -> Dict[str, Any]:
+        """状態を辞書に変換"""
+        return {
+            "currency_pair": self.currency_pair,
+            "timeframe": self.timeframe,
+            "config": self.config,
+            "last_timestamp": (
+                self.last_timestamp.isoformat() if self.last_timestamp else None
+            ),
+            "bar_count": self.bar_count,
+            "states": {key: state.to_dict() for key, state in self.states.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "IncrementalIndicatorEngine":
+        """辞書から状態を復元"""
+        engine = cls(data["currency_pair"], data["timeframe"], data["config"])
+        engine.last_timestamp = (
+            datetime.fromisoformat(data["last_timestamp"])
+            if data.get("last_timestamp")
+            else None
+        )
+        engine.bar_count = data.get("bar_count", 0)
+        for key, state_data in data["states"].items():
+            if key in engine.states:
+                engine.states[key].load_dict(state_data)
+        return engine
+
+
+class IndicatorStateStore:
+    """
+    インクリメンタル指標状態の永続化（通貨ペア・時間足ごとのJSONファイル）
+
+    JSON の float 表現は往復で値が変わらないため、復元後もビット単位で
+    同じ計算を継続できる。
+    """
+
+    def __init__(self, state_dir: str = "data/indicator_state"):
+        """
+        初期化
+
+        Args:
+            state_dir: 状態ファイルの保存ディレクトリ
+        """
+        self.state_dir = Path(state_dir)
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+
+    def _get_state_file_path(self, currency_pair: str, timeframe: str) -> Path:
+        safe_pair = currency_pair.replace("/", "")
+        return self.state_dir / f"{safe_pair}_{timeframe}.json"
+
+    def load(
+        self,
+        currency_pair: str,
+        timeframe: str,
+        config: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> Optional[IncrementalIndicatorEngine]:
+        """
+        状態を読み込み
+
+        Args:
+            currency_pair: 通貨ペア
+            timeframe: 時間足
+            config: 期待する指標設定（保存時と異なる場合は破棄）
+
+        Returns:
+            Optional[IncrementalIndicatorEngine]: 復元したエンジン
+            （存在しない・設定変更時はNone）
+        """
+        state_file = self._get_state_file_path(currency_pair, timeframe)
+        if not state_file.exists():
+            return None
+
+        try:
+            with open(state_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+
+            if data.get("config") != (config or DEFAULT_INDICATOR_CONFIG):
+                logger.info(f"Indicator config changed, discarding state: {state_file}")
+                return None
+
+            return IncrementalIndicatorEngine.from_dict(data)
+
+        except Exception as e:
+            logger.error(f"Failed to load indicator state {state_file}: {e}")
+            return None
+
+    def save(self, engine: IncrementalIndicatorEngine) -> bool:
+        """
+        状態を保存（一時ファイル経由で置き換え）
+
+        Args:
+            engine: 保存するエンジン
+
+        Returns:
+            bool: 保存成功時True
+        """
+        state_file = self._get_state_file_path(engine.currency_pair, engine.timeframe)
+        temp_file = state_file.with_suffix(".tmp")
+
+        try:
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(engine.to_dict(), f)
+            os.replace(temp_file, state_file)
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to save indicator state {state_file}: {e}")
+            return False
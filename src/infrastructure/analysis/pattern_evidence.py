@@ -0,0 +1,229 @@
+"""
+パターン検出エビデンス
+
+PatternDetectionModel.indicator_data に保存するコンパクトな検出根拠
+
+マルチタイムフレームデータ（価格 DataFrame と指標 Series）をそのまま保存する
+代わりに、時間軸ごとに検出器が参照するスカラー値と、価格データを参照する
+ための範囲（通貨ペア・時間軸・先頭/末尾バーの時刻・本数）のみを保存する。
+全体のコンテキストは EfficientPatternDetectionService.load_pattern_context で
+価格データから再構築する。
+
+形式:
+    {
+        "format": "pattern_evidence/v1",
+        "currency_pair": "USD/JPY",
+        "timeframes": {
+            "5m": {
+                "start": "...", "end": "...", "bars": 288,
+                "open": ..., "high": ..., "low": ..., "close": ...,
+                "recent_close": [...],
+                "indicators": {"rsi": ..., "macd": ..., ...},
+            },
+            ...
+        },
+    }
+"""
+
+import math
+from typing import Any, Dict, Optional
+
+import pandas as pd
+
+EVIDENCE_FORMAT = "pattern_evidence/v1"
+
+# 検出器が参照する直近の終値の本数
+RECENT_BARS = 5
+
+# 検出器が期待する指標 Series の長さ
+INDICATOR_SERIES_LENGTH = 20
+
+
+def is_pattern_evidence(data: Any) -> bool:
+    """
+    コンパクト形式のエビデンスかどうか
+
+    Args:
+        data: indicator_data の値
+
+    Returns:
+        bool: コンパクト形式の場合True
+    """
+    return isinstance(data, dict) and data.get("format") == EVIDENCE_FORMAT
+
+
+def _to_float(value: Any) -> Optional[float]:
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return None if math.isnan(number) or math.isinf(number) else number
+
+
+def _last_value(value: Any) -> Optional[float]:
+    """スカラー・リスト・Series・辞書（JSON化された Series）の最新値"""
+    if isinstance(value, pd.Series):
+        return _to_float(value.iloc[-1]) if len(value) else None
+    if isinstance(value, dict):
+        value = list(value.values())
+    if isinstance(value, (list, tuple)):
+        return _to_float(value[-1]) if value else None
+    return _to_float(value)
+
+
+def _to_price_frame(price_data: Any) -> pd.DataFrame:
+    """
+    価格データを DataFrame に変換
+
+    JSON 化された旧形式（レコードのリスト・列ごとの辞書・split 形式）にも対応する。
+    """
+    if isinstance(price_data, pd.DataFrame):
+        return price_data
+    if not price_data:
+        return pd.DataFrame()
+
+    if isinstance(price_data, dict) and {"data", "columns"} <= set(price_data):
+        df = pd.DataFrame(
+            price_data["data"],
+            index=price_data.get("index"),
+            columns=price_data["columns"],
+        )
+    else:
+        df = pd.DataFrame(price_data)
+
+    if "timestamp" in df.columns:
+        df = df.set_index("timestamp")
+    try:
+        df.index = pd.to_datetime(df.index)
+    except (TypeError, ValueError):
+        pass
+    return df
+
+
+def _column(df: pd.DataFrame, name: str) -> Optional[pd.Series]:
+    for candidate in (name, name.lower(), f"{name.lower()}_price"):
+        if candidate in df.columns:
+            return df[candidate]
+    return None
+
+
+def _snapshot_indicators(indicators: Dict[str, Any]) -> Dict[str, Optional[float]]:
+    rsi = indicators.get("rsi") or {}
+    macd = indicators.get("macd") or {}
+    bands = indicators.get("bollinger_bands") or {}
+    snapshot = {
+        "rsi": _last_value(rsi.get("current_value", rsi.get("series"))),
+        "macd": _last_value(macd.get("macd")),
+        "macd_signal": _last_value(macd.get("signal")),
+        "macd_histogram": _last_value(macd.get("histogram")),
+        "bb_upper": _last_value(bands.get("upper")),
+        "bb_middle": _last_value(bands.get("middle")),
+        "bb_lower": _last_value(bands.get("lower")),
+    }
+    return {key: value for key, value in snapshot.items() if value is not None}
+
+
+def _format_timestamp(value: Any) -> Optional[str]:
+    if isinstance(value, (pd.Timestamp,)) or hasattr(value, "isoformat"):
+        return value.isoformat()
+    return None if value is None else str(value)
+
+
+def _snapshot_timeframe(entry: Dict[str, Any]) -> Dict[str, Any]:
+    df = _to_price_frame(entry.get("price_data"))
+    snapshot: Dict[str, Any] = {"bars": int(len(df))}
+
+    if len(df):
+        snapshot["start"] = _format_timestamp(df.index[0])
+        snapshot["end"] = _format_timestamp(df.index[-1])
+        for name in ("Open", "High", "Low", "Close"):
+            column = _column(df, name)
+            if column is not None:
+                snapshot[name.lower()] = _to_float(column.iloc[-1])
+        close = _column(df, "Close")
+        if close is not None:
+            snapshot["recent_close"] = [
+                _to_float(value) for value in close.iloc[-RECENT_BARS:]
+            ]
+
+    snapshot["indicators"] = _snapshot_indicators(entry.get("indicators") or {})
+    return snapshot
+
+
+def build_pattern_evidence(
+    multi_timeframe_data: Dict[str, Any], currency_pair: str
+) -> Dict[str, Any]:
+    """
+    マルチタイムフレームデータからエビデンスを作成
+
+    Args:
+        multi_timeframe_data: 検出に使用したマルチタイムフレームデータ
+        currency_pair: 通貨ペア
+
+    Returns:
+        Dict[str, Any]: JSON 保存可能なエビデンス
+    """
+    return {
+        "format": EVIDENCE_FORMAT,
+        "currency_pair": currency_pair,
+        "timeframes": {
+            timeframe: _snapshot_timeframe(entry)
+            for timeframe, entry in (multi_timeframe_data or {}).items()
+            if isinstance(entry, dict)
+        },
+    }
+
+
+def compact_indicator_data(
+    indicator_data: Any, currency_pair: str
+) -> Optional[Dict[str, Any]]:
+    """
+    保存済みの indicator_data をエビデンスに変換（移行用）
+
+    Args:
+        indicator_data: 旧形式または新形式の indicator_data
+        currency_pair: 通貨ペア
+
+    Returns:
+        Optional[Dict[str, Any]]: エビデンス（変換できない場合はNone）
+    """
+    if indicator_data is None or is_pattern_evidence(indicator_data):
+        return indicator_data
+    if not isinstance(indicator_data, dict):
+        return None
+    return build_pattern_evidence(indicator_data, currency_pair)
+
+
+def expand_indicators(snapshot: Dict[str, Optional[float]]) -> Dict[str, Any]:
+    """
+    エビデンスの指標値を検出器が期待する形式に展開
+
+    検出時と同様に最新値を一定の Series として展開する。
+
+    Args:
+        snapshot: エビデンスの indicators
+
+    Returns:
+        Dict[str, Any]: rsi, rsi_series, macd, bollinger_bands
+    """
+
+    def series(value: Optional[float]) -> pd.Series:
+        return pd.Series([value] * INDICATOR_SERIES_LENGTH)
+
+    indicators: Dict[str, Any] = {}
+    if "rsi" in snapshot:
+        indicators["rsi"] = {"current_value": snapshot["rsi"]}
+        indicators["rsi_series"] = series(snapshot["rsi"])
+    if "macd" in snapshot:
+        indicators["macd"] = {
+            "macd": series(snapshot["macd"]),
+            "signal": series(snapshot.get("macd_signal", 0.0)),
+            "histogram": series(snapshot.get("macd_histogram", 0.0)),
+        }
+    if "bb_middle" in snapshot:
+        indicators["bollinger_bands"] = {
+            "upper": series(snapshot.get("bb_upper")),
+            "middle": series(snapshot["bb_middle"]),
+            "lower": series(snapshot.get("bb_lower")),
+        }
+    return indicators
@@ -0,0 +1,492 @@
+"""
+パターンスキャナー
+
+パターン検出器（パターン1〜6）の条件を全バーに対して一括評価する
+
+検出器の detect(multi_timeframe_data) は最新バーのみを評価するため、過去の
+発生箇所を調べるにはバーごとにパイプラインを再実行する必要があった。
+スキャナーは各時間軸の条件をローリングウィンドウの配列演算で全バー分求め、
+基準時間軸（M5）のバーに揃えて結合する。
+
+特徴:
+- 上位足は確定したバーのみを参照する（H1 10:00 のバーは M5 10:55 以降）
+- 指標列（rsi, macd, macd_signal, bb_upper, bb_middle, bb_lower）が無い場合は
+  PatternUtils と同じ計算式で算出
+- 上位足のデータが無い場合は基準時間軸から集計
+- 信頼度は PatternUtils.get_pattern_confidence_score と同じ値
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from ...utils.logging_config import get_infrastructure_logger
+from ...utils.pattern_utils import PatternUtils
+
+logger = get_infrastructure_logger()
+
+TIMEFRAMES = ("D1", "H4", "H1", "M5")
+
+TIMEFRAME_DURATIONS = {
+    "M5": pd.Timedelta(minutes=5),
+    "H1": pd.Timedelta(hours=1),
+    "H4": pd.Timedelta(hours=4),
+    "D1": pd.Timedelta(days=1),
+}
+
+# PatternUtils.validate_timeframe_data の最低データ数
+MIN_HISTORY = 20
+
+INDICATOR_COLUMNS = ("rsi", "macd", "macd_signal", "bb_upper", "bb_middle", "bb_lower")
+
+
+@dataclass
+class PatternScanResult:
+    """
+    パターン1件のスキャン結果
+
+    Attributes:
+        pattern_number: パターン番号
+        conditions: 時間軸別の条件（基準時間軸のバー × D1/H4/H1/M5）
+        signal: 全時間軸の条件を満たしたバー
+        confidence: 信頼度スコア（条件の達成状況から算出、全バー分）
+    """
+
+    pattern_number: int
+    conditions: pd.DataFrame
+    signal: np.ndarray
+    confidence: np.ndarray
+
+    @property
+    def timestamps(self) -> pd.DatetimeIndex:
+        """シグナルが発生したバーの時刻"""
+        return self.conditions.index[self.signal]
+
+
+def _prev(values: np.ndarray, k: int) -> np.ndarray:
+    """k 本前の値（先頭は NaN）"""
+    shifted = np.full(len(values), np.nan)
+    if k < len(values):
+        shifted[k:] = values[: len(values) - k]
+    return shifted
+
+
+def _rising3(values: np.ndarray) -> np.ndarray:
+    """直近3本で連続上昇"""
+    return (values > _prev(values, 1)) & (_prev(values, 1) > _prev(values, 2))
+
+
+def _falling3(values: np.ndarray) -> np.ndarray:
+    """直近3本で連続下降"""
+    return (values < _prev(values, 1)) & (_prev(values, 1) < _prev(values, 2))
+
+
+def _between(values: np.ndarray, low: float, high: float) -> np.ndarray:
+    return (values >= low) & (values <= high)
+
+
+def _near(price: np.ndarray, band: np.ndarray, ratio: float) -> np.ndarray:
+    """価格がバンドの ratio 以内"""
+    return np.abs(price - band) <= band * ratio
+
+
+def _min_length(n: int, length: int) -> np.ndarray:
+    """各バーまでのデータ数が length 以上"""
+    return np.arange(n) >= length - 1
+
+
+class PatternScanner:
+    """
+    パターンの一括スキャン
+
+    責任:
+    - 時間軸別データへの指標列の付与
+    - パターン条件の全バー評価
+    - 上位足条件の基準時間軸への整列
+    """
+
+    def __init__(self, base_timeframe: str = "M5"):
+        """
+        初期化
+
+        Args:
+            base_timeframe: 結果を揃える時間軸
+        """
+        self.base_timeframe = base_timeframe
+        self._checks: Dict[int, Dict[str, Callable[[pd.DataFrame], np.ndarray]]] = {
+            1: {
+                "D1": self._trend_reversal_d1,
+                "H4": self._trend_reversal_upper_band,
+                "H1": self._trend_reversal_upper_band,
+                "M5": self._trend_reversal_m5,
+            },
+            2: {
+                "D1": self._pullback_d1,
+                "H4": lambda df: self._pullback_lower_band(df, 45),
+                "H1": lambda df: self._pullback_lower_band(df, 40),
+                "M5": self._pullback_m5,
+            },
+            3: {
+                "D1": self._divergence_d1,
+                "H4": self._divergence_intraday,
+                "H1": self._divergence_intraday,
+                "M5": self._divergence_intraday,
+            },
+            4: {
+                "D1": self._breakout_d1,
+                "H4": self._breakout_upper_band,
+                "H1": self._breakout_upper_band,
+                "M5": self._breakout_m5,
+            },
+            5: {
+                "D1": self._rsi_battle_d1,
+                "H4": self._rsi_battle_h4,
+                "H1": self._rsi_battle_h1,
+                "M5": self._rsi_battle_m5,
+            },
+            6: {
+                "D1": self._composite_d1,
+                "H4": self._composite_band,
+                "H1": self._composite_band,
+                "M5": self._composite_m5,
+            },
+        }
+        # データ妥当性チェック（20本以上）を行うパターン
+        self._validated_patterns = {1, 2, 3, 4, 6}
+
+    # ------------------------------------------------------------------
+    # データ準備
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def add_indicators(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        不足している指標列を追加
+
+        Args:
+            df: Open, High, Low, Close 列を持つ価格データ
+
+        Returns:
+            pd.DataFrame: 指標列を追加したデータ
+        """
+        missing = [column for column in INDICATOR_COLUMNS if column not in df.columns]
+        if not missing:
+            return df
+
+        close = df["Close"].astype(np.float64)
+        macd = PatternUtils.calculate_macd(close)
+        bands = PatternUtils.calculate_bollinger_bands(close)
+        computed = {
+            "rsi": PatternUtils.calculate_rsi(close),
+            "macd": macd["macd"],
+            "macd_signal": macd["signal"],
+            "bb_upper": bands["upper"],
+            "bb_middle": bands["middle"],
+            "bb_lower": bands["lower"],
+        }
+        return df.assign(**{column: computed[column] for column in missing})
+
+    def prepare(self, frames: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
+        """
+        全時間軸のデータを準備
+
+        上位足が無い場合は基準時間軸から集計する。
+
+        Args:
+            frames: 時間軸別の価格データ（DatetimeIndex、Open/High/Low/Close 列）
+
+        Returns:
+            Dict[str, pd.DataFrame]: 指標列付きの時間軸別データ
+        """
+        base = frames.get(self.base_timeframe)
+        if base is None:
+            raise ValueError(f"{self.base_timeframe} data is required for scanning")
+
+        prepared = {}
+        for timeframe in TIMEFRAMES:
+            df = frames.get(timeframe)
+            if df is None:
+                df = (
+                    base[["Open", "High", "Low", "Close"]]
+                    .resample(TIMEFRAME_DURATIONS[timeframe])
+                    .agg(
+                        {"Open": "first", "High": "max", "Low": "min", "Close": "last"}
+                    )
+                    .dropna()
+                )
+            prepared[timeframe] = self.add_indicators(df.sort_index())
+        return prepared
+
+    def _align(
+        self,
+        values: np.ndarray,
+        df: pd.DataFrame,
+        timeframe: str,
+        base_index: pd.DatetimeIndex,
+    ) -> np.ndarray:
+        """
+        時間軸の条件を基準時間軸のバーに揃える
+
+        上位足のバーは期間が終わる基準バーから参照可能とする。
+        """
+        if timeframe == self.base_timeframe:
+            return values
+
+        available = (
+            df.index
+            + TIMEFRAME_DURATIONS[timeframe]
+            - TIMEFRAME_DURATIONS[self.base_timeframe]
+        )
+        positions = available.searchsorted(base_index, side="right") - 1
+        aligned = np.zeros(len(base_index), dtype=bool)
+        visible = positions >= 0
+        aligned[visible] = values[positions[visible]]
+        return aligned
+
+    # ------------------------------------------------------------------
+    # スキャン
+    # ------------------------------------------------------------------
+
+    def scan(
+        self,
+        frames: Dict[str, pd.DataFrame],
+        patterns: Optional[Iterable[int]] = None,
+    ) -> Dict[int, PatternScanResult]:
+        """
+        全バーのパターン条件を評価
+
+        Args:
+            frames: 時間軸別の価格データ（M5のみでも可）
+            patterns: 対象パターン番号（Noneで全パターン）
+
+        Returns:
+            Dict[int, PatternScanResult]: パターン番号別のスキャン結果
+        """
+        prepared = self.prepare(frames)
+        base_index = prepared[self.base_timeframe].index
+        # 条件の組み合わせ（16通り）ごとの信頼度。get_pattern_confidence_score の
+        # 丸めと一致させるため、配列演算ではなく同関数の値を引く
+        codes = np.arange(2 ** len(TIMEFRAMES))
+        bits = (codes[:, None] >> np.arange(len(TIMEFRAMES))) & 1
+        scores = np.array(
+            [
+                PatternUtils.get_pattern_confidence_score(
+                    {tf: bool(met) for tf, met in zip(TIMEFRAMES, row)}
+                )
+                for row in bits
+            ]
+        )
+
+        results = {}
+        for pattern_number in patterns or sorted(self._checks):
+            checks = self._checks[pattern_number]
+            conditions = {}
+            for timeframe in TIMEFRAMES:
+                df = prepared[timeframe]
+                met = np.asarray(checks[timeframe](df), dtype=bool)
+                if pattern_number in self._validated_patterns:
+                    met &= _min_length(len(df), MIN_HISTORY)
+                conditions[timeframe] = self._align(met, df, timeframe, base_index)
+
+            matrix = np.column_stack([conditions[tf] for tf in TIMEFRAMES])
+            code = matrix @ (1 << np.arange(len(TIMEFRAMES)))
+            results[pattern_number] = PatternScanResult(
+                pattern_number=pattern_number,
+                conditions=pd.DataFrame(conditions, index=base_index),
+                signal=matrix.all(axis=1),
+                confidence=scores[code],
+            )
+
+        logger.info(
+            f"Scanned {len(base_index)} {self.base_timeframe} bars: "
+            + ", ".join(
+                f"pattern {n}={int(r.signal.sum())}" for n, r in results.items()
+            )
+        )
+        return results
+
+    def scan_frame(
+        self,
+        frames: Dict[str, pd.DataFrame],
+        patterns: Optional[Iterable[int]] = None,
+    ) -> pd.DataFrame:
+        """
+        スキャン結果を1つの DataFrame で取得
+
+        Args:
+            frames: 時間軸別の価格データ
+            patterns: 対象パターン番号（Noneで全パターン）
+
+        Returns:
+            pd.DataFrame: pattern_{n}（bool）と pattern_{n}_confidence 列
+        """
+        results = self.scan(frames, patterns)
+        index = next(iter(results.values())).conditions.index if results else None
+        columns = {}
+        for pattern_number, result in results.items():
+            columns[f"pattern_{pattern_number}"] = result.signal
+            columns[f"pattern_{pattern_number}_confidence"] = result.confidence
+        return pd.DataFrame(columns, index=index)
+
+    # ------------------------------------------------------------------
+    # パターン1: トレンド転換
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _trend_reversal_d1(df: pd.DataFrame) -> np.ndarray:
+        return df["rsi"].to_numpy() > 65
+
+    @staticmethod
+    def _trend_reversal_upper_band(df: pd.DataFrame) -> np.ndarray:
+        close = df["Close"].to_numpy()
+        upper = df["bb_upper"].to_numpy()
+        return (df["rsi"].to_numpy() > 65) & _near(close, upper, 0.05)
+
+    @staticmethod
+    def _trend_reversal_m5(df: pd.DataFrame) -> np.ndarray:
+        open_, high, low, close = (
+            df[column].to_numpy() for column in ("Open", "High", "Low", "Close")
+        )
+        upper_shadow = high - np.maximum(open_, close)
+        lower_shadow = np.minimum(open_, close) - low
+        shadow = (upper_shadow > 0.05) | (lower_shadow > 0.05)
+        # 直近3本のいずれかでヒゲ形成
+        recent_shadow = (
+            pd.Series(shadow).rolling(3).max().to_numpy() == 1
+        ) & _min_length(len(df), 3)
+        return (df["rsi"].to_numpy() > 65) & recent_shadow
+
+    # ------------------------------------------------------------------
+    # パターン2: 押し目・戻り売り
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _pullback_d1(df: pd.DataFrame) -> np.ndarray:
+        return _between(df["rsi"].to_numpy(), 25, 55) & _rising3(df["macd"].to_numpy())
+
+    @staticmethod
+    def _pullback_lower_band(df: pd.DataFrame, rsi_high: float) -> np.ndarray:
+        close = df["Close"].to_numpy()
+        return _between(df["rsi"].to_numpy(), 25, rsi_high) & _near(
+            close, df["bb_lower"].to_numpy(), 0.05
+        )
+
+    @staticmethod
+    def _pullback_m5(df: pd.DataFrame) -> np.ndarray:
+        return (df["rsi"].to_numpy() <= 35) & _rising3(df["Close"].to_numpy())
+
+    # ------------------------------------------------------------------
+    # パターン3: ダイバージェンス
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _divergence_d1(df: pd.DataFrame) -> np.ndarray:
+        rsi = df["rsi"]
+        rsi_below_average = rsi.to_numpy() < rsi.rolling(5).mean().to_numpy()
+        return _rising3(df["Close"].to_numpy()) & rsi_below_average
+
+    @staticmethod
+    def _divergence_intraday(df: pd.DataFrame) -> np.ndarray:
+        return (
+            _rising3(df["Close"].to_numpy())
+            & _falling3(df["rsi"].to_numpy())
+            & _min_length(len(df), 10)
+        )
+
+    # ------------------------------------------------------------------
+    # パターン4: ブレイクアウト
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _breakout_d1(df: pd.DataFrame) -> np.ndarray:
+        return _between(df["rsi"].to_numpy(), 45, 75) & _rising3(df["macd"].to_numpy())
+
+    @staticmethod
+    def _breakout_upper_band(df: pd.DataFrame) -> np.ndarray:
+        return _near(df["Close"].to_numpy(), df["bb_upper"].to_numpy(), 0.05)
+
+    @staticmethod
+    def _breakout_m5(df: pd.DataFrame) -> np.ndarray:
+        return _rising3(df["Close"].to_numpy()) & _min_length(len(df), 5)
+
+    # ------------------------------------------------------------------
+    # パターン5: RSI50ライン攻防
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _rsi_battle_d1(df: pd.DataFrame) -> np.ndarray:
+        return (
+            _between(df["rsi"].to_numpy(), 40, 60)
+            & (np.abs(df["macd"].to_numpy()) <= 0.2)
+            & (np.abs(df["macd_signal"].to_numpy()) <= 0.2)
+        )
+
+    @staticmethod
+    def _rsi_battle_h4(df: pd.DataFrame) -> np.ndarray:
+        close = df["Close"].to_numpy()
+        middle = df["bb_middle"].to_numpy()
+        return _between(df["rsi"].to_numpy(), 40, 60) & (
+            np.abs(close - middle) / middle <= 0.005
+        )
+
+    @staticmethod
+    def _rsi_battle_h1(df: pd.DataFrame) -> np.ndarray:
+        close = df["Close"].to_numpy()
+        # 直近2回の変化率の平均が0.1%以上
+        change = np.abs(close - _prev(close, 1)) / _prev(close, 1)
+        volatility = (change + _prev(change, 1)) / 2
+        return (
+            _between(df["rsi"].to_numpy(), 40, 60)
+            & (volatility >= 0.001)
+            & _min_length(len(df), 10)
+        )
+
+    @staticmethod
+    def _rsi_battle_m5(df: pd.DataFrame) -> np.ndarray:
+        rsi = df["rsi"].to_numpy()
+        in_range = _between(rsi, 40, 60).astype(np.float64)
+        below = (rsi < 50).astype(np.float64)
+        above = (rsi > 50).astype(np.float64)
+        # 直近5本が40-60、前半3本に50未満、後半3本に50超
+        near_50 = pd.Series(in_range).rolling(5).min().to_numpy() == 1
+        crossed_from_below = _prev(pd.Series(below).rolling(3).max().to_numpy(), 2) == 1
+        crossed_to_above = pd.Series(above).rolling(3).max().to_numpy() == 1
+        return near_50 & crossed_from_below & crossed_to_above
+
+    # ------------------------------------------------------------------
+    # パターン6: 複合シグナル
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _composite_d1(df: pd.DataFrame) -> np.ndarray:
+        close = df["Close"].to_numpy()
+        macd = df["macd"].to_numpy()
+        previous = _prev(close, 1)
+        macd_condition = (macd > df["macd_signal"].to_numpy()) | _rising3(macd)
+        price_condition = (close > previous) | (
+            np.abs(close - previous) / previous < 0.01
+        )
+        return (
+            _between(df["rsi"].to_numpy(), 25, 75)
+            & macd_condition
+            & price_condition
+            & _min_length(len(df), 5)
+        )
+
+    @staticmethod
+    def _composite_band(df: pd.DataFrame) -> np.ndarray:
+        close = df["Close"].to_numpy()
+        upper = df["bb_upper"].to_numpy()
+        lower = df["bb_lower"].to_numpy()
+        middle = df["bb_middle"].to_numpy()
+        in_band = (lower <= close) & (close <= upper)
+        near_middle = np.abs(close - middle) / middle < 0.02
+        return _between(df["rsi"].to_numpy(), 25, 75) & (in_band | near_middle)
+
+    @staticmethod
+    def _composite_m5(df: pd.DataFrame) -> np.ndarray:
+        close = df["Close"]
+        volatility = (close.rolling(5).std() / close.rolling(5).mean()).to_numpy()
+        return _between(df["rsi"].to_numpy(), 25, 75) & (volatility < 0.05)
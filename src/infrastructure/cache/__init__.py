@@ -6,7 +6,18 @@ Cache System Package
 """
 
 from .analysis_cache import AnalysisCache
+from .bar_store import OHLCVBarStore, get_bar_store
 from .cache_manager import CacheManager
 from .file_cache import FileCache
+from .segment_file_cache import SegmentFileCache
+from .single_flight import SingleFlight
 
-__all__ = ["CacheManager", "AnalysisCache", "FileCache"]
+__all__ = [
+    "CacheManager",
+    "AnalysisCache",
+    "FileCache",
+    "SegmentFileCache",
+    "SingleFlight",
+    "OHLCVBarStore",
+    "get_bar_store",
+]
@@ -0,0 +1,592 @@
+"""
+OHLCV Bar Store
+プロセス共有のOHLCVバーストア
+
+(通貨ペア, 時間足) ごとに連続した NumPy 配列 (ts, o, h, l, c, v) を保持し、
+複数時間足を扱う各コンシューマが同じバーを共有するためのリードスルーキャッシュ。
+
+- 追加: 容量倍増による償却 O(1)
+- 範囲読み出し: 内部バッファを共有するゼロコピー DataFrame ビュー
+- DB同期: 保持している最大タイムスタンプ以降のみを取得する差分同期。
+  同期後 ``min_sync_interval`` 秒以内の読み出しは SQL を発行しない
+"""
+
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...utils.logging_config import get_infrastructure_logger
+from ..database.models.price_data_model import normalize_timeframe
+from ..database.repositories.price_data_repository_impl import PriceDataRepositoryImpl
+from ..monitoring.metrics import record_cache_lookup
+
+logger = get_infrastructure_logger()
+
+BAR_COLUMNS: Tuple[str, ...] = ("open", "high", "low", "close", "volume")
+TITLE_BAR_COLUMNS: Tuple[str, ...] = ("Open", "High", "Low", "Close", "Volume")
+
+
+class BarSeries:
+    """
+    単一 (通貨ペア, 時間足) のバー列
+
+    タイムスタンプは int64 (ns) 配列、OHLCV は (capacity, 5) の float64 配列に
+    連続して格納する。容量不足時は倍の容量へ再確保するため追加は償却 O(1)。
+    再確保後も既に返したビューは旧バッファを参照し続けるため安全に使える
+    （形成中バーの上書きのみビューにも反映される）。
+    ビューはバッファ全体を包む DataFrame の行スライスなので、コンシューマ側での
+    書き込みは pandas の Copy-on-Write によりコピーされ、ストアには波及しない。
+    """
+
+    def __init__(self, capacity: int = 1024):
+        """
+        初期化
+
+        Args:
+            capacity: 初期容量（バー数）
+        """
+        self._ts = np.empty(max(capacity, 1), dtype=np.int64)
+        self._values = np.empty((max(capacity, 1), len(BAR_COLUMNS)), dtype=np.float64)
+        self._size = 0
+        self._frame: Optional[pd.DataFrame] = None
+        self.tz = None
+        self.tz_known = False
+        self.last_sync_monotonic: Optional[float] = None
+        self.loaded_from: Optional[int] = None
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def last_ns(self) -> Optional[int]:
+        """最新バーのタイムスタンプ（ns）"""
+        return int(self._ts[self._size - 1]) if self._size else None
+
+    def _reserve(self, required: int) -> None:
+        capacity = len(self._ts)
+        if required <= capacity:
+            return
+        while capacity < required:
+            capacity *= 2
+        ts = np.empty(capacity, dtype=np.int64)
+        values = np.empty((capacity, len(BAR_COLUMNS)), dtype=np.float64)
+        ts[: self._size] = self._ts[: self._size]
+        values[: self._size] = self._values[: self._size]
+        self._ts = ts
+        self._values = values
+        self._frame = None
+
+    def append(self, ts_ns: int, values: Sequence[float]) -> bool:
+        """
+        バーを1本追加
+
+        最新バーと同じタイムスタンプの場合は形成中バーの更新として上書きし、
+        それより古いバーは無視する。
+
+        Args:
+            ts_ns: タイムスタンプ（ns）
+            values: (open, high, low, close, volume)
+
+        Returns:
+            bool: 追加・更新した場合True
+        """
+        last = self.last_ns
+        if last is not None and ts_ns < last:
+            return False
+        if last is not None and ts_ns == last:
+            self._values[self._size - 1] = values
+            return True
+        self._reserve(self._size + 1)
+        self._ts[self._size] = ts_ns
+        self._values[self._size] = values
+        self._size += 1
+        return True
+
+    def extend(self, ts_ns: np.ndarray, values: np.ndarray) -> int:
+        """
+        昇順のバー列をまとめて追加
+
+        Args:
+            ts_ns: タイムスタンプ配列（ns, 昇順）
+            values: (n, 5) の OHLCV 配列
+
+        Returns:
+            int: 新規に追加したバー数
+        """
+        if len(ts_ns) == 0:
+            return 0
+        last = self.last_ns
+        if last is not None:
+            same = ts_ns == last
+            if same.any():
+                self._values[self._size - 1] = values[same][-1]
+            keep = ts_ns > last
+            ts_ns, values = ts_ns[keep], values[keep]
+        if len(ts_ns) == 0:
+            return 0
+        # 同一タイムスタンプが複数ソースから来た場合は後勝ち
+        unique = np.append(ts_ns[1:] != ts_ns[:-1], True)
+        ts_ns, values = ts_ns[unique], values[unique]
+        n = len(ts_ns)
+        self._reserve(self._size + n)
+        self._ts[self._size : self._size + n] = ts_ns
+        self._values[self._size : self._size + n] = values
+        self._size += n
+        return n
+
+    def prepend(self, ts_ns: np.ndarray, values: np.ndarray) -> int:
+        """
+        保持範囲より古いバー列を先頭に追加（読み込み範囲の拡張時のみ）
+
+        Args:
+            ts_ns: タイムスタンプ配列（ns, 昇順）
+            values: (n, 5) の OHLCV 配列
+
+        Returns:
+            int: 追加したバー数
+        """
+        if self._size:
+            keep = ts_ns < self._ts[0]
+            ts_ns, values = ts_ns[keep], values[keep]
+        if len(ts_ns) == 0:
+            return 0
+        unique = np.append(ts_ns[1:] != ts_ns[:-1], True)
+        ts_ns, values = ts_ns[unique], values[unique]
+        n = len(ts_ns)
+        capacity = len(self._ts)
+        while capacity < self._size + n:
+            capacity *= 2
+        new_ts = np.empty(capacity, dtype=np.int64)
+        new_values = np.empty((capacity, len(BAR_COLUMNS)), dtype=np.float64)
+        new_ts[:n] = ts_ns
+        new_values[:n] = values
+        new_ts[n : n + self._size] = self._ts[: self._size]
+        new_values[n : n + self._size] = self._values[: self._size]
+        self._ts = new_ts
+        self._values = new_values
+        self._frame = None
+        self._size += n
+        return n
+
+    def bounds(
+        self, start_ns: Optional[int] = None, end_ns: Optional[int] = None
+    ) -> Tuple[int, int]:
+        """
+        [start, end] に含まれるバーの添字範囲を取得
+
+        Args:
+            start_ns: 開始タイムスタンプ（ns, 含む）
+            end_ns: 終了タイムスタンプ（ns, 含む）
+
+        Returns:
+            Tuple[int, int]: (開始添字, 終了添字)
+        """
+        ts = self._ts[: self._size]
+        lo = 0 if start_ns is None else int(np.searchsorted(ts, start_ns, "left"))
+        hi = self._size if end_ns is None else int(np.searchsorted(ts, end_ns, "right"))
+        return lo, max(lo, hi)
+
+    def view(
+        self,
+        lo: int,
+        hi: int,
+        columns: Sequence[str] = BAR_COLUMNS,
+    ) -> pd.DataFrame:
+        """
+        添字範囲のゼロコピー DataFrame ビューを作成
+
+        Args:
+            lo: 開始添字
+            hi: 終了添字（含まない）
+            columns: 列名（OHLCV の順）
+
+        Returns:
+            pd.DataFrame: timestamp をインデックスとする DataFrame
+        """
+        if self._frame is None:
+            self._frame = pd.DataFrame(
+                self._values, columns=list(BAR_COLUMNS), copy=False
+            )
+        index = pd.DatetimeIndex(
+            self._ts[lo:hi].view("datetime64[ns]"), name="timestamp"
+        )
+        if self.tz is not None:
+            index = index.tz_localize("UTC").tz_convert(self.tz)
+        frame = self._frame.iloc[lo:hi]
+        frame.index = index
+        frame.columns = list(columns)
+        return frame
+
+
+@dataclass
+class _SyncStats:
+    syncs: int = 0
+    sql_skipped: int = 0
+    rows_loaded: int = 0
+    last_sync: Dict[str, str] = field(default_factory=dict)
+
+
+class OHLCVBarStore:
+    """
+    プロセス共有のOHLCVバーストア
+
+    責任:
+    - (通貨ペア, 時間足) ごとのバー列の保持
+    - DBからの差分同期（最大タイムスタンプ以降のみ）
+    - 範囲読み出し（ゼロコピービュー）
+    """
+
+    def __init__(
+        self,
+        min_sync_interval: float = 60.0,
+        initial_lookback_days: int = 60,
+    ):
+        """
+        初期化
+
+        Args:
+            min_sync_interval: 直近同期からこの秒数以内はDBへ問い合わせない
+            initial_lookback_days: 初回同期時に読み込む日数
+        """
+        self.min_sync_interval = min_sync_interval
+        self.initial_lookback_days = initial_lookback_days
+        self._series: Dict[Tuple[str, str], BarSeries] = {}
+        self._lock = threading.Lock()
+        self._stats = _SyncStats()
+
+    def series(self, currency_pair: str, timeframe: str) -> BarSeries:
+        """
+        バー列を取得（存在しなければ作成）
+
+        Args:
+            currency_pair: 通貨ペア
+            timeframe: 時間足
+
+        Returns:
+            BarSeries: バー列
+        """
+        key = (currency_pair, normalize_timeframe(timeframe))
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = BarSeries()
+                self._series[key] = series
+            return series
+
+    def _to_ns(self, series: BarSeries, value: datetime) -> int:
+        ts = pd.Timestamp(value)
+        if series.tz is None:
+            # tz を持たないDB（SQLite）は壁時計時刻で保存されている
+            if ts.tzinfo is not None:
+                ts = ts.tz_localize(None)
+            return int(ts.value)
+        if ts.tzinfo is None:
+            ts = ts.tz_localize(series.tz)
+        return int(ts.value)
+
+    def _observe_tz(self, series: BarSeries, sample: datetime) -> None:
+        if not series.tz_known:
+            series.tz = getattr(sample, "tzinfo", None)
+            series.tz_known = True
+
+    def append(
+        self,
+        currency_pair: str,
+        timeframe: str,
+        timestamp: datetime,
+        open_price: float,
+        high_price: float,
+        low_price: float,
+        close_price: float,
+        volume: float = 0.0,
+    ) -> bool:
+        """
+        バーを1本追加（書き込み側からの直接反映用）
+
+        Args:
+            currency_pair: 通貨ペア
+            timeframe: 時間足
+            timestamp: タイムスタンプ
+            open_price: 始値
+            high_price: 高値
+            low_price: 安値
+            close_price: 終値
+            volume: 出来高
+
+        Returns:
+            bool: 追加・更新した場合True
+        """
+        series = self.series(currency_pair, timeframe)
+        if not series.tz_known:
+            # DB未同期の列に書き込むと初回同期の範囲が狂うため反映しない
+            return False
+        return series.append(
+            self._to_ns(series, timestamp),
+            (
+                float(open_price),
+                float(high_price),
+                float(low_price),
+                float(close_price),
+                float(volume or 0),
+            ),
+        )
+
+    async def sync(
+        self,
+        session: AsyncSession,
+        currency_pair: str,
+        timeframe: str,
+        since: Optional[datetime] = None,
+        force: bool = False,
+    ) -> int:
+        """
+        DBから差分同期
+
+        保持している最大タイムスタンプ以降（形成中バーの更新を拾うため同値を含む）
+        のみを取得する。``since`` が読み込み済み範囲より古い場合は不足分を補う。
+
+        Args:
+            session: データベースセッション
+            currency_pair: 通貨ペア
+            timeframe: 時間足
+            since: 必要な最古のタイムスタンプ
+            force: 同期間隔に関係なく同期する場合True
+
+        Returns:
+            int: 新規に読み込んだバー数
+        """
+        tf = normalize_timeframe(timeframe)
+        series = self.series(currency_pair, tf)
+        now = time.monotonic()
+
+        needs_backfill = False
+        if series.loaded_from is not None and since is not None:
+            needs_backfill = self._to_ns(series, since) < series.loaded_from
+
+        if (
+            not force
+            and not needs_backfill
+            and series.last_sync_monotonic is not None
+            and now - series.last_sync_monotonic < self.min_sync_interval
+        ):
+            self._stats.sql_skipped += 1
+            record_cache_lookup("bar_store", True)
+            return 0
+
+        record_cache_lookup("bar_store", False)
+        loaded = 0
+        try:
+            if series.last_ns is None:
+                start = since or (
+                    datetime.now() - timedelta(days=self.initial_lookback_days)
+                )
+                ts_ns, values = await self._fetch(
+                    session, currency_pair, tf, start, None
+                )
+                loaded += series.extend(ts_ns, values)
+                series.loaded_from = (
+                    int(series._ts[0]) if len(series) else self._to_ns(series, start)
+                )
+            else:
+                if needs_backfill:
+                    ts_ns, values = await self._fetch(
+                        session,
+                        currency_pair,
+                        tf,
+                        since,
+                        self._from_ns(series, series.loaded_from),
+                        end_inclusive=False,
+                    )
+                    loaded += series.prepend(ts_ns, values)
+                    series.loaded_from = self._to_ns(series, since)
+                ts_ns, values = await self._fetch(
+                    session,
+                    currency_pair,
+                    tf,
+                    self._from_ns(series, series.last_ns),
+                    None,
+                )
+                loaded += series.extend(ts_ns, values)
+
+            series.last_sync_monotonic = now
+            self._stats.syncs += 1
+            self._stats.rows_loaded += loaded
+            self._stats.last_sync[f"{currency_pair}:{tf}"] = datetime.now().isoformat()
+            return loaded
+
+        except Exception as e:
+            logger.error(f"Error syncing bar store {currency_pair} {tf}: {e}")
+            return 0
+
+    def _from_ns(self, series: BarSeries, ts_ns: int) -> datetime:
+        ts = pd.Timestamp(ts_ns)
+        if series.tz is not None:
+            ts = ts.tz_localize("UTC").tz_convert(series.tz)
+        return ts.to_pydatetime()
+
+    async def _fetch(
+        self,
+        session: AsyncSession,
+        currency_pair: str,
+        timeframe: str,
+        start: datetime,
+        end: Optional[datetime],
+        end_inclusive: bool = True,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        [start, end] のバーを列指向で取得
+
+        Args:
+            session: データベースセッション
+            currency_pair: 通貨ペア
+            timeframe: 正規化済み時間足
+            start: 開始タイムスタンプ（含む）
+            end: 終了タイムスタンプ
+            end_inclusive: 終了タイムスタンプを含む場合True
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (タイムスタンプ ns 配列, (n, 5) OHLCV 配列)
+        """
+        frame = await PriceDataRepositoryImpl(session).find_ohlcv_frame(
+            start,
+            end,
+            currency_pair,
+            timeframe,
+            include_end=end_inclusive,
+        )
+        if frame.empty:
+            return np.empty(0, dtype=np.int64), np.empty((0, len(BAR_COLUMNS)))
+
+        series = self.series(currency_pair, timeframe)
+        self._observe_tz(series, frame.index[0])
+        index = frame.index
+        if index.tz is not None:
+            index = index.tz_convert("UTC").tz_localize(None)
+        ts_ns = index.as_unit("ns").asi8
+        values = frame[list(BAR_COLUMNS)].to_numpy(dtype=np.float64)
+        return ts_ns, values
+
+    async def get_frame(
+        self,
+        session: AsyncSession,
+        currency_pair: str,
+        timeframe: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        columns: Sequence[str] = BAR_COLUMNS,
+    ) -> pd.DataFrame:
+        """
+        範囲のバーを DataFrame ビューで取得（必要に応じてDB同期）
+
+        Args:
+            session: データベースセッション
+            currency_pair: 通貨ペア
+            timeframe: 時間足
+            start: 開始タイムスタンプ（含む）
+            end: 終了タイムスタンプ（含む）
+            limit: 最大件数（範囲の末尾から）
+            columns: 列名（OHLCV の順）
+
+        Returns:
+            pd.DataFrame: timestamp をインデックスとする DataFrame
+        """
+        await self.sync(session, currency_pair, timeframe, since=start)
+        series = self.series(currency_pair, timeframe)
+        if not len(series):
+            return pd.DataFrame(columns=list(columns))
+
+        lo, hi = series.bounds(
+            None if start is None else self._to_ns(series, start),
+            None if end is None else self._to_ns(series, end),
+        )
+        if limit is not None:
+            lo = max(lo, hi - limit)
+        return series.view(lo, hi, columns)
+
+    async def get_latest_bar(
+        self, session: AsyncSession, currency_pair: str, timeframe: str
+    ) -> Optional[Dict[str, float]]:
+        """
+        最新バーを取得
+
+        Args:
+            session: データベースセッション
+            currency_pair: 通貨ペア
+            timeframe: 時間足
+
+        Returns:
+            Optional[Dict[str, float]]: timestamp と OHLCV の辞書
+        """
+        frame = await self.get_frame(session, currency_pair, timeframe, limit=1)
+        if frame.empty:
+            return None
+        bar = {column: float(frame[column].iloc[0]) for column in BAR_COLUMNS}
+        bar["timestamp"] = frame.index[0].to_pydatetime()
+        return bar
+
+    def invalidate(
+        self, currency_pair: Optional[str] = None, timeframe: Optional[str] = None
+    ) -> None:
+        """
+        次回読み出し時にDB同期させる
+
+        Args:
+            currency_pair: 通貨ペア（Noneで全て）
+            timeframe: 時間足（Noneで全て）
+        """
+        tf = normalize_timeframe(timeframe) if timeframe else None
+        with self._lock:
+            for (pair, series_tf), series in self._series.items():
+                if currency_pair and pair != currency_pair:
+                    continue
+                if tf and series_tf != tf:
+                    continue
+                series.last_sync_monotonic = None
+
+    def clear(self) -> None:
+        """全てのバー列を破棄"""
+        with self._lock:
+            self._series.clear()
+
+    def get_statistics(self) -> Dict[str, object]:
+        """
+        統計情報を取得
+
+        Returns:
+            Dict[str, object]: 統計情報
+        """
+        with self._lock:
+            sizes = {f"{pair}:{tf}": len(s) for (pair, tf), s in self._series.items()}
+        return {
+            "series": sizes,
+            "syncs": self._stats.syncs,
+            "sql_skipped": self._stats.sql_skipped,
+            "rows_loaded": self._stats.rows_loaded,
+            "last_sync": dict(self._stats.last_sync),
+        }
+
+
+_bar_store: Optional[OHLCVBarStore] = None
+_bar_store_lock = threading.Lock()
+
+
+def get_bar_store() -> OHLCVBarStore:
+    """
+    プロセス共有のバーストアを取得
+
+    Returns:
+        OHLCVBarStore: バーストア
+    """
+    global _bar_store
+    if _bar_store is None:
+        with _bar_store_lock:
+            if _bar_store is None:
+                _bar_store = OHLCVBarStore()
+    return _bar_store
@@ -8,17 +8,73 @@ Cache Manager System
 メモリ、ファイル、データベースの3層キャッシュシステム
 """
 
-from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
+import heapq
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from ...domain.repositories.analysis_cache_repository import AnalysisCacheRepository
 from ...utils.cache_utils import generate_cache_key
 from ...utils.logging_config import get_infrastructure_logger
+from ..monitoring.metrics import record_cache_lookup
 from .analysis_cache import AnalysisCacheManager
 from .file_cache import FileCache
+from .segment_file_cache import SegmentCacheLockedError, SegmentFileCache
+from .single_flight import SingleFlight
 
 logger = get_infrastructure_logger()
 
+# get_or_load の鮮度期限を保存するキーの接尾辞
+FRESH_UNTIL_SUFFIX = ":fresh_until"
+
+
+class _MemoryCacheEntry:
+    """メモリキャッシュのエントリ"""
+
+    __slots__ = ("data", "expires_at", "size", "version")
+
+    def __init__(self, data: Any, expires_at: float, size: int, version: int):
+        self.data = data
+        self.expires_at = expires_at
+        self.size = size
+        self.version = version
+
+
+def _estimate_size(data: Any, _depth: int = 0) -> int:
+    """
+    データのおおよそのメモリサイズ（バイト）を推定
+
+    Args:
+        data: 対象データ
+
+    Returns:
+        int: 推定サイズ
+    """
+    nbytes = getattr(data, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    memory_usage = getattr(data, "memory_usage", None)
+    if callable(memory_usage):
+        try:
+            usage = memory_usage(deep=True)
+            return int(usage.sum() if hasattr(usage, "sum") else usage)
+        except Exception:
+            pass
+
+    size = sys.getsizeof(data)
+    if _depth >= 4:
+        return size
+    if isinstance(data, dict):
+        size += sum(
+            _estimate_size(k, _depth + 1) + _estimate_size(v, _depth + 1)
+            for k, v in data.items()
+        )
+    elif isinstance(data, (list, tuple, set, frozenset)):
+        size += sum(_estimate_size(item, _depth + 1) for item in data)
+    return size
+
 
 class MemoryCache:
     """
@@ -28,34 +84,88 @@ class MemoryCache:
     - 高速なメモリベースキャッシュ
     - サイズ制限管理
     - TTL管理
+
+    特徴:
+    - OrderedDict による O(1) の LRU 管理
+    - エントリ単位の TTL（取得時に遅延判定）
+    - 期限ヒープによる償却スイープ（書き込みごとに少量ずつ）
+    - エントリ数・バイト数の上限
     """
 
-    def __init__(self, max_size: int = 1000, ttl_seconds: int = 300):
+    # 書き込み1回あたりに処理する期限切れエントリの上限
+    SWEEP_BATCH = 64
+
+    def __init__(
+        self,
+        max_size: int = 1000,
+        ttl_seconds: int = 300,
+        max_bytes: Optional[int] = None,
+    ):
         """
         初期化
 
         Args:
             max_size: 最大エントリ数
-            ttl_seconds: TTL（秒）
+            ttl_seconds: デフォルトTTL（秒）
+            max_bytes: 最大バイト数（Noneで無制限）
         """
         self.max_size = max_size
         self.ttl_seconds = ttl_seconds
-        self._cache: Dict[str, Dict[str, Any]] = {}
-        self._access_times: Dict[str, datetime] = {}
+        self.max_bytes = max_bytes
+        self._cache: "OrderedDict[str, _MemoryCacheEntry]" = OrderedDict()
+        self._expiry_heap: List[Tuple[float, int, str]] = []
+        self._version = 0
+        self._current_bytes = 0
+        self._lock = threading.RLock()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+        logger.info(
+            f"MemoryCache initialized: max_size={max_size}, ttl={ttl_seconds}s, "
+            f"max_bytes={max_bytes}"
+        )
 
-        logger.info(f"MemoryCache initialized: max_size={max_size}, ttl={ttl_seconds}s")
+    def _remove(self, key: str) -> _MemoryCacheEntry:
+        entry = self._cache.pop(key)
+        self._current_bytes -= entry.size
+        return entry
 
-    def _is_expired(self, access_time: datetime) -> bool:
+    def _sweep(self, now: float, limit: Optional[int]) -> int:
         """
-        期限切れかどうかを判定
+        期限ヒープの先頭から期限切れエントリを削除
 
         Args:
-            access_time: アクセス時刻
+            now: 現在時刻（monotonic）
+            limit: 処理するヒープ要素数の上限（Noneで無制限）
 
         Returns:
-            bool: 期限切れの場合True
+            int: 削除されたエントリ数
         """
-        return datetime.utcnow() - access_time > timedelta(seconds=self.ttl_seconds)
+        removed = 0
+        processed = 0
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now and (limit is None or processed < limit):
+            _, version, key = heapq.heappop(heap)
+            processed += 1
+            entry = self._cache.get(key)
+            # 上書き・削除済みのエントリに対応する古いヒープ要素は読み捨てる
+            if entry is not None and entry.version == version:
+                self._remove(key)
+                removed += 1
+
+        # 上書きで溜まった古いヒープ要素が多い場合は作り直す
+        if len(heap) > 2 * len(self._cache) + 1024:
+            self._expiry_heap = [
+                (entry.expires_at, entry.version, key)
+                for key, entry in self._cache.items()
+            ]
+            heapq.heapify(self._expiry_heap)
+
+        self._expirations += removed
+        return removed
 
     def _cleanup_expired(self) -> int:
         """
@@ -64,44 +174,32 @@ class MemoryCache:
         Returns:
             int: 削除されたエントリ数
         """
-        expired_keys = [
-            key
-            for key, access_time in self._access_times.items()
-            if self._is_expired(access_time)
-        ]
+        with self._lock:
+            removed = self._sweep(time.monotonic(), None)
 
-        for key in expired_keys:
-            del self._cache[key]
-            del self._access_times[key]
+        if removed:
+            logger.debug(f"Cleaned up {removed} expired memory cache entries")
 
-        if expired_keys:
-            logger.debug(f"Cleaned up {len(expired_keys)} expired memory cache entries")
-
-        return len(expired_keys)
+        return removed
 
     def _evict_oldest(self) -> int:
         """
-        古いエントリを削除
+        上限を超えている間、最も古く使われたエントリを削除
 
         Returns:
             int: 削除されたエントリ数
         """
-        if len(self._cache) <= self.max_size:
-            return 0
-
-        # アクセス時刻でソート
-        sorted_items = sorted(self._access_times.items(), key=lambda x: x[1])
-
-        # 古い順に削除
-        to_delete = len(self._cache) - self.max_size
         deleted_count = 0
-
-        for key, _ in sorted_items[:to_delete]:
-            del self._cache[key]
-            del self._access_times[key]
+        while self._cache and (
+            len(self._cache) > self.max_size
+            or (self.max_bytes is not None and self._current_bytes > self.max_bytes)
+        ):
+            key, entry = self._cache.popitem(last=False)
+            self._current_bytes -= entry.size
             deleted_count += 1
 
         if deleted_count > 0:
+            self._evictions += deleted_count
             logger.debug(f"Evicted {deleted_count} old memory cache entries")
 
         return deleted_count
@@ -117,18 +215,24 @@ class MemoryCache:
             Optional[Any]: キャッシュされたデータ
         """
         try:
-            # 期限切れエントリをクリーンアップ
-            self._cleanup_expired()
-
-            if key not in self._cache:
-                return None
-
-            # アクセス時刻を更新
-            self._access_times[key] = datetime.utcnow()
-            data = self._cache[key]
+            with self._lock:
+                entry = self._cache.get(key)
+                if entry is None:
+                    self._misses += 1
+                    return None
+
+                # 期限切れは取得時に判定して削除
+                if entry.expires_at <= time.monotonic():
+                    self._remove(key)
+                    self._expirations += 1
+                    self._misses += 1
+                    return None
+
+                self._cache.move_to_end(key)
+                self._hits += 1
 
             logger.debug(f"Memory cache hit: {key}")
-            return data
+            return entry.data
 
         except Exception as e:
             logger.error(f"Failed to get memory cache for {key}: {str(e)}")
@@ -147,20 +251,33 @@ class MemoryCache:
             bool: 保存成功の場合True
         """
         try:
-            # 期限切れエントリをクリーンアップ
-            self._cleanup_expired()
-
-            # サイズ制限をチェック
-            if len(self._cache) >= self.max_size:
-                self._evict_oldest()
-
             # TTLを設定
             if ttl_seconds is None:
                 ttl_seconds = self.ttl_seconds
 
-            # データを保存
-            self._cache[key] = data
-            self._access_times[key] = datetime.utcnow()
+            # バイト数上限がある場合のみサイズを推定する
+            size = _estimate_size(data) if self.max_bytes is not None else 0
+            if self.max_bytes is not None and size > self.max_bytes:
+                logger.debug(f"Memory cache skip (too large: {size} bytes): {key}")
+                return False
+
+            with self._lock:
+                now = time.monotonic()
+                self._sweep(now, self.SWEEP_BATCH)
+
+                if key in self._cache:
+                    self._remove(key)
+
+                self._version += 1
+                expires_at = now + ttl_seconds
+                self._cache[key] = _MemoryCacheEntry(
+                    data, expires_at, size, self._version
+                )
+                self._current_bytes += size
+                heapq.heappush(self._expiry_heap, (expires_at, self._version, key))
+
+                # サイズ制限をチェック
+                self._evict_oldest()
 
             logger.debug(f"Memory cache set: {key}")
             return True
@@ -180,12 +297,13 @@ class MemoryCache:
             bool: 削除成功の場合True
         """
         try:
-            if key in self._cache:
-                del self._cache[key]
-                del self._access_times[key]
-                logger.debug(f"Memory cache deleted: {key}")
-                return True
-            return False
+            with self._lock:
+                if key not in self._cache:
+                    return False
+                self._remove(key)
+
+            logger.debug(f"Memory cache deleted: {key}")
+            return True
 
         except Exception as e:
             logger.error(f"Failed to delete memory cache for {key}: {str(e)}")
@@ -199,9 +317,11 @@ class MemoryCache:
             int: 削除されたエントリ数
         """
         try:
-            count = len(self._cache)
-            self._cache.clear()
-            self._access_times.clear()
+            with self._lock:
+                count = len(self._cache)
+                self._cache.clear()
+                self._expiry_heap.clear()
+                self._current_bytes = 0
             logger.info(f"Cleared {count} memory cache entries")
             return count
 
@@ -220,17 +340,26 @@ class MemoryCache:
             # 期限切れエントリをクリーンアップ
             expired_count = self._cleanup_expired()
 
-            total_entries = len(self._cache)
-            valid_entries = total_entries - expired_count
-
-            statistics = {
-                "total_entries": total_entries,
-                "valid_entries": valid_entries,
-                "expired_entries": expired_count,
-                "max_size": self.max_size,
-                "usage_percentage": (total_entries / self.max_size) * 100,
-                "ttl_seconds": self.ttl_seconds,
-            }
+            with self._lock:
+                total_entries = len(self._cache)
+                lookups = self._hits + self._misses
+                statistics = {
+                    "total_entries": total_entries,
+                    "valid_entries": total_entries,
+                    "expired_entries": expired_count,
+                    "max_size": self.max_size,
+                    "usage_percentage": (total_entries / self.max_size) * 100,
+                    "ttl_seconds": self.ttl_seconds,
+                    "current_bytes": (
+                        self._current_bytes if self.max_bytes is not None else None
+                    ),
+                    "max_bytes": self.max_bytes,
+                    "hits": self._hits,
+                    "misses": self._misses,
+                    "hit_rate": (self._hits / lookups) * 100 if lookups else 0.0,
+                    "evictions": self._evictions,
+                    "expirations": self._expirations,
+                }
 
             logger.debug(f"Memory cache statistics: {statistics}")
             return statistics
@@ -250,6 +379,7 @@ class CacheManager:
     - データベースキャッシュ管理
     - 有効期限管理
     - 自動クリーンアップ
+    - 同一キーの同時読み込みの集約（get_or_load）
     """
 
     def __init__(
@@ -257,9 +387,11 @@ class CacheManager:
         analysis_cache_repository: AnalysisCacheRepository,
         memory_cache_size: int = 1000,
         memory_cache_ttl: int = 300,
+        memory_cache_max_bytes: Optional[int] = None,
         file_cache_dir: str = "/app/cache",
         file_cache_size_mb: int = 100,
         file_cache_ttl: int = 1800,
+        file_cache_backend: str = "json",
         analysis_cache_ttl_minutes: int = 60,
     ):
         """
@@ -269,28 +401,49 @@ class CacheManager:
             analysis_cache_repository: 分析キャッシュリポジトリ
             memory_cache_size: メモリキャッシュサイズ
             memory_cache_ttl: メモリキャッシュTTL（秒）
+            memory_cache_max_bytes: メモリキャッシュ最大バイト数（Noneで無制限）
             file_cache_dir: ファイルキャッシュディレクトリ
             file_cache_size_mb: ファイルキャッシュサイズ（MB）
             file_cache_ttl: ファイルキャッシュTTL（秒）
+            file_cache_backend: ファイルキャッシュ形式（"json": ファイルごとの
+                gzip JSON、"segment": セグメントファイル。segment は1プロセス専用の
+                ディレクトリでのみ使用でき、他のプロセスが使用中の場合は json になる）
             analysis_cache_ttl_minutes: 分析キャッシュTTL（分）
         """
         # 3層キャッシュを初期化
         self.memory_cache = MemoryCache(
             max_size=memory_cache_size,
             ttl_seconds=memory_cache_ttl,
+            max_bytes=memory_cache_max_bytes,
         )
 
-        self.file_cache = FileCache(
-            cache_dir=file_cache_dir,
-            max_size_mb=file_cache_size_mb,
-            ttl_seconds=file_cache_ttl,
-        )
+        self.file_cache = None
+        if file_cache_backend == "segment":
+            try:
+                self.file_cache = SegmentFileCache(
+                    cache_dir=file_cache_dir,
+                    max_size_mb=file_cache_size_mb,
+                    ttl_seconds=file_cache_ttl,
+                )
+            except SegmentCacheLockedError as e:
+                logger.warning(f"{e}; falling back to JSON file cache")
+        if self.file_cache is None:
+            self.file_cache = FileCache(
+                cache_dir=file_cache_dir,
+                max_size_mb=file_cache_size_mb,
+                ttl_seconds=file_cache_ttl,
+            )
 
         self.analysis_cache = AnalysisCacheManager(
             repository=analysis_cache_repository,
             default_ttl_minutes=analysis_cache_ttl_minutes,
         )
 
+        # get_or_load 用の読み込みの集約（鮮度期限はエントリと一緒に各層へ保存する）
+        self.single_flight = SingleFlight()
+        self._stale_hits = 0
+        self._background_refreshes = 0
+
         logger.info(
             f"CacheManager initialized with 3-layer cache system: "
             f"memory({memory_cache_size} entries, {memory_cache_ttl}s), "
@@ -311,6 +464,78 @@ class CacheManager:
         """
         return generate_cache_key(cache_type, components)
 
+    def _get_fresh_until(
+        self, cache_key: str, use_memory: bool, use_file: bool
+    ) -> Optional[float]:
+        """
+        get_or_load で保存したエントリの鮮度期限を取得
+
+        鮮度期限はエントリと同じメモリ・ファイル層に保存するため、
+        別プロセス（cron など）から読んでも期限切れを判定できる。
+
+        Args:
+            cache_key: キャッシュキー
+            use_memory: メモリキャッシュを使用するか
+            use_file: ファイルキャッシュを使用するか
+
+        Returns:
+            Optional[float]: 鮮度期限（UNIXタイムスタンプ、未保存の場合はNone）
+        """
+        marker_key = cache_key + FRESH_UNTIL_SUFFIX
+        if use_memory:
+            fresh_until = self.memory_cache.get(marker_key)
+            if fresh_until is not None:
+                return fresh_until
+        if use_file:
+            fresh_until = self.file_cache.get(marker_key)
+            if fresh_until is not None:
+                if use_memory:
+                    remaining = max(1, int(fresh_until - time.time()))
+                    self.memory_cache.set(marker_key, fresh_until, remaining)
+                return fresh_until
+        return None
+
+    def _set_fresh_until(
+        self,
+        cache_key: str,
+        fresh_until: float,
+        ttl_seconds: int,
+        use_memory: bool,
+        use_file: bool,
+    ) -> None:
+        """
+        エントリの鮮度期限をエントリと同じ層に保存
+
+        Args:
+            cache_key: キャッシュキー
+            fresh_until: 鮮度期限（UNIXタイムスタンプ）
+            ttl_seconds: 保存期間（秒、エントリと同じ）
+            use_memory: メモリキャッシュを使用するか
+            use_file: ファイルキャッシュを使用するか
+        """
+        marker_key = cache_key + FRESH_UNTIL_SUFFIX
+        if use_memory:
+            self.memory_cache.set(marker_key, fresh_until, ttl_seconds)
+        if use_file:
+            self.file_cache.set(marker_key, fresh_until, ttl_seconds)
+
+    def _delete_fresh_until(
+        self, cache_key: str, use_memory: bool, use_file: bool
+    ) -> None:
+        """
+        エントリの鮮度期限を削除
+
+        Args:
+            cache_key: キャッシュキー
+            use_memory: メモリキャッシュを使用するか
+            use_file: ファイルキャッシュを使用するか
+        """
+        marker_key = cache_key + FRESH_UNTIL_SUFFIX
+        if use_memory:
+            self.memory_cache.delete(marker_key)
+        if use_file:
+            self.file_cache.delete(marker_key)
+
     async def get(
         self,
         cache_type: str,
@@ -338,6 +563,7 @@ class CacheManager:
             # 1. メモリキャッシュから検索
             if use_memory:
                 data = self.memory_cache.get(cache_key)
+                record_cache_lookup("memory", data is not None)
                 if data is not None:
                     logger.debug(f"Cache hit (memory): {cache_key}")
                     return data
@@ -345,6 +571,7 @@ class CacheManager:
             # 2. ファイルキャッシュから検索
             if use_file:
                 data = self.file_cache.get(cache_key)
+                record_cache_lookup("file", data is not None)
                 if data is not None:
                     # メモリキャッシュにも保存
                     if use_memory:
@@ -355,6 +582,7 @@ class CacheManager:
             # 3. データベースキャッシュから検索（分析キャッシュの場合）
             if use_database and cache_type == "analysis":
                 data = await self.analysis_cache.get_analysis(**components)
+                record_cache_lookup("database", data is not None)
                 if data is not None:
                     # メモリとファイルキャッシュにも保存
                     if use_memory:
@@ -399,6 +627,8 @@ class CacheManager:
         try:
             cache_key = self._generate_cache_key(cache_type, components)
             success_count = 0
+            # 直接保存したエントリは鮮度期限を持たない（TTL まで新鮮とみなす）
+            self._delete_fresh_until(cache_key, use_memory, use_file)
 
             # 1. メモリキャッシュに保存
             if use_memory:
@@ -425,6 +655,88 @@ class CacheManager:
             logger.error(f"Failed to set cache for {cache_type}: {str(e)}")
             return False
 
+    async def get_or_load(
+        self,
+        cache_type: str,
+        components: Dict[str, Any],
+        loader: Callable[[], Awaitable[Any]],
+        ttl_seconds: Optional[int] = None,
+        stale_ttl_seconds: int = 0,
+        use_memory: bool = True,
+        use_file: bool = True,
+        use_database: bool = True,
+    ) -> Optional[Any]:
+        """
+        キャッシュから取得し、なければ読み込んで保存
+
+        同じキーのキャッシュミスが同時に発生した場合、読み込みは1回だけ実行し、
+        他の呼び出しはその結果を待つ。stale_ttl_seconds を指定すると、TTL 経過後も
+        その期間はキャッシュ済みのデータを即座に返し、バックグラウンドで1回だけ
+        再読み込みする。
+
+        Args:
+            cache_type: キャッシュタイプ
+            components: キーコンポーネント
+            loader: 読み込み関数（引数なしのコルーチン関数、Noneや空のデータはキャッシュしない）
+            ttl_seconds: TTL（秒、Noneの場合はメモリキャッシュのデフォルト値）
+            stale_ttl_seconds: TTL 経過後に期限切れデータを提供する期間（秒）
+            use_memory: メモリキャッシュを使用するか
+            use_file: ファイルキャッシュを使用するか
+            use_database: データベースキャッシュを使用するか
+
+        Returns:
+            Optional[Any]: キャッシュされたデータまたは読み込んだデータ
+        """
+        cache_key = self._generate_cache_key(cache_type, components)
+
+        async def _load_and_set() -> Any:
+            data = await loader()
+            if data is None or (hasattr(data, "__len__") and len(data) == 0):
+                return data
+
+            fresh_ttl = ttl_seconds if ttl_seconds else self.memory_cache.ttl_seconds
+            await self.set(
+                cache_type,
+                components,
+                data,
+                ttl_seconds=fresh_ttl + stale_ttl_seconds,
+                use_memory=use_memory,
+                use_file=use_file,
+                use_database=use_database,
+            )
+            if stale_ttl_seconds > 0:
+                self._set_fresh_until(
+                    cache_key,
+                    time.time() + fresh_ttl,
+                    fresh_ttl + stale_ttl_seconds,
+                    use_memory,
+                    use_file,
+                )
+            return data
+
+        data = await self.get(
+            cache_type,
+            components,
+            use_memory=use_memory,
+            use_file=use_file,
+            use_database=use_database,
+        )
+        if data is not None:
+            fresh_until = (
+                self._get_fresh_until(cache_key, use_memory, use_file)
+                if stale_ttl_seconds > 0
+                else None
+            )
+            if fresh_until is not None and time.time() > fresh_until:
+                self._stale_hits += 1
+                if self.single_flight.start_background(cache_key, _load_and_set):
+                    self._background_refreshes += 1
+                    logger.debug(f"Serving stale cache, refreshing: {cache_key}")
+            return data
+
+        data, _ = await self.single_flight.do(cache_key, _load_and_set)
+        return data
+
     async def delete(
         self,
         cache_type: str,
@@ -449,6 +761,7 @@ class CacheManager:
         try:
             cache_key = self._generate_cache_key(cache_type, components)
             success_count = 0
+            self._delete_fresh_until(cache_key, use_memory, use_file)
 
             # 1. メモリキャッシュから削除
             if use_memory:
@@ -514,6 +827,11 @@ class CacheManager:
                 "memory_cache": memory_stats,
                 "file_cache": file_stats,
                 "analysis_cache": analysis_stats,
+                "single_flight": {
+                    **self.single_flight.get_statistics(),
+                    "stale_hits": self._stale_hits,
+                    "background_refreshes": self._background_refreshes,
+                },
                 "total_entries": (
                     memory_stats.get("total_entries", 0)
                     + file_stats.get("total_files", 0)
@@ -19,6 +19,7 @@ import redis.asyncio as redis
 from redis.asyncio import Redis
 
 from ...utils.logging_config import get_infrastructure_logger
+from ..monitoring.metrics import record_cache_lookup
 
 logger = get_infrastructure_logger()
 
@@ -246,10 +247,12 @@ class RedisClient:
 
             if value is None:
                 self._stats["misses"] += 1
+                record_cache_lookup("redis", False)
                 logger.debug(f"Cache miss: {key}")
                 return default
 
             self._stats["hits"] += 1
+            record_cache_lookup("redis", True)
             logger.debug(f"Cache hit: {key}")
 
             return self._deserialize_value(value, value_type)
@@ -0,0 +1,926 @@
+"""
+Segment File Cache System
+セグメントファイルキャッシュシステム
+
+設計書参照:
+- api_optimization_design_2025.md
+
+追記型セグメントファイルとメモリ上のオフセットインデックスによる
+ディスクベースのキャッシュシステム（CacheManager の中間層）
+
+レコード形式:
+- ヘッダ（マジック・フラグ・キー長・値記述長・バッファ数・有効期限・レコード長）
+- キー（UTF-8）
+- 値の記述（JSON。数値・日時の配列はバッファ番号で参照）
+- バッファテーブル（レコード先頭からの相対オフセット・長さ）
+- 64バイト境界に揃えた生バッファ（ndarray / DataFrame の数値・日時列）
+
+値の記述はデータのみを表す JSON のため、キャッシュディレクトリに書き込める
+相手がいてもコードは実行されない（pickle は使わない）。
+読み込み時は生バッファを mmap（ACCESS_COPY）上のビューから復元するため、
+ndarray・数値列はコピーせずに復元される。書き込みはプライベートページに
+コピーされ、ファイルには反映されない。
+
+セグメントのオフセットはプロセス内で管理するため、1つのディレクトリを
+使えるのは1プロセスのみ（初期化時にディレクトリのロックを取得し、
+取得できない場合は SegmentCacheLockedError を送出する）。
+"""
+
+import io
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+import numpy as np
+import pandas as pd
+
+from ...utils.logging_config import get_infrastructure_logger
+
+logger = get_infrastructure_logger()
+
+_MAGIC = b"FCS2"
+_FLAG_TOMBSTONE = 0x01
+_ALIGNMENT = 64
+_SEGMENT_SUFFIX = ".seg"
+_LOCK_FILE = ".segment.lock"
+
+# magic, flags, key_len, stream_len, n_buffers, expires_at, record_size
+_HEADER = struct.Struct("<4sB3xIIIdQ")
+# offset（レコード先頭からの相対位置）, length
+_BUFFER_ENTRY = struct.Struct("<QQ")
+
+
+def _align(value: int) -> int:
+    return (value + _ALIGNMENT - 1) & ~(_ALIGNMENT - 1)
+
+
+class SegmentCacheLockedError(RuntimeError):
+    """キャッシュディレクトリを他のプロセスが使用中"""
+
+
+def _rebuild_datetime_array(values: np.ndarray, unit: str, tz: Any):
+    """UTC基準の int64 値から日時配列を復元（タイムゾーン付きの場合のみコピー）"""
+    index = pd.DatetimeIndex(values.view(f"M8[{unit}]"), copy=False)
+    if tz is not None:
+        index = index.tz_localize("UTC").tz_convert(tz)
+    return index.array
+
+
+def _encode_tz(tz: Any) -> Any:
+    if tz is None:
+        return None
+    if isinstance(tz, timezone):
+        return {"offset": tz.utcoffset(None).total_seconds()}
+    return str(tz)
+
+
+def _decode_tz(value: Any) -> Any:
+    if isinstance(value, dict):
+        return timezone(timedelta(seconds=value["offset"]))
+    return value
+
+
+def _add_buffer(array: np.ndarray, buffers: List[memoryview]) -> int:
+    array = np.ascontiguousarray(array)
+    buffers.append(memoryview(array.reshape(-1).view(np.uint8)))
+    return len(buffers) - 1
+
+
+def _encode_array(array: np.ndarray, buffers: List[memoryview]) -> Dict[str, Any]:
+    if array.dtype.kind in "biufcmM":
+        return {
+            "t": "ndarray",
+            "b": _add_buffer(array, buffers),
+            "dtype": array.dtype.str,
+            "shape": list(array.shape),
+        }
+    return {
+        "t": "objarray",
+        "v": [_encode_value(item, buffers) for item in array.ravel().tolist()],
+        "shape": list(array.shape),
+    }
+
+
+def _encode_column(values: Any, buffers: List[memoryview]) -> Dict[str, Any]:
+    """Series・Index の値（日時は int64 のバッファとして保存）"""
+    array = getattr(values, "array", values)
+    if isinstance(array, pd.arrays.DatetimeArray):
+        return {
+            "t": "dtarray",
+            "b": _add_buffer(array.asi8, buffers),
+            "unit": array.unit,
+            "tz": _encode_tz(array.tz),
+        }
+    if isinstance(values.dtype, np.dtype) and values.dtype.kind in "biufcmM":
+        return _encode_array(np.asarray(values), buffers)
+    return {
+        "t": "column",
+        "dtype": str(values.dtype),
+        "v": [_encode_value(item, buffers) for item in list(values)],
+    }
+
+
+def _encode_value(value: Any, buffers: List[memoryview]) -> Any:
+    """
+    値を JSON で表せる記述に変換
+
+    dict は常に {"t": "dict"} で包むため、記述中の JSON オブジェクトは
+    すべて型付きの記述になる。
+
+    Raises:
+        TypeError: 保存できない型の場合
+    """
+    if value is None or isinstance(value, (bool, str)):
+        return value
+    if isinstance(value, (int, float)):
+        return value
+    if value is pd.NaT:
+        return {"t": "nat"}
+    if value is pd.NA:
+        return {"t": "na"}
+    if isinstance(value, np.generic):
+        return _encode_value(value.item(), buffers)
+    if isinstance(value, pd.Timestamp):
+        return {"t": "timestamp", "v": value.isoformat()}
+    if isinstance(value, datetime):
+        return {"t": "datetime", "v": value.isoformat()}
+    if isinstance(value, date):
+        return {"t": "date", "v": value.isoformat()}
+    if isinstance(value, timedelta):
+        return {"t": "timedelta", "v": value.total_seconds()}
+    if isinstance(value, Decimal):
+        return {"t": "decimal", "v": str(value)}
+    if isinstance(value, list):
+        return [_encode_value(item, buffers) for item in value]
+    if isinstance(value, tuple):
+        return {"t": "tuple", "v": [_encode_value(item, buffers) for item in value]}
+    if isinstance(value, dict):
+        return {
+            "t": "dict",
+            "k": [_encode_value(key, buffers) for key in value],
+            "v": [_encode_value(item, buffers) for item in value.values()],
+        }
+    if isinstance(value, np.ndarray):
+        return _encode_array(value, buffers)
+    if isinstance(value, pd.RangeIndex):
+        return {
+            "t": "rangeindex",
+            "start": value.start,
+            "stop": value.stop,
+            "step": value.step,
+            "name": _encode_value(value.name, buffers),
+        }
+    if isinstance(value, pd.Index) and not isinstance(value, pd.MultiIndex):
+        return {
+            "t": "index",
+            "v": _encode_column(value, buffers),
+            "name": _encode_value(value.name, buffers),
+        }
+    if isinstance(value, pd.Series):
+        return {
+            "t": "series",
+            "v": _encode_column(value, buffers),
+            "index": _encode_value(value.index, buffers),
+            "name": _encode_value(value.name, buffers),
+        }
+    if isinstance(value, pd.DataFrame):
+        return {
+            "t": "frame",
+            "columns": _encode_value(value.columns, buffers),
+            "v": [
+                _encode_column(value.iloc[:, i], buffers) for i in range(value.shape[1])
+            ],
+            "index": _encode_value(value.index, buffers),
+        }
+    raise TypeError(f"Unsupported cache value type: {type(value).__name__}")
+
+
+def _decode_column(spec: Dict[str, Any], buffers: List[memoryview]) -> Any:
+    if spec["t"] == "dtarray":
+        values = np.frombuffer(buffers[spec["b"]], dtype=np.int64)
+        return _rebuild_datetime_array(values, spec["unit"], _decode_tz(spec["tz"]))
+    if spec["t"] == "column":
+        return pd.array(
+            [_decode_value(item, buffers) for item in spec["v"]], dtype=spec["dtype"]
+        )
+    return _decode_value(spec, buffers)
+
+
+def _decode_value(spec: Any, buffers: List[memoryview]) -> Any:
+    """_encode_value の記述から値を復元"""
+    if isinstance(spec, list):
+        return [_decode_value(item, buffers) for item in spec]
+    if not isinstance(spec, dict):
+        return spec
+
+    kind = spec["t"]
+    if kind == "dict":
+        return {
+            _decode_value(key, buffers): _decode_value(item, buffers)
+            for key, item in zip(spec["k"], spec["v"])
+        }
+    if kind == "tuple":
+        return tuple(_decode_value(item, buffers) for item in spec["v"])
+    if kind == "nat":
+        return pd.NaT
+    if kind == "na":
+        return pd.NA
+    if kind == "timestamp":
+        return pd.Timestamp(spec["v"])
+    if kind == "datetime":
+        return datetime.fromisoformat(spec["v"])
+    if kind == "date":
+        return date.fromisoformat(spec["v"])
+    if kind == "timedelta":
+        return timedelta(seconds=spec["v"])
+    if kind == "decimal":
+        return Decimal(spec["v"])
+    if kind == "ndarray":
+        return np.frombuffer(buffers[spec["b"]], dtype=np.dtype(spec["dtype"])).reshape(
+            spec["shape"]
+        )
+    if kind == "objarray":
+        array = np.empty(len(spec["v"]), dtype=object)
+        array[:] = [_decode_value(item, buffers) for item in spec["v"]]
+        return array.reshape(spec["shape"])
+    if kind == "rangeindex":
+        return pd.RangeIndex(
+            spec["start"],
+            spec["stop"],
+            spec["step"],
+            name=_decode_value(spec["name"], buffers),
+        )
+    if kind == "index":
+        return pd.Index(
+            _decode_column(spec["v"], buffers),
+            name=_decode_value(spec["name"], buffers),
+            copy=False,
+        )
+    if kind == "series":
+        return pd.Series(
+            _decode_column(spec["v"], buffers),
+            index=_decode_value(spec["index"], buffers),
+            name=_decode_value(spec["name"], buffers),
+            copy=False,
+        )
+    if kind == "frame":
+        frame = pd.DataFrame(
+            {i: _decode_column(column, buffers) for i, column in enumerate(spec["v"])},
+            index=_decode_value(spec["index"], buffers),
+            copy=False,
+        )
+        frame.columns = _decode_value(spec["columns"], buffers)
+        return frame
+    raise ValueError(f"Unknown cache value kind: {kind}")
+
+
+class _SegmentEntry:
+    """インデックスのエントリ（レコードの位置と有効期限）"""
+
+    __slots__ = ("segment", "offset", "size", "expires_at")
+
+    def __init__(self, segment: int, offset: int, size: int, expires_at: float):
+        self.segment = segment
+        self.offset = offset
+        self.size = size
+        self.expires_at = expires_at
+
+
+class SegmentFileCache:
+    """
+    セグメントファイルキャッシュシステム
+
+    責任:
+    - 追記型セグメントファイルへのキャッシュ保存
+    - オフセットインデックスの管理（起動時にセグメントを走査して再構築）
+    - サイズ制限の管理（古い順に削除）
+    - TTL管理
+    - バックグラウンドでのコンパクション
+
+    特徴:
+    - FileCache と同じインターフェース
+    - DataFrame・ndarray を生バッファで保存し、mmap からコピーなしで復元
+    - サイズはレコード追加・削除時に差分で更新
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = "/app/cache",
+        max_size_mb: int = 100,
+        ttl_seconds: int = 1800,
+        segment_size_mb: Optional[int] = None,
+        compaction_ratio: float = 0.5,
+    ):
+        """
+        初期化
+
+        Args:
+            cache_dir: キャッシュディレクトリ
+            max_size_mb: 最大サイズ（MB、有効なレコードの合計）
+            ttl_seconds: TTL（秒）
+            segment_size_mb: セグメントの切り替えサイズ（MB、Noneで最大サイズの1/4）
+            compaction_ratio: コンパクションを開始する不要領域の割合
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_size_mb = max_size_mb
+        self.ttl_seconds = ttl_seconds
+        self.segment_bytes = (
+            (
+                segment_size_mb
+                if segment_size_mb is not None
+                else max(1, max_size_mb // 4)
+            )
+            * 1024
+            * 1024
+        )
+        self.compaction_ratio = compaction_ratio
+
+        self._lock = threading.RLock()
+        self._index: "OrderedDict[str, _SegmentEntry]" = OrderedDict()
+        self._segment_sizes: Dict[int, int] = {}
+        self._segment_live: Dict[int, int] = {}
+        self._readers: Dict[int, BinaryIO] = {}
+        self._active_id = 0
+        self._active_file: Optional[io.BufferedWriter] = None
+        self._live_bytes = 0
+        self._total_bytes = 0
+        self._compaction_thread: Optional[threading.Thread] = None
+        self._compactions = 0
+
+        # キャッシュディレクトリを作成
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._lock_file = self._acquire_directory_lock()
+        self._load_segments()
+
+        logger.info(
+            f"SegmentFileCache initialized: {cache_dir}, "
+            f"max_size: {max_size_mb}MB, ttl: {ttl_seconds}s, "
+            f"entries: {len(self._index)}"
+        )
+
+    # ------------------------------------------------------------------
+    # セグメント管理
+    # ------------------------------------------------------------------
+
+    def _acquire_directory_lock(self) -> BinaryIO:
+        """
+        キャッシュディレクトリの排他ロックを取得
+
+        ロックはプロセス終了（ファイルのクローズ）で解放される。
+
+        Raises:
+            SegmentCacheLockedError: 他のプロセスが使用中の場合
+        """
+        lock_file = open(self.cache_dir / _LOCK_FILE, "ab")
+        if fcntl is not None:
+            try:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                lock_file.close()
+                raise SegmentCacheLockedError(
+                    f"Segment cache directory is in use by another process: "
+                    f"{self.cache_dir}"
+                )
+        return lock_file
+
+    def close(self) -> None:
+        """ファイルを閉じてディレクトリのロックを解放"""
+        with self._lock:
+            if self._active_file is not None:
+                self._active_file.close()
+                self._active_file = None
+            for reader in self._readers.values():
+                reader.close()
+            self._readers.clear()
+            self._lock_file.close()
+
+    def _segment_path(self, segment: int) -> Path:
+        return self.cache_dir / f"{segment:08d}{_SEGMENT_SUFFIX}"
+
+    def _load_segments(self) -> None:
+        """既存セグメントを走査してインデックスを再構築"""
+        segments = sorted(
+            int(path.stem)
+            for path in self.cache_dir.glob(f"*{_SEGMENT_SUFFIX}")
+            if path.stem.isdigit()
+        )
+        now = time.time()
+        for segment in segments:
+            path = self._segment_path(segment)
+            file_size = path.stat().st_size
+            valid_size = 0
+            self._segment_sizes[segment] = 0
+            self._segment_live[segment] = 0
+
+            if file_size > 0:
+                with open(path, "rb") as f:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        valid_size = self._scan_segment(segment, mm, file_size, now)
+
+            if valid_size < file_size:
+                # 書き込み途中で終了したレコードを切り捨て
+                logger.warning(
+                    f"Truncating segment {path.name}: {file_size} -> {valid_size} bytes"
+                )
+                os.truncate(path, valid_size)
+
+            self._segment_sizes[segment] = valid_size
+            self._total_bytes += valid_size
+
+        self._active_id = segments[-1] if segments else 0
+        self._open_active()
+
+    def _scan_segment(
+        self, segment: int, mm: mmap.mmap, file_size: int, now: float
+    ) -> int:
+        """
+        セグメント内のレコードをインデックスに登録
+
+        Returns:
+            int: 有効なレコードの末尾オフセット
+        """
+        offset = 0
+        while offset + _HEADER.size <= file_size:
+            magic, flags, key_len, _, _, expires_at, size = _HEADER.unpack_from(
+                mm, offset
+            )
+            if magic != _MAGIC or size < _HEADER.size or offset + size > file_size:
+                break
+
+            start = offset + _HEADER.size
+            key = mm[start : start + key_len].decode("utf-8")
+            self._discard(key)
+            if not flags & _FLAG_TOMBSTONE and expires_at > now:
+                self._add(key, _SegmentEntry(segment, offset, size, expires_at))
+            offset += size
+        return offset
+
+    def _open_active(self) -> None:
+        if self._active_file is not None:
+            self._active_file.close()
+        path = self._segment_path(self._active_id)
+        self._active_file = open(path, "ab")
+        self._segment_sizes.setdefault(self._active_id, 0)
+        self._segment_live.setdefault(self._active_id, 0)
+
+    def _roll_segment(self) -> None:
+        """アクティブセグメントを切り替え"""
+        self._active_id += 1
+        self._open_active()
+
+    def _map_record(
+        self, entry: _SegmentEntry, access: int = mmap.ACCESS_COPY
+    ) -> Tuple[mmap.mmap, int]:
+        """
+        レコードの範囲を mmap
+
+        ACCESS_COPY のマップは呼び出しごとに作成するため、返却したデータへの
+        書き込みは他の取得結果やファイルに影響しない。マップは参照する配列が
+        無くなった時点で解放され、セグメント削除後も有効なまま残る。
+
+        Returns:
+            Tuple[mmap.mmap, int]: (マップ, マップ内でのレコード先頭位置)
+        """
+        reader = self._readers.get(entry.segment)
+        if reader is None:
+            reader = open(self._segment_path(entry.segment), "rb")
+            self._readers[entry.segment] = reader
+        base = entry.offset % mmap.ALLOCATIONGRANULARITY
+        mm = mmap.mmap(
+            reader.fileno(),
+            base + entry.size,
+            access=access,
+            offset=entry.offset - base,
+        )
+        return mm, base
+
+    def _drop_segment(self, segment: int) -> None:
+        reader = self._readers.pop(segment, None)
+        if reader is not None:
+            reader.close()
+        self._total_bytes -= self._segment_sizes.pop(segment, 0)
+        self._segment_live.pop(segment, None)
+        self._segment_path(segment).unlink(missing_ok=True)
+
+    # ------------------------------------------------------------------
+    # インデックス管理
+    # ------------------------------------------------------------------
+
+    def _add(self, key: str, entry: _SegmentEntry) -> None:
+        self._index[key] = entry
+        self._segment_live[entry.segment] += entry.size
+        self._live_bytes += entry.size
+
+    def _discard(self, key: str) -> Optional[_SegmentEntry]:
+        entry = self._index.pop(key, None)
+        if entry is not None:
+            self._segment_live[entry.segment] -= entry.size
+            self._live_bytes -= entry.size
+        return entry
+
+    def _append(self, parts: List[Any], size: int) -> Tuple[int, int]:
+        """
+        アクティブセグメントにレコードを追記
+
+        Returns:
+            Tuple[int, int]: (セグメント番号, オフセット)
+        """
+        if self._segment_sizes[self._active_id] >= self.segment_bytes:
+            self._roll_segment()
+
+        segment = self._active_id
+        offset = self._segment_sizes[segment]
+        try:
+            for part in parts:
+                self._active_file.write(part)
+            self._active_file.flush()
+        except Exception:
+            # 書きかけのレコードを残さない
+            self._active_file.close()
+            os.truncate(self._segment_path(segment), offset)
+            self._active_file = None
+            self._open_active()
+            raise
+
+        self._segment_sizes[segment] = offset + size
+        self._total_bytes += size
+        return segment, offset
+
+    @staticmethod
+    def _encode(
+        key: str, data: Any, expires_at: float, flags: int = 0
+    ) -> Tuple[List[Any], int]:
+        """
+        レコードを書き込み用のバイト列に変換
+
+        Returns:
+            Tuple[List[Any], int]: (書き込むバイト列のリスト, レコード長)
+        """
+        key_bytes = key.encode("utf-8")
+        buffers: List[memoryview] = []
+        stream = b""
+        if not flags & _FLAG_TOMBSTONE:
+            stream = json.dumps(
+                _encode_value(data, buffers), ensure_ascii=False
+            ).encode("utf-8")
+
+        head_size = (
+            _HEADER.size
+            + len(key_bytes)
+            + len(stream)
+            + _BUFFER_ENTRY.size * len(buffers)
+        )
+        table = bytearray()
+        layout: List[Tuple[int, memoryview]] = []
+        position = _align(head_size)
+        for buf in buffers:
+            table += _BUFFER_ENTRY.pack(position, buf.nbytes)
+            layout.append((position, buf))
+            position = _align(position + buf.nbytes)
+        size = _align(head_size) if not buffers else position
+
+        header = _HEADER.pack(
+            _MAGIC, flags, len(key_bytes), len(stream), len(buffers), expires_at, size
+        )
+        parts: List[Any] = [header, key_bytes, stream, bytes(table)]
+        written = head_size
+        for position, buf in layout:
+            parts.append(bytes(position - written))
+            parts.append(buf)
+            written = position + buf.nbytes
+        parts.append(bytes(size - written))
+        return parts, size
+
+    def _decode(self, entry: _SegmentEntry) -> Any:
+        mm, base = self._map_record(entry)
+        _, _, key_len, stream_len, n_buffers, _, _ = _HEADER.unpack_from(mm, base)
+
+        view = memoryview(mm)
+        start = base + _HEADER.size + key_len
+        stream = view[start : start + stream_len]
+        table = start + stream_len
+        buffers = []
+        for i in range(n_buffers):
+            position, length = _BUFFER_ENTRY.unpack_from(
+                mm, table + i * _BUFFER_ENTRY.size
+            )
+            buffers.append(view[base + position : base + position + length])
+        return _decode_value(json.loads(bytes(stream)), buffers)
+
+    # ------------------------------------------------------------------
+    # FileCache 互換インターフェース
+    # ------------------------------------------------------------------
+
+    def _get_cache_size_mb(self) -> float:
+        """
+        キャッシュサイズを取得（MB）
+
+        Returns:
+            float: 有効なレコードの合計サイズ（MB）
+        """
+        return self._live_bytes / (1024 * 1024)
+
+    def _cleanup_expired_files(self) -> int:
+        """
+        期限切れエントリを削除
+
+        Returns:
+            int: 削除されたエントリ数
+        """
+        now = time.time()
+        with self._lock:
+            expired = [
+                key for key, entry in self._index.items() if entry.expires_at <= now
+            ]
+            for key in expired:
+                self._discard(key)
+
+        if expired:
+            logger.info(f"Cleaned up {len(expired)} expired cache entries")
+            self._maybe_compact()
+        return len(expired)
+
+    def _cleanup_oldest_entries(self, target_size_mb: float) -> int:
+        """
+        古いエントリを削除してサイズを調整
+
+        削除はトゥームストーンを追記して再起動後も有効にする。
+
+        Args:
+            target_size_mb: 目標サイズ（MB）
+
+        Returns:
+            int: 削除されたエントリ数
+        """
+        target_bytes = target_size_mb * 1024 * 1024
+        deleted_count = 0
+        with self._lock:
+            while self._index and self._live_bytes > target_bytes:
+                key = next(iter(self._index))
+                self._discard(key)
+                self._write_tombstone(key)
+                deleted_count += 1
+
+        if deleted_count > 0:
+            logger.info(f"Cleaned up {deleted_count} old cache entries")
+        return deleted_count
+
+    def _write_tombstone(self, key: str) -> None:
+        parts, size = self._encode(key, None, 0.0, _FLAG_TOMBSTONE)
+        self._append(parts, size)
+
+    def get(self, cache_key: str) -> Optional[Any]:
+        """
+        キャッシュからデータを取得
+
+        Args:
+            cache_key: キャッシュキー
+
+        Returns:
+            Optional[Any]: キャッシュされたデータ
+        """
+        try:
+            with self._lock:
+                entry = self._index.get(cache_key)
+                if entry is None:
+                    return None
+                if entry.expires_at <= time.time():
+                    self._discard(cache_key)
+                    return None
+                self._index.move_to_end(cache_key)
+                data = self._decode(entry)
+
+            logger.debug(f"Cache hit: {cache_key}")
+            return data
+
+        except Exception as e:
+            logger.error(f"Failed to get cache for {cache_key}: {str(e)}")
+            return None
+
+    def set(self, cache_key: str, data: Any, ttl_seconds: Optional[int] = None) -> bool:
+        """
+        キャッシュにデータを保存
+
+        Args:
+            cache_key: キャッシュキー
+            data: 保存するデータ
+            ttl_seconds: TTL（秒、Noneの場合はデフォルト値）
+
+        Returns:
+            bool: 保存成功の場合True
+        """
+        try:
+            # TTLを設定
+            if ttl_seconds is None:
+                ttl_seconds = self.ttl_seconds
+            expires_at = time.time() + ttl_seconds
+
+            # シリアライズはロック外で行う
+            parts, size = self._encode(cache_key, data, expires_at)
+
+            with self._lock:
+                segment, offset = self._append(parts, size)
+                self._discard(cache_key)
+                self._add(cache_key, _SegmentEntry(segment, offset, size, expires_at))
+
+                # サイズ制限をチェック
+                if self._get_cache_size_mb() > self.max_size_mb * 0.9:
+                    self._cleanup_oldest_entries(self.max_size_mb * 0.8)
+
+            self._maybe_compact()
+            logger.debug(f"Cache set: {cache_key}, size: {size} bytes")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to set cache for {cache_key}: {str(e)}")
+            return False
+
+    def delete(self, cache_key: str) -> bool:
+        """
+        キャッシュを削除
+
+        Args:
+            cache_key: キャッシュキー
+
+        Returns:
+            bool: 削除成功の場合True
+        """
+        try:
+            with self._lock:
+                if self._discard(cache_key) is None:
+                    return False
+                self._write_tombstone(cache_key)
+
+            logger.debug(f"Cache deleted: {cache_key}")
+            self._maybe_compact()
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to delete cache for {cache_key}: {str(e)}")
+            return False
+
+    def clear(self) -> int:
+        """
+        全キャッシュを削除
+
+        Returns:
+            int: 削除されたエントリ数
+        """
+        try:
+            with self._lock:
+                deleted_count = len(self._index)
+                self._index.clear()
+                self._live_bytes = 0
+                if self._active_file is not None:
+                    self._active_file.close()
+                    self._active_file = None
+                for segment in list(self._segment_sizes):
+                    self._drop_segment(segment)
+                self._active_id += 1
+                self._open_active()
+
+            logger.info(f"Cleared {deleted_count} cache entries")
+            return deleted_count
+
+        except Exception as e:
+            logger.error(f"Failed to clear cache: {str(e)}")
+            return 0
+
+    # ------------------------------------------------------------------
+    # コンパクション
+    # ------------------------------------------------------------------
+
+    def _dead_bytes(self) -> int:
+        return self._total_bytes - self._live_bytes
+
+    def _maybe_compact(self) -> None:
+        """不要領域が閾値を超えたらバックグラウンドでコンパクションを開始"""
+        with self._lock:
+            dead = self._dead_bytes()
+            if (
+                dead < self.segment_bytes
+                or dead < self._total_bytes * self.compaction_ratio
+            ):
+                return
+            thread = self._compaction_thread
+            if thread is not None and thread.is_alive():
+                return
+            self._compaction_thread = threading.Thread(
+                target=self.compact, name="segment-file-cache-compaction", daemon=True
+            )
+            self._compaction_thread.start()
+
+    def compact(self) -> int:
+        """
+        封印済みセグメントの有効レコードをアクティブセグメントへ移して削除
+
+        トゥームストーンは対象より古いセグメントのレコードを打ち消すため、
+        不要領域の多いセグメントまでの古い順の連続した範囲をまとめて処理する。
+        レコードの移動はロック内で1件ずつ行い、書き込みとの順序を保つ。
+
+        Returns:
+            int: 移動したレコード数
+        """
+        try:
+            with self._lock:
+                sealed = sorted(s for s in self._segment_sizes if s != self._active_id)
+                candidates = [
+                    s
+                    for s in sealed
+                    if self._segment_live[s]
+                    <= self._segment_sizes[s] * (1 - self.compaction_ratio)
+                ]
+                if not candidates:
+                    return 0
+                targets = [s for s in sealed if s <= candidates[-1]]
+
+            moved = 0
+            now = time.time()
+            for segment in targets:
+                with self._lock:
+                    keys = [k for k, e in self._index.items() if e.segment == segment]
+
+                for key in keys:
+                    with self._lock:
+                        entry = self._index.get(key)
+                        if entry is None or entry.segment != segment:
+                            continue
+                        if entry.expires_at <= now:
+                            self._discard(key)
+                            continue
+                        mm, base = self._map_record(entry, mmap.ACCESS_READ)
+                        with mm:
+                            record = memoryview(mm)[base : base + entry.size]
+                            new_segment, new_offset = self._append([record], entry.size)
+                            record.release()
+                        # LRU順を保つためエントリを書き換える
+                        self._segment_live[segment] -= entry.size
+                        self._segment_live[new_segment] += entry.size
+                        entry.segment = new_segment
+                        entry.offset = new_offset
+                        moved += 1
+
+                with self._lock:
+                    if segment in self._segment_sizes:
+                        self._drop_segment(segment)
+
+            with self._lock:
+                self._compactions += 1
+            logger.info(
+                f"Compacted {len(targets)} cache segments, moved {moved} entries"
+            )
+            return moved
+
+        except Exception as e:
+            logger.error(f"Failed to compact cache segments: {str(e)}")
+            return 0
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        キャッシュ統計を取得
+
+        Returns:
+            Dict[str, Any]: キャッシュ統計
+        """
+        try:
+            now = time.time()
+            with self._lock:
+                total_files = len(self._index)
+                expired_count = sum(
+                    1 for entry in self._index.values() if entry.expires_at <= now
+                )
+                total_size_mb = self._get_cache_size_mb()
+                statistics = {
+                    "total_files": total_files,
+                    "total_size_mb": total_size_mb,
+                    "expired_files": expired_count,
+                    "valid_files": total_files - expired_count,
+                    "max_size_mb": self.max_size_mb,
+                    "usage_percentage": (total_size_mb / self.max_size_mb) * 100,
+                    "compression_enabled": False,
+                    "cache_directory": str(self.cache_dir),
+                    "segments": len(self._segment_sizes),
+                    "disk_size_mb": self._total_bytes / (1024 * 1024),
+                    "dead_size_mb": self._dead_bytes() / (1024 * 1024),
+                    "compactions": self._compactions,
+                }
+
+            logger.debug(f"Cache statistics: {statistics}")
+            return statistics
+
+        except Exception as e:
+            logger.error(f"Failed to get cache statistics: {str(e)}")
+            return {"error": str(e)}
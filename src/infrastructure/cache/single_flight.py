@@ -0,0 +1,119 @@
+"""
+Single Flight
+同一キーの同時リクエストの集約
+
+同じキーに対する読み込みが実行中の場合、新たに読み込みを開始せず、
+実行中の読み込み結果を共有する。読み込みは独立したタスクとして実行するため、
+待機中の呼び出し元がキャンセルされても他の待機者への結果は失われない。
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+from ...utils.logging_config import get_infrastructure_logger
+
+logger = get_infrastructure_logger()
+
+
+class SingleFlight:
+    """
+    同一キーの読み込み集約
+
+    責任:
+    - キーごとに実行中の読み込みを1つに制限
+    - 実行中の読み込み結果（例外を含む）を全待機者に共有
+    - 集約統計の記録
+    """
+
+    def __init__(self):
+        """初期化"""
+        self._calls: Dict[str, "asyncio.Task[Any]"] = {}
+        self._executions = 0
+        self._coalesced = 0
+        self._failures = 0
+
+    def _start(
+        self, key: str, func: Callable[[], Awaitable[Any]]
+    ) -> Tuple["asyncio.Task[Any]", bool]:
+        """
+        読み込みを開始（実行中ならそのタスクを返す）
+
+        Returns:
+            Tuple[asyncio.Task, bool]: (読み込みタスク, 新たに開始した場合True)
+        """
+        task = self._calls.get(key)
+        if task is not None:
+            return task, False
+
+        task = asyncio.ensure_future(func())
+        self._calls[key] = task
+        self._executions += 1
+
+        def _done(finished: "asyncio.Task[Any]") -> None:
+            if self._calls.get(key) is finished:
+                del self._calls[key]
+            if not finished.cancelled() and finished.exception() is not None:
+                self._failures += 1
+                logger.warning(f"Load failed for {key}: {finished.exception()}")
+
+        task.add_done_callback(_done)
+        return task, True
+
+    async def do(
+        self, key: str, func: Callable[[], Awaitable[Any]]
+    ) -> Tuple[Any, bool]:
+        """
+        読み込みを実行（同一キーの実行中の読み込みがあれば結果を共有）
+
+        Args:
+            key: 集約キー
+            func: 読み込み関数（引数なしのコルーチン関数）
+
+        Returns:
+            Tuple[Any, bool]: (読み込み結果, 他の呼び出しの結果を共有した場合True)
+        """
+        task, started = self._start(key, func)
+        if not started:
+            self._coalesced += 1
+            logger.debug(f"Coalesced request: {key}")
+        return await asyncio.shield(task), not started
+
+    def start_background(self, key: str, func: Callable[[], Awaitable[Any]]) -> bool:
+        """
+        読み込みをバックグラウンドで開始（実行中の場合は何もしない）
+
+        Args:
+            key: 集約キー
+            func: 読み込み関数（引数なしのコルーチン関数）
+
+        Returns:
+            bool: 新たに開始した場合True
+        """
+        _, started = self._start(key, func)
+        return started
+
+    def in_flight(self, key: str) -> bool:
+        """
+        キーの読み込みが実行中かどうか
+
+        Args:
+            key: 集約キー
+
+        Returns:
+            bool: 実行中の場合True
+        """
+        return key in self._calls
+
+    def get_statistics(self) -> Dict[str, int]:
+        """
+        集約統計を取得
+
+        Returns:
+            Dict[str, int]: 実行数・集約数・失敗数・実行中の数
+        """
+        return {
+            "executions": self._executions,
+            "coalesced_requests": self._coalesced,
+            "failures": self._failures,
+            "in_flight": len(self._calls),
+        }
@@ -148,6 +148,7 @@ class SystemConfigManager:
                 "file_path": "logs/app.log",
                 "max_file_size": 10485760,  # 10MB
                 "backup_count": 5,
+                "event_log_dir": "logs/events",  # システムイベントの時間別セグメント
                 "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
             },
             # システム設定
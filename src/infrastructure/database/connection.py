@@ -15,6 +15,7 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_asyn
 from sqlalchemy.pool import StaticPool
 
 from ...utils.logging_config import get_infrastructure_logger
+from ..monitoring.tracing import get_tracer
 
 logger = get_infrastructure_logger()
 
@@ -97,6 +98,9 @@ class DatabaseManager:
             # 非同期エンジンを作成
             self._engine = create_async_engine(database_url, echo=echo, **engine_kwargs)
 
+            # SQLトレース（TRACING_ENABLED=true の場合のみ）
+            get_tracer().instrument_engine(self._engine)
+
             # セッションファクトリを作成
             self._session_factory = async_sessionmaker(
                 bind=self._engine,
@@ -0,0 +1,199 @@
+"""Compact pattern_detections.indicator_data into evidence snapshots
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+
+import math
+from typing import Any, Dict, Optional
+
+from alembic import op
+import pandas as pd
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "005"
+down_revision = "004"
+branch_labels = None
+depends_on = None
+
+# 1回の読み込み件数（旧形式の行は1件が大きいため小さめにする）
+BATCH_SIZE = 200
+
+pattern_detections = sa.table(
+    "pattern_detections",
+    sa.column("id", sa.Integer()),
+    sa.column("currency_pair", sa.String()),
+    sa.column("indicator_data", sa.JSON()),
+)
+
+# 変換ロジックは移行時点の src.infrastructure.analysis.pattern_evidence の複製
+# （アプリケーションコードの変更で過去のマイグレーションの結果が変わらないようにする）
+EVIDENCE_FORMAT = "pattern_evidence/v1"
+RECENT_BARS = 5
+
+
+def _is_pattern_evidence(data: Any) -> bool:
+    return isinstance(data, dict) and data.get("format") == EVIDENCE_FORMAT
+
+
+def _to_float(value: Any) -> Optional[float]:
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return None if math.isnan(number) or math.isinf(number) else number
+
+
+def _last_value(value: Any) -> Optional[float]:
+    """スカラー・リスト・辞書（JSON化された Series）の最新値"""
+    if isinstance(value, dict):
+        value = list(value.values())
+    if isinstance(value, (list, tuple)):
+        return _to_float(value[-1]) if value else None
+    return _to_float(value)
+
+
+def _to_price_frame(price_data: Any) -> pd.DataFrame:
+    """JSON 化された価格データ（レコード・列ごとの辞書・split 形式）を変換"""
+    if not price_data:
+        return pd.DataFrame()
+
+    if isinstance(price_data, dict) and {"data", "columns"} <= set(price_data):
+        df = pd.DataFrame(
+            price_data["data"],
+            index=price_data.get("index"),
+            columns=price_data["columns"],
+        )
+    else:
+        df = pd.DataFrame(price_data)
+
+    if "timestamp" in df.columns:
+        df = df.set_index("timestamp")
+    try:
+        df.index = pd.to_datetime(df.index)
+    except (TypeError, ValueError):
+        pass
+    return df
+
+
+def _column(df: pd.DataFrame, name: str) -> Optional[pd.Series]:
+    for candidate in (name, name.lower(), f"{name.lower()}_price"):
+        if candidate in df.columns:
+            return df[candidate]
+    return None
+
+
+def _snapshot_indicators(indicators: Dict[str, Any]) -> Dict[str, Optional[float]]:
+    rsi = indicators.get("rsi") or {}
+    macd = indicators.get("macd") or {}
+    bands = indicators.get("bollinger_bands") or {}
+    snapshot = {
+        "rsi": _last_value(rsi.get("current_value", rsi.get("series"))),
+        "macd": _last_value(macd.get("macd")),
+        "macd_signal": _last_value(macd.get("signal")),
+        "macd_histogram": _last_value(macd.get("histogram")),
+        "bb_upper": _last_value(bands.get("upper")),
+        "bb_middle": _last_value(bands.get("middle")),
+        "bb_lower": _last_value(bands.get("lower")),
+    }
+    return {key: value for key, value in snapshot.items() if value is not None}
+
+
+def _format_timestamp(value: Any) -> Optional[str]:
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return None if value is None else str(value)
+
+
+def _snapshot_timeframe(entry: Dict[str, Any]) -> Dict[str, Any]:
+    df = _to_price_frame(entry.get("price_data"))
+    snapshot: Dict[str, Any] = {"bars": int(len(df))}
+
+    if len(df):
+        snapshot["start"] = _format_timestamp(df.index[0])
+        snapshot["end"] = _format_timestamp(df.index[-1])
+        for name in ("Open", "High", "Low", "Close"):
+            column = _column(df, name)
+            if column is not None:
+                snapshot[name.lower()] = _to_float(column.iloc[-1])
+        close = _column(df, "Close")
+        if close is not None:
+            snapshot["recent_close"] = [
+                _to_float(value) for value in close.iloc[-RECENT_BARS:]
+            ]
+
+    snapshot["indicators"] = _snapshot_indicators(entry.get("indicators") or {})
+    return snapshot
+
+
+def compact_indicator_data(
+    indicator_data: Any, currency_pair: str
+) -> Optional[Dict[str, Any]]:
+    """旧形式の indicator_data をエビデンスに変換（変換できない場合はNone）"""
+    if indicator_data is None or _is_pattern_evidence(indicator_data):
+        return indicator_data
+    if not isinstance(indicator_data, dict):
+        return None
+    return {
+        "format": EVIDENCE_FORMAT,
+        "currency_pair": currency_pair,
+        "timeframes": {
+            timeframe: _snapshot_timeframe(entry)
+            for timeframe, entry in indicator_data.items()
+            if isinstance(entry, dict)
+        },
+    }
+
+
+def upgrade() -> None:
+    # 旧形式のマルチタイムフレームデータをエビデンス形式に変換
+    bind = op.get_bind()
+    if not sa.inspect(bind).has_table("pattern_detections"):
+        # pattern_detections はこのリビジョン系列では作成されない
+        # （未作成の環境では変換対象がない）
+        return
+
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(
+                pattern_detections.c.id,
+                pattern_detections.c.currency_pair,
+                pattern_detections.c.indicator_data,
+            )
+            .where(pattern_detections.c.id > last_id)
+            .where(pattern_detections.c.indicator_data.is_not(None))
+            .order_by(pattern_detections.c.id)
+            .limit(BATCH_SIZE)
+        ).fetchall()
+        if not rows:
+            break
+
+        for row in rows:
+            if _is_pattern_evidence(row.indicator_data):
+                continue
+            bind.execute(
+                pattern_detections.update()
+                .where(pattern_detections.c.id == row.id)
+                .values(
+                    indicator_data=compact_indicator_data(
+                        row.indicator_data, row.currency_pair
+                    )
+                )
+            )
+        last_id = rows[-1].id
+
+    # 変換後の領域を回収
+    if bind.dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.execute("VACUUM (ANALYZE) pattern_detections")
+
+
+def downgrade() -> None:
+    # 元のマルチタイムフレームデータは価格データから
+    # EfficientPatternDetectionService.load_pattern_context で再構築できるため、
+    # indicator_data は変換後のまま残す
+    pass
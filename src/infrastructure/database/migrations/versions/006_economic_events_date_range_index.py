@@ -0,0 +1,39 @@
+"""Add covering index for economic_events date range queries
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "006"
+down_revision = "005"
+branch_labels = None
+depends_on = None
+
+INDEX_NAME = "idx_economic_events_date_importance_country"
+
+
+def upgrade() -> None:
+    # find_by_date_range / find_upcoming_events / count_events の
+    # 日付範囲・重要度・国名の絞り込みと日付順の並び替えをインデックス内で完結させる
+    # （count_events はインデックスオンリースキャンになる）
+    with op.get_context().autocommit_block():
+        op.create_index(
+            INDEX_NAME,
+            "economic_events",
+            ["date_utc", "importance", "country"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            INDEX_NAME,
+            table_name="economic_events",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,306 @@
+"""Add timeframe column and covering index to price_data
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+
+import re
+from typing import Dict, List, Optional
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "007"
+down_revision = "006"
+branch_labels = None
+depends_on = None
+
+OLD_UNIQUE_NAME = "idx_price_data_currency_timestamp_source"
+UNIQUE_INDEX_NAME = "idx_price_data_currency_timeframe_timestamp"
+CALCULATED_INDEX_NAME = "idx_price_data_calculated_timeframe"
+
+# 1回の更新件数（大きなテーブルでロックを長く保持しないようにする）
+BATCH_SIZE = 10000
+
+# 衝突レポートに含める件数
+COLLISION_REPORT_LIMIT = 20
+
+# データソース名に含まれる時間足表記
+# （アプリのコードが変わってもマイグレーションの結果が変わらないよう、
+#   price_data_model の推定ロジックを取り込まずにここで定義する）
+_TIMEFRAME_TOKENS = {
+    "5m": "5m",
+    "m5": "5m",
+    "1h": "1h",
+    "h1": "1h",
+    "4h": "4h",
+    "h4": "4h",
+    "1d": "1d",
+    "d1": "1d",
+}
+_SOURCE_TIMEFRAME_PATTERN = re.compile(
+    r"(?<![0-9a-z])(5m|m5|1h|h1|4h|h4|1d|d1)(?![0-9a-z])"
+)
+# "Aggregated from 5m" の集計元表記は時間足ではない
+_SOURCE_ORIGIN_PATTERN = re.compile(r"from\s+(5m|m5|1h|h1|4h|h4)")
+
+# 隣接バーとの間隔（分）の下限と時間足（大きい順）
+_SPACING_TIMEFRAMES = ((1440, "1d"), (240, "4h"), (60, "1h"), (0, "5m"))
+
+price_data = sa.table(
+    "price_data",
+    sa.column("id", sa.Integer()),
+    sa.column("currency_pair", sa.String()),
+    sa.column("timestamp", sa.DateTime()),
+    sa.column("data_source", sa.String()),
+    sa.column("timeframe", sa.String()),
+)
+
+
+def _existing_names(bind) -> tuple:
+    inspector = sa.inspect(bind)
+    columns = {c["name"] for c in inspector.get_columns("price_data")}
+    indexes = {i["name"] for i in inspector.get_indexes("price_data")}
+    constraints = {c["name"] for c in inspector.get_unique_constraints("price_data")}
+    return columns, indexes, constraints
+
+
+def _explicit_timeframe(source: Optional[str]) -> Optional[str]:
+    # データソース名に明示された時間足（"Yahoo Finance (H1) ...", "..._4h_..."）
+    if not source:
+        return None
+    name = _SOURCE_ORIGIN_PATTERN.sub(" ", source.lower().replace("_", " "))
+    match = _SOURCE_TIMEFRAME_PATTERN.search(name)
+    return _TIMEFRAME_TOKENS[match.group(1)] if match else None
+
+
+def _timeframe_from_spacing(minutes: float) -> str:
+    for lower_bound, timeframe in _SPACING_TIMEFRAMES:
+        if minutes >= lower_bound:
+            return timeframe
+    return "5m"
+
+
+def _infer_from_spacing(rows: List[tuple]) -> Dict[str, List[int]]:
+    """
+    同じ通貨ペア・データソースのバーの時間足を隣接バーとの間隔から推定
+
+    "Yahoo Finance Initial Load" のように複数の時間足を同じデータソース名で
+    保存していた場合も、時間足ごとに期間が分かれているためバー単位で判定する
+    （前後のバーとの短い方の間隔を使い、週末などの欠損の影響を抑える）。
+
+    Args:
+        rows: (id, timestamp) のリスト（timestamp 昇順）
+
+    Returns:
+        Dict[str, List[int]]: 時間足別の id（隣接バーがなく判定できない
+            行は None キー）
+    """
+    assignments: Dict[Optional[str], List[int]] = {}
+    for i, (row_id, timestamp) in enumerate(rows):
+        gaps = [
+            abs((rows[j][1] - timestamp).total_seconds()) / 60
+            for j in (i - 1, i + 1)
+            if 0 <= j < len(rows) and rows[j][1] != timestamp
+        ]
+        timeframe = _timeframe_from_spacing(min(gaps)) if gaps else None
+        assignments.setdefault(timeframe, []).append(row_id)
+    return assignments
+
+
+def _update_ids(bind, ids: List[int], timeframe: str) -> None:
+    for start in range(0, len(ids), BATCH_SIZE):
+        bind.execute(
+            price_data.update()
+            .where(price_data.c.id.in_(ids[start : start + BATCH_SIZE]))
+            .values(timeframe=timeframe)
+        )
+
+
+def _backfill_timeframe(bind) -> None:
+    # データソース名に時間足が明示されていればそれを使い、
+    # それ以外は通貨ペア・データソースごとのバー間隔から推定する
+    # （未設定の行のみ対象。中止後に手動で設定した時間足は上書きしない）
+    groups = bind.execute(
+        sa.select(price_data.c.currency_pair, price_data.c.data_source)
+        .where(price_data.c.timeframe.is_(None))
+        .distinct()
+    ).all()
+
+    unresolved = []
+    for currency_pair, source in groups:
+        condition = sa.and_(
+            price_data.c.timeframe.is_(None),
+            price_data.c.currency_pair == currency_pair,
+            (
+                price_data.c.data_source.is_(None)
+                if source is None
+                else price_data.c.data_source == source
+            ),
+        )
+
+        explicit = _explicit_timeframe(source)
+        if explicit is not None:
+            bind.execute(
+                price_data.update().where(condition).values(timeframe=explicit)
+            )
+            continue
+
+        rows = bind.execute(
+            sa.select(price_data.c.id, price_data.c.timestamp)
+            .where(condition)
+            .order_by(price_data.c.timestamp, price_data.c.id)
+        ).all()
+        for timeframe, ids in _infer_from_spacing(rows).items():
+            if timeframe is None:
+                unresolved.extend((currency_pair, source, row_id) for row_id in ids)
+            else:
+                _update_ids(bind, ids, timeframe)
+
+    if unresolved:
+        details = "\n".join(
+            f"  id={row_id} currency_pair={pair} data_source={source!r}"
+            for pair, source, row_id in unresolved[:COLLISION_REPORT_LIMIT]
+        )
+        raise RuntimeError(
+            f"price_data: {len(unresolved)} rows have no neighbouring bar to "
+            f"infer their timeframe from; set price_data.timeframe for them "
+            f"manually and re-run the migration.\n{details}"
+        )
+
+
+def _check_collisions(bind) -> None:
+    # 同一時間足・同一時刻のバーが複数ある場合は削除せずに中止する
+    # （どちらが正しいバーかはマイグレーションでは判断できない）
+    key = (price_data.c.currency_pair, price_data.c.timeframe, price_data.c.timestamp)
+    collisions = (
+        sa.select(*key, sa.func.count().label("rows"))
+        .group_by(*key)
+        .having(sa.func.count() > 1)
+        .subquery()
+    )
+    total = bind.execute(sa.select(sa.func.count()).select_from(collisions)).scalar()
+    if not total:
+        return
+
+    samples = bind.execute(sa.select(collisions).limit(COLLISION_REPORT_LIMIT)).all()
+    lines = []
+    for currency_pair, timeframe, timestamp, count in samples:
+        sources = bind.execute(
+            sa.select(price_data.c.id, price_data.c.data_source)
+            .where(price_data.c.currency_pair == currency_pair)
+            .where(price_data.c.timeframe == timeframe)
+            .where(price_data.c.timestamp == timestamp)
+            .order_by(price_data.c.id)
+        ).all()
+        lines.append(
+            f"  {currency_pair} {timeframe} {timestamp}: "
+            + ", ".join(f"id={row_id} ({source})" for row_id, source in sources)
+        )
+    raise RuntimeError(
+        f"price_data: {total} (currency_pair, timeframe, timestamp) keys have "
+        f"more than one bar. Resolve them (keep one row per key) and re-run "
+        f"the migration; no rows were changed.\n" + "\n".join(lines)
+    )
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if not sa.inspect(bind).has_table("price_data"):
+        # price_data は scripts/database/postgresql_schema.sql で作成される
+        return
+    columns, indexes, constraints = _existing_names(bind)
+
+    if "timeframe" not in columns:
+        # 推定が終わるまでは NULL を許可する（中止後の再実行では
+        # 未設定の行のみ推定する）
+        op.add_column(
+            "price_data",
+            sa.Column(
+                "timeframe",
+                sa.String(length=5),
+                nullable=True,
+                comment="時間足（5m, 1h, 4h, 1d）",
+            ),
+        )
+
+    if UNIQUE_INDEX_NAME not in indexes:
+        _backfill_timeframe(bind)
+        _check_collisions(bind)
+
+        with op.batch_alter_table("price_data") as batch_op:
+            batch_op.alter_column(
+                "timeframe",
+                existing_type=sa.String(length=5),
+                nullable=False,
+                server_default="5m",
+            )
+
+        # 時間足別の最新N本・期間取得をインデックスオンリースキャンで完結させる
+        # カバリングインデックス（一意制約を兼ねる）
+        with op.get_context().autocommit_block():
+            op.create_index(
+                UNIQUE_INDEX_NAME,
+                "price_data",
+                ["currency_pair", "timeframe", sa.text("timestamp DESC")],
+                unique=True,
+                postgresql_include=[
+                    "open_price",
+                    "high_price",
+                    "low_price",
+                    "close_price",
+                    "volume",
+                ],
+                postgresql_concurrently=True,
+            )
+
+    if OLD_UNIQUE_NAME in constraints:
+        with op.batch_alter_table("price_data") as batch_op:
+            batch_op.drop_constraint(OLD_UNIQUE_NAME, type_="unique")
+
+    # 差分検知用インデックスをデータソースから時間足に切り替え
+    with op.get_context().autocommit_block():
+        if CALCULATED_INDEX_NAME in indexes:
+            op.drop_index(
+                CALCULATED_INDEX_NAME,
+                table_name="price_data",
+                postgresql_concurrently=True,
+            )
+        op.create_index(
+            CALCULATED_INDEX_NAME,
+            "price_data",
+            ["technical_indicators_calculated", "timeframe", "timestamp"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            CALCULATED_INDEX_NAME,
+            table_name="price_data",
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            CALCULATED_INDEX_NAME,
+            "price_data",
+            ["technical_indicators_calculated", "data_source", "timestamp"],
+            postgresql_concurrently=True,
+        )
+
+    with op.batch_alter_table("price_data") as batch_op:
+        batch_op.create_unique_constraint(
+            OLD_UNIQUE_NAME, ["currency_pair", "timestamp", "data_source"]
+        )
+
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            UNIQUE_INDEX_NAME,
+            table_name="price_data",
+            postgresql_concurrently=True,
+        )
+
+    op.drop_column("price_data", "timeframe")
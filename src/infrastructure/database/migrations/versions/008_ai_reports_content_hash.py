@@ -0,0 +1,60 @@
+"""Add content_hash column to ai_reports
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "008"
+down_revision = "007"
+branch_labels = None
+depends_on = None
+
+INDEX_NAME = "idx_ai_reports_content_hash"
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if not inspector.has_table("ai_reports"):
+        return
+
+    # 同じ入力（レポートタイプ・イベント・予想値・結果値・テンプレート）の
+    # レポートをプロセスをまたいで再生成しないためのハッシュ
+    # （既存のレポートは NULL のまま）
+    columns = {c["name"] for c in inspector.get_columns("ai_reports")}
+    if "content_hash" not in columns:
+        op.add_column(
+            "ai_reports",
+            sa.Column(
+                "content_hash",
+                sa.String(length=64),
+                nullable=True,
+                comment="生成時の入力の SHA-256",
+            ),
+        )
+
+    indexes = {i["name"] for i in inspector.get_indexes("ai_reports")}
+    if INDEX_NAME not in indexes:
+        with op.get_context().autocommit_block():
+            op.create_index(
+                INDEX_NAME,
+                "ai_reports",
+                ["content_hash"],
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            INDEX_NAME,
+            table_name="ai_reports",
+            postgresql_concurrently=True,
+        )
+    op.drop_column("ai_reports", "content_hash")
@@ -5,6 +5,7 @@ USD/JPY特化の5分おきデータ取得システム用の価格データモデ
 設計書参照: /app/note/database_implementation_design_2025.md
 """
 
+import re
 from datetime import datetime
 from typing import Optional
 
@@ -16,7 +17,6 @@ from sqlalchemy import (
     Index,
     Integer,
     String,
-    UniqueConstraint,
     func,
 )
 from sqlalchemy.orm import declarative_base
@@ -28,6 +28,71 @@ logger = get_infrastructure_logger()
 
 Base = declarative_base()
 
+# 保存する時間足
+TIMEFRAMES = ("5m", "1h", "4h", "1d")
+
+# 時間足の表記ゆれ（M5, H1, 1H, D1 など）
+_TIMEFRAME_ALIASES = {
+    "5m": "5m",
+    "m5": "5m",
+    "1h": "1h",
+    "h1": "1h",
+    "4h": "4h",
+    "h4": "4h",
+    "1d": "1d",
+    "d1": "1d",
+}
+
+# データソース名に含まれる時間足表記
+# （"Aggregated from 5m" のような集計元の表記は除外する）
+_SOURCE_TIMEFRAME_PATTERN = re.compile(
+    r"(?<![0-9a-z])(5m|m5|1h|h1|4h|h4|1d|d1)(?![0-9a-z])"
+)
+_SOURCE_ORIGIN_PATTERN = re.compile(r"from\s+(5m|m5|1h|h1|4h|h4)")
+
+
+def normalize_timeframe(timeframe: str) -> str:
+    """
+    時間足表記を正規化
+
+    Args:
+        timeframe: 時間足（"5m", "M5", "1H", "H1" など）
+
+    Returns:
+        str: 正規化した時間足（"5m", "1h", "4h", "1d"、不明な表記はそのまま）
+    """
+    value = timeframe.strip()
+    return _TIMEFRAME_ALIASES.get(value.lower(), value)
+
+
+def infer_timeframe_from_source(
+    data_source: Optional[str], default: Optional[str] = "5m"
+) -> Optional[str]:
+    """
+    データソース名から時間足を推定
+
+    timeframe を指定しない書き込み用
+    （"Yahoo Finance 1h Aggregated", "yahoo_finance_4h_differential" など）。
+    時間足を含まないデータソース名（"Yahoo Finance", "Aggregated from 5m" など）は
+    default になるため、5m 以外を保存する場合は timeframe を明示すること。
+    既存データの移行（マイグレーション 007）はこの関数を使わず、
+    バー間隔から時間足を推定する。
+
+    Args:
+        data_source: データソース名
+        default: 時間足を読み取れない場合の値
+
+    Returns:
+        Optional[str]: 時間足
+    """
+    if not data_source:
+        return default
+    source = _SOURCE_ORIGIN_PATTERN.sub(" ", data_source.lower().replace("_", " "))
+    match = _SOURCE_TIMEFRAME_PATTERN.search(source)
+    if not match:
+        return default
+    return _TIMEFRAME_ALIASES[match.group(1)]
+
 
 class PriceDataModel(BaseModel):
     """
@@ -119,6 +184,15 @@ class PriceDataModel(BaseModel):
         comment="データソース（Yahoo Finance等）",
     )
 
+    # 時間足
+    timeframe = Column(
+        String(5),
+        nullable=False,
+        default="5m",
+        server_default="5m",
+        comment="時間足（5m, 1h, 4h, 1d）",
+    )
+
     # メタデータ
     created_at = Column(
         DateTime(timezone=True),
@@ -159,12 +233,23 @@ class PriceDataModel(BaseModel):
 
     # インデックス
     __table_args__ = (
-        # 通貨ペア・タイムスタンプ・データソースの複合ユニーク制約
-        UniqueConstraint(
+        # 通貨ペア・時間足・タイムスタンプの複合ユニークインデックス
+        # （OHLCVを含むカバリングインデックス。時間足別の最新N本や期間取得を
+        # インデックスオンリースキャンで完結させる）
+        Index(
+            "idx_price_data_currency_timeframe_timestamp",
             "currency_pair",
+            "timeframe",
             "timestamp",
-            "data_source",
-            name="idx_price_data_currency_timestamp_source",
+            unique=True,
+            postgresql_ops={"timestamp": "DESC"},
+            postgresql_include=[
+                "open_price",
+                "high_price",
+                "low_price",
+                "close_price",
+                "volume",
+            ],
         ),
         # タイムスタンプインデックス（降順）
         Index(
@@ -191,7 +276,7 @@ class PriceDataModel(BaseModel):
         Index(
             "idx_price_data_calculated_timeframe",
             "technical_indicators_calculated",
-            "data_source",
+            "timeframe",
             "timestamp",
         ),
         # SQLite AUTOINCREMENT設定
@@ -210,6 +295,7 @@ class PriceDataModel(BaseModel):
         close_price: float = None,
         volume: Optional[int] = None,
         data_source: str = "Yahoo Finance",
+        timeframe: Optional[str] = None,
         technical_indicators_calculated: bool = False,
         technical_indicators_calculated_at: datetime = None,
         technical_indicators_version: int = 0,
@@ -229,6 +315,7 @@ class PriceDataModel(BaseModel):
             close_price: 終値
             volume: 取引量
             data_source: データソース
+            timeframe: 時間足（Noneでデータソース名から推定）
             technical_indicators_calculated: テクニカル指標計算済みフラグ
             technical_indicators_calculated_at: テクニカル指標計算実行時刻
             technical_indicators_version: テクニカル指標計算バージョン
@@ -245,6 +332,11 @@ class PriceDataModel(BaseModel):
         self.close_price = close_price
         self.volume = volume
         self.data_source = data_source
+        self.timeframe = (
+            normalize_timeframe(timeframe)
+            if timeframe
+            else infer_timeframe_from_source(data_source)
+        )
         self.technical_indicators_calculated = technical_indicators_calculated
         if (
             technical_indicators_calculated
@@ -262,6 +354,7 @@ class PriceDataModel(BaseModel):
             f"<PriceDataModel("
             f"id={self.id}, "
             f"currency_pair='{self.currency_pair}', "
+            f"timeframe='{self.timeframe}', "
             f"timestamp='{self.timestamp}', "
             f"close_price={self.close_price}, "
             f"version={self.version}"
@@ -285,6 +378,7 @@ class PriceDataModel(BaseModel):
             "close_price": float(self.close_price) if self.close_price else None,
             "volume": self.volume,
             "data_source": self.data_source,
+            "timeframe": self.timeframe,
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
             "version": self.version,
@@ -321,6 +415,7 @@ class PriceDataModel(BaseModel):
             close_price=data.get("close_price"),
             volume=data.get("volume"),
             data_source=data.get("data_source", "Yahoo Finance"),
+            timeframe=data.get("timeframe"),
             technical_indicators_calculated=data.get(
                 "technical_indicators_calculated", False
             ),
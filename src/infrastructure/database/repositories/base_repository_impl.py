@@ -3,13 +3,14 @@ Base Repository Implementation
 基本リポジトリ実装
 """
 
-from typing import List, Optional, Type, TypeVar
+from typing import Any, Dict, List, Optional, Type, TypeVar
 
-from sqlalchemy import select
+from sqlalchemy import Row, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import DeclarativeBase
 
 from src.domain.entities.base import BaseEntity
+from src.infrastructure.monitoring.metrics import observe_query
 from src.utils.logging_config import get_infrastructure_logger
 
 logger = get_infrastructure_logger()
@@ -55,6 +56,7 @@ class BaseRepositoryImpl:
             logger.error(f"Entity has to_model: {hasattr(entity, 'to_model')}")
             raise
 
+    @observe_query
     async def find_by_id(
         self, entity_class: Type[T], model_class: Type[M], id: int
     ) -> Optional[T]:
@@ -82,6 +84,7 @@ class BaseRepositoryImpl:
             logger.error(f"Failed to find entity by id: {str(e)}")
             raise
 
+    @observe_query
     async def find_all(self, entity_class: Type[T], model_class: Type[M]) -> List[T]:
         """
         全エンティティを取得
@@ -104,6 +107,7 @@ class BaseRepositoryImpl:
             logger.error(f"Failed to find all entities: {str(e)}")
             raise
 
+    @observe_query
     async def delete(self, entity: T) -> bool:
         """
         エンティティを削除
@@ -129,6 +133,7 @@ class BaseRepositoryImpl:
             logger.error(f"Failed to delete entity: {str(e)}")
             raise
 
+    @observe_query
     async def count(self, model_class: Type[M]) -> int:
         """
         エンティティの総数を取得
@@ -147,3 +152,104 @@ class BaseRepositoryImpl:
         except Exception as e:
             logger.error(f"Failed to count entities: {str(e)}")
             raise
+
+    async def _bulk_insert_on_conflict(
+        self,
+        model_class: Type[M],
+        rows: List[Dict[str, Any]],
+        conflict_columns: List[str],
+        update_columns: Optional[List[str]] = None,
+        chunk_size: int = 1000,
+    ) -> int:
+        """
+        複数行 INSERT ... ON CONFLICT を1トランザクションで実行
+
+        行ごとの重複チェック + INSERT の代わりに、chunk_size 行ずつ
+        multi-row INSERT として発行する（PostgreSQL / SQLite 対応）。
+
+        Args:
+            model_class: モデルクラス
+            rows: 挿入する行（カラム名→値の辞書、全行で同じキーを持つこと）
+            conflict_columns: 一意制約を構成するカラム
+            update_columns: 競合時に更新するカラム（Noneの場合は DO NOTHING）
+            chunk_size: 1文あたりの最大行数
+
+        Returns:
+            int: 挿入（または更新）された行数
+        """
+        written = await self._bulk_insert_on_conflict_returning(
+            model_class,
+            rows,
+            conflict_columns,
+            ["id"],
+            update_columns=update_columns,
+            chunk_size=chunk_size,
+        )
+        return len(written)
+
+    async def _bulk_insert_on_conflict_returning(
+        self,
+        model_class: Type[M],
+        rows: List[Dict[str, Any]],
+        conflict_columns: List[str],
+        returning_columns: List[str],
+        update_columns: Optional[List[str]] = None,
+        chunk_size: int = 1000,
+    ) -> List[Row]:
+        """
+        複数行 INSERT ... ON CONFLICT を実行し、書き込まれた行を返す
+
+        DO NOTHING で競合した行は RETURNING に含まれないため、
+        戻り値は実際に挿入（または更新）された行のみとなる。
+
+        Args:
+            model_class: モデルクラス
+            rows: 挿入する行（カラム名→値の辞書、全行で同じキーを持つこと）
+            conflict_columns: 一意制約を構成するカラム
+            returning_columns: RETURNING で返すカラム
+            update_columns: 競合時に更新するカラム（Noneの場合は DO NOTHING）
+            chunk_size: 1文あたりの最大行数
+
+        Returns:
+            List[Row]: 書き込まれた行の returning_columns
+        """
+        if not rows:
+            return []
+
+        dialect_name = self.session.get_bind().dialect.name
+        if dialect_name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        elif dialect_name == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        else:
+            raise NotImplementedError(
+                f"Bulk upsert is not supported for dialect: {dialect_name}"
+            )
+
+        table = model_class.__table__
+        stmt = dialect_insert(table)
+        if update_columns:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=conflict_columns,
+                set_={col: stmt.excluded[col] for col in update_columns},
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=conflict_columns)
+        stmt = stmt.returning(*(table.c[col] for col in returning_columns))
+
+        written: List[Row] = []
+        try:
+            # executemany は insertmanyvalues により multi-row INSERT に展開される
+            for start in range(0, len(rows), chunk_size):
+                result = await self.session.execute(
+                    stmt, rows[start : start + chunk_size]
+                )
+                written.extend(result.all())
+
+            await self.session.commit()
+            return written
+
+        except Exception as e:
+            await self.session.rollback()
+            logger.error(f"Failed to bulk insert {model_class.__name__}: {str(e)}")
+            raise
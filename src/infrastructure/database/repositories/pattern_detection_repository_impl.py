@@ -21,6 +21,7 @@ from src.infrastructure.database.repositories.base_repository_impl import (
 from src.infrastructure.database.repositories.pattern_detection_repository import (
     PatternDetectionRepository,
 )
+from src.infrastructure.monitoring.metrics import observe_query
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +46,7 @@ class PatternDetectionRepositoryImpl(BaseRepositoryImpl, PatternDetectionReposit
     def __init__(self, session: AsyncSession):
         super().__init__(session)
 
+    @observe_query
     async def save(self, pattern: PatternDetectionModel) -> PatternDetectionModel:
         """
         パターン検出結果を保存
@@ -85,6 +87,7 @@ class PatternDetectionRepositoryImpl(BaseRepositoryImpl, PatternDetectionReposit
             logger.error(f"Error saving pattern detection: {e}")
             raise
 
+    @observe_query
     async def save_batch(
         self, pattern_list: List[PatternDetectionModel]
     ) -> List[PatternDetectionModel]:
@@ -129,6 +132,7 @@ class PatternDetectionRepositoryImpl(BaseRepositoryImpl, PatternDetectionReposit
             logger.error(f"Error finding pattern detection by ID {id}: {e}")
             return None
 
+    @observe_query
     async def find_by_timestamp_and_type(
         self,
         timestamp: datetime,
@@ -355,6 +359,7 @@ class PatternDetectionRepositoryImpl(BaseRepositoryImpl, PatternDetectionReposit
             logger.error(f"Error finding pattern detections by direction: {e}")
             return []
 
+    @observe_query
     async def find_unnotified_patterns(
         self,
         currency_pair: str = "USD/JPY",
@@ -783,6 +788,7 @@ class PatternDetectionRepositoryImpl(BaseRepositoryImpl, PatternDetectionReposit
             logger.error(f"Error finding pattern detections by pattern type: {e}")
             return []
 
+    @observe_query
     async def mark_notification_sent(
         self,
         pattern_id: int,
@@ -866,6 +872,7 @@ class PatternDetectionRepositoryImpl(BaseRepositoryImpl, PatternDetectionReposit
             logger.error(f"Error getting high confidence patterns: {e}")
             return []
 
+    @observe_query
     async def find_latest(
         self,
         currency_pair: str = "USD/JPY",
@@ -910,6 +917,7 @@ class PatternDetectionRepositoryImpl(BaseRepositoryImpl, PatternDetectionReposit
             logger.error(f"Error finding latest patterns: {e}")
             return []
 
+    @observe_query
     async def find_recent_duplicate(
         self,
         currency_pair: str,
@@ -7,7 +7,9 @@ USD/JPY特化の5分おきデータ取得システム用の価格データリポ
 
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
+
+import pandas as pd
 
 from src.infrastructure.database.models.price_data_model import PriceDataModel
 
@@ -57,6 +59,19 @@ class PriceDataRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def ingest_batch(self, df: pd.DataFrame) -> Dict[str, int]:
+        """
+        価格データを一括取り込み（既存キーとの差分のみ保存）
+
+        Args:
+            df: price_data のカラム名を持つDataFrame
+
+        Returns:
+            Dict[str, int]: inserted, skipped, failed の件数
+        """
+        pass
+
     @abstractmethod
     async def find_by_id(self, id: int) -> Optional[PriceDataModel]:
         """
@@ -88,7 +103,10 @@ class PriceDataRepository(ABC):
 
     @abstractmethod
     async def find_latest(
-        self, currency_pair: str = "USD/JPY", limit: int = 1
+        self,
+        currency_pair: str = "USD/JPY",
+        limit: int = 1,
+        timeframe: Optional[str] = None,
     ) -> List[PriceDataModel]:
         """
         最新の価格データを取得
@@ -96,6 +114,7 @@ class PriceDataRepository(ABC):
         Args:
             currency_pair: 通貨ペア（デフォルト: USD/JPY）
             limit: 取得件数（デフォルト: 1）
+            timeframe: 時間足（Noneで全時間足）
 
         Returns:
             List[PriceDataModel]: 最新の価格データリスト
@@ -124,6 +143,32 @@ class PriceDataRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def find_ohlcv_frame(
+        self,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        currency_pair: str = "USD/JPY",
+        timeframe: Optional[str] = None,
+        limit: Optional[int] = None,
+        include_end: bool = True,
+    ) -> pd.DataFrame:
+        """
+        日付範囲のOHLCVを列指向で取得
+
+        Args:
+            start_date: 開始日時（Noneで下限なし）
+            end_date: 終了日時（Noneで上限なし）
+            currency_pair: 通貨ペア（デフォルト: USD/JPY）
+            timeframe: 時間足（Noneで全時間足）
+            limit: 取得件数制限（最新側から）
+            include_end: 終了日時を含む場合True
+
+        Returns:
+            pd.DataFrame: timestamp をインデックスとする OHLCV DataFrame
+        """
+        pass
+
     @abstractmethod
     async def find_by_price_range(
         self,
@@ -7,18 +7,25 @@ USD/JPY特化の5分おきデータ取得システム用の価格データリポ
 
 import logging
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
-from sqlalchemy import and_, func, select
+import numpy as np
+import pandas as pd
+from sqlalchemy import Float, and_, cast, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.infrastructure.database.models.price_data_model import PriceDataModel
+from src.infrastructure.database.models.price_data_model import (
+    PriceDataModel,
+    infer_timeframe_from_source,
+    normalize_timeframe,
+)
 from src.infrastructure.database.repositories.base_repository_impl import (
     BaseRepositoryImpl,
 )
 from src.infrastructure.database.repositories.price_data_repository import (
     PriceDataRepository,
 )
+from src.infrastructure.monitoring.metrics import observe_query
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +50,7 @@ class PriceDataRepositoryImpl(BaseRepositoryImpl, PriceDataRepository):
     def __init__(self, session: AsyncSession):
         super().__init__(session)
 
+    @observe_query
     async def save(self, price_data: PriceDataModel) -> PriceDataModel:
         """
         価格データを保存
@@ -58,9 +66,9 @@ class PriceDataRepositoryImpl(BaseRepositoryImpl, PriceDataRepository):
             if not price_data.validate():
                 raise ValueError("Invalid price data")
 
-            # 重複チェック（タイムスタンプ、通貨ペア、データソースで判定）
-            existing = await self.find_by_timestamp_and_source(
-                price_data.timestamp, price_data.currency_pair, price_data.data_source
+            # 重複チェック（タイムスタンプ、通貨ペア、時間足で判定）
+            existing = await self.find_by_timestamp_and_timeframe(
+                price_data.timestamp, price_data.currency_pair, price_data.timeframe
             )
             if existing:
                 # 重複の場合は静かに既存データを返す
@@ -116,6 +124,277 @@ class PriceDataRepositoryImpl(BaseRepositoryImpl, PriceDataRepository):
             logger.error(f"Error deleting price data: {e}")
             raise
 
+    async def ingest_batch(self, df: pd.DataFrame) -> Dict[str, int]:
+        """
+        価格データを一括取り込み（既存キーとの差分のみINSERT）
+
+        取り込み範囲の既存キー（timestamp, currency_pair, timeframe）を
+        1クエリで取得してメモリ上で差分を取り、新規行だけを
+        1トランザクションの複数行INSERTで保存する。
+
+        Args:
+            df: price_data のカラム名を持つDataFrame
+                （timestamp, currency_pair, data_source, open_price,
+                high_price, low_price, close_price は必須。
+                timeframe がない場合はデータソース名から推定する）
+
+        Returns:
+            Dict[str, int]: inserted（保存件数）, skipped（重複件数）,
+            failed（バリデーション・保存失敗件数）
+        """
+        counts, _ = await self.ingest_batch_returning(df)
+        return counts
+
+    @observe_query
+    async def ingest_batch_returning(
+        self, df: pd.DataFrame
+    ) -> Tuple[Dict[str, int], List[dict]]:
+        """
+        価格データを一括取り込みし、INSERT対象となった行も返す
+
+        Args:
+            df: price_data のカラム名を持つDataFrame
+
+        Returns:
+            Tuple[Dict[str, int], List[dict]]: 件数と、
+            実際に INSERT した行（カラム名→値、id を含む）リスト
+        """
+        counts = {"inserted": 0, "skipped": 0, "failed": 0}
+        if df is None or df.empty:
+            return counts, []
+
+        try:
+            frame = df.reset_index(drop=True).copy()
+            frame["timestamp"] = pd.to_datetime(frame["timestamp"])
+            if "timeframe" in frame.columns:
+                frame["timeframe"] = frame["timeframe"].map(normalize_timeframe)
+            else:
+                frame["timeframe"] = frame["data_source"].map(
+                    infer_timeframe_from_source
+                )
+
+            # バリデーション（PriceDataModel.validate と同じ条件をベクトル化）
+            prices = frame[
+                ["open_price", "high_price", "low_price", "close_price"]
+            ].astype(float)
+            valid = (
+                (frame["currency_pair"] == "USD/JPY")
+                & prices.notna().all(axis=1)
+                & (prices["high_price"] >= prices["low_price"])
+            )
+            counts["failed"] = int((~valid).sum())
+            frame = frame[valid].copy()
+            prices = prices[valid]
+
+            # OHLCの整合性を保つ（High/LowをOpen/Closeで補正）
+            frame["high_price"] = np.maximum(
+                prices["high_price"],
+                np.maximum(prices["open_price"], prices["close_price"]),
+            )
+            frame["low_price"] = np.minimum(
+                prices["low_price"],
+                np.minimum(prices["open_price"], prices["close_price"]),
+            )
+            frame["open_price"] = prices["open_price"]
+            frame["close_price"] = prices["close_price"]
+
+            # バッチ内の重複を除外
+            key_columns = ["timestamp_key", "currency_pair", "timeframe"]
+            frame["timestamp_key"] = self._normalize_timestamp_keys(frame["timestamp"])
+            duplicated = frame.duplicated(subset=key_columns)
+            counts["skipped"] += int(duplicated.sum())
+            frame = frame[~duplicated]
+            if frame.empty:
+                return counts, []
+
+            # 取り込み範囲の既存キーを1クエリで取得
+            result = await self.session.execute(
+                select(
+                    PriceDataModel.timestamp,
+                    PriceDataModel.currency_pair,
+                    PriceDataModel.timeframe,
+                ).where(
+                    and_(
+                        PriceDataModel.currency_pair.in_(
+                            frame["currency_pair"].unique().tolist()
+                        ),
+                        PriceDataModel.timeframe.in_(
+                            frame["timeframe"].unique().tolist()
+                        ),
+                        PriceDataModel.timestamp >= frame["timestamp"].min(),
+                        PriceDataModel.timestamp <= frame["timestamp"].max(),
+                    )
+                )
+            )
+            existing = pd.DataFrame(
+                result.all(), columns=["timestamp", "currency_pair", "timeframe"]
+            )
+
+            # アンチジョイン
+            if not existing.empty:
+                existing["timestamp_key"] = self._normalize_timestamp_keys(
+                    pd.to_datetime(existing["timestamp"])
+                )
+                existing_keys = pd.MultiIndex.from_frame(existing[key_columns])
+                is_existing = pd.MultiIndex.from_frame(frame[key_columns]).isin(
+                    existing_keys
+                )
+                counts["skipped"] += int(is_existing.sum())
+                frame = frame[~is_existing]
+            if frame.empty:
+                logger.info(f"Ingest batch: {counts}")
+                return counts, []
+
+            rows = self._frame_to_rows(frame.drop(columns=["timestamp_key"]))
+            try:
+                written = await self._bulk_insert_on_conflict_returning(
+                    PriceDataModel,
+                    rows,
+                    conflict_columns=["currency_pair", "timeframe", "timestamp"],
+                    returning_columns=["id", "timestamp", "currency_pair", "timeframe"],
+                )
+            except Exception as e:
+                logger.error(f"Error inserting price data batch: {e}")
+                counts["failed"] += len(rows)
+                return counts, []
+
+            # 差分取得後に他プロセスが保存した行は ON CONFLICT でスキップされ、
+            # RETURNING に含まれない。返ってきたキーで挿入行を特定して id を付与する
+            written_ids = {}
+            if written:
+                returned = pd.DataFrame(
+                    written, columns=["id", "timestamp", "currency_pair", "timeframe"]
+                )
+                returned["timestamp_key"] = self._normalize_timestamp_keys(
+                    pd.to_datetime(returned["timestamp"])
+                )
+                written_ids = dict(
+                    zip(
+                        pd.MultiIndex.from_frame(returned[key_columns]),
+                        returned["id"],
+                    )
+                )
+            inserted_rows = []
+            for row, key in zip(rows, pd.MultiIndex.from_frame(frame[key_columns])):
+                if key in written_ids:
+                    row["id"] = int(written_ids[key])
+                    inserted_rows.append(row)
+
+            counts["inserted"] = len(inserted_rows)
+            counts["skipped"] += len(rows) - len(inserted_rows)
+
+            logger.info(f"Ingest batch: {counts}")
+            return counts, inserted_rows
+
+        except Exception as e:
+            logger.error(f"Error ingesting price data batch: {e}")
+            counts["failed"] += len(df) - sum(counts.values())
+            return counts, []
+
+    @staticmethod
+    def ohlcv_to_ingest_frame(
+        data: pd.DataFrame,
+        currency_pair: str,
+        data_source: str,
+        bar_duration: Optional[timedelta] = None,
+        now: Optional[datetime] = None,
+    ) -> pd.DataFrame:
+        """
+        Yahoo Finance の OHLCV を ingest_batch 用のDataFrameに変換
+
+        bar_duration を指定した場合は確定済みの足（開始から bar_duration 経過）
+        のみを残し、形成中の足は保存しない。
+
+        Args:
+            data: Open/High/Low/Close（Volume は任意）列と時刻インデックス
+            currency_pair: 通貨ペア
+            data_source: データソース名
+            bar_duration: 足の長さ（Noneで全ての足を残す）
+            now: 現在時刻（デフォルト: 現在の日本時間）
+
+        Returns:
+            pd.DataFrame: price_data のカラム名を持つDataFrame
+        """
+        now = pd.Timestamp.now(tz="Asia/Tokyo") if now is None else pd.Timestamp(now)
+        if bar_duration is not None:
+            tz = data.index.tz
+            if tz is None:
+                cutoff = now.tz_localize(None) if now.tzinfo else now
+            else:
+                cutoff = now.tz_convert(tz) if now.tzinfo else now.tz_localize(tz)
+            data = data[data.index + bar_duration <= cutoff]
+
+        return pd.DataFrame(
+            {
+                "timestamp": data.index,
+                "data_timestamp": data.index,  # データの実際のタイムスタンプ
+                "fetched_at": now.to_pydatetime(),  # 取得時刻
+                "currency_pair": currency_pair,
+                "open_price": data["Open"].to_numpy(dtype=float),
+                "high_price": data["High"].to_numpy(dtype=float),
+                "low_price": data["Low"].to_numpy(dtype=float),
+                "close_price": data["Close"].to_numpy(dtype=float),
+                "volume": (
+                    data["Volume"].fillna(0).to_numpy() if "Volume" in data else 0
+                ),
+                "data_source": data_source,
+            }
+        )
+
+    def _normalize_timestamp_keys(self, timestamps: pd.Series) -> pd.Series:
+        """
+        重複判定用にタイムスタンプを揃える
+
+        SQLite はタイムゾーンを保存せず受け取った時刻表記のまま保持するため
+        タイムゾーン情報だけを外し、それ以外はUTCに変換してから外す。
+
+        Args:
+            timestamps: タイムスタンプ列
+
+        Returns:
+            pd.Series: タイムゾーンなしのタイムスタンプ列
+        """
+        keep_wall_time = self.session.get_bind().dialect.name == "sqlite"
+
+        def normalize(ts: pd.Timestamp) -> pd.Timestamp:
+            ts = pd.Timestamp(ts)
+            if ts.tzinfo is None:
+                return ts
+            if not keep_wall_time:
+                ts = ts.tz_convert("UTC")
+            return ts.tz_localize(None)
+
+        return timestamps.map(normalize)
+
+    @staticmethod
+    def _frame_to_rows(frame: pd.DataFrame) -> List[dict]:
+        """
+        DataFrameをINSERT用の行リストに変換
+
+        Args:
+            frame: 保存するDataFrame
+
+        Returns:
+            List[dict]: カラム名→値の辞書リスト
+        """
+        now = datetime.now()
+        rows = []
+        for record in frame.to_dict("records"):
+            for column, value in record.items():
+                if isinstance(value, pd.Timestamp):
+                    record[column] = value.to_pydatetime()
+            if pd.isna(record.get("data_timestamp", np.nan)):
+                record["data_timestamp"] = record["timestamp"]
+            if pd.isna(record.get("fetched_at", np.nan)):
+                record["fetched_at"] = now
+            volume = record.get("volume")
+            record["volume"] = 0 if volume is None or pd.isna(volume) else int(volume)
+            for column in ("open_price", "high_price", "low_price", "close_price"):
+                record[column] = float(record[column])
+            rows.append(record)
+        return rows
+
+    @observe_query
     async def save_batch(
         self, price_data_list: List[PriceDataModel]
     ) -> List[PriceDataModel]:
@@ -142,24 +421,28 @@ class PriceDataRepositoryImpl(BaseRepositoryImpl, PriceDataRepository):
                 return []
 
             # 重複チェック
-            timestamps = [(pd.timestamp, pd.currency_pair) for pd in valid_data]
+            timestamps = [
+                (pd.timestamp, pd.currency_pair, pd.timeframe) for pd in valid_data
+            ]
             existing_query = select(PriceDataModel).where(
                 and_(
                     PriceDataModel.timestamp.in_([ts[0] for ts in timestamps]),
                     PriceDataModel.currency_pair.in_([ts[1] for ts in timestamps]),
+                    PriceDataModel.timeframe.in_({ts[2] for ts in timestamps}),
                 )
             )
             existing_result = await self.session.execute(existing_query)
             existing_data = existing_result.scalars().all()
             existing_timestamps = {
-                (ed.timestamp, ed.currency_pair) for ed in existing_data
+                (ed.timestamp, ed.currency_pair, ed.timeframe) for ed in existing_data
             }
 
             # 重複しないデータのみ保存
             new_data = [
                 pd
                 for pd in valid_data
-                if (pd.timestamp, pd.currency_pair) not in existing_timestamps
+                if (pd.timestamp, pd.currency_pair, pd.timeframe)
+                not in existing_timestamps
             ]
 
             if not new_data:
@@ -231,8 +514,42 @@ class PriceDataRepositoryImpl(BaseRepositoryImpl, PriceDataRepository):
             logger.error(f"Error finding price data by timestamp and source: {e}")
             raise
 
+    @observe_query
+    async def find_by_timestamp_and_timeframe(
+        self, timestamp: datetime, currency_pair: str, timeframe: str
+    ) -> Optional[PriceDataModel]:
+        """
+        タイムスタンプと時間足で価格データを取得
+
+        Args:
+            timestamp: タイムスタンプ
+            currency_pair: 通貨ペア
+            timeframe: 時間足（5m, 1h, 4h, 1d）
+
+        Returns:
+            Optional[PriceDataModel]: 価格データ（存在しない場合はNone）
+        """
+        try:
+            query = select(PriceDataModel).where(
+                and_(
+                    PriceDataModel.currency_pair == currency_pair,
+                    PriceDataModel.timeframe == normalize_timeframe(timeframe),
+                    PriceDataModel.timestamp == timestamp,
+                )
+            )
+            result = await self.session.execute(query)
+            return result.scalar_one_or_none()
+
+        except Exception as e:
+            logger.error(f"Error finding price data by timestamp and timeframe: {e}")
+            raise
+
+    @observe_query
     async def find_latest(
-        self, currency_pair: str = "USD/JPY", limit: int = 1
+        self,
+        currency_pair: str = "USD/JPY",
+        limit: int = 1,
+        timeframe: Optional[str] = None,
     ) -> List[PriceDataModel]:
         """
         最新の価格データを取得
@@ -240,14 +557,21 @@ class PriceDataRepositoryImpl(BaseRepositoryImpl, PriceDataRepository):
         Args:
             currency_pair: 通貨ペア（デフォルト: USD/JPY）
             limit: 取得件数（デフォルト: 1）
+            timeframe: 時間足（Noneで全時間足）
 
         Returns:
             List[PriceDataModel]: 最新の価格データリスト
         """
         try:
+            conditions = [PriceDataModel.currency_pair == currency_pair]
+            if timeframe:
+                conditions.append(
+                    PriceDataModel.timeframe == normalize_timeframe(timeframe)
+                )
+
             query = (
                 select(PriceDataModel)
-                .where(PriceDataModel.currency_pair == currency_pair)
+                .where(and_(*conditions))
                 .order_by(PriceDataModel.timestamp.desc())
                 .limit(limit)
             )
@@ -258,6 +582,7 @@ class PriceDataRepositoryImpl(BaseRepositoryImpl, PriceDataRepository):
             logger.error(f"Error finding latest price data: {e}")
             raise
 
+    @observe_query
     async def find_by_date_range(
         self,
         start_date: datetime,
@@ -314,6 +639,116 @@ class PriceDataRepositoryImpl(BaseRepositoryImpl, PriceDataRepository):
             logger.error(f"Error finding price data by date range: {e}")
             raise
 
+    @observe_query
+    async def find_ohlcv_frame(
+        self,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        currency_pair: str = "USD/JPY",
+        timeframe: Optional[str] = None,
+        limit: Optional[int] = None,
+        include_end: bool = True,
+    ) -> pd.DataFrame:
+        """
+        日付範囲のOHLCVを列指向で取得
+
+        ORMインスタンスを生成せず、Core select() で必要な列のみを取得して
+        結果行から直接 DataFrame を構築する。時間足を指定した場合は
+        (currency_pair, timeframe, timestamp) のカバリングインデックスの
+        範囲スキャンのみで完結する。
+
+        Args:
+            start_date: 開始日時（Noneで下限なし）
+            end_date: 終了日時（Noneで上限なし）
+            currency_pair: 通貨ペア（デフォルト: USD/JPY）
+            timeframe: 時間足（Noneで全時間足）
+            limit: 取得件数制限（最新側から）
+            include_end: 終了日時を含む場合True
+
+        Returns:
+            pd.DataFrame: timestamp をインデックスとする open, high, low, close,
+            volume の DataFrame（昇順）
+        """
+        try:
+            conditions = [PriceDataModel.currency_pair == currency_pair]
+            if start_date is not None:
+                conditions.append(PriceDataModel.timestamp >= start_date)
+            if end_date is not None:
+                conditions.append(
+                    PriceDataModel.timestamp <= end_date
+                    if include_end
+                    else PriceDataModel.timestamp < end_date
+                )
+            if timeframe:
+                conditions.append(
+                    PriceDataModel.timeframe == normalize_timeframe(timeframe)
+                )
+
+            query = select(
+                PriceDataModel.timestamp,
+                cast(PriceDataModel.open_price, Float),
+                cast(PriceDataModel.high_price, Float),
+                cast(PriceDataModel.low_price, Float),
+                cast(PriceDataModel.close_price, Float),
+                func.coalesce(PriceDataModel.volume, 0),
+            ).where(and_(*conditions))
+
+            # 時間足を指定した場合はタイムスタンプが一意になるため、
+            # インデックス順のまま返せるよう id での並び替えを付けない
+            if limit:
+                # 最新側から limit 件を取得し、後で昇順に戻す
+                order = [PriceDataModel.timestamp.desc()]
+                if not timeframe:
+                    order.append(PriceDataModel.id.desc())
+                query = query.order_by(*order).limit(limit)
+            else:
+                order = [PriceDataModel.timestamp.asc()]
+                if not timeframe:
+                    order.append(PriceDataModel.id.asc())
+                query = query.order_by(*order)
+
+            rows = (await self.session.execute(query)).all()
+            if not rows:
+                return self._empty_ohlcv_frame()
+            if limit:
+                rows.reverse()
+
+            timestamps, opens, highs, lows, closes, volumes = zip(*rows)
+            frame = pd.DataFrame(
+                {
+                    "open": np.fromiter(opens, dtype=np.float64, count=len(rows)),
+                    "high": np.fromiter(highs, dtype=np.float64, count=len(rows)),
+                    "low": np.fromiter(lows, dtype=np.float64, count=len(rows)),
+                    "close": np.fromiter(closes, dtype=np.float64, count=len(rows)),
+                    "volume": np.fromiter(volumes, dtype=np.int64, count=len(rows)),
+                },
+                index=pd.DatetimeIndex(timestamps, name="timestamp"),
+            )
+
+            logger.info(
+                f"Loaded {len(frame)} OHLCV rows for {currency_pair} "
+                f"timeframe {timeframe or 'all'}"
+            )
+            return frame
+
+        except Exception as e:
+            logger.error(f"Error loading OHLCV frame: {e}")
+            raise
+
+    @staticmethod
+    def _empty_ohlcv_frame() -> pd.DataFrame:
+        """空の OHLCV DataFrame を作成"""
+        return pd.DataFrame(
+            {
+                "open": pd.Series(dtype=np.float64),
+                "high": pd.Series(dtype=np.float64),
+                "low": pd.Series(dtype=np.float64),
+                "close": pd.Series(dtype=np.float64),
+                "volume": pd.Series(dtype=np.int64),
+            },
+            index=pd.DatetimeIndex([], name="timestamp"),
+        )
+
     async def find_by_price_range(
         self,
         min_price: float,
@@ -461,6 +896,7 @@ class PriceDataRepositoryImpl(BaseRepositoryImpl, PriceDataRepository):
             logger.error(f"Error counting all price data: {e}")
             return 0
 
+    @observe_query
     async def count_by_timeframe(
         self, currency_pair: str = "USD/JPY", timeframe: str = "5m"
     ) -> int:
@@ -475,14 +911,10 @@ class PriceDataRepositoryImpl(BaseRepositoryImpl, PriceDataRepository):
             int: データ数
         """
         try:
-            # データソース名から時間足を判定
-            # 基盤データのデータソース名: yahoo_finance_5m, yahoo_finance_1h, 
-            # yahoo_finance_4h, yahoo_finance_1d
-            
-            query = select(func.count(PriceDataModel.id)).where(
+            query = select(func.count()).where(
                 and_(
                     PriceDataModel.currency_pair == currency_pair,
-                    PriceDataModel.data_source.like(f"%{timeframe}%"),
+                    PriceDataModel.timeframe == normalize_timeframe(timeframe),
                 )
             )
             result = await self.session.execute(query)
@@ -749,6 +1181,7 @@ class PriceDataRepositoryImpl(BaseRepositoryImpl, PriceDataRepository):
             await self.session.rollback()
             raise
 
+    @observe_query
     async def get_latest_by_timeframe(
         self, currency_pair: str, timeframe: str
     ) -> Optional[PriceDataModel]:
@@ -765,7 +1198,9 @@ class PriceDataRepositoryImpl(BaseRepositoryImpl, PriceDataRepository):
         try:
             # 時間足に応じてタイムスタンプを調整
             current_time = datetime.now()
-            adjusted_time = self._adjust_timestamp_for_timeframe(current_time, timeframe)
+            adjusted_time = self._adjust_timestamp_for_timeframe(
+                current_time, normalize_timeframe(timeframe)
+            )
 
             # 最新のデータを取得
             query = (
@@ -773,6 +1208,7 @@ class PriceDataRepositoryImpl(BaseRepositoryImpl, PriceDataRepository):
                 .where(
                     and_(
                         PriceDataModel.currency_pair == currency_pair,
+                        PriceDataModel.timeframe == normalize_timeframe(timeframe),
                         PriceDataModel.timestamp <= adjusted_time,
                     )
                 )
@@ -797,6 +1233,7 @@ class PriceDataRepositoryImpl(BaseRepositoryImpl, PriceDataRepository):
             logger.error(f"Error getting latest {timeframe} data for {currency_pair}: {e}")
             return None
 
+    @observe_query
     async def find_by_date_range_and_timeframe(
         self,
         start_date: datetime,
@@ -819,6 +1256,8 @@ class PriceDataRepositoryImpl(BaseRepositoryImpl, PriceDataRepository):
             List[PriceDataModel]: 価格データリスト
         """
         try:
+            timeframe = normalize_timeframe(timeframe)
+
             # 時間軸に応じてタイムスタンプを調整
             adjusted_start = self._adjust_timestamp_for_timeframe(start_date, timeframe)
             adjusted_end = self._adjust_timestamp_for_timeframe(end_date, timeframe)
@@ -828,6 +1267,7 @@ class PriceDataRepositoryImpl(BaseRepositoryImpl, PriceDataRepository):
                 .where(
                     and_(
                         PriceDataModel.currency_pair == currency_pair,
+                        PriceDataModel.timeframe == timeframe,
                         PriceDataModel.timestamp >= adjusted_start,
                         PriceDataModel.timestamp <= adjusted_end,
                     )
@@ -875,6 +1315,7 @@ class PriceDataRepositoryImpl(BaseRepositoryImpl, PriceDataRepository):
         else:
             return timestamp
 
+    @observe_query
     async def update_batch(self, price_data_list: List[PriceDataModel]) -> bool:
         """
         価格データのバッチ更新
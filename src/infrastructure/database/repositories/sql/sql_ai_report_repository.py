@@ -127,6 +127,31 @@ class SQLAIReportRepository(AIReportRepository):
             self.logger.error(f"Database error finding AI reports by event ID: {e}")
             raise
 
+    async def find_by_content_hash(self, content_hash: str) -> Optional[AIReport]:
+        """
+        生成時の入力のハッシュでAIレポートを検索
+
+        Args:
+            content_hash: AIReport.content_hash
+
+        Returns:
+            Optional[AIReport]: 見つかったAIレポート（最新のもの）
+        """
+        try:
+            with self.connection_manager.get_session() as session:
+                model = (
+                    session.query(AIReportModel)
+                    .filter(AIReportModel.content_hash == content_hash)
+                    .order_by(desc(AIReportModel.generated_at))
+                    .first()
+                )
+
+                return self.mapper.to_domain(model) if model else None
+
+        except SQLAlchemyError as e:
+            self.logger.error(f"Database error finding AI report by hash: {e}")
+            raise
+
     async def find_by_date_range(
         self,
         start_date: date,
@@ -1,15 +1,19 @@
 """
 経済カレンダーSQLリポジトリ
 経済イベントデータのCRUD操作を担当
+
+全ての操作は AsyncSession で実行し、イベントループをブロックしない。
+一括保存は event_id をキーにした INSERT ... ON CONFLICT DO UPDATE ... RETURNING で
+1文（チャンク単位）にまとめる。
 """
 
 import logging
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from typing import Any, Dict, List, Optional
 
-from sqlalchemy import and_, asc, desc, or_
+from sqlalchemy import and_, asc, desc, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Session
 
 from src.domain.entities.economic_event import EconomicEvent, Importance
 from src.domain.repositories.economic_calendar_repository import (
@@ -21,6 +25,9 @@ from src.infrastructure.database.models.economic_event import (
     EconomicEventModel,
 )
 
+# 一括保存の1文あたりの行数（PostgreSQL のバインドパラメータ上限 32767 未満に収める）
+BULK_SAVE_CHUNK_SIZE = 1000
+
 
 class SQLEconomicCalendarRepository(EconomicCalendarRepository):
     """経済カレンダーSQLリポジトリ実装"""
@@ -30,6 +37,20 @@ class SQLEconomicCalendarRepository(EconomicCalendarRepository):
         self.mapper = EconomicEventMapper()
         self.logger = logging.getLogger(self.__class__.__name__)
 
+    @staticmethod
+    def _apply_filters(
+        query,
+        countries: Optional[List[str]] = None,
+        importances: Optional[List[Importance]] = None,
+    ):
+        """国名・重要度フィルターを適用"""
+        if countries:
+            query = query.where(EconomicEventModel.country.in_(countries))
+        if importances:
+            importance_values = [imp.value for imp in importances]
+            query = query.where(EconomicEventModel.importance.in_(importance_values))
+        return query
+
     async def save(self, event: EconomicEvent) -> EconomicEvent:
         """
         経済イベントを保存
@@ -41,23 +62,19 @@ class SQLEconomicCalendarRepository(EconomicCalendarRepository):
             EconomicEvent: 保存された経済イベント
         """
         try:
-            with self.connection_manager.get_session() as session:
+            async with self.connection_manager.get_async_session() as session:
                 if event.id is None:
                     # 新規作成
                     model = self.mapper.create_model_from_entity(event)
                     session.add(model)
-                    session.flush()  # IDを取得するためにflush
+                    await session.flush()  # IDを取得するためにflush
 
                     # エンティティにIDを設定
                     event.id = model.id
                     self.logger.info(f"Created new economic event: {event.event_id}")
                 else:
                     # 更新
-                    model = (
-                        session.query(EconomicEventModel)
-                        .filter(EconomicEventModel.id == event.id)
-                        .first()
-                    )
+                    model = await session.get(EconomicEventModel, event.id)
 
                     if not model:
                         raise ValueError(f"Economic event with ID {event.id} not found")
@@ -65,8 +82,7 @@ class SQLEconomicCalendarRepository(EconomicCalendarRepository):
                     self.mapper.update_model_from_entity(model, event)
                     self.logger.info(f"Updated economic event: {event.event_id}")
 
-                session.commit()
-                return self.mapper.to_domain(model)
+            return self.mapper.to_domain(model)
 
         except SQLAlchemyError as e:
             self.logger.error(f"Database error saving economic event: {e}")
@@ -86,13 +102,8 @@ class SQLEconomicCalendarRepository(EconomicCalendarRepository):
             Optional[EconomicEvent]: 見つかった経済イベント
         """
         try:
-            with self.connection_manager.get_session() as session:
-                model = (
-                    session.query(EconomicEventModel)
-                    .filter(EconomicEventModel.id == event_id)
-                    .first()
-                )
-
+            async with self.connection_manager.get_async_session() as session:
+                model = await session.get(EconomicEventModel, event_id)
                 return self.mapper.to_domain(model) if model else None
 
         except SQLAlchemyError as e:
@@ -110,13 +121,13 @@ class SQLEconomicCalendarRepository(EconomicCalendarRepository):
             Optional[EconomicEvent]: 見つかった経済イベント
         """
         try:
-            with self.connection_manager.get_session() as session:
-                model = (
-                    session.query(EconomicEventModel)
-                    .filter(EconomicEventModel.event_id == event_id)
-                    .first()
+            async with self.connection_manager.get_async_session() as session:
+                result = await session.execute(
+                    select(EconomicEventModel).where(
+                        EconomicEventModel.event_id == event_id
+                    )
                 )
-
+                model = result.scalars().first()
                 return self.mapper.to_domain(model) if model else None
 
         except SQLAlchemyError as e:
@@ -143,29 +154,19 @@ class SQLEconomicCalendarRepository(EconomicCalendarRepository):
             List[EconomicEvent]: 見つかった経済イベントのリスト
         """
         try:
-            with self.connection_manager.get_session() as session:
-                query = session.query(EconomicEventModel).filter(
-                    and_(
-                        EconomicEventModel.date_utc >= start_date,
-                        EconomicEventModel.date_utc <= end_date,
-                    )
+            query = select(EconomicEventModel).where(
+                and_(
+                    EconomicEventModel.date_utc >= start_date,
+                    EconomicEventModel.date_utc <= end_date,
                 )
+            )
+            query = self._apply_filters(query, countries, importances)
 
-                # 国名フィルター
-                if countries:
-                    query = query.filter(EconomicEventModel.country.in_(countries))
-
-                # 重要度フィルター
-                if importances:
-                    importance_values = [imp.value for imp in importances]
-                    query = query.filter(
-                        EconomicEventModel.importance.in_(importance_values)
-                    )
-
-                # 日付順でソート
-                query = query.order_by(asc(EconomicEventModel.date_utc))
+            # 日付順でソート
+            query = query.order_by(asc(EconomicEventModel.date_utc))
 
-                models = query.all()
+            async with self.connection_manager.get_async_session() as session:
+                models = (await session.execute(query)).scalars().all()
                 return [self.mapper.to_domain(model) for model in models]
 
         except SQLAlchemyError as e:
@@ -190,25 +191,15 @@ class SQLEconomicCalendarRepository(EconomicCalendarRepository):
             List[EconomicEvent]: 見つかった経済イベントのリスト
         """
         try:
-            with self.connection_manager.get_session() as session:
-                query = session.query(EconomicEventModel)
-
-                # 国名フィルター
-                if countries:
-                    query = query.filter(EconomicEventModel.country.in_(countries))
-
-                # 重要度フィルター
-                if importances:
-                    importance_values = [imp.value for imp in importances]
-                    query = query.filter(
-                        EconomicEventModel.importance.in_(importance_values)
-                    )
+            query = self._apply_filters(
+                select(EconomicEventModel), countries, importances
+            )
 
-                # 作成日時の降順でソート
-                query = query.order_by(desc(EconomicEventModel.created_at))
-                query = query.limit(limit)
+            # 作成日時の降順でソート
+            query = query.order_by(desc(EconomicEventModel.created_at)).limit(limit)
 
-                models = query.all()
+            async with self.connection_manager.get_async_session() as session:
+                models = (await session.execute(query)).scalars().all()
                 return [self.mapper.to_domain(model) for model in models]
 
         except SQLAlchemyError as e:
@@ -233,8 +224,6 @@ class SQLEconomicCalendarRepository(EconomicCalendarRepository):
             List[EconomicEvent]: 見つかった経済イベントのリスト
         """
         try:
-            from datetime import timedelta
-
             start_date = date.today()
             end_date = start_date + timedelta(days=days_ahead)
 
@@ -263,15 +252,15 @@ class SQLEconomicCalendarRepository(EconomicCalendarRepository):
             List[EconomicEvent]: 見つかった経済イベントのリスト
         """
         try:
-            with self.connection_manager.get_session() as session:
-                query = (
-                    session.query(EconomicEventModel)
-                    .filter(EconomicEventModel.event_name.ilike(f"%{search_term}%"))
-                    .order_by(desc(EconomicEventModel.date_utc))
-                )
+            query = (
+                select(EconomicEventModel)
+                .where(EconomicEventModel.event_name.ilike(f"%{search_term}%"))
+                .order_by(desc(EconomicEventModel.date_utc))
+                .limit(limit)
+            )
 
-                query = query.limit(limit)
-                models = query.all()
+            async with self.connection_manager.get_async_session() as session:
+                models = (await session.execute(query)).scalars().all()
                 return [self.mapper.to_domain(model) for model in models]
 
         except SQLAlchemyError as e:
@@ -289,12 +278,8 @@ class SQLEconomicCalendarRepository(EconomicCalendarRepository):
             bool: 削除成功時True
         """
         try:
-            with self.connection_manager.get_session() as session:
-                model = (
-                    session.query(EconomicEventModel)
-                    .filter(EconomicEventModel.id == event_id)
-                    .first()
-                )
+            async with self.connection_manager.get_async_session() as session:
+                model = await session.get(EconomicEventModel, event_id)
 
                 if not model:
                     self.logger.warning(
@@ -302,68 +287,86 @@ class SQLEconomicCalendarRepository(EconomicCalendarRepository):
                     )
                     return False
 
-                session.delete(model)
-                session.commit()
+                await session.delete(model)
 
-                self.logger.info(f"Deleted economic event: {model.event_id}")
-                return True
+            self.logger.info(f"Deleted economic event: {model.event_id}")
+            return True
 
         except SQLAlchemyError as e:
             self.logger.error(f"Database error deleting economic event: {e}")
             raise
 
+    def _to_upsert_row(self, event: EconomicEvent, now: datetime) -> Dict[str, Any]:
+        """
+        エンティティを一括保存用の行に変換
+
+        Args:
+            event: 経済イベント
+            now: 保存時刻
+
+        Returns:
+            Dict[str, Any]: id を除く全カラムの値
+        """
+        model = self.mapper.create_model_from_entity(event)
+        row = {
+            column.name: getattr(model, column.key)
+            for column in EconomicEventModel.__table__.columns
+            if column.name != "id"
+        }
+        row["created_at"] = row.get("created_at") or now
+        row["updated_at"] = now
+        return row
+
     async def bulk_save(self, events: List[EconomicEvent]) -> List[EconomicEvent]:
         """
         経済イベントの一括保存
 
+        event_id が既に存在するイベントは更新し、存在しないイベントは新規作成する。
+
         Args:
             events: 保存する経済イベントのリスト
 
         Returns:
-            List[EconomicEvent]: 保存された経済イベントのリスト
+            List[EconomicEvent]: 保存された経済イベントのリスト（IDを設定済み）
         """
+        if not events:
+            return []
+
         try:
-            saved_events = []
-
-            with self.connection_manager.get_session() as session:
-                for event in events:
-                    if event.id is None:
-                        # 新規作成
-                        model = self.mapper.create_model_from_entity(event)
-                        session.add(model)
-                    else:
-                        # 更新
-                        model = (
-                            session.query(EconomicEventModel)
-                            .filter(EconomicEventModel.id == event.id)
-                            .first()
-                        )
-
-                        if model:
-                            self.mapper.update_model_from_entity(model, event)
-                        else:
-                            # IDが指定されているが存在しない場合は新規作成
-                            model = self.mapper.create_model_from_entity(event)
-                            session.add(model)
-
-                session.flush()  # 全てのIDを取得
-
-                # 新規作成されたイベントのIDを更新
-                for i, event in enumerate(events):
-                    if event.id is None:
-                        event.id = (
-                            session.query(EconomicEventModel)
-                            .filter(EconomicEventModel.event_id == event.event_id)
-                            .first()
-                            .id
-                        )
-
-                    saved_events.append(event)
-
-                session.commit()
-                self.logger.info(f"Bulk saved {len(events)} economic events")
-
-                return saved_events
+            # 同じ文で同じ行を2回更新できないため、event_id ごとに最後の値を採用
+            now = datetime.utcnow()
+            rows = {
+                event.event_id: self._to_upsert_row(event, now) for event in events
+            }
+            values = list(rows.values())
+
+            table = EconomicEventModel.__table__
+            saved_ids: Dict[str, int] = {}
+
+            async with self.connection_manager.get_async_session() as session:
+                for start in range(0, len(values), BULK_SAVE_CHUNK_SIZE):
+                    statement = pg_insert(table).values(
+                        values[start : start + BULK_SAVE_CHUNK_SIZE]
+                    )
+                    statement = statement.on_conflict_do_update(
+                        index_elements=[table.c.event_id],
+                        set_={
+                            column.name: statement.excluded[column.name]
+                            for column in table.columns
+                            if column.name not in ("id", "event_id", "created_at")
+                        },
+                    ).returning(table.c.id, table.c.event_id)
+
+                    result = await session.execute(statement)
+                    saved_ids.update({row.event_id: row.id for row in result})
+
+            for event in events:
+                event.id = saved_ids.get(event.event_id, event.id)
+
+            self.logger.info(
+                f"Bulk saved {len(events)} economic events ({len(values)} unique)"
+            )
+            return list(events)
 
         except SQLAlchemyError as e:
             self.logger.error(f"Database error in bulk save: {e}")
@@ -389,27 +392,18 @@ class SQLEconomicCalendarRepository(EconomicCalendarRepository):
             int: イベント件数
         """
         try:
-            with self.connection_manager.get_session() as session:
-                query = session.query(EconomicEventModel)
-
-                # 日付フィルター
-                if start_date:
-                    query = query.filter(EconomicEventModel.date_utc >= start_date)
-                if end_date:
-                    query = query.filter(EconomicEventModel.date_utc <= end_date)
-
-                # 国名フィルター
-                if countries:
-                    query = query.filter(EconomicEventModel.country.in_(countries))
-
-                # 重要度フィルター
-                if importances:
-                    importance_values = [imp.value for imp in importances]
-                    query = query.filter(
-                        EconomicEventModel.importance.in_(importance_values)
-                    )
+            query = select(func.count()).select_from(EconomicEventModel)
+
+            # 日付フィルター
+            if start_date:
+                query = query.where(EconomicEventModel.date_utc >= start_date)
+            if end_date:
+                query = query.where(EconomicEventModel.date_utc <= end_date)
+
+            query = self._apply_filters(query, countries, importances)
 
-                return query.count()
+            async with self.connection_manager.get_async_session() as session:
+                return (await session.execute(query)).scalar_one()
 
         except SQLAlchemyError as e:
             self.logger.error(f"Database error counting events: {e}")
@@ -7,7 +7,7 @@ USD/JPY特化の5分おきデータ取得システム用のテクニカル指標
 
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from src.infrastructure.database.models.technical_indicator_model import (
     TechnicalIndicatorModel,
@@ -59,6 +59,22 @@ class TechnicalIndicatorRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def upsert_batch(
+        self, rows: List[Dict[str, Any]], overwrite: bool = False
+    ) -> int:
+        """
+        テクニカル指標を列指向でバルク保存
+
+        Args:
+            rows: 保存する行（カラム名→値の辞書）リスト
+            overwrite: 既存行を上書きする場合True
+
+        Returns:
+            int: 保存（上書き）された件数
+        """
+        pass
+
     @abstractmethod
     async def find_by_id(self, id: int) -> Optional[TechnicalIndicatorModel]:
         """
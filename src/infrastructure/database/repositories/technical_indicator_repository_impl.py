@@ -7,7 +7,7 @@ USD/JPY特化の5分おきデータ取得システム用のテクニカル指標
 
 import logging
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from sqlalchemy import and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -21,6 +21,7 @@ from src.infrastructure.database.repositories.base_repository_impl import (
 from src.infrastructure.database.repositories.technical_indicator_repository import (
     TechnicalIndicatorRepository,
 )
+from src.infrastructure.monitoring.metrics import observe_query
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +48,7 @@ class TechnicalIndicatorRepositoryImpl(
     def __init__(self, session: AsyncSession):
         super().__init__(session)
 
+    @observe_query
     async def save(self, indicator: TechnicalIndicatorModel) -> TechnicalIndicatorModel:
         """
         テクニカル指標を保存
@@ -89,6 +91,7 @@ class TechnicalIndicatorRepositoryImpl(
             logger.error(f"Error saving technical indicator: {e}")
             raise
 
+    @observe_query
     async def save_batch(
         self, indicator_list: List[TechnicalIndicatorModel]
     ) -> List[TechnicalIndicatorModel]:
@@ -163,6 +166,55 @@ class TechnicalIndicatorRepositoryImpl(
             logger.error(f"Error saving technical indicator batch: {e}")
             raise
 
+    @observe_query
+    async def upsert_batch(
+        self, rows: List[Dict[str, Any]], overwrite: bool = False
+    ) -> int:
+        """
+        テクニカル指標を列指向でバルク保存
+
+        モデルを1件ずつ生成・重複チェックせず、
+        INSERT ... ON CONFLICT をチャンク単位で発行する。
+
+        Args:
+            rows: 保存する行（カラム名→値の辞書）リスト
+            overwrite: 既存行を上書きする場合True（DO UPDATE）、
+                Falseの場合は既存行をスキップ（DO NOTHING）
+
+        Returns:
+            int: 保存（上書き）された件数
+        """
+        try:
+            update_columns = (
+                ["value", "additional_data", "parameters", "updated_at"]
+                if overwrite
+                else None
+            )
+            if overwrite:
+                now = datetime.now()
+                rows = [{**row, "updated_at": now} for row in rows]
+
+            saved_count = await self._bulk_insert_on_conflict(
+                TechnicalIndicatorModel,
+                rows,
+                conflict_columns=[
+                    "currency_pair",
+                    "timestamp",
+                    "indicator_type",
+                    "timeframe",
+                ],
+                update_columns=update_columns,
+            )
+            logger.info(
+                f"Bulk saved {saved_count}/{len(rows)} technical indicators"
+            )
+            return saved_count
+
+        except Exception as e:
+            logger.error(f"Error bulk saving technical indicators: {e}")
+            raise
+
+    @observe_query
     async def find_by_timestamp_and_type(
         self,
         timestamp: datetime,
@@ -200,6 +252,7 @@ class TechnicalIndicatorRepositoryImpl(
             )
             raise
 
+    @observe_query
     async def find_latest_by_type(
         self,
         indicator_type: str,
@@ -239,6 +292,7 @@ class TechnicalIndicatorRepositoryImpl(
             logger.error(f"Error finding latest technical indicators by type: {e}")
             raise
 
+    @observe_query
     async def find_by_date_range(
         self,
         start_date: datetime,
@@ -735,6 +789,7 @@ class TechnicalIndicatorRepositoryImpl(
             logger.error(f"Error finding technical indicators by indicator type: {e}")
             raise
 
+    @observe_query
     async def find_by_timeframe(
         self,
         timeframe: str,
@@ -170,8 +170,8 @@ class DataFetcherService:
                 return None
 
             # 重複チェック
-            existing_data = await self.price_repo.find_by_timestamp(
-                price_data.timestamp, self.currency_pair
+            existing_data = await self.price_repo.find_by_timestamp_and_timeframe(
+                price_data.timestamp, self.currency_pair, price_data.timeframe
             )
 
             if existing_data:
@@ -227,7 +227,7 @@ class DataFetcherService:
             List[PriceDataModel]: 最新の価格データリスト
         """
         try:
-            return await self.price_repo.find_latest(self.currency_pair, limit)
+            return await self.price_repo.find_latest(self.currency_pair, limit, "5m")
         except Exception as e:
             logger.error(f"Error getting latest price data: {e}")
             return []
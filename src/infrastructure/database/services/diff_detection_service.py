@@ -14,7 +14,10 @@ import pytz
 from sqlalchemy import and_, select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.infrastructure.database.models.price_data_model import PriceDataModel
+from src.infrastructure.database.models.price_data_model import (
+    TIMEFRAMES,
+    PriceDataModel,
+)
 from src.infrastructure.database.repositories.price_data_repository_impl import (
     PriceDataRepositoryImpl,
 )
@@ -37,13 +40,8 @@ class DiffDetectionService:
         self.session = session
         self.price_repo = PriceDataRepositoryImpl(session)
         
-        # 各時間足のデータソースマッピング
-        self.timeframe_sources = {
-            "5m": ["yahoo_finance_5m_continuous", "yahoo_finance_5m_differential"],
-            "1h": ["yahoo_finance_1h_differential"],
-            "4h": ["yahoo_finance_4h_differential"],
-            "1d": ["yahoo_finance_1d_differential"]
-        }
+        # 対象の時間足（price_data.timeframe で絞り込む）
+        self.timeframes = TIMEFRAMES
     
     async def detect_calculation_differences(self) -> Dict[str, int]:
         """
@@ -56,9 +54,9 @@ class DiffDetectionService:
             logger.info("🔍 差分検知を開始...")
             differences = {}
             
-            for timeframe, sources in self.timeframe_sources.items():
+            for timeframe in self.timeframes:
                 # 未計算データの件数を取得
-                count = await self._count_uncalculated_data(sources)
+                count = await self._count_uncalculated_data(timeframe)
                 differences[timeframe] = count
                 logger.info(f"📊 {timeframe}: {count}件の未計算データを検出")
             
@@ -87,17 +85,16 @@ class DiffDetectionService:
             List[PriceDataModel]: 未計算データのリスト
         """
         try:
-            if timeframe not in self.timeframe_sources:
+            if timeframe not in self.timeframes:
                 logger.error(f"❌ 無効な時間足: {timeframe}")
                 return []
             
-            sources = self.timeframe_sources[timeframe]
             logger.info(f"📥 {timeframe}の未計算データを取得中...")
             
             # 未計算データを取得
             query = select(PriceDataModel).where(
                 and_(
-                    PriceDataModel.data_source.in_(sources),
+                    PriceDataModel.timeframe == timeframe,
                     PriceDataModel.technical_indicators_calculated.is_(False)
                 )
             ).order_by(PriceDataModel.timestamp.asc())
@@ -180,21 +177,23 @@ class DiffDetectionService:
             
             # 時間足別の統計
             timeframe_stats = {}
-            for timeframe, sources in self.timeframe_sources.items():
-                calculated_query = select(func.count(PriceDataModel.id)).where(
-                    and_(
-                        PriceDataModel.data_source.in_(sources),
+            # 時間足別の件数を1クエリで集計
+            stats_query = (
+                select(
+                    PriceDataModel.timeframe,
+                    func.count(),
+                    func.count().filter(
                         PriceDataModel.technical_indicators_calculated.is_(True)
-                    )
-                )
-                calculated_result = await self.session.execute(calculated_query)
-                calculated = calculated_result.scalar()
-                
-                total_query = select(func.count(PriceDataModel.id)).where(
-                    PriceDataModel.data_source.in_(sources)
+                    ),
                 )
-                total_result = await self.session.execute(total_query)
-                total = total_result.scalar()
+                .where(PriceDataModel.timeframe.in_(self.timeframes))
+                .group_by(PriceDataModel.timeframe)
+            )
+            stats_result = await self.session.execute(stats_query)
+            counts = {row[0]: (row[1], row[2]) for row in stats_result.all()}
+
+            for timeframe in self.timeframes:
+                total, calculated = counts.get(timeframe, (0, 0))
                 
                 progress = (calculated / total * 100) if total > 0 else 0
                 timeframe_stats[timeframe] = {
@@ -227,12 +226,12 @@ class DiffDetectionService:
             logger.error(f"❌ 計算状況取得エラー: {e}")
             return {}
     
-    async def _count_uncalculated_data(self, sources: List[str]) -> int:
+    async def _count_uncalculated_data(self, timeframe: str) -> int:
         """
-        指定データソースの未計算データ件数を取得
+        指定時間足の未計算データ件数を取得
         
         Args:
-            sources: データソースのリスト
+            timeframe: 時間足
             
         Returns:
             int: 未計算データ件数
@@ -240,7 +239,7 @@ class DiffDetectionService:
         try:
             query = select(func.count(PriceDataModel.id)).where(
                 and_(
-                    PriceDataModel.data_source.in_(sources),
+                    PriceDataModel.timeframe == timeframe,
                     PriceDataModel.technical_indicators_calculated.is_(False)
                 )
             )
@@ -266,13 +265,12 @@ class DiffDetectionService:
         """
         try:
             if timeframe:
-                if timeframe not in self.timeframe_sources:
+                if timeframe not in self.timeframes:
                     logger.error(f"❌ 無効な時間足: {timeframe}")
                     return False
                 
-                sources = self.timeframe_sources[timeframe]
                 query = select(PriceDataModel).where(
-                    PriceDataModel.data_source.in_(sources)
+                    PriceDataModel.timeframe == timeframe
                 )
                 logger.info(f"🔄 {timeframe}の計算フラグをリセット中...")
             else:
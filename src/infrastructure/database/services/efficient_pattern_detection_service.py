@@ -11,6 +11,12 @@ from typing import Dict, List, Optional
 import pandas as pd
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.infrastructure.analysis.detector_executor import DetectorExecutor
+from src.infrastructure.analysis.pattern_evidence import (
+    build_pattern_evidence,
+    expand_indicators,
+    is_pattern_evidence,
+)
 from src.infrastructure.analysis.pattern_detectors import (
     BreakoutDetector,
     CompositeSignalDetector,
@@ -19,6 +25,7 @@ from src.infrastructure.analysis.pattern_detectors import (
     RSIBattleDetector,
     TrendReversalDetector,
 )
+from src.infrastructure.cache.bar_store import TITLE_BAR_COLUMNS, get_bar_store
 from src.infrastructure.database.models.pattern_detection_model import (
     PatternDetectionModel,
 )
@@ -37,6 +44,7 @@ from src.infrastructure.database.services.multi_timeframe_technical_indicator_se
 from src.infrastructure.database.services.timeframe_data_service import (
     TimeframeDataService,
 )
+from src.infrastructure.monitoring.tracing import traced
 from src.utils.logging_config import get_infrastructure_logger
 
 logger = get_infrastructure_logger()
@@ -53,12 +61,20 @@ class EfficientPatternDetectionService:
     - API呼び出し数を最小限に抑制
     """
 
-    def __init__(self, session: AsyncSession):
+    def __init__(
+        self,
+        session: AsyncSession,
+        detector_timeout_seconds: float = 30.0,
+        detector_execution_mode: Optional[str] = None,
+    ):
         """
         初期化
 
         Args:
             session: データベースセッション
+            detector_timeout_seconds: 検出器ごとのタイムアウト（秒）
+            detector_execution_mode: 検出器の実行方式（process / thread / inline、
+                Noneで thread）
         """
         self.session = session
 
@@ -67,6 +83,9 @@ class EfficientPatternDetectionService:
         self.indicator_repo = TechnicalIndicatorRepositoryImpl(session)
         self.price_repo = PriceDataRepositoryImpl(session)
 
+        # プロセス共有のOHLCVバーストア
+        self.bar_store = get_bar_store()
+
         # 時間軸データサービス初期化
         self.timeframe_service = TimeframeDataService(session)
 
@@ -88,6 +107,13 @@ class EfficientPatternDetectionService:
             6: CompositeSignalDetector(),
         }
 
+        # 検出器の並列実行
+        self.detector_executor = DetectorExecutor(
+            self.detectors,
+            timeout_seconds=detector_timeout_seconds,
+            mode=detector_execution_mode,
+        )
+
         # パターン設定
         self.pattern_configs = {
             1: {
@@ -132,6 +158,7 @@ class EfficientPatternDetectionService:
             f"Initialized EfficientPatternDetectionService for {self.currency_pair}"
         )
 
+    @traced()
     async def detect_all_patterns(
         self,
         start_date: Optional[datetime] = None,
@@ -161,17 +188,8 @@ class EfficientPatternDetectionService:
                 start_date, end_date
             )
 
-            # 全パターンを検出
-            all_patterns = {}
-            for pattern_number, detector in self.detectors.items():
-                try:
-                    patterns = await self._detect_single_pattern(
-                        pattern_number, detector, multi_timeframe_data
-                    )
-                    all_patterns[pattern_number] = patterns
-                except Exception as e:
-                    logger.error(f"❌ パターン{pattern_number}検出エラー: {e}")
-                    all_patterns[pattern_number] = []
+            # 全パターンを並列検出
+            all_patterns = await self._detect_patterns(multi_timeframe_data)
 
             # 重複チェック付きで保存
             for pattern_number, patterns in all_patterns.items():
@@ -231,23 +249,14 @@ class EfficientPatternDetectionService:
                 logger.warning(f"⚠️ {timeframe}時間軸のデータが空です")
                 return []
 
-            # 全パターンを検出
-            all_patterns = []
-            for pattern_number, detector in self.detectors.items():
-                try:
-                    patterns = await self._detect_single_pattern(
-                        pattern_number, detector, multi_timeframe_data
-                    )
-
-                    # 指定時間軸のパターンのみをフィルタリング
-                    timeframe_patterns = [
-                        p for p in patterns if p.timeframe == timeframe
-                    ]
-
-                    all_patterns.extend(timeframe_patterns)
-
-                except Exception as e:
-                    logger.error(f"❌ パターン{pattern_number}検出エラー: {e}")
+            # 全パターンを並列検出し、指定時間軸のパターンのみをフィルタリング
+            detected = await self._detect_patterns(multi_timeframe_data)
+            all_patterns = [
+                p
+                for patterns in detected.values()
+                for p in patterns
+                if p.timeframe == timeframe
+            ]
 
             # 重複チェック付きで保存
             saved_patterns = await self._save_patterns_with_duplicate_check(
@@ -316,59 +325,6 @@ class EfficientPatternDetectionService:
         except Exception as e:
             logger.error(f"❌ 未通知パターン取得エラー: {e}")
             return []
-        try:
-            # デフォルト日時の設定
-            if end_date is None:
-                end_date = datetime.now()
-            if start_date is None:
-                start_date = end_date - timedelta(hours=24)
-
-            logger.info(f"Detecting all patterns from {start_date} to {end_date}")
-
-            # 効率的なマルチタイムフレームデータを構築
-            multi_timeframe_data = await self._build_efficient_multi_timeframe_data(
-                start_date, end_date
-            )
-
-            if not multi_timeframe_data:
-                logger.warning(
-                    "No multi-timeframe data available for pattern detection"
-                )
-                return {}
-
-            # 各パターンを検出
-            results = {}
-            for pattern_number, detector in self.detectors.items():
-                try:
-                    patterns = await self._detect_single_pattern(
-                        pattern_number, detector, multi_timeframe_data
-                    )
-                    if patterns:
-                        results[pattern_number] = patterns
-                        logger.info(
-                            f"Detected {len(patterns)} patterns for pattern {pattern_number}"
-                        )
-
-                except Exception as e:
-                    logger.error(f"Error detecting pattern {pattern_number}: {e}")
-                    # デバッグ情報を追加
-                    logger.debug(f"Pattern {pattern_number} detector: {detector}")
-                    logger.debug(
-                        f"Multi-timeframe data keys: {list(multi_timeframe_data.keys())}"
-                    )
-                    for timeframe, data in multi_timeframe_data.items():
-                        logger.debug(
-                            f"{timeframe} data: price_data={len(data.get('price_data', pd.DataFrame()))}, indicators={list(data.get('indicators', {}).keys())}"
-                        )
-
-            logger.info(
-                f"Pattern detection completed. Found patterns: {list(results.keys())}"
-            )
-            return results
-
-        except Exception as e:
-            logger.error(f"Error in detect_all_patterns: {e}")
-            return {}
 
     async def _build_efficient_multi_timeframe_data(
         self, start_date: datetime, end_date: datetime
@@ -382,22 +338,13 @@ class EfficientPatternDetectionService:
         - マルチタイムフレームテクニカル指標サービスを使用して指標を取得
         """
         try:
-            # 5分足データを取得（基本データ）- 最新データを確実に取得
-            # データベースの最新データ時刻を取得
-            from sqlalchemy import text
-
-            result = await self.session.execute(
-                text(
-                    "SELECT MAX(timestamp) as latest_data FROM price_data WHERE currency_pair = :currency_pair"
-                ),
-                {"currency_pair": self.currency_pair},
+            # 5分足データを取得（基本データ）- 共有バーストアから最新データを取得
+            latest_bar = await self.bar_store.get_latest_bar(
+                self.session, self.currency_pair, "5m"
             )
-            latest_data_str = result.scalar()
 
-            if latest_data_str:
-                latest_data = datetime.fromisoformat(
-                    latest_data_str.replace("Z", "+00:00")
-                )
+            if latest_bar:
+                latest_data = latest_bar["timestamp"]
                 # より短い期間で最新データを取得
                 actual_start_date = latest_data - timedelta(hours=24)  # 24時間前から
                 actual_end_date = latest_data
@@ -405,19 +352,18 @@ class EfficientPatternDetectionService:
                 actual_start_date = start_date
                 actual_end_date = end_date
 
-            m5_price_data = await self.price_repo.find_by_date_range(
-                actual_start_date, actual_end_date, self.currency_pair, 1000
+            m5_df = await self.bar_store.get_frame(
+                self.session,
+                self.currency_pair,
+                "5m",
+                start=actual_start_date,
+                end=actual_end_date,
+                limit=1000,
+                columns=TITLE_BAR_COLUMNS,
             )
 
-            if not m5_price_data:
-                logger.warning("No 5m price data available")
-                return {}
-
-            # 5分足データをDataFrameに変換
-            m5_df = self._convert_to_dataframe(m5_price_data)
-
             if m5_df.empty:
-                logger.warning("5m DataFrame is empty")
+                logger.warning("No 5m price data available")
                 return {}
 
             # 各時間軸のデータを5分足から集計
@@ -596,34 +542,20 @@ class EfficientPatternDetectionService:
             pd.DataFrame: 集計データ
         """
         try:
-            # 期間内の保存済み集計データを検索
-            saved_data = await self.price_repo.find_by_date_range_and_timeframe(
-                start_date, end_date, self.currency_pair, timeframe, 100
+            # 期間内の保存済み集計データを共有バーストアから取得
+            df = await self.bar_store.get_frame(
+                self.session,
+                self.currency_pair,
+                timeframe,
+                start=start_date,
+                end=end_date,
+                limit=100,
+                columns=TITLE_BAR_COLUMNS,
             )
 
-            if saved_data:
-                # DataFrameに変換
-                df_data = []
-                for data in saved_data:
-                    # 進行中データまたは完了データのいずれか
-                    if "Aggregated" in data.data_source:
-                        df_data.append(
-                            {
-                                "timestamp": data.timestamp,
-                                "Open": float(data.open_price),
-                                "High": float(data.high_price),
-                                "Low": float(data.low_price),
-                                "Close": float(data.close_price),
-                                "Volume": int(data.volume),
-                            }
-                        )
-
-                if df_data:
-                    df = pd.DataFrame(df_data)
-                    df.set_index("timestamp", inplace=True)
-                    df.sort_index(inplace=True)
-                    logger.info(f"✅ {timeframe}保存済みデータ取得: {len(df_data)}件")
-                    return df
+            if not df.empty:
+                logger.info(f"✅ {timeframe}保存済みデータ取得: {len(df)}件")
+                return df
 
             logger.info(f"📊 {timeframe}保存済みデータなし、動的集計を使用")
             return pd.DataFrame()
@@ -632,31 +564,6 @@ class EfficientPatternDetectionService:
             logger.error(f"Error getting saved aggregated data for {timeframe}: {e}")
             return pd.DataFrame()
 
-    def _convert_to_dataframe(self, price_data: List) -> pd.DataFrame:
-        """
-        価格データをDataFrameに変換
-        """
-        if not price_data:
-            return pd.DataFrame()
-
-        df_data = []
-        for data in price_data:
-            df_data.append(
-                {
-                    "timestamp": data.timestamp,
-                    "Open": float(data.open_price) if data.open_price else 0.0,
-                    "High": float(data.high_price) if data.high_price else 0.0,
-                    "Low": float(data.low_price) if data.low_price else 0.0,
-                    "Close": float(data.close_price) if data.close_price else 0.0,
-                    "Volume": int(data.volume) if data.volume else 0,
-                }
-            )
-
-        df = pd.DataFrame(df_data)
-        if not df.empty:
-            df.set_index("timestamp", inplace=True)
-        return df
-
     def _aggregate_timeframe(self, df: pd.DataFrame, timeframe: str) -> pd.DataFrame:
         """
         時間軸を集計
@@ -736,46 +643,112 @@ class EfficientPatternDetectionService:
             logger.error(f"Error getting indicators for timeframe {timeframe}: {e}")
             return {}
 
-    async def _detect_single_pattern(
+    async def _detect_patterns(
+        self, multi_timeframe_data: Dict
+    ) -> Dict[int, List[PatternDetectionModel]]:
+        """
+        全検出器を並列実行し、検出結果をモデルに変換
+
+        保存は呼び出し側で重複チェック付きで行う。
+
+        Args:
+            multi_timeframe_data: マルチタイムフレームデータ
+
+        Returns:
+            Dict[int, List[PatternDetectionModel]]: パターン番号別の検出結果
+        """
+        outcomes = await self.detector_executor.run(multi_timeframe_data)
+        all_patterns = {}
+        for pattern_number, outcome in outcomes.items():
+            all_patterns[pattern_number] = (
+                [
+                    self._to_pattern_model(
+                        pattern_number, outcome.result, multi_timeframe_data
+                    )
+                ]
+                if outcome.result
+                else []
+            )
+        return all_patterns
+
+    def _to_pattern_model(
         self,
         pattern_number: int,
-        detector,
+        detection_result: Dict,
         multi_timeframe_data: Dict,
-    ) -> List[PatternDetectionModel]:
+    ) -> PatternDetectionModel:
         """
-        単一パターンを検出
+        検出結果をデータベースモデルに変換
         """
-        try:
-            # パターン検出器で検出
-            detection_result = detector.detect(multi_timeframe_data)
+        return PatternDetectionModel(
+            currency_pair=self.currency_pair,
+            timestamp=datetime.now(),
+            pattern_type=pattern_number,
+            pattern_name=detection_result.get("pattern_name", ""),
+            confidence_score=detection_result.get("confidence_score", 0.0),
+            direction=(
+                "BUY" if detection_result.get("confidence_score", 0) > 0 else "SELL"
+            ),
+            detection_data=detection_result.get("conditions_met", {}),
+            indicator_data=build_pattern_evidence(
+                multi_timeframe_data, self.currency_pair
+            ),
+            notification_sent=False,
+            notification_sent_at=None,
+            notification_message=detection_result.get("notification_title", ""),
+        )
 
-            if not detection_result:
-                return []
+    async def load_pattern_context(self, pattern: PatternDetectionModel) -> Dict:
+        """
+        保存済みパターンの検出時マルチタイムフレームデータを再構築
 
-            # 検出結果をデータベースモデルに変換
-            pattern = PatternDetectionModel(
-                currency_pair=self.currency_pair,
-                timestamp=datetime.now(),
-                pattern_type=pattern_number,
-                pattern_name=detection_result.get("pattern_name", ""),
-                confidence_score=detection_result.get("confidence_score", 0.0),
-                direction=(
-                    "BUY" if detection_result.get("confidence_score", 0) > 0 else "SELL"
-                ),
-                detection_data=detection_result.get("conditions_met", {}),
-                indicator_data=multi_timeframe_data,
-                notification_sent=False,
-                notification_sent_at=None,
-                notification_message=detection_result.get("notification_title", ""),
-            )
+        エビデンスに記録された範囲の価格データを共有バーストアから取得し、
+        指標はエビデンスの値から展開する。保存済みの集計データがない時間軸は
+        5分足から集計する。
 
-            # 重複チェックして保存
-            saved_patterns = await self._save_patterns_with_duplicate_check([pattern])
-            return saved_patterns
+        Args:
+            pattern: パターン検出モデル
+
+        Returns:
+            Dict: 検出器と同じ形式のマルチタイムフレームデータ
+        """
+        evidence = pattern.indicator_data
+        if not is_pattern_evidence(evidence):
+            # 移行前の形式はそのまま返す
+            return evidence or {}
+
+        currency_pair = evidence.get("currency_pair") or pattern.currency_pair
+        timeframes = evidence.get("timeframes", {})
+        context = {}
+        try:
+            for timeframe, snapshot in timeframes.items():
+                df = pd.DataFrame()
+                if snapshot.get("bars"):
+                    df = await self.bar_store.get_frame(
+                        self.session,
+                        currency_pair,
+                        timeframe,
+                        start=pd.Timestamp(snapshot["start"]).to_pydatetime(),
+                        end=pd.Timestamp(snapshot["end"]).to_pydatetime(),
+                        limit=snapshot["bars"],
+                        columns=TITLE_BAR_COLUMNS,
+                    )
+                context[timeframe] = {
+                    "price_data": df,
+                    "indicators": expand_indicators(snapshot.get("indicators", {})),
+                }
+
+            m5_df = context.get("5m", {}).get("price_data", pd.DataFrame())
+            for timeframe, rule in (("1h", "1H"), ("4h", "4H"), ("1d", "1D")):
+                entry = context.get(timeframe)
+                if entry is not None and entry["price_data"].empty:
+                    entry["price_data"] = self._aggregate_timeframe(m5_df, rule)
+
+            return context
 
         except Exception as e:
-            logger.error(f"Error in _detect_single_pattern: {e}")
-            return []
+            logger.error(f"Error loading pattern context: {e}")
+            return {}
 
     async def _save_patterns_with_duplicate_check(
         self, patterns: List[PatternDetectionModel]
@@ -159,8 +159,8 @@ class HybridDataFetcherService:
                 price_data = self._create_price_data_model(row, timeframe, "direct")
 
                 # 重複チェック（タイムスタンプのみ）
-                existing = await self.price_repo.find_by_timestamp_and_source(
-                    price_data.timestamp, self.currency_pair, price_data.data_source
+                existing = await self.price_repo.find_by_timestamp_and_timeframe(
+                    price_data.timestamp, self.currency_pair, price_data.timeframe
                 )
 
                 if existing:
@@ -223,8 +223,8 @@ class HybridDataFetcherService:
                 saved_count = 0
                 for data in aggregated_data:
                     # 重複チェック
-                    existing = await self.price_repo.find_by_timestamp_and_source(
-                        data.timestamp, self.currency_pair, data.data_source
+                    existing = await self.price_repo.find_by_timestamp_and_timeframe(
+                        data.timestamp, self.currency_pair, data.timeframe
                     )
 
                     if existing:
@@ -267,6 +267,7 @@ class HybridDataFetcherService:
             close_price=row["Close"],
             volume=row.get("Volume", 1000000),
             data_source=f"Yahoo Finance ({timeframe.upper()}) {source_type.title()}",
+            timeframe=timeframe,
             data_timestamp=row.name,
             fetched_at=datetime.now(),
         )
@@ -8,20 +8,20 @@
 - システム初期化の完了確認
 
 特徴:
-- API制限を考慮した段階的データ取得
+- 全時間軸の並行取得（共有レート制限内）と一括保存
+- スナップショット（Parquet/CSV）からのオフライン復元
 - 重複データの防止
 - 包括的エラーハンドリング
 - 初期化進捗の監視
 """
 
-import asyncio
 import logging
+import os
 from datetime import datetime, timedelta
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.infrastructure.database.models.price_data_model import PriceDataModel
 from src.infrastructure.database.repositories.price_data_repository_impl import (
     PriceDataRepositoryImpl,
 )
@@ -31,6 +31,10 @@ from src.infrastructure.database.services.efficient_pattern_detection_service im
 from src.infrastructure.database.services.multi_timeframe_technical_indicator_service import (
     MultiTimeframeTechnicalIndicatorService,
 )
+from src.infrastructure.database.services.price_history_bootstrap_service import (
+    DEFAULT_TIMEFRAME_CONFIG,
+    PriceHistoryBootstrapService,
+)
 from src.infrastructure.external_apis.yahoo_finance_client import YahooFinanceClient
 
 logger = logging.getLogger(__name__)
@@ -55,37 +59,32 @@ class InitialDataLoaderService:
         self.pattern_service = EfficientPatternDetectionService(session)
 
         # 初回取得設定（移動平均線200期間に基づく最適化）
-        self.initial_load_config = {
-            "5m": {
-                "period": "7d",
-                "interval": "5m",
-                "description": "5分足",
-            },  # 7日分（200期間×5分=1000分+安全マージン）
-            "1h": {
-                "period": "30d",
-                "interval": "1h",
-                "description": "1時間足",
-            },  # 30日分（200期間×1時間=200時間+安全マージン）
-            "4h": {
-                "period": "60d",
-                "interval": "4h",
-                "description": "4時間足",
-            },  # 60日分（200期間×4時間=800時間+安全マージン）
-            "1d": {
-                "period": "365d",
-                "interval": "1d",
-                "description": "日足",
-            },  # 365日分（200期間×1日=200日+安全マージン）
-        }
+        self.initial_load_config = DEFAULT_TIMEFRAME_CONFIG
 
         self.currency_pair = "USD/JPY"
         self.max_retries = 3
         self.retry_delay = 5  # 秒
 
-    async def load_all_initial_data(self) -> Dict[str, Any]:
+        # 履歴データの並行取得・一括保存
+        self.bootstrap_service = PriceHistoryBootstrapService(
+            session,
+            yahoo_client=self.yahoo_client,
+            currency_pair=self.currency_pair,
+            timeframe_config=self.initial_load_config,
+        )
+        # スナップショットのパス（設定時はネットワークを使わずに復元）
+        self.seed_path = os.getenv("PRICE_DATA_SEED_PATH")
+
+    async def load_all_initial_data(
+        self, seed_path: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         全時間軸の初回データを取得
 
+        Args:
+            seed_path: スナップショットのパス（Noneで PRICE_DATA_SEED_PATH、
+                未設定の場合は Yahoo Finance から取得）
+
         Returns:
             Dict[str, Any]: 各時間軸の取得結果
         """
@@ -101,18 +100,15 @@ class InitialDataLoaderService:
         try:
             logger.info("=== 初回データ取得開始 ===")
 
-            # 1. 各時間軸のデータを順次取得（API制限対応）
-            for timeframe, config in self.initial_load_config.items():
-                logger.info(f"📊 {config['description']}データ取得中...")
-
-                data_count = await self.load_timeframe_data(timeframe)
-                results["data_counts"][timeframe] = data_count
-
-                logger.info(f"✅ {config['description']}完了: {data_count}件")
-
-                # API制限を考慮した待機
-                if timeframe != "1d":  # 最後の時間軸以外で待機
-                    await asyncio.sleep(self.retry_delay)
+            # 1. 全時間軸のデータを並行取得して一括保存（またはスナップショットから復元）
+            results["data_counts"] = await self.bootstrap_service.bootstrap(
+                seed_path or self.seed_path
+            )
+            for timeframe, data_count in results["data_counts"].items():
+                description = self.initial_load_config.get(timeframe, {}).get(
+                    "description", timeframe
+                )
+                logger.info(f"✅ {description}完了: {data_count}件")
 
             # 2. 初回テクニカル指標計算
             logger.info("📈 初回テクニカル指標計算中...")
@@ -148,69 +144,7 @@ class InitialDataLoaderService:
             int: 取得したデータ件数
         """
         try:
-            config = self.initial_load_config[timeframe]
-
-            # 既存データチェック（移動平均線200期間に基づく最適化）
-            # 各時間軸の期間に応じてチェック期間を調整
-            if timeframe == "5m":
-                check_days = 7  # 7日分
-            elif timeframe == "1h":
-                check_days = 30  # 30日分
-            elif timeframe == "4h":
-                check_days = 60  # 60日分
-            elif timeframe == "1d":
-                check_days = 365  # 365日分
-            else:
-                check_days = 30
-
-            existing_count = await self.price_repo.count_by_date_range(
-                datetime.now() - timedelta(days=check_days),
-                datetime.now(),
-                self.currency_pair,
-            )
-
-            # 期間に応じた閾値設定
-            threshold = check_days * 10  # 1日あたり10件を基準
-
-            if existing_count > threshold:  # 期間に応じた閾値でチェック
-                logger.info(
-                    f"  ⚠️ {config['description']}データは既に存在: {existing_count}件（閾値: {threshold}件）"
-                )
-                return existing_count
-
-            # Yahoo Financeから履歴データ取得
-            hist_data = await self.yahoo_client.get_historical_data(
-                self.currency_pair, config["period"], config["interval"]
-            )
-
-            if hist_data is None or hist_data.empty:
-                logger.warning(f"  ❌ {config['description']}データ取得失敗")
-                return 0
-
-            # データベースに保存
-            saved_count = 0
-            for timestamp, row in hist_data.iterrows():
-                price_data = PriceDataModel(
-                    currency_pair=self.currency_pair,
-                    timestamp=timestamp,
-                    open_price=float(row["Open"]),
-                    high_price=float(row["High"]),
-                    low_price=float(row["Low"]),
-                    close_price=float(row["Close"]),
-                    volume=int(row["Volume"]) if "Volume" in row else 1000000,
-                    data_source="Yahoo Finance Initial Load",
-                )
-
-                # 重複チェック
-                existing = await self.price_repo.find_by_timestamp(
-                    timestamp, self.currency_pair
-                )
-                if not existing:
-                    await self.price_repo.save(price_data)
-                    saved_count += 1
-
-            logger.info(f"  ✅ {config['description']}保存完了: {saved_count}件")
-            return saved_count
+            return await self.bootstrap_service.load_timeframe(timeframe)
 
         except Exception as e:
             logger.error(f"  ❌ {timeframe}データ取得エラー: {e}")
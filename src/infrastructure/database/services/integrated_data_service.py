@@ -13,7 +13,7 @@ USD/JPY特化の統合データ管理サービス
 
 import asyncio
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Optional, Tuple
 
 import pandas as pd
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -266,45 +266,6 @@ class IntegratedDataService:
             logger.error(f"統合パターン検出エラー: {e}")
             return {"success": False, "patterns": 0, "error": str(e)}
 
-    def _convert_to_dataframe(self, price_data_list: List) -> pd.DataFrame:
-        """
-        価格データリストをDataFrameに変換
-
-        Args:
-            price_data_list: 価格データリスト
-
-        Returns:
-            pd.DataFrame: 変換されたDataFrame
-        """
-        try:
-            if not price_data_list:
-                return pd.DataFrame()
-
-            # データを辞書のリストに変換
-            data = []
-            for price_data in price_data_list:
-                data.append(
-                    {
-                        "timestamp": price_data.timestamp,
-                        "Open": price_data.open_price,
-                        "High": price_data.high_price,
-                        "Low": price_data.low_price,
-                        "Close": price_data.close_price,
-                        "Volume": price_data.volume,
-                    }
-                )
-
-            # DataFrameを作成
-            df = pd.DataFrame(data)
-            df.set_index("timestamp", inplace=True)
-            df.sort_index(inplace=True)
-
-            return df
-
-        except Exception as e:
-            logger.error(f"Error converting to DataFrame: {e}")
-            return pd.DataFrame()
-
     async def _calculate_and_save_rsi(self, df: pd.DataFrame, timeframe: str) -> int:
         """RSIを計算して保存"""
         try:
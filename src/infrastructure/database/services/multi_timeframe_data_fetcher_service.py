@@ -21,6 +21,7 @@ from src.infrastructure.database.repositories.price_data_repository_impl import
     PriceDataRepositoryImpl,
 )
 from src.infrastructure.external_apis.yahoo_finance_client import YahooFinanceClient
+from src.infrastructure.monitoring.tracing import traced
 from src.utils.logging_config import get_infrastructure_logger
 
 logger = get_infrastructure_logger()
@@ -91,6 +92,7 @@ class MultiTimeframeDataFetcherService:
 
         return results
 
+    @traced()
     async def fetch_timeframe_data(self, timeframe: str) -> Optional[PriceDataModel]:
         """
         特定時間軸のデータを取得
@@ -150,8 +152,8 @@ class MultiTimeframeDataFetcherService:
                 raise ValueError(f"Failed to normalize {config['description']} data")
 
             # 重複チェック
-            existing_data = await self.price_repo.find_by_timestamp(
-                price_data.timestamp, self.currency_pair
+            existing_data = await self.price_repo.find_by_timestamp_and_timeframe(
+                price_data.timestamp, self.currency_pair, timeframe
             )
             if existing_data:
                 logger.info(
@@ -233,8 +235,10 @@ class MultiTimeframeDataFetcherService:
                 price_data = self._normalize_dataframe_row(row, timeframe)
                 if price_data:
                     # 重複チェック
-                    existing_data = await self.price_repo.find_by_timestamp(
-                        price_data.timestamp, self.currency_pair
+                    existing_data = (
+                        await self.price_repo.find_by_timestamp_and_timeframe(
+                            price_data.timestamp, self.currency_pair, timeframe
+                        )
                     )
                     if not existing_data:
                         saved_data.append(await self.price_repo.save(price_data))
@@ -268,6 +272,7 @@ class MultiTimeframeDataFetcherService:
                 close_price=ticker_data.get("rate", 0.0),  # 現在価格をクローズ価格として使用
                 volume=1000000,  # デフォルトボリューム
                 data_source="Yahoo Finance",
+                timeframe=timeframe,
             )
 
         except Exception as e:
@@ -296,6 +301,7 @@ class MultiTimeframeDataFetcherService:
                 close_price=float(row.get("Close", 0.0)),
                 volume=int(row.get("Volume", 0)),
                 data_source="Yahoo Finance",
+                timeframe=timeframe,
             )
 
         except Exception as e:
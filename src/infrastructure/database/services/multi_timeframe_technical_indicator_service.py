@@ -19,6 +19,7 @@ from src.infrastructure.database.repositories.technical_indicator_repository_imp
 from src.infrastructure.database.services.timeframe_data_service import (
     TimeframeDataService,
 )
+from src.infrastructure.monitoring.tracing import traced
 from src.utils.logging_config import get_infrastructure_logger
 
 logger = get_infrastructure_logger()
@@ -116,6 +117,7 @@ class MultiTimeframeTechnicalIndicatorService:
             logger.error(f"Error calculating all timeframe indicators: {e}")
             return {}
 
+    @traced()
     async def calculate_timeframe_indicators(self, timeframe: str) -> Dict:
         """
         特定時間軸のテクニカル指標を計算
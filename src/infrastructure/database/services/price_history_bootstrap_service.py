@@ -0,0 +1,356 @@
+"""
+価格履歴ブートストラップサービス
+
+責任:
+- 全時間軸の履歴データの並行取得と一括保存
+- ローカルスナップショット（Parquet/CSV）からのオフライン復元
+- スナップショットの書き出し
+
+特徴:
+- 時間軸ごとの取得は並行実行（Yahoo Finance 呼び出しは共有レート制限内）
+- 保存は時間軸ごとに既存キーとの差分を1トランザクションの複数行INSERTで実行
+- ネットワークなしで新規ノード・テスト環境を数秒で復元
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import pandas as pd
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.database.models.price_data_model import normalize_timeframe
+from src.infrastructure.database.repositories.price_data_repository_impl import (
+    PriceDataRepositoryImpl,
+)
+from src.infrastructure.external_apis.yahoo_finance_client import YahooFinanceClient
+from src.utils.logging_config import get_infrastructure_logger
+
+logger = get_infrastructure_logger()
+
+# 全時間軸の初回取得設定（移動平均線200期間に基づく最適化）
+DEFAULT_TIMEFRAME_CONFIG = {
+    "5m": {"period": "7d", "interval": "5m", "description": "5分足", "days": 7},
+    "1h": {"period": "30d", "interval": "1h", "description": "1時間足", "days": 30},
+    "4h": {"period": "60d", "interval": "4h", "description": "4時間足", "days": 60},
+    "1d": {"period": "365d", "interval": "1d", "description": "日足", "days": 365},
+}
+
+# スナップショットの列（find_ohlcv_frame の列名 + 時間足・通貨ペア）
+SNAPSHOT_COLUMNS = [
+    "timestamp",
+    "currency_pair",
+    "timeframe",
+    "open",
+    "high",
+    "low",
+    "close",
+    "volume",
+]
+
+_PRICE_COLUMNS = {
+    "open": "open_price",
+    "high": "high_price",
+    "low": "low_price",
+    "close": "close_price",
+}
+
+
+class PriceHistoryBootstrapService:
+    """
+    価格履歴ブートストラップサービス
+
+    責任:
+    - 全時間軸の履歴データの並行取得と一括保存
+    - スナップショットからのオフライン復元
+    - スナップショットの書き出し
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        yahoo_client: Optional[YahooFinanceClient] = None,
+        currency_pair: str = "USD/JPY",
+        timeframe_config: Optional[Dict[str, Dict[str, Any]]] = None,
+        data_source: str = "Yahoo Finance Initial Load",
+    ):
+        """
+        初期化
+
+        Args:
+            session: データベースセッション
+            yahoo_client: Yahoo Finance クライアント（Noneで新規作成）
+            currency_pair: 通貨ペア
+            timeframe_config: 時間軸ごとの取得設定（Noneで既定値）
+            data_source: 保存時のデータソース名
+        """
+        self.session = session
+        self.price_repo = PriceDataRepositoryImpl(session)
+        self._yahoo_client = yahoo_client
+        self.currency_pair = currency_pair
+        self.timeframe_config = timeframe_config or DEFAULT_TIMEFRAME_CONFIG
+        self.data_source = data_source
+
+    @property
+    def yahoo_client(self) -> YahooFinanceClient:
+        """Yahoo Finance クライアント（スナップショット復元のみの場合は作成しない）"""
+        if self._yahoo_client is None:
+            self._yahoo_client = YahooFinanceClient()
+        return self._yahoo_client
+
+    async def bootstrap(
+        self, seed_path: Optional[str] = None, skip_existing: bool = True
+    ) -> Dict[str, int]:
+        """
+        全時間軸の履歴データを準備
+
+        Args:
+            seed_path: スナップショットのパス（指定時はネットワークを使わない）
+            skip_existing: 十分なデータがある時間軸の取得を省略する場合True
+
+        Returns:
+            Dict[str, int]: 時間軸別の保存件数
+        """
+        if seed_path:
+            return await self.load_snapshot(seed_path)
+        return await self.fetch_all(skip_existing=skip_existing)
+
+    async def fetch_all(self, skip_existing: bool = True) -> Dict[str, int]:
+        """
+        全時間軸の履歴データを並行取得して一括保存
+
+        取得は時間軸ごとに並行で行い、取得できた時間軸から順に保存する
+        （セッションは1つのため保存は順次実行）。
+
+        Args:
+            skip_existing: 十分なデータがある時間軸の取得を省略する場合True
+
+        Returns:
+            Dict[str, int]: 時間軸別の保存件数（省略した時間軸は既存件数）
+        """
+        results: Dict[str, int] = {}
+        targets = []
+        for timeframe in self.timeframe_config:
+            if skip_existing:
+                existing_count = await self._sufficient_existing_count(timeframe)
+                if existing_count is not None:
+                    results[timeframe] = existing_count
+                    continue
+            targets.append(timeframe)
+
+        if not targets:
+            return results
+
+        logger.info(f"📊 履歴データ並行取得開始: {', '.join(targets)}")
+        tasks = [
+            asyncio.ensure_future(self._fetch_history(timeframe))
+            for timeframe in targets
+        ]
+        try:
+            for completed in asyncio.as_completed(tasks):
+                timeframe, history = await completed
+                results[timeframe] = await self._ingest_history(timeframe, history)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        return results
+
+    async def load_timeframe(self, timeframe: str, skip_existing: bool = True) -> int:
+        """
+        1つの時間軸の履歴データを取得して一括保存
+
+        Args:
+            timeframe: 時間軸（5m, 1h, 4h, 1d）
+            skip_existing: 十分なデータがある場合に取得を省略する場合True
+
+        Returns:
+            int: 保存件数（省略した場合は既存件数）
+        """
+        if skip_existing:
+            existing_count = await self._sufficient_existing_count(timeframe)
+            if existing_count is not None:
+                return existing_count
+
+        _, history = await self._fetch_history(timeframe)
+        return await self._ingest_history(timeframe, history)
+
+    async def _sufficient_existing_count(self, timeframe: str) -> Optional[int]:
+        """
+        既存データが十分にある場合はその件数を返す
+
+        Args:
+            timeframe: 時間軸
+
+        Returns:
+            Optional[int]: 既存件数（不足している場合はNone）
+        """
+        config = self.timeframe_config[timeframe]
+        existing_count = await self.price_repo.count_by_timeframe(
+            self.currency_pair, timeframe
+        )
+        # 期間に応じた閾値（1日あたり10件を基準）
+        threshold = config["days"] * 10
+        if existing_count <= threshold:
+            return None
+        logger.info(
+            f"⚠️ {config['description']}データは既に存在: "
+            f"{existing_count}件（閾値: {threshold}件）"
+        )
+        return existing_count
+
+    async def _fetch_history(
+        self, timeframe: str
+    ) -> Tuple[str, Optional[pd.DataFrame]]:
+        """
+        時間軸の履歴データを取得
+
+        Args:
+            timeframe: 時間軸
+
+        Returns:
+            Tuple[str, Optional[pd.DataFrame]]: (時間軸, 履歴データ)
+        """
+        config = self.timeframe_config[timeframe]
+        try:
+            history = await self.yahoo_client.get_historical_data(
+                self.currency_pair, config["period"], config["interval"]
+            )
+        except Exception as e:
+            logger.error(f"❌ {config['description']}データ取得エラー: {e}")
+            history = None
+        return timeframe, history
+
+    async def _ingest_history(
+        self, timeframe: str, history: Optional[pd.DataFrame]
+    ) -> int:
+        """
+        Yahoo Finance の履歴データを一括保存
+
+        Args:
+            timeframe: 時間軸
+            history: 履歴データ（Open, High, Low, Close, Volume 列）
+
+        Returns:
+            int: 保存件数
+        """
+        description = self.timeframe_config[timeframe]["description"]
+        if history is None or history.empty:
+            logger.warning(f"❌ {description}データ取得失敗")
+            return 0
+
+        frame = pd.DataFrame(
+            {
+                "timestamp": history.index,
+                "currency_pair": self.currency_pair,
+                "timeframe": timeframe,
+                "open_price": history["Open"].to_numpy(dtype=float),
+                "high_price": history["High"].to_numpy(dtype=float),
+                "low_price": history["Low"].to_numpy(dtype=float),
+                "close_price": history["Close"].to_numpy(dtype=float),
+                "volume": (
+                    history["Volume"].fillna(0).to_numpy(dtype="int64")
+                    if "Volume" in history.columns
+                    else 0
+                ),
+                "data_source": self.data_source,
+            }
+        )
+
+        counts = await self.price_repo.ingest_batch(frame)
+        logger.info(
+            f"✅ {description}保存完了: 保存{counts['inserted']}件, "
+            f"既存{counts['skipped']}件, 失敗{counts['failed']}件"
+        )
+        return counts["inserted"]
+
+    async def load_snapshot(self, path: str) -> Dict[str, int]:
+        """
+        スナップショットから価格データを復元（ネットワーク不要）
+
+        Args:
+            path: スナップショットのパス（.parquet または .csv / .csv.gz）
+
+        Returns:
+            Dict[str, int]: 時間軸別の保存件数
+        """
+        snapshot = self._read_snapshot(Path(path))
+        if snapshot.empty:
+            logger.warning(f"スナップショットが空です: {path}")
+            return {}
+
+        frame = snapshot.rename(columns=_PRICE_COLUMNS)
+        if "currency_pair" not in frame.columns:
+            frame["currency_pair"] = self.currency_pair
+        if "data_source" not in frame.columns:
+            frame["data_source"] = "Snapshot Seed"
+        frame["timeframe"] = frame["timeframe"].map(normalize_timeframe)
+        frame["timestamp"] = pd.to_datetime(frame["timestamp"])
+        frame["volume"] = frame["volume"].fillna(0).astype("int64")
+
+        results = {}
+        for timeframe, group in frame.groupby("timeframe", sort=False):
+            counts = await self.price_repo.ingest_batch(group)
+            results[timeframe] = counts["inserted"]
+            logger.info(
+                f"✅ {timeframe}スナップショット復元: 保存{counts['inserted']}件, "
+                f"既存{counts['skipped']}件, 失敗{counts['failed']}件"
+            )
+        return results
+
+    async def export_snapshot(
+        self, path: str, days: Optional[Dict[str, int]] = None
+    ) -> int:
+        """
+        価格データをスナップショットとして書き出し
+
+        Args:
+            path: 出力パス（.parquet または .csv / .csv.gz）
+            days: 時間軸別の書き出し日数（Noneで取得設定の日数）
+
+        Returns:
+            int: 書き出し件数
+        """
+        now = datetime.now()
+        frames = []
+        for timeframe, config in self.timeframe_config.items():
+            lookback = (days or {}).get(timeframe, config["days"])
+            frame = await self.price_repo.find_ohlcv_frame(
+                now - timedelta(days=lookback),
+                None,
+                self.currency_pair,
+                timeframe,
+            )
+            if frame.empty:
+                continue
+            frame = frame.reset_index()
+            frame["currency_pair"] = self.currency_pair
+            frame["timeframe"] = timeframe
+            frames.append(frame[SNAPSHOT_COLUMNS])
+
+        snapshot = (
+            pd.concat(frames, ignore_index=True)
+            if frames
+            else pd.DataFrame(columns=SNAPSHOT_COLUMNS)
+        )
+        self._write_snapshot(snapshot, Path(path))
+        logger.info(f"💾 スナップショット書き出し: {len(snapshot)}件 → {path}")
+        return len(snapshot)
+
+    @staticmethod
+    def _read_snapshot(path: Path) -> pd.DataFrame:
+        """スナップショットを読み込み"""
+        if path.suffix in (".parquet", ".pq"):
+            # pyarrow（または fastparquet）が必要
+            return pd.read_parquet(path)
+        return pd.read_csv(path)
+
+    @staticmethod
+    def _write_snapshot(snapshot: pd.DataFrame, path: Path) -> None:
+        """スナップショットを書き出し"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.suffix in (".parquet", ".pq"):
+            snapshot.to_parquet(path, index=False)
+        else:
+            snapshot.to_csv(path, index=False)
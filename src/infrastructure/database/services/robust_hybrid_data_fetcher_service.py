@@ -350,10 +350,11 @@ class RobustHybridDataFetcherService:
             data.data_source = (
                 f"Yahoo Finance ({timeframe.upper()}) Aggregated ({source_method})"
             )
+            data.timeframe = timeframe
 
             # 重複チェック
-            existing = await self.price_repo.find_by_timestamp_and_source(
-                data.timestamp, self.currency_pair, data.data_source
+            existing = await self.price_repo.find_by_timestamp_and_timeframe(
+                data.timestamp, self.currency_pair, data.timeframe
             )
 
             if not existing:
@@ -378,8 +379,8 @@ class RobustHybridDataFetcherService:
             for _, row in data.iterrows():
                 price_data = self._create_price_data_model(row, timeframe, "direct")
 
-                existing = await self.price_repo.find_by_timestamp_and_source(
-                    price_data.timestamp, self.currency_pair, price_data.data_source
+                existing = await self.price_repo.find_by_timestamp_and_timeframe(
+                    price_data.timestamp, self.currency_pair, price_data.timeframe
                 )
 
                 if not existing:
@@ -405,6 +406,7 @@ class RobustHybridDataFetcherService:
             close_price=row["Close"],
             volume=row.get("Volume", 1000000),
             data_source=f"Yahoo Finance ({timeframe.upper()}) {source_type.title()}",
+            timeframe=timeframe,
             data_timestamp=row.name,
             fetched_at=datetime.now(),
         )
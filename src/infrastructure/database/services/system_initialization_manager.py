@@ -258,6 +258,15 @@ class SystemInitializationManager:
         try:
             logger.info("🔄 基盤データ復元を開始...")
 
+            # スナップショットが設定されている場合はプロセス内で一括復元
+            seed_path = self.initial_loader.seed_path
+            if seed_path:
+                restored = await self.initial_loader.bootstrap_service.load_snapshot(
+                    seed_path
+                )
+                logger.info(f"✅ スナップショットから基盤データ復元完了: {restored}")
+                return True
+
             if not self.base_data_restorer_path.exists():
                 logger.error(
                     f"❌ 基盤データ復元スクリプトが見つかりません: "
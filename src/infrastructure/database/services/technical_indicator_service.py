@@ -6,13 +6,20 @@ USD/JPY特化の5分おきデータ取得システム用のテクニカル指標
 """
 
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.infrastructure.database.models.price_data_model import PriceDataModel
+from src.infrastructure.analysis.incremental_indicators import (
+    IncrementalIndicatorEngine,
+    IndicatorStateStore,
+)
+from src.infrastructure.database.models.price_data_model import (
+    PriceDataModel,
+    normalize_timeframe,
+)
 from src.infrastructure.database.models.technical_indicator_model import (
     TechnicalIndicatorModel,
 )
@@ -22,6 +29,7 @@ from src.infrastructure.database.repositories.price_data_repository_impl import
 from src.infrastructure.database.repositories.technical_indicator_repository_impl import (
     TechnicalIndicatorRepositoryImpl,
 )
+from src.infrastructure.monitoring.tracing import traced
 from src.utils.logging_config import get_infrastructure_logger
 
 logger = get_infrastructure_logger()
@@ -69,6 +77,10 @@ class TechnicalIndicatorService:
             "EMA": {"period": 20},
         }
 
+        # インクリメンタル計算の状態（時間足ごと、実行間で永続化）
+        self.state_store = IndicatorStateStore()
+        self._incremental_engines: Dict[str, IncrementalIndicatorEngine] = {}
+
         logger.info(f"Initialized TechnicalIndicatorService for {self.currency_pair}")
 
     async def calculate_rsi(
@@ -501,6 +513,152 @@ class TechnicalIndicatorService:
             logger.error(f"Error calculating all indicators: {e}")
             return {}
 
+    @traced()
+    async def update_indicators_incrementally(
+        self, price_data: PriceDataModel, timeframe: str = "5m"
+    ) -> Dict[str, float]:
+        """
+        新しい足1本分だけ全テクニカル指標を更新
+
+        全期間の再計算は行わず、保持している指標状態を O(1) で進める。
+        状態が無い場合は過去データをリプレイして初期化し、
+        前回の足から間が空いている場合は不足分の足を先に適用する。
+
+        Args:
+            price_data: 新しい足の価格データ
+            timeframe: タイムフレーム（デフォルト: 5m、"M5" などは "5m" に正規化）
+
+        Returns:
+            Dict[str, float]: 指標タイプ→値（保存した指標）
+        """
+        try:
+            # 状態ファイル・指標行の時間足表記を統一
+            timeframe = normalize_timeframe(timeframe)
+            engine = await self._get_incremental_engine(timeframe)
+
+            # 前回の足から新しい足の直前までを適用（同じ時間足の足のみ）
+            start_date = engine.last_timestamp or (
+                price_data.timestamp - timedelta(days=30)
+            )
+            pending = await self.price_repo.find_by_date_range_and_timeframe(
+                start_date, price_data.timestamp, self.currency_pair, timeframe, 10000
+            )
+            pending.sort(key=lambda record: record.timestamp)
+            for record in pending:
+                if record.timestamp < price_data.timestamp:
+                    engine.update(
+                        record.timestamp,
+                        record.high_price,
+                        record.low_price,
+                        record.close_price,
+                    )
+
+            outputs = engine.update(
+                price_data.timestamp,
+                price_data.high_price,
+                price_data.low_price,
+                price_data.close_price,
+            )
+            self.state_store.save(engine)
+
+            rows = self._incremental_outputs_to_rows(
+                price_data.timestamp, timeframe, outputs
+            )
+            if rows:
+                await self.indicator_repo.upsert_batch(rows)
+
+            logger.info(
+                f"Incrementally updated {len(rows)} indicators "
+                f"for {price_data.timestamp} ({timeframe})"
+            )
+            return {row["indicator_type"]: row["value"] for row in rows}
+
+        except Exception as e:
+            logger.error(f"Error updating indicators incrementally: {e}")
+            return {}
+
+    async def _get_incremental_engine(
+        self, timeframe: str
+    ) -> IncrementalIndicatorEngine:
+        """
+        時間足のインクリメンタル指標エンジンを取得
+
+        Args:
+            timeframe: タイムフレーム
+
+        Returns:
+            IncrementalIndicatorEngine: メモリ上・永続化済み状態、
+            どちらも無ければ新規のエンジン
+        """
+        engine = self._incremental_engines.get(timeframe)
+        if engine is None:
+            engine = self.state_store.load(self.currency_pair, timeframe)
+            if engine is None:
+                engine = IncrementalIndicatorEngine(self.currency_pair, timeframe)
+            self._incremental_engines[timeframe] = engine
+        return engine
+
+    def _incremental_outputs_to_rows(
+        self,
+        timestamp: datetime,
+        timeframe: str,
+        outputs: Dict[str, Dict[str, float]],
+    ) -> List[Dict[str, Any]]:
+        """
+        エンジンの出力を technical_indicators の行に変換
+
+        Args:
+            timestamp: 足のタイムスタンプ
+            timeframe: タイムフレーム
+            outputs: 状態キー→出力値
+
+        Returns:
+            List[Dict[str, Any]]: 保存する行リスト
+        """
+        field_types = {
+            "BB": {"upper": "BB_UPPER", "middle": "BB_MIDDLE", "lower": "BB_LOWER"},
+            "MACD": {
+                "macd": "MACD",
+                "signal": "MACD_SIGNAL",
+                "histogram": "MACD_HISTOGRAM",
+            },
+            "STOCH": {"k": "STOCH_K", "d": "STOCH_D"},
+        }
+
+        rows = []
+        for key, values in outputs.items():
+            base_type, *periods = key.split("_")
+            periods = [int(period) for period in periods]
+            if base_type == "BB":
+                parameters = {
+                    "period": periods[0],
+                    "std_dev": self.default_params["BB"]["std_dev"],
+                }
+            elif base_type == "MACD":
+                parameters = dict(
+                    zip(["fast_period", "slow_period", "signal_period"], periods)
+                )
+            elif base_type == "STOCH":
+                parameters = dict(
+                    zip(["fastk_period", "slowk_period", "slowd_period"], periods)
+                )
+            else:
+                parameters = {"period": periods[0]}
+
+            for field, value in values.items():
+                indicator_type = field_types.get(base_type, {}).get(field, base_type)
+                rows.append(
+                    {
+                        "currency_pair": self.currency_pair,
+                        "timestamp": timestamp,
+                        "indicator_type": indicator_type,
+                        "timeframe": timeframe,
+                        "value": value,
+                        "parameters": parameters,
+                    }
+                )
+        return rows
+
     async def get_latest_indicators(
         self,
         indicator_type: str,
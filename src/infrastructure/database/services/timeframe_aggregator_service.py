@@ -25,6 +25,7 @@ from src.infrastructure.database.models.price_data_model import PriceDataModel
 from src.infrastructure.database.repositories.price_data_repository_impl import (
     PriceDataRepositoryImpl,
 )
+from src.infrastructure.monitoring.tracing import traced
 
 logger = logging.getLogger(__name__)
 
@@ -146,8 +147,8 @@ class TimeframeAggregatorService:
             current_hour_start = now.replace(minute=0, second=0, microsecond=0)
 
             # 進行中の1時間足データが存在するかチェック
-            existing_data = await self.price_repo.find_by_timestamp_and_source(
-                current_hour_start, self.currency_pair, "1h_aggregated_data"
+            existing_data = await self.price_repo.find_by_timestamp_and_timeframe(
+                current_hour_start, self.currency_pair, "1h"
             )
 
             if existing_data:
@@ -180,8 +181,8 @@ class TimeframeAggregatorService:
             )
 
             # 進行中の4時間足データが存在するかチェック
-            existing_data = await self.price_repo.find_by_timestamp_and_source(
-                current_4h_start, self.currency_pair, "4h_aggregated_data"
+            existing_data = await self.price_repo.find_by_timestamp_and_timeframe(
+                current_4h_start, self.currency_pair, "4h"
             )
 
             if existing_data:
@@ -212,8 +213,8 @@ class TimeframeAggregatorService:
             current_day_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
 
             # 進行中の日足データが存在するかチェック
-            existing_data = await self.price_repo.find_by_timestamp_and_source(
-                current_day_start, self.currency_pair, "1d_aggregated_data"
+            existing_data = await self.price_repo.find_by_timestamp_and_timeframe(
+                current_day_start, self.currency_pair, "1d"
             )
 
             if existing_data:
@@ -252,17 +253,14 @@ class TimeframeAggregatorService:
         """
         try:
             # 期間内の5分足データを取得
-            m5_data = await self.price_repo.find_by_date_range_and_timeframe(
+            df = await self.price_repo.find_ohlcv_frame(
                 start_time, end_time, self.currency_pair, "5m", 1000
             )
 
-            if not m5_data:
+            if df.empty:
                 return []
 
-            # 既存データの始値は固定、その他を更新
-            df = self._convert_to_dataframe(m5_data)
-
-            # OHLCVを計算
+            # OHLCVを計算（既存データの始値は固定、その他を更新）
             open_price = existing_data.open_price  # 始値は固定
             high_price = max(existing_data.high_price, float(df["high"].max()))
             low_price = min(existing_data.low_price, float(df["low"].min()))
@@ -306,16 +304,13 @@ class TimeframeAggregatorService:
         """
         try:
             # 期間内の5分足データを取得
-            m5_data = await self.price_repo.find_by_date_range_and_timeframe(
+            df = await self.price_repo.find_ohlcv_frame(
                 start_time, end_time, self.currency_pair, "5m", 1000
             )
 
-            if not m5_data:
+            if df.empty:
                 return []
 
-            # DataFrameに変換
-            df = self._convert_to_dataframe(m5_data)
-
             # OHLCVを計算
             open_price = float(df["open"].iloc[0])  # 最初の始値
             high_price = float(df["high"].max())
@@ -333,13 +328,14 @@ class TimeframeAggregatorService:
                 close_price=close_price,
                 volume=volume,
                 data_source=f"Yahoo Finance {timeframe} Aggregated (Ongoing)",
+                timeframe=timeframe,
                 data_timestamp=end_time,
                 fetched_at=datetime.now(),
             )
 
-            # 既存データをチェック（データソースも含めて）
-            existing_data = await self.price_repo.find_by_timestamp_and_source(
-                start_time, self.currency_pair, f"{timeframe} Aggregated"
+            # 既存データをチェック（同じ時間足の同時刻のバー）
+            existing_data = await self.price_repo.find_by_timestamp_and_timeframe(
+                start_time, self.currency_pair, timeframe
             )
 
             if existing_data:
@@ -374,6 +370,7 @@ class TimeframeAggregatorService:
             logger.error(f"進行中集計データ作成エラー: {e}")
             return []
 
+    @traced()
     async def aggregate_all_timeframes(self) -> Dict[str, int]:
         """
         全時間軸の集計を実行
@@ -407,42 +404,6 @@ class TimeframeAggregatorService:
             logger.error(f"全時間軸集計エラー: {e}")
             return {"1h": 0, "4h": 0, "1d": 0}
 
-    def _convert_to_dataframe(
-        self, price_data_list: List[PriceDataModel]
-    ) -> pd.DataFrame:
-        """
-        価格データリストをDataFrameに変換
-
-        Args:
-            price_data_list: 価格データリスト
-
-        Returns:
-            pd.DataFrame: 変換されたDataFrame
-        """
-        try:
-            data = []
-            for price_data in price_data_list:
-                data.append(
-                    {
-                        "timestamp": price_data.timestamp,
-                        "open": float(price_data.open_price),
-                        "high": float(price_data.high_price),
-                        "low": float(price_data.low_price),
-                        "close": float(price_data.close_price),
-                        "volume": int(price_data.volume),
-                    }
-                )
-
-            df = pd.DataFrame(data)
-            df.set_index("timestamp", inplace=True)
-            df.sort_index(inplace=True)
-
-            return df
-
-        except Exception as e:
-            logger.error(f"DataFrame変換エラー: {e}")
-            return pd.DataFrame()
-
     def _aggregate_timeframe_data(
         self, df: pd.DataFrame, timeframe: str
     ) -> pd.DataFrame:
@@ -494,31 +455,45 @@ class TimeframeAggregatorService:
             List[PriceDataModel]: 保存されたデータ
         """
         try:
-            saved_data = []
+            data_source = f"Yahoo Finance {timeframe} Aggregated"
+            frame = pd.DataFrame(
+                {
+                    "timestamp": df.index,
+                    "currency_pair": self.currency_pair,
+                    "open_price": df["open"].to_numpy(dtype=float),
+                    "high_price": df["high"].to_numpy(dtype=float),
+                    "low_price": df["low"].to_numpy(dtype=float),
+                    "close_price": df["close"].to_numpy(dtype=float),
+                    "volume": df["volume"].to_numpy(),
+                    "data_source": data_source,
+                    "timeframe": timeframe,
+                }
+            )
 
-            for timestamp, row in df.iterrows():
-                price_data = PriceDataModel(
-                    currency_pair=self.currency_pair,
-                    timestamp=timestamp,
-                    open_price=float(row["open"]),
-                    high_price=float(row["high"]),
-                    low_price=float(row["low"]),
-                    close_price=float(row["close"]),
-                    volume=int(row["volume"]),
-                    data_source=f"Yahoo Finance {timeframe} Aggregated",
-                )
+            # 既存キーとの差分のみ一括保存
+            counts, inserted_rows = await self.price_repo.ingest_batch_returning(frame)
+            logger.info(
+                f"✅ {timeframe}集計データ保存: 保存{counts['inserted']}件, "
+                f"既存{counts['skipped']}件, 失敗{counts['failed']}件"
+            )
 
-                # 重複チェック（タイムスタンプと通貨ペアで）
-                existing = await self.price_repo.find_by_timestamp(
-                    timestamp, self.currency_pair
+            saved_data = []
+            for row in inserted_rows:
+                model = PriceDataModel(
+                    currency_pair=row["currency_pair"],
+                    timestamp=row["timestamp"],
+                    data_timestamp=row["data_timestamp"],
+                    fetched_at=row["fetched_at"],
+                    open_price=row["open_price"],
+                    high_price=row["high_price"],
+                    low_price=row["low_price"],
+                    close_price=row["close_price"],
+                    volume=row["volume"],
+                    data_source=row["data_source"],
+                    timeframe=row["timeframe"],
                 )
-
-                if not existing:
-                    saved_data.append(await self.price_repo.save(price_data))
-                    logger.info(f"✅ {timeframe}集計データ保存: {timestamp}")
-                else:
-                    logger.info(f"⏭️ {timeframe}集計データ既存: {timestamp}")
-
+                model.id = row["id"]
+                saved_data.append(model)
             return saved_data
 
         except Exception as e:
@@ -538,7 +513,9 @@ class TimeframeAggregatorService:
             # 各時間軸の最新集計状況を確認
             for timeframe in ["1h", "4h"]:
                 # 最新の集計データを取得
-                latest_data = await self.price_repo.find_latest(self.currency_pair, 1)
+                latest_data = await self.price_repo.find_latest(
+                    self.currency_pair, 1, timeframe
+                )
 
                 if latest_data:
                     status["last_aggregation"][timeframe] = {
@@ -576,20 +553,17 @@ class TimeframeAggregatorService:
             end_date = completed_hour_start + timedelta(hours=1)
             start_date = completed_hour_start
 
-            m5_data = await self.price_repo.find_by_date_range_and_timeframe(
+            df = await self.price_repo.find_ohlcv_frame(
                 start_date, end_date, self.currency_pair, "5m", 1000
             )
 
-            if len(m5_data) < self.quality_thresholds["min_data_points"]["1h"]:
+            if len(df) < self.quality_thresholds["min_data_points"]["1h"]:
                 logger.warning(
-                    f"1時間足集計に必要な5分足データが不足: {len(m5_data)}/"
+                    f"1時間足集計に必要な5分足データが不足: {len(df)}/"
                     f"{self.quality_thresholds['min_data_points']['1h']}"
                 )
                 return []
 
-            # DataFrameに変換
-            df = self._convert_to_dataframe(m5_data)
-
             # 1時間足に集計
             h1_df = self._aggregate_timeframe_data(df, "1H")
 
@@ -621,20 +595,17 @@ class TimeframeAggregatorService:
             end_date = completed_4h_start + timedelta(hours=4)
             start_date = completed_4h_start
 
-            m5_data = await self.price_repo.find_by_date_range_and_timeframe(
+            df = await self.price_repo.find_ohlcv_frame(
                 start_date, end_date, self.currency_pair, "5m", 1000
             )
 
-            if len(m5_data) < self.quality_thresholds["min_data_points"]["4h"]:
+            if len(df) < self.quality_thresholds["min_data_points"]["4h"]:
                 logger.warning(
-                    f"4時間足集計に必要な5分足データが不足: {len(m5_data)}/"
+                    f"4時間足集計に必要な5分足データが不足: {len(df)}/"
                     f"{self.quality_thresholds['min_data_points']['4h']}"
                 )
                 return []
 
-            # DataFrameに変換
-            df = self._convert_to_dataframe(m5_data)
-
             # 4時間足に集計
             h4_df = self._aggregate_timeframe_data(df, "4H")
 
@@ -665,20 +636,17 @@ class TimeframeAggregatorService:
             end_date = completed_day_start + timedelta(days=1)
             start_date = completed_day_start
 
-            m5_data = await self.price_repo.find_by_date_range_and_timeframe(
+            df = await self.price_repo.find_ohlcv_frame(
                 start_date, end_date, self.currency_pair, "5m", 1000
             )
 
-            if len(m5_data) < self.quality_thresholds["min_data_points"]["1d"]:
+            if len(df) < self.quality_thresholds["min_data_points"]["1d"]:
                 logger.warning(
-                    f"日足集計に必要な5分足データが不足: {len(m5_data)}/"
+                    f"日足集計に必要な5分足データが不足: {len(df)}/"
                     f"{self.quality_thresholds['min_data_points']['1d']}"
                 )
                 return []
 
-            # DataFrameに変換
-            df = self._convert_to_dataframe(m5_data)
-
             # 日足に集計
             d1_df = self._aggregate_timeframe_data(df, "1D")
 
@@ -5,10 +5,11 @@
 """
 
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict
 
 import pandas as pd
 
+from src.infrastructure.cache.bar_store import TITLE_BAR_COLUMNS, get_bar_store
 from src.infrastructure.database.repositories.price_data_repository_impl import (
     PriceDataRepositoryImpl,
 )
@@ -35,6 +36,7 @@ class TimeframeConverter:
     ):
         self.price_repo = price_repo
         self.indicator_repo = indicator_repo
+        self.bar_store = get_bar_store()
 
     async def create_multi_timeframe_data(
         self, start_date: datetime, end_date: datetime, currency_pair: str = "USD/JPY"
@@ -51,18 +53,21 @@ class TimeframeConverter:
             Dict: パターン検出器用のマルチタイムフレームデータ
         """
         try:
-            # 5分足データを取得
-            m5_price_data = await self.price_repo.find_by_date_range(
-                start_date, end_date, currency_pair, 1000
+            # 5分足データを共有バーストアから取得
+            m5_df = await self.bar_store.get_frame(
+                self.price_repo.session,
+                currency_pair,
+                "5m",
+                start=start_date,
+                end=end_date,
+                limit=1000,
+                columns=TITLE_BAR_COLUMNS,
             )
 
-            if not m5_price_data:
+            if m5_df.empty:
                 logger.warning("No M5 price data found")
                 return {}
 
-            # 5分足データをDataFrameに変換
-            m5_df = self._convert_to_dataframe(m5_price_data)
-
             # 各時間軸のデータを生成
             multi_timeframe_data = {}
 
@@ -98,27 +103,6 @@ class TimeframeConverter:
             logger.error(f"Error creating multi-timeframe data: {e}")
             return {}
 
-    def _convert_to_dataframe(self, price_data: List) -> pd.DataFrame:
-        """
-        価格データをDataFrameに変換
-        """
-        df_data = []
-        for data in price_data:
-            df_data.append(
-                {
-                    "timestamp": data.timestamp,
-                    "Open": float(data.open_price) if data.open_price else 0.0,
-                    "High": float(data.high_price) if data.high_price else 0.0,
-                    "Low": float(data.low_price) if data.low_price else 0.0,
-                    "Close": float(data.close_price) if data.close_price else 0.0,
-                    "Volume": int(data.volume) if data.volume else 0,
-                }
-            )
-
-        df = pd.DataFrame(df_data)
-        df.set_index("timestamp", inplace=True)
-        return df
-
     def _aggregate_timeframe(self, df: pd.DataFrame, timeframe: str) -> pd.DataFrame:
         """
         時間軸を集約
@@ -78,8 +78,9 @@ class TimeframeDataService:
             )
 
             # 重複チェック
-            existing = await self.price_repo.find_by_timestamp(
-                price_data.timestamp, self.currency_pair
+            price_data.timeframe = "5m"
+            existing = await self.price_repo.find_by_timestamp_and_timeframe(
+                price_data.timestamp, self.currency_pair, "5m"
             )
             if existing:
                 logger.info(f"5m data already exists for {price_data.timestamp}")
@@ -111,8 +112,9 @@ class TimeframeDataService:
             )
 
             # 重複チェック
-            existing = await self.price_repo.find_by_timestamp(
-                price_data.timestamp, self.currency_pair
+            price_data.timeframe = "1d"
+            existing = await self.price_repo.find_by_timestamp_and_timeframe(
+                price_data.timestamp, self.currency_pair, "1d"
             )
             if existing:
                 logger.info(f"D1 data already exists for {price_data.timestamp}")
@@ -171,11 +173,12 @@ class TimeframeDataService:
                     close_price=float(row["Close"]),
                     volume=int(row["Volume"]),
                     data_source="Aggregated from 5m",
+                    timeframe="1h",
                 )
 
                 # 重複チェック
-                existing = await self.price_repo.find_by_timestamp(
-                    timestamp, self.currency_pair
+                existing = await self.price_repo.find_by_timestamp_and_timeframe(
+                    timestamp, self.currency_pair, "1h"
                 )
                 if not existing:
                     saved_data.append(await self.price_repo.save(price_data))
@@ -230,11 +233,12 @@ class TimeframeDataService:
                     close_price=float(row["Close"]),
                     volume=int(row["Volume"]),
                     data_source="Aggregated from 5m",
+                    timeframe="4h",
                 )
 
                 # 重複チェック
-                existing = await self.price_repo.find_by_timestamp(
-                    timestamp, self.currency_pair
+                existing = await self.price_repo.find_by_timestamp_and_timeframe(
+                    timestamp, self.currency_pair, "4h"
                 )
                 if not existing:
                     saved_data.append(await self.price_repo.save(price_data))
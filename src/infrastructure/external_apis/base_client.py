@@ -9,14 +9,16 @@ Base External API Client
 """
 
 import asyncio
+import time
 from abc import ABC, abstractmethod
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Optional, Union
 
 import aiohttp
 from aiohttp import ClientSession, ClientTimeout
 
 from ...utils.logging_config import get_infrastructure_logger
+from ...utils.rate_limit_utils import get_shared_rate_limiter
+from ..monitoring.metrics import record_api_call, record_rate_limit_wait
 
 logger = get_infrastructure_logger()
 
@@ -84,10 +86,12 @@ class BaseAPIClient(ABC):
         self.max_retries = max_retries
         self.retry_delay = retry_delay
 
-        # レート制限管理
+        # レート制限管理（同じベースURL・同じ制限のクライアント間で共有）
         self.rate_limit_calls = rate_limit_calls
         self.rate_limit_period = rate_limit_period
-        self._call_times: List[datetime] = []
+        self._rate_limiter = get_shared_rate_limiter(
+            self.base_url, [(rate_limit_calls, rate_limit_period)]
+        )
 
         # セッション管理
         self._session: Optional[ClientSession] = None
@@ -116,29 +120,15 @@ class BaseAPIClient(ABC):
             logger.debug(f"Closed session for {self.__class__.__name__}")
 
     async def _check_rate_limit(self) -> None:
-        """レート制限をチェック"""
-        now = datetime.utcnow()
-
-        # 期間外の古い呼び出し記録を削除
-        cutoff_time = now - timedelta(seconds=self.rate_limit_period)
-        self._call_times = [
-            call_time for call_time in self._call_times if call_time > cutoff_time
-        ]
-
-        # レート制限に達している場合は待機
-        if len(self._call_times) >= self.rate_limit_calls:
-            wait_time = (
-                self.rate_limit_period - (now - self._call_times[0]).total_seconds()
-            )
-            if wait_time > 0:
-                logger.warning(f"Rate limit reached, waiting {wait_time:.2f} seconds")
-                await asyncio.sleep(wait_time)
-                # 再帰的にチェック
-                await self._check_rate_limit()
+        """
+        レート制限をチェック
 
-    def _record_api_call(self) -> None:
-        """API呼び出しを記録"""
-        self._call_times.append(datetime.utcnow())
+        呼び出し枠を確保して記録する。制限に達している場合は次の枠まで待機する。
+        """
+        waited = await self._rate_limiter.acquire()
+        if waited > 0:
+            record_rate_limit_wait(self.__class__.__name__, waited)
+            logger.warning(f"Rate limit reached, waited {waited:.2f} seconds")
 
     async def _make_request(
         self,
@@ -166,7 +156,6 @@ class BaseAPIClient(ABC):
             RateLimitError: レート制限エラー
         """
         await self._ensure_session()
-        await self._check_rate_limit()
 
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
 
@@ -185,24 +174,37 @@ class BaseAPIClient(ABC):
 
         while retry_count <= self.max_retries:
             try:
+                # 試行ごとに呼び出し枠を確保
+                await self._check_rate_limit()
                 logger.debug(
                     f"Making {method} request to {url} (attempt {retry_count + 1})"
                 )
 
-                async with self._session.request(
-                    method=method,
-                    url=url,
-                    params=params,
-                    json=data,
-                    headers=request_headers,
-                ) as response:
-                    self._record_api_call()
-
-                    # レスポンスの処理
-                    response_data = await self._handle_response(response)
-
-                    logger.debug(f"Request successful: {method} {url}")
-                    return response_data
+                started_at = time.perf_counter()
+                outcome = "error"
+                try:
+                    async with self._session.request(
+                        method=method,
+                        url=url,
+                        params=params,
+                        json=data,
+                        headers=request_headers,
+                    ) as response:
+                        # レスポンスの処理
+                        response_data = await self._handle_response(response)
+                        outcome = "success"
+
+                        logger.debug(f"Request successful: {method} {url}")
+                        return response_data
+                except RateLimitError:
+                    outcome = "rate_limited"
+                    raise
+                finally:
+                    record_api_call(
+                        self.__class__.__name__,
+                        outcome,
+                        time.perf_counter() - started_at,
+                    )
 
             except RateLimitError as e:
                 logger.warning(
@@ -359,25 +361,12 @@ class BaseAPIClient(ABC):
         Returns:
             Dict[str, Union[int, float]]: レート制限状況
         """
-        now = datetime.utcnow()
-        cutoff_time = now - timedelta(seconds=self.rate_limit_period)
-
-        recent_calls = [
-            call_time for call_time in self._call_times if call_time > cutoff_time
-        ]
-
-        remaining_calls = max(0, self.rate_limit_calls - len(recent_calls))
-
-        if recent_calls:
-            reset_time = recent_calls[0] + timedelta(seconds=self.rate_limit_period)
-            reset_in_seconds = (reset_time - now).total_seconds()
-        else:
-            reset_in_seconds = 0
+        calls_made = self._rate_limiter.count(self.rate_limit_period)
 
         return {
-            "calls_made": len(recent_calls),
-            "calls_remaining": remaining_calls,
-            "reset_in_seconds": max(0, reset_in_seconds),
+            "calls_made": calls_made,
+            "calls_remaining": max(0, self.rate_limit_calls - calls_made),
+            "reset_in_seconds": self._rate_limiter.wait_time(),
             "limit": self.rate_limit_calls,
             "period": self.rate_limit_period,
         }
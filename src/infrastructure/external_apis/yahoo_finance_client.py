@@ -8,13 +8,19 @@ Yahoo Finance APIクライアント - 無料データソース
 機能:
 - リアルタイム為替レート取得
 - 履歴データ取得 (テクニカル指標用)
-- 複数通貨ペア対応
+- 複数通貨ペア対応（yf.download による一括取得）
 - エラーハンドリング
+
+yfinance は同期 API のため、呼び出しはすべて共有のスレッドプールで実行し、
+イベントループをブロックしない。
 """
 
 import asyncio
+import functools
 import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -28,10 +34,34 @@ from rich.table import Table
 from ...domain.entities.exchange_rate import ExchangeRateEntity
 from ...domain.value_objects.currency import CurrencyCode, CurrencyPair, Price
 from ...utils.logging_config import get_infrastructure_logger
+from ..monitoring.metrics import record_api_call
 from .base_client import APIError, BaseAPIClient
 
 logger = get_infrastructure_logger()
 
+# yfinance 呼び出し用スレッドプールの最大スレッド数（全クライアントで共有）
+YFINANCE_MAX_WORKERS = int(os.getenv("YFINANCE_MAX_WORKERS", "4"))
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_yfinance_executor() -> ThreadPoolExecutor:
+    """
+    yfinance 呼び出し用の共有スレッドプールを取得
+
+    Returns:
+        ThreadPoolExecutor: 共有スレッドプール
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=YFINANCE_MAX_WORKERS, thread_name_prefix="yfinance"
+                )
+    return _executor
+
 
 class YahooFinanceClient(BaseAPIClient):
     """
@@ -77,23 +107,49 @@ class YahooFinanceClient(BaseAPIClient):
 
         logger.info("Initialized Yahoo Finance client")
 
+    async def _run_in_executor(self, func, *args, **kwargs):
+        """同期関数を共有スレッドプールで実行"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            get_yfinance_executor(), functools.partial(func, *args, **kwargs)
+        )
+
     async def _retry_with_backoff(self, func, *args, **kwargs):
-        """リトライ機構付きでAPIコールを実行"""
+        """
+        リトライ機構付きでAPIコールを実行
+
+        同期関数は共有スレッドプールで実行する。各試行は共有レート制限の
+        呼び出し枠を確保してから行う（並行呼び出し時も制限内に収める）。
+        """
         last_exception = None
 
         for attempt in range(self.max_retries + 1):
+            started_at = time.perf_counter()
             try:
-                return (
-                    await func(*args, **kwargs)
-                    if asyncio.iscoroutinefunction(func)
-                    else func(*args, **kwargs)
+                await self._check_rate_limit()
+                started_at = time.perf_counter()
+                if asyncio.iscoroutinefunction(func):
+                    result = await func(*args, **kwargs)
+                else:
+                    result = await self._run_in_executor(func, *args, **kwargs)
+                record_api_call(
+                    self.__class__.__name__,
+                    "success",
+                    time.perf_counter() - started_at,
                 )
+                return result
             except Exception as e:
                 last_exception = e
                 error_msg = str(e).lower()
+                rate_limited = "429" in error_msg or "too many requests" in error_msg
+                record_api_call(
+                    self.__class__.__name__,
+                    "rate_limited" if rate_limited else "error",
+                    time.perf_counter() - started_at,
+                )
 
                 # レート制限エラーの場合
-                if "429" in error_msg or "too many requests" in error_msg:
+                if rate_limited:
                     if attempt < self.max_retries:
                         wait_time = self.rate_limit_delay * (
                             2**attempt
@@ -157,8 +213,7 @@ class YahooFinanceClient(BaseAPIClient):
             self.console.print("🧪 Yahoo Finance接続テスト...")
 
             # テスト用にUSD/JPYのデータを取得
-            ticker = yf.Ticker("USDJPY=X")
-            info = ticker.info
+            info = await self._run_in_executor(lambda: yf.Ticker("USDJPY=X").info)
 
             if info and "regularMarketPrice" in info:
                 self.console.print("✅ Yahoo Finance接続成功")
@@ -235,12 +290,7 @@ class YahooFinanceClient(BaseAPIClient):
                 self.console.print(f"❌ {currency_pair}: 履歴データなし")
                 return None
 
-            # データを日本時間に変換（データベース保存用）
-            if hist.index.tz is not None:
-                hist.index = hist.index.tz_convert(self.jst)
-            else:
-                # タイムゾーン情報がない場合は日本時間として扱う
-                hist.index = hist.index.tz_localize(self.jst)
+            hist = self._to_jst(hist)
 
             # 基本統計表示
             self.console.print(f"✅ {currency_pair}: {len(hist)}件のデータ取得")
@@ -253,37 +303,165 @@ class YahooFinanceClient(BaseAPIClient):
             self.console.print(f"❌ {currency_pair} 履歴データエラー: {str(e)}")
             return None
 
+    def _to_jst(self, hist: pd.DataFrame) -> pd.DataFrame:
+        """データを日本時間に変換（データベース保存用）"""
+        if hist.index.tz is not None:
+            hist.index = hist.index.tz_convert(self.jst)
+        else:
+            # タイムゾーン情報がない場合は日本時間として扱う
+            hist.index = hist.index.tz_localize(self.jst)
+        return hist
+
+    async def _download(
+        self, symbols: List[str], period: str, interval: str
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        複数シンボルの履歴データを1回のリクエストで取得し、シンボル別に分割
+
+        Args:
+            symbols: Yahoo Finance シンボルのリスト
+            period: 期間
+            interval: 間隔
+
+        Returns:
+            Dict[str, pd.DataFrame]: シンボル別の履歴データ（データなしは含まない）
+        """
+
+        def _download_tickers():
+            return yf.download(
+                tickers=symbols,
+                period=period,
+                interval=interval,
+                group_by="ticker",
+                auto_adjust=False,
+                progress=False,
+                threads=False,
+            )
+
+        data = await self._retry_with_backoff(_download_tickers)
+        if data is None or data.empty:
+            return {}
+
+        frames = {}
+        for symbol in symbols:
+            if isinstance(data.columns, pd.MultiIndex):
+                if symbol not in data.columns.get_level_values(0):
+                    continue
+                df = data[symbol]
+            elif len(symbols) == 1:
+                df = data
+            else:
+                continue
+            df = df.dropna(how="all")
+            if not df.empty:
+                frames[symbol] = df
+        return frames
+
+    async def get_multiple_historical_data(
+        self, currency_pairs: List[str], period: str = "1mo", interval: str = "1d"
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        複数通貨ペアの履歴データ一括取得
+
+        Args:
+            currency_pairs: 通貨ペアのリスト
+            period: 期間
+            interval: 間隔
+
+        Returns:
+            Dict[str, pd.DataFrame]: 通貨ペア別の履歴データ（日本時間、データなしは含まない）
+        """
+        symbols = {pair: self.get_yahoo_symbol(pair) for pair in currency_pairs}
+        try:
+            frames = await self._download(list(symbols.values()), period, interval)
+        except Exception as e:
+            self.console.print(f"❌ 履歴データ一括取得エラー: {str(e)}")
+            return {}
+
+        return {
+            pair: self._to_jst(frames[symbol].copy())
+            for pair, symbol in symbols.items()
+            if symbol in frames
+        }
+
+    def _rate_from_daily_bars(
+        self, currency_pair: str, symbol: str, bars: pd.DataFrame
+    ) -> Optional[Dict[str, Any]]:
+        """日足データから get_current_rate と同じ形式のレートデータを作成（bid/ask は None）"""
+        bars = bars.dropna(subset=["Close"])
+        if bars.empty:
+            return None
+
+        latest = bars.iloc[-1]
+        rate = float(latest["Close"])
+        previous_close = float(bars["Close"].iloc[-2]) if len(bars) > 1 else None
+        change = rate - previous_close if previous_close else None
+
+        return {
+            "currency_pair": currency_pair,
+            "rate": rate,
+            "bid": None,
+            "ask": None,
+            "previous_close": previous_close,
+            "day_high": float(latest["High"]),
+            "day_low": float(latest["Low"]),
+            "market_change": change,
+            "market_change_percent": (
+                change / previous_close * 100 if change is not None else None
+            ),
+            "timestamp": datetime.now(self.jst).strftime("%Y-%m-%d %H:%M:%S JST"),
+            "data_source": "Yahoo Finance",
+            "symbol": symbol,
+        }
+
     async def get_multiple_rates(self, currency_pairs: List[str]) -> Dict[str, Any]:
-        """複数通貨ペアのレート一括取得"""
+        """
+        複数通貨ペアのレート一括取得
+
+        直近の日足を1回の yf.download でまとめて取得し、通貨ペア別に分割する。
+        一括取得に含まれなかった通貨ペアのみ個別に取得する。
+        レートは最新の日足の終値で、日足からは得られない bid/ask は None となる
+        （ビッド・アスクが必要な場合は get_current_rate を使用）。
+
+        Args:
+            currency_pairs: 通貨ペアのリスト
+
+        Returns:
+            Dict[str, Any]: rates（通貨ペア別レート）, summary, timestamp, data_source
+        """
         self.console.print(f"📊 {len(currency_pairs)}通貨ペアのレート取得開始...")
 
+        symbols = {pair: self.get_yahoo_symbol(pair) for pair in currency_pairs}
+        try:
+            frames = await self._download(list(symbols.values()), "5d", "1d")
+        except Exception as e:
+            self.console.print(f"⚠️ 一括取得エラー、個別取得に切り替え: {str(e)}")
+            frames = {}
+
         results = {}
-        successful = 0
-        failed = 0
+        for pair, symbol in symbols.items():
+            if symbol in frames:
+                rate_data = self._rate_from_daily_bars(pair, symbol, frames[symbol])
+                if rate_data:
+                    results[pair] = rate_data
 
-        for i, pair in enumerate(currency_pairs):
-            try:
-                rate_data = await self.get_current_rate(pair)
+        missing = [pair for pair in currency_pairs if pair not in results]
+        if missing:
+            fallback = await asyncio.gather(
+                *(self.get_current_rate(pair) for pair in missing)
+            )
+            for pair, rate_data in zip(missing, fallback):
                 if rate_data:
                     results[pair] = rate_data
-                    successful += 1
-                    self.console.print(f"✅ {pair}: レート取得成功")
-                else:
-                    failed += 1
-                    self.console.print(f"❌ {pair}: データなし")
 
-                # レート制限対応 - 複数リクエスト間の間隔を長めに
-                if i < len(currency_pairs) - 1:  # 最後以外
-                    await asyncio.sleep(2.0)  # 2秒間隔
+        for pair in currency_pairs:
+            if pair in results:
+                self.console.print(f"✅ {pair}: レート取得成功")
+            else:
+                self.console.print(f"❌ {pair}: データなし")
 
-            except Exception as e:
-                error_msg = str(e)
-                if "429" in error_msg or "Too Many Requests" in error_msg:
-                    self.console.print(f"⚠️ {pair}: レート制限エラー - 少し待機します")
-                    await asyncio.sleep(10.0)  # レート制限時は10秒待機
-                else:
-                    self.console.print(f"❌ {pair}: {error_msg}")
-                failed += 1
+        successful = len(results)
+        failed = len(currency_pairs) - successful
 
         # 結果サマリー
         self.console.print(f"\n📊 取得結果: 成功 {successful}件, 失敗 {failed}件")
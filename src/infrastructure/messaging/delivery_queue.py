@@ -0,0 +1,585 @@
+"""
+Discord Delivery Queue
+Discord 通知送信キュー
+
+設計書参照:
+- インフラ・プラグイン設計_20250809.md
+
+Discord Webhook への送信をキューに集約する
+
+特徴:
+- 同じ Webhook 宛ての埋め込みを1リクエストあたり最大10個（合計6000文字以内）に
+  まとめて送信
+- 固定の待機ではなく、Webhook ごとの X-RateLimit-* ヘッダーと 429 の
+  retry_after に従って送信間隔を調整
+- サーバーエラー・通信エラーはジッター付き指数バックオフで再送
+  （2xx は応答本文を読めなくても送信済みとし、再送しない）
+- 未送信の通知はスプールファイルに記録し、再起動後に再送
+- deliver() は送信完了をタイムアウト付きで待ち、送信ワーカーが停止した場合も
+  待機中の呼び出し元に失敗（None）を返す
+"""
+
+import asyncio
+import json
+import os
+import random
+import time
+import uuid
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from typing import Any, Deque, Dict, List, Optional
+
+import aiohttp
+
+from ...utils.logging_config import get_infrastructure_logger
+from ..monitoring.metrics import record_api_call, record_rate_limit_wait
+
+logger = get_infrastructure_logger()
+
+# Discord の1メッセージあたりの制限
+MAX_EMBEDS_PER_MESSAGE = 10
+MAX_EMBED_CHARS_PER_MESSAGE = 6000
+
+
+@dataclass
+class DeliveryItem:
+    """
+    送信キューの1件
+
+    Attributes:
+        embed: Discord Embed
+        webhook_url: 送信先 Webhook URL
+        id: 識別子
+        attempts: 失敗した送信試行回数
+        enqueued_at: 追加時刻（UNIX時間）
+    """
+
+    embed: Dict[str, Any]
+    webhook_url: str
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    attempts: int = 0
+    enqueued_at: float = field(default_factory=time.time)
+
+
+@dataclass
+class _WebhookBucket:
+    """Webhook ごとのレート制限状態（時刻は monotonic）"""
+
+    remaining: Optional[int] = None
+    reset_at: float = 0.0
+    blocked_until: float = 0.0
+
+
+def embed_size(embed: Dict[str, Any]) -> int:
+    """
+    Discord の文字数制限で数える埋め込みの文字数
+
+    Args:
+        embed: Discord Embed
+
+    Returns:
+        int: タイトル・説明・フィールド・フッター・作成者名の合計文字数
+    """
+    size = len(embed.get("title") or "") + len(embed.get("description") or "")
+    size += len((embed.get("footer") or {}).get("text") or "")
+    size += len((embed.get("author") or {}).get("name") or "")
+    for embed_field in embed.get("fields") or []:
+        size += len(embed_field.get("name") or "") + len(embed_field.get("value") or "")
+    return size
+
+
+class DiscordDeliveryQueue:
+    """
+    Discord 通知送信キュー
+
+    責任:
+    - 埋め込みのバッチ送信
+    - Webhook ごとのレート制限への追従
+    - 再送と未送信通知の永続化
+    """
+
+    def __init__(
+        self,
+        webhook_url: str = "",
+        spool_path: Optional[str] = None,
+        batch_window_seconds: float = 0.05,
+        max_attempts: int = 5,
+        retry_base_seconds: float = 1.0,
+        retry_max_seconds: float = 60.0,
+        request_timeout_seconds: float = 30.0,
+        deliver_timeout_seconds: Optional[float] = 120.0,
+        session: Optional[aiohttp.ClientSession] = None,
+    ):
+        """
+        初期化
+
+        Args:
+            webhook_url: デフォルトの送信先 Webhook URL
+            spool_path: 未送信通知のスプールファイル（Noneで永続化しない）
+            batch_window_seconds: 送信前に後続の通知を待つ時間（秒）
+            max_attempts: 1件あたりの最大送信試行回数（429 は数えない）
+            retry_base_seconds: 再送待機の基準時間（秒）
+            retry_max_seconds: 再送待機の上限（秒）
+            request_timeout_seconds: リクエストタイムアウト（秒）
+            deliver_timeout_seconds: deliver() で送信完了を待つ時間
+                （秒、Noneで無制限）
+            session: 使用する HTTP セッション（Noneで内部に作成）
+        """
+        self.webhook_url = webhook_url
+        self.spool_path = spool_path
+        self.batch_window_seconds = batch_window_seconds
+        self.max_attempts = max_attempts
+        self.retry_base_seconds = retry_base_seconds
+        self.retry_max_seconds = retry_max_seconds
+        self.request_timeout_seconds = request_timeout_seconds
+        self.deliver_timeout_seconds = deliver_timeout_seconds
+
+        self._session = session
+        self._owns_session = session is None
+        self._pending: Dict[str, Deque[DeliveryItem]] = {}
+        self._waiters: Dict[str, "asyncio.Future[Optional[str]]"] = {}
+        self._buckets: Dict[str, _WebhookBucket] = {}
+        self._global_blocked_until = 0.0
+        self._wakeup = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._worker: Optional["asyncio.Task[None]"] = None
+
+        # 統計情報
+        self.requests_sent = 0
+        self.embeds_delivered = 0
+        self.embeds_failed = 0
+        self.rate_limited_responses = 0
+        self.retries = 0
+
+        self._load_spool()
+
+    # キュー操作
+
+    def enqueue(self, embed: Dict[str, Any], webhook_url: Optional[str] = None) -> str:
+        """
+        埋め込みを送信キューに追加
+
+        Args:
+            embed: Discord Embed
+            webhook_url: 送信先 Webhook URL（Noneでデフォルト）
+
+        Returns:
+            str: 追加した通知の識別子
+        """
+        url = webhook_url or self.webhook_url
+        if not url:
+            raise ValueError("Webhook URL is not configured")
+
+        item = DeliveryItem(embed=embed, webhook_url=url)
+        self._pending.setdefault(url, deque()).append(item)
+        self._append_spool({"op": "add", "item": asdict(item)})
+        self._idle.clear()
+        self._wakeup.set()
+        return item.id
+
+    async def deliver(
+        self,
+        embeds: List[Dict[str, Any]],
+        webhook_url: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> List[Optional[str]]:
+        """
+        埋め込みを送信キューに追加し、送信完了まで待機
+
+        タイムアウトした埋め込みはキューに残り、後で送信される。
+
+        Args:
+            embeds: Discord Embed のリスト
+            webhook_url: 送信先 Webhook URL（Noneでデフォルト）
+            timeout: 待機時間（秒、Noneで deliver_timeout_seconds）
+
+        Returns:
+            List[Optional[str]]: 埋め込みごとの Discord メッセージID
+                （失敗・タイムアウト時はNone）
+        """
+        if self._worker is None or self._worker.done():
+            await self.start()
+
+        loop = asyncio.get_running_loop()
+        waiters = []
+        for embed in embeds:
+            item_id = self.enqueue(embed, webhook_url)
+            future = loop.create_future()
+            self._waiters[item_id] = future
+            waiters.append((item_id, future))
+        if not waiters:
+            return []
+
+        timeout = self.deliver_timeout_seconds if timeout is None else timeout
+        await asyncio.wait([future for _, future in waiters], timeout=timeout)
+
+        results: List[Optional[str]] = []
+        timed_out = 0
+        for item_id, future in waiters:
+            if future.done():
+                results.append(future.result())
+            else:
+                self._waiters.pop(item_id, None)
+                future.cancel()
+                results.append(None)
+                timed_out += 1
+        if timed_out:
+            logger.warning(
+                f"Timed out waiting for {timed_out} Discord embeds after {timeout}s; "
+                f"they stay queued"
+            )
+        return results
+
+    async def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        キューが空になるまで待機
+
+        Args:
+            timeout: タイムアウト（秒、Noneで無制限）
+
+        Returns:
+            bool: キューが空になった場合True
+        """
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    def pending_count(self) -> int:
+        """
+        未送信の通知数
+
+        Returns:
+            int: 未送信の通知数
+        """
+        return sum(len(queue) for queue in self._pending.values())
+
+    # ライフサイクル
+
+    async def start(self) -> None:
+        """送信ワーカーを開始"""
+        if self._worker is not None and not self._worker.done():
+            return
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.request_timeout_seconds)
+            )
+            self._owns_session = True
+        self._worker = asyncio.create_task(self._run(), name="discord-delivery-queue")
+        if self.pending_count():
+            logger.info(f"Resuming {self.pending_count()} undelivered Discord embeds")
+            self._idle.clear()
+            self._wakeup.set()
+
+    async def stop(self, flush_timeout: Optional[float] = 10.0) -> None:
+        """
+        送信ワーカーを停止
+
+        未送信の通知はスプールファイルに残り、次回の start で再送される。
+
+        Args:
+            flush_timeout: 停止前に送信完了を待つ時間（秒、0で待たない）
+        """
+        if self._worker is not None:
+            if flush_timeout:
+                await self.flush(flush_timeout)
+            self._worker.cancel()
+            await asyncio.gather(self._worker, return_exceptions=True)
+            self._worker = None
+
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    # 送信処理
+
+    async def _run(self) -> None:
+        try:
+            while True:
+                await self._wakeup.wait()
+                self._wakeup.clear()
+
+                # 同時に発生した通知をまとめるために少し待つ
+                if self.batch_window_seconds > 0:
+                    await asyncio.sleep(self.batch_window_seconds)
+
+                while self.pending_count():
+                    for url in list(self._pending):
+                        queue = self._pending[url]
+                        if queue:
+                            batch = self._take_batch(queue)
+                            try:
+                                await self._send_batch(url, batch)
+                            except Exception as e:
+                                # 想定外のエラーでもワーカーを止めない
+                                logger.exception("Unexpected Discord delivery error")
+                                self._fail(batch, repr(e))
+                        if not queue:
+                            del self._pending[url]
+
+                self._compact_spool()
+                self._idle.set()
+        finally:
+            # 停止後は送信されないため、待機中の呼び出し元に失敗を返す
+            # （未送信の通知はスプールに残り、次回の start で再送される）
+            self._release_waiters()
+
+    def _release_waiters(self) -> None:
+        """待機中の deliver() に None を返す"""
+        waiters, self._waiters = self._waiters, {}
+        for future in waiters.values():
+            if not future.done():
+                future.set_result(None)
+
+    @staticmethod
+    def _take_batch(queue: Deque[DeliveryItem]) -> List[DeliveryItem]:
+        """1メッセージに収まる分だけキューの先頭から取り出す"""
+        batch = [queue.popleft()]
+        size = embed_size(batch[0].embed)
+        while queue and len(batch) < MAX_EMBEDS_PER_MESSAGE:
+            next_size = embed_size(queue[0].embed)
+            if size + next_size > MAX_EMBED_CHARS_PER_MESSAGE:
+                break
+            batch.append(queue.popleft())
+            size += next_size
+        return batch
+
+    async def _send_batch(self, url: str, batch: List[DeliveryItem]) -> None:
+        """
+        バッチを送信（成功・破棄まで再送）
+
+        Args:
+            url: Webhook URL
+            batch: 送信する通知
+        """
+        bucket = self._buckets.setdefault(url, _WebhookBucket())
+        payload = {"embeds": [item.embed for item in batch]}
+
+        while True:
+            await self._wait_for_bucket(bucket)
+            started_at = time.perf_counter()
+            responded = False
+            try:
+                async with self._session.post(
+                    url, params={"wait": "true"}, json=payload
+                ) as response:
+                    self.requests_sent += 1
+                    self._update_bucket(bucket, response.headers)
+                    responded = True
+                    record_api_call(
+                        self.__class__.__name__,
+                        self._call_outcome(response.status),
+                        time.perf_counter() - started_at,
+                    )
+
+                    if 200 <= response.status < 300:
+                        # 受理済みのバッチは本文を読めなくても再送しない
+                        body = await self._read_json(response)
+                        self._complete(batch, str(body.get("id", "")))
+                        return
+
+                    if response.status == 429:
+                        self._handle_rate_limited(
+                            bucket, response, await self._read_json(response)
+                        )
+                        continue
+
+                    error = f"HTTP {response.status}: {await response.text()}"
+                    if response.status < 500:
+                        # 不正な埋め込みは他の通知を巻き込まないよう個別に送り直す
+                        if len(batch) > 1:
+                            for item in batch:
+                                await self._send_batch(url, [item])
+                        else:
+                            self._fail(batch, error)
+                        return
+
+            except Exception as e:
+                error = repr(e)
+                if not responded:
+                    record_api_call(
+                        self.__class__.__name__,
+                        "error",
+                        time.perf_counter() - started_at,
+                    )
+
+            if not await self._backoff(batch, error):
+                return
+
+    @staticmethod
+    async def _read_json(response: Any) -> Dict[str, Any]:
+        """応答本文の JSON オブジェクト（読めない場合は空）"""
+        try:
+            body = await response.json(content_type=None)
+        except Exception as e:
+            logger.debug(f"Failed to read Discord response body: {e!r}")
+            return {}
+        return body if isinstance(body, dict) else {}
+
+    @staticmethod
+    def _call_outcome(status: int) -> str:
+        if 200 <= status < 300:
+            return "success"
+        if status == 429:
+            return "rate_limited"
+        return "error"
+
+    async def _wait_for_bucket(self, bucket: _WebhookBucket) -> None:
+        now = time.monotonic()
+        wait_until = max(self._global_blocked_until, bucket.blocked_until)
+        if bucket.remaining == 0:
+            wait_until = max(wait_until, bucket.reset_at)
+        if wait_until > now:
+            record_rate_limit_wait(self.__class__.__name__, wait_until - now)
+            await asyncio.sleep(wait_until - now)
+            bucket.remaining = None
+
+    @staticmethod
+    def _update_bucket(bucket: _WebhookBucket, headers: Any) -> None:
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset_after = headers.get("X-RateLimit-Reset-After")
+        try:
+            if remaining is not None:
+                bucket.remaining = int(remaining)
+            if reset_after is not None:
+                bucket.reset_at = time.monotonic() + float(reset_after)
+        except ValueError:
+            pass
+
+    def _handle_rate_limited(
+        self, bucket: _WebhookBucket, response: Any, body: Optional[Dict[str, Any]]
+    ) -> None:
+        body = body or {}
+        retry_after = (
+            body.get("retry_after") or response.headers.get("Retry-After") or 1
+        )
+        until = time.monotonic() + float(retry_after)
+        if body.get("global") or response.headers.get("X-RateLimit-Global"):
+            self._global_blocked_until = until
+        else:
+            bucket.blocked_until = until
+        self.rate_limited_responses += 1
+        logger.warning(
+            f"Discord rate limited, retrying after {float(retry_after):.2f}s"
+        )
+
+    async def _backoff(self, batch: List[DeliveryItem], error: str) -> bool:
+        """
+        再送前の待機（試行回数を超えた通知は破棄）
+
+        Returns:
+            bool: 再送する場合True
+        """
+        for item in batch:
+            item.attempts += 1
+        attempts = max(item.attempts for item in batch)
+        if attempts >= self.max_attempts:
+            self._fail(batch, error)
+            return False
+
+        # ジッター付き指数バックオフ（待機時間の半分をランダム化）
+        delay = min(
+            self.retry_max_seconds, self.retry_base_seconds * 2 ** (attempts - 1)
+        )
+        delay = delay / 2 + random.uniform(0, delay / 2)
+        self.retries += 1
+        logger.warning(
+            f"Discord delivery failed ({error}), retry {attempts}/{self.max_attempts} "
+            f"in {delay:.2f}s"
+        )
+        await asyncio.sleep(delay)
+        return True
+
+    def _complete(self, batch: List[DeliveryItem], message_id: str) -> None:
+        self.embeds_delivered += len(batch)
+        for item in batch:
+            self._resolve(item, message_id or item.id)
+        logger.info(f"Delivered {len(batch)} Discord embeds in one request")
+
+    def _fail(self, batch: List[DeliveryItem], error: str) -> None:
+        self.embeds_failed += len(batch)
+        for item in batch:
+            self._resolve(item, None)
+        logger.error(f"Dropped {len(batch)} Discord embeds: {error}")
+
+    def _resolve(self, item: DeliveryItem, message_id: Optional[str]) -> None:
+        self._append_spool({"op": "done", "id": item.id})
+        future = self._waiters.pop(item.id, None)
+        if future is not None and not future.done():
+            future.set_result(message_id)
+
+    # スプールファイル
+
+    def _append_spool(self, record: Dict[str, Any]) -> None:
+        if not self.spool_path:
+            return
+        try:
+            with open(self.spool_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        except OSError as e:
+            logger.error(f"Failed to write Discord delivery spool: {e}")
+
+    def _load_spool(self) -> None:
+        """スプールファイルから未送信の通知を読み込み"""
+        if not self.spool_path:
+            return
+        os.makedirs(os.path.dirname(self.spool_path) or ".", exist_ok=True)
+        if not os.path.exists(self.spool_path):
+            return
+
+        items: Dict[str, DeliveryItem] = {}
+        try:
+            with open(self.spool_path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # 書き込み途中で停止した行は読み飛ばす
+                        continue
+                    if record.get("op") == "add":
+                        item = DeliveryItem(**record["item"])
+                        items[item.id] = item
+                    elif record.get("op") == "done":
+                        items.pop(record.get("id"), None)
+        except OSError as e:
+            logger.error(f"Failed to read Discord delivery spool: {e}")
+            return
+
+        for item in sorted(items.values(), key=lambda i: i.enqueued_at):
+            self._pending.setdefault(item.webhook_url, deque()).append(item)
+        if items:
+            self._idle.clear()
+        self._compact_spool()
+
+    def _compact_spool(self) -> None:
+        """スプールファイルを未送信の通知だけに書き直す"""
+        if not self.spool_path:
+            return
+        tmp_path = f"{self.spool_path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                for queue in self._pending.values():
+                    for item in queue:
+                        record = {"op": "add", "item": asdict(item)}
+                        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            os.replace(tmp_path, self.spool_path)
+        except OSError as e:
+            logger.error(f"Failed to compact Discord delivery spool: {e}")
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        送信統計を取得
+
+        Returns:
+            Dict[str, Any]: 送信統計
+        """
+        return {
+            "pending": self.pending_count(),
+            "requests_sent": self.requests_sent,
+            "embeds_delivered": self.embeds_delivered,
+            "embeds_failed": self.embeds_failed,
+            "rate_limited_responses": self.rate_limited_responses,
+            "retries": self.retries,
+        }
@@ -18,6 +18,7 @@ from ...domain.repositories.notification_history_repository import (
     NotificationHistoryRepository,
 )
 from ...utils.logging_config import get_infrastructure_logger
+from .delivery_queue import DiscordDeliveryQueue
 from .discord_client import DiscordClient
 
 logger = get_infrastructure_logger()
@@ -118,6 +119,7 @@ class NotificationManager:
         max_notifications_per_hour: int = 10,
         enable_priority_filtering: bool = True,
         enable_duplicate_prevention: bool = True,
+        delivery_queue: Optional[DiscordDeliveryQueue] = None,
     ):
         """
         初期化
@@ -129,8 +131,10 @@ class NotificationManager:
             max_notifications_per_hour: 1時間あたりの最大通知数
             enable_priority_filtering: 優先度フィルタリングを有効にするか
             enable_duplicate_prevention: 重複防止を有効にするか
+            delivery_queue: Discord送信キュー（指定時は一括処理の通知をまとめて送信）
         """
         self.discord_client = discord_client
+        self.delivery_queue = delivery_queue
         self.notification_history_repository = notification_history_repository
         self.duplicate_check_window_minutes = duplicate_check_window_minutes
         self.max_notifications_per_hour = max_notifications_per_hour
@@ -228,12 +232,13 @@ class NotificationManager:
         await asyncio.sleep(self.duplicate_check_window_minutes * 60)
         self._recent_notifications.discard(notification_key)
 
-    def _is_hourly_limit_exceeded(self, currency_pair: str) -> bool:
+    def _is_hourly_limit_exceeded(self, currency_pair: str, pending: int = 0) -> bool:
         """
         時間制限を超過しているかどうかを判定
 
         Args:
             currency_pair: 通貨ペア
+            pending: 送信待ちの通知数
 
         Returns:
             bool: 制限超過の場合True
@@ -241,7 +246,7 @@ class NotificationManager:
         current_hour = datetime.utcnow().replace(minute=0, second=0, microsecond=0)
         hour_key = f"{currency_pair}_{current_hour.isoformat()}"
 
-        count = self._notification_count_per_hour.get(hour_key, 0)
+        count = self._notification_count_per_hour.get(hour_key, 0) + pending
         return count >= self.max_notifications_per_hour
 
     def _increment_hourly_count(self, currency_pair: str) -> None:
@@ -351,33 +356,20 @@ class NotificationManager:
             notification_data = notification_pattern.to_dict()
             discord_message = await self._create_discord_message(notification_data)
 
-            message_id = await self.discord_client.send_rich_embed(
-                title=discord_message["title"],
-                description=discord_message["description"],
-                fields=discord_message.get("fields", []),
-                color=discord_message.get("color", 0x00FF00),
-            )
+            if self.delivery_queue is not None:
+                message_id = (await self.delivery_queue.deliver([discord_message]))[0]
+            else:
+                message_id = await self.discord_client.send_rich_embed(
+                    title=discord_message["title"],
+                    description=discord_message["description"],
+                    fields=discord_message.get("fields", []),
+                    color=discord_message.get("color", 0x00FF00),
+                )
 
             if message_id:
-                # 通知履歴を記録
-                await self._log_notification(
+                await self._record_sent_notification(
                     notification_pattern, message_id, notification_data
                 )
-
-                # 統計情報を更新
-                self.total_notifications_sent += 1
-                self._increment_hourly_count(notification_pattern.currency_pair)
-                self._add_to_recent_notifications(
-                    notification_pattern.pattern_type,
-                    notification_pattern.currency_pair,
-                    notification_pattern.timeframe,
-                )
-
-                logger.info(
-                    f"Notification sent successfully: "
-                    f"{notification_pattern.get_pattern_key()}, "
-                    f"message_id: {message_id}"
-                )
                 return True
             else:
                 self.notification_errors += 1
@@ -389,6 +381,43 @@ class NotificationManager:
             logger.error(f"Failed to send pattern notification: {str(e)}")
             return False
 
+    async def _record_sent_notification(
+        self,
+        notification_pattern: NotificationPattern,
+        message_id: str,
+        notification_data: Dict[str, Any],
+    ) -> None:
+        """
+        送信済み通知の履歴と統計を記録
+
+        Args:
+            notification_pattern: 通知パターン
+            message_id: DiscordメッセージID
+            notification_data: 通知データ
+
+        Returns:
+            None
+        """
+        # 通知履歴を記録
+        await self._log_notification(
+            notification_pattern, message_id, notification_data
+        )
+
+        # 統計情報を更新
+        self.total_notifications_sent += 1
+        self._increment_hourly_count(notification_pattern.currency_pair)
+        self._add_to_recent_notifications(
+            notification_pattern.pattern_type,
+            notification_pattern.currency_pair,
+            notification_pattern.timeframe,
+        )
+
+        logger.info(
+            f"Notification sent successfully: "
+            f"{notification_pattern.get_pattern_key()}, "
+            f"message_id: {message_id}"
+        )
+
     async def _create_discord_message(
         self, notification_data: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -518,6 +547,11 @@ class NotificationManager:
             patterns, key=lambda p: p.get_priority_score(), reverse=True
         )
 
+        if self.delivery_queue is not None:
+            await self._deliver_notification_batch(sorted_patterns, results)
+            logger.info(f"Notification patterns processed: {results}")
+            return results
+
         for pattern in sorted_patterns:
             try:
                 success = await self.send_pattern_notification(pattern)
@@ -546,6 +580,86 @@ class NotificationManager:
         logger.info(f"Notification patterns processed: {results}")
         return results
 
+    async def _deliver_notification_batch(
+        self, patterns: List[NotificationPattern], results: Dict[str, int]
+    ) -> None:
+        """
+        通知パターンをフィルタリングし、送信キューでまとめて送信
+
+        Args:
+            patterns: 優先度順の通知パターンリスト
+            results: 処理結果統計（更新される）
+
+        Returns:
+            None
+        """
+        accepted = []
+        batch_keys: Set[str] = set()
+        batch_counts: Dict[str, int] = {}
+
+        for pattern in patterns:
+            try:
+                # 同じバッチ内の重複・時間制限も送信済みとして扱う
+                notification_key = self._generate_notification_key(
+                    pattern.pattern_type, pattern.currency_pair, pattern.timeframe
+                )
+                in_batch = (
+                    self.enable_duplicate_prevention and notification_key in batch_keys
+                )
+                if self._is_duplicate_notification(
+                    pattern.pattern_type, pattern.currency_pair, pattern.timeframe
+                ) or in_batch:
+                    self.duplicate_notifications_blocked += 1
+                    results["duplicate_blocked"] += 1
+                    continue
+
+                if self._is_hourly_limit_exceeded(
+                    pattern.currency_pair, batch_counts.get(pattern.currency_pair, 0)
+                ):
+                    logger.warning(f"Hourly limit exceeded for {pattern.currency_pair}")
+                    results["errors"] += 1
+                    continue
+
+                if self.enable_priority_filtering and pattern.get_priority_score() < 30:
+                    self.low_priority_notifications_filtered += 1
+                    results["low_priority_filtered"] += 1
+                    continue
+
+                notification_data = pattern.to_dict()
+                discord_message = await self._create_discord_message(notification_data)
+                accepted.append((pattern, notification_data, discord_message))
+                batch_keys.add(notification_key)
+                batch_counts[pattern.currency_pair] = (
+                    batch_counts.get(pattern.currency_pair, 0) + 1
+                )
+
+            except Exception as e:
+                results["errors"] += 1
+                logger.error(f"Failed to process pattern: {str(e)}")
+
+        if not accepted:
+            return
+
+        try:
+            message_ids = await self.delivery_queue.deliver(
+                [discord_message for _, _, discord_message in accepted]
+            )
+        except Exception as e:
+            self.notification_errors += len(accepted)
+            results["errors"] += len(accepted)
+            logger.error(f"Failed to deliver notification batch: {str(e)}")
+            return
+
+        for (pattern, notification_data, _), message_id in zip(accepted, message_ids):
+            if message_id:
+                await self._record_sent_notification(
+                    pattern, message_id, notification_data
+                )
+                results["sent"] += 1
+            else:
+                self.notification_errors += 1
+                results["errors"] += 1
+
     async def get_notification_statistics(self, hours: int = 24) -> Dict[str, Any]:
         """
         通知統計を取得
@@ -18,6 +18,8 @@ import logging
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
+from .metrics import observe_cycle
+
 logger = logging.getLogger(__name__)
 
 
@@ -115,6 +117,7 @@ class ContinuousProcessingMonitor:
             # 処理時間を記録
             processing_time = cycle_data.get("processing_time", 0)
             self.metrics["processing_times"].append(processing_time)
+            observe_cycle("continuous", processing_time)
 
             # 処理時間の閾値チェック
             if processing_time > self.alert_thresholds["max_processing_time"]:
@@ -3,6 +3,9 @@
 ログ管理システム
 
 USD/JPY特化の5分おきデータ取得システムのログ管理機能
+
+システムイベントは SegmentedLogStore（1時間ごとのセグメント + サイドインデックス）に
+保存し、統計・検索はインデックスで対象セグメントを絞り込んで行う
 """
 
 import asyncio
@@ -15,6 +18,7 @@ from typing import Any, Dict, List, Optional
 
 from src.infrastructure.config.system_config_manager import SystemConfigManager
 from src.infrastructure.discord_webhook_sender import DiscordWebhookSender
+from src.infrastructure.monitoring.log_store import SegmentedLogStore
 from src.utils.logging_config import get_infrastructure_logger
 
 logger = get_infrastructure_logger()
@@ -34,7 +38,12 @@ class LogManager:
         self.log_level = config_manager.get("logging.level", "INFO")
 
         self.setup_logging()
-        self.log_entries = []
+        self.log_store = SegmentedLogStore(
+            config_manager.get(
+                "logging.event_log_dir",
+                str(Path(self.log_file_path).parent / "events"),
+            )
+        )
         self.error_count = 0
         self.warning_count = 0
         self.info_count = 0
@@ -99,9 +108,6 @@ class LogManager:
                 "additional_data": additional_data or {},
             }
 
-            # ログエントリを保存
-            self.log_entries.append(log_entry)
-
             # カウンターを更新
             if level == "ERROR":
                 self.error_count += 1
@@ -120,26 +126,30 @@ class LogManager:
             else:
                 logger.info(f"[{event_type}] {message}")
 
-            # ログエントリをファイルに保存
-            await self._save_log_entry(log_entry)
+            # ログエントリをセグメントに保存（書き込みはバックグラウンド）
+            self._save_log_entry(log_entry)
 
         except Exception as e:
             print(f"Error logging system event: {e}")
 
-    async def _save_log_entry(self, log_entry: Dict):
+    def _save_log_entry(self, log_entry: Dict):
         """
-        ログエントリをファイルに保存
+        ログエントリをセグメントの書き込みキューに追加
         """
         try:
-            log_file = Path(self.log_file_path)
-
-            # JSON形式でログエントリを保存
-            with open(log_file, "a", encoding="utf-8") as f:
-                f.write(json.dumps(log_entry, ensure_ascii=False) + "\n")
+            self.log_store.append(log_entry)
 
         except Exception as e:
             print(f"Error saving log entry: {e}")
 
+    def close(self):
+        """
+        書き込みキューのログエントリを書き切ってログストアを停止
+
+        プロセス終了時にも atexit で呼び出される
+        """
+        self.log_store.close()
+
     async def get_log_statistics(self, hours: int = 24) -> Dict[str, Any]:
         """
         ログ統計を取得
@@ -147,37 +157,22 @@ class LogManager:
         try:
             cutoff_time = datetime.now() - timedelta(hours=hours)
 
-            # 指定時間内のログエントリをフィルタリング
-            recent_entries = [
-                entry
-                for entry in self.log_entries
-                if datetime.fromisoformat(entry["timestamp"]) > cutoff_time
-            ]
+            # セグメントのインデックスから集計
+            summary = await asyncio.to_thread(
+                self.log_store.summarize, cutoff_time.isoformat()
+            )
+            levels = summary["levels"]
 
-            # 統計を計算
             stats = {
-                "total_entries": len(recent_entries),
-                "error_count": len(
-                    [e for e in recent_entries if e["level"] == "ERROR"]
-                ),
-                "warning_count": len(
-                    [e for e in recent_entries if e["level"] == "WARNING"]
-                ),
-                "info_count": len([e for e in recent_entries if e["level"] == "INFO"]),
-                "debug_count": len(
-                    [e for e in recent_entries if e["level"] == "DEBUG"]
-                ),
-                "event_types": {},
+                "total_entries": summary["count"],
+                "error_count": levels.get("ERROR", 0),
+                "warning_count": levels.get("WARNING", 0),
+                "info_count": levels.get("INFO", 0),
+                "debug_count": levels.get("DEBUG", 0),
+                "event_types": summary["event_types"],
                 "time_period_hours": hours,
             }
 
-            # イベントタイプ別の統計
-            for entry in recent_entries:
-                event_type = entry["event_type"]
-                stats["event_types"][event_type] = (
-                    stats["event_types"].get(event_type, 0) + 1
-                )
-
             return stats
 
         except Exception as e:
@@ -197,29 +192,14 @@ class LogManager:
         try:
             cutoff_time = datetime.now() - timedelta(hours=hours)
 
-            # 指定時間内のログエントリをフィルタリング
-            recent_entries = [
-                entry
-                for entry in self.log_entries
-                if datetime.fromisoformat(entry["timestamp"]) > cutoff_time
-            ]
-
-            # 検索条件でフィルタリング
-            filtered_entries = []
-            for entry in recent_entries:
-                # レベルフィルター
-                if level and entry["level"] != level:
-                    continue
-
-                # イベントタイプフィルター
-                if event_type and entry["event_type"] != event_type:
-                    continue
-
-                # 検索語フィルター
-                if search_term.lower() in entry["message"].lower():
-                    filtered_entries.append(entry)
-
-            return filtered_entries
+            # 期間・レベル・イベントタイプが該当するセグメントのみ検索
+            return await asyncio.to_thread(
+                self.log_store.search,
+                search_term,
+                cutoff_time.isoformat(),
+                level,
+                event_type,
+            )
 
         except Exception as e:
             logger.error(f"Error searching logs: {e}")
@@ -232,12 +212,10 @@ class LogManager:
         try:
             cutoff_time = datetime.now() - timedelta(days=days)
 
-            # 古いログエントリを削除
-            self.log_entries = [
-                entry
-                for entry in self.log_entries
-                if datetime.fromisoformat(entry["timestamp"]) > cutoff_time
-            ]
+            # 古いセグメントを削除
+            removed = await asyncio.to_thread(
+                self.log_store.delete_before, cutoff_time.isoformat()
+            )
 
             # ログファイルのローテーションを確認
             log_file = Path(self.log_file_path)
@@ -245,7 +223,8 @@ class LogManager:
                 logger.info("Log file rotation triggered")
 
             logger.info(
-                f"Log cleanup completed: removed entries older than {days} days"
+                f"Log cleanup completed: removed {removed} segments "
+                f"older than {days} days"
             )
 
         except Exception as e:
@@ -259,11 +238,11 @@ class LogManager:
         """
         try:
             # 指定期間のログエントリをフィルタリング
-            filtered_entries = [
-                entry
-                for entry in self.log_entries
-                if start_time <= datetime.fromisoformat(entry["timestamp"]) <= end_time
-            ]
+            filtered_entries = await asyncio.to_thread(
+                self.log_store.read_entries,
+                start_time.isoformat(),
+                end_time.isoformat(),
+            )
 
             if format == "json":
                 return json.dumps(filtered_entries, ensure_ascii=False, indent=2)
@@ -291,29 +270,15 @@ class LogManager:
         try:
             cutoff_time = datetime.now() - timedelta(hours=hours)
 
-            # エラーログを取得
-            error_entries = [
-                entry
-                for entry in self.log_entries
-                if entry["level"] == "ERROR"
-                and datetime.fromisoformat(entry["timestamp"]) > cutoff_time
-            ]
-
-            # エラータイプ別にグループ化
-            error_types = {}
-            for entry in error_entries:
-                event_type = entry["event_type"]
-                if event_type not in error_types:
-                    error_types[event_type] = []
-                error_types[event_type].append(entry)
+            # セグメントのインデックスから集計
+            stats = await asyncio.to_thread(
+                self.log_store.summarize, cutoff_time.isoformat()
+            )
 
             summary = {
-                "total_errors": len(error_entries),
-                "error_types": {
-                    error_type: len(entries)
-                    for error_type, entries in error_types.items()
-                },
-                "recent_errors": error_entries[-10:],  # 最新10件
+                "total_errors": stats["levels"].get("ERROR", 0),
+                "error_types": stats["error_event_types"],
+                "recent_errors": stats["recent_errors"],  # 最新10件
                 "time_period_hours": hours,
             }
 
@@ -0,0 +1,508 @@
+#!/usr/bin/env python3
+"""
+セグメント化ログストア
+
+LogManager のシステムイベント（JSON行）を1時間ごとのセグメントファイルに保存し、
+セグメントごとのサイドインデックスで統計・検索を高速化する
+
+- 書き込みはキュー経由でバックグラウンドスレッドがまとめて追記（イベントループを
+  ブロックしない）
+- インデックス: タイムスタンプ範囲、レベル別件数、イベントタイプ別件数、
+  エラーのイベントタイプ別件数、直近のエラー
+- 統計は期間内に完全に含まれるセグメントのインデックスのみで集計し、
+  期間の境界にかかる1セグメントだけを読み込む
+- 検索は期間・レベル・イベントタイプが該当するセグメントのみを読み込む
+- 複数プロセスが同じディレクトリに書き込めるよう、追記とインデックス更新は
+  ディレクトリのロック（flock）内で行い、インデックスは常にディスク上のものに
+  加算する。読み出し時は更新されたインデックスファイルを読み直す
+- プロセス終了時（atexit）にキューを書き切る
+"""
+
+import atexit
+import json
+import queue
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+from src.utils.logging_config import get_infrastructure_logger
+
+logger = get_infrastructure_logger()
+
+SEGMENT_PREFIX = "events-"
+SEGMENT_SUFFIX = ".jsonl"
+INDEX_SUFFIX = ".idx.json"
+LOCK_FILENAME = ".lock"
+
+# 書き込みスレッドの停止指示
+_STOP = object()
+
+
+def segment_key(timestamp: str) -> str:
+    """
+    タイムスタンプ（ISO形式）からセグメントキー（YYYYMMDDHH）を取得
+
+    Args:
+        timestamp: ISO形式のタイムスタンプ
+
+    Returns:
+        str: セグメントキー
+    """
+    return timestamp[:13].replace("-", "").replace("T", "")
+
+
+def _new_index(key: str) -> Dict[str, Any]:
+    """空のインデックス"""
+    return {
+        "segment": key,
+        "start": None,
+        "end": None,
+        "count": 0,
+        "levels": {},
+        "event_types": {},
+        "error_event_types": {},
+        "recent_errors": [],
+    }
+
+
+def _file_signature(path: Path) -> Tuple[int, int]:
+    """ファイルの更新時刻（ns）とサイズ"""
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+class SegmentedLogStore:
+    """
+    セグメント化ログストア
+
+    責任:
+    - ログエントリのバックグラウンド書き込みと1時間ごとのローテーション
+    - セグメントごとのインデックスの維持
+    - インデックスを使った統計・検索・エクスポート
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        flush_interval: float = 1.0,
+        max_batch_size: int = 1000,
+        recent_errors_per_segment: int = 10,
+    ):
+        """
+        初期化
+
+        Args:
+            directory: セグメントの保存ディレクトリ
+            flush_interval: 書き込みスレッドの待機間隔（秒）
+            max_batch_size: 1回にまとめて書き込む最大件数
+            recent_errors_per_segment: インデックスに保持する直近エラー数
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.flush_interval = flush_interval
+        self.max_batch_size = max_batch_size
+        self.recent_errors_per_segment = recent_errors_per_segment
+
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._handles: Dict[str, TextIO] = {}
+        self._indexes: Dict[str, Dict[str, Any]] = {}
+        # インデックスファイルの更新時刻とサイズ（他プロセスの更新を検知する）
+        self._index_stats: Dict[str, Tuple[int, int]] = {}
+        self._load_indexes()
+
+        self._thread = threading.Thread(
+            target=self._run, name="log-store-writer", daemon=True
+        )
+        self._thread.start()
+        # 書き込みスレッドは daemon のため、終了時にキューを書き切る
+        atexit.register(self.close)
+
+    # ------------------------------------------------------------------
+    # 書き込み
+    # ------------------------------------------------------------------
+
+    def append(self, entry: Dict[str, Any]) -> None:
+        """
+        ログエントリを書き込みキューに追加（ブロックしない）
+
+        Args:
+            entry: ログエントリ（timestamp, event_type, message, level を含む）
+        """
+        self._queue.put(entry)
+
+    def flush(self) -> None:
+        """キュー内のエントリがすべて書き込まれるまで待機"""
+        if self._thread.is_alive():
+            self._queue.join()
+
+    def close(self) -> None:
+        """キューを書き切って書き込みスレッドを停止"""
+        atexit.unregister(self.close)
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+
+    def _run(self) -> None:
+        """書き込みスレッド"""
+        while True:
+            try:
+                batch = [self._queue.get(timeout=self.flush_interval)]
+            except queue.Empty:
+                continue
+
+            while len(batch) < self.max_batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            entries = [item for item in batch if item is not _STOP]
+            try:
+                if entries:
+                    self._write_batch(entries)
+            except Exception as e:
+                logger.error(f"Error writing log segment: {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+            if len(entries) < len(batch):
+                self._close_handles()
+                return
+
+    def _write_batch(self, entries: List[Dict[str, Any]]) -> None:
+        """エントリをセグメントごとに追記してインデックスを更新"""
+        by_segment: Dict[str, List[Dict[str, Any]]] = {}
+        for entry in entries:
+            by_segment.setdefault(segment_key(entry["timestamp"]), []).append(entry)
+
+        with self._directory_lock():
+            for key, segment_entries in sorted(by_segment.items()):
+                # 他プロセスの書き込みを失わないよう、ディスク上のインデックスに加算
+                index = self._read_index(key)
+                if index is None:
+                    index = self._rebuild_index(key)
+
+                handle = self._handle(key)
+                handle.write(
+                    "".join(
+                        json.dumps(entry, ensure_ascii=False) + "\n"
+                        for entry in segment_entries
+                    )
+                )
+                handle.flush()
+
+                for entry in segment_entries:
+                    self._update_index(index, entry)
+                self._write_index(key, index)
+
+        # 1時間経過したセグメントのファイルを閉じる（ローテーション）
+        latest = max(by_segment)
+        for key in [key for key in self._handles if key < latest]:
+            self._handles.pop(key).close()
+
+    def _handle(self, key: str) -> TextIO:
+        """セグメントファイルのハンドルを取得"""
+        handle = self._handles.get(key)
+        if handle is None:
+            handle = open(self._segment_path(key), "a", encoding="utf-8")
+            self._handles[key] = handle
+        return handle
+
+    def _close_handles(self) -> None:
+        for handle in self._handles.values():
+            handle.close()
+        self._handles.clear()
+
+    def _update_index(self, index: Dict[str, Any], entry: Dict[str, Any]) -> None:
+        """インデックスにエントリを反映"""
+        timestamp = entry["timestamp"]
+        level = entry.get("level", "INFO")
+        event_type = entry.get("event_type", "")
+
+        index["count"] += 1
+        if index["start"] is None or timestamp < index["start"]:
+            index["start"] = timestamp
+        if index["end"] is None or timestamp > index["end"]:
+            index["end"] = timestamp
+        index["levels"][level] = index["levels"].get(level, 0) + 1
+        index["event_types"][event_type] = index["event_types"].get(event_type, 0) + 1
+
+        if level == "ERROR":
+            errors = index["error_event_types"]
+            errors[event_type] = errors.get(event_type, 0) + 1
+            index["recent_errors"].append(entry)
+            del index["recent_errors"][: -self.recent_errors_per_segment]
+
+    def _write_index(self, key: str, index: Dict[str, Any]) -> None:
+        """インデックスファイルを置き換え（ディレクトリのロック内で呼び出す）"""
+        path = self._index_path(key)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(index, ensure_ascii=False), encoding="utf-8")
+        tmp_path.replace(path)
+        with self._lock:
+            self._indexes[key] = index
+            self._index_stats[key] = _file_signature(path)
+
+    @contextmanager
+    def _directory_lock(self) -> Iterator[None]:
+        """ディレクトリの排他ロック（同じディレクトリに書き込むプロセス間）"""
+        with open(self.directory / LOCK_FILENAME, "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    # ------------------------------------------------------------------
+    # インデックス
+    # ------------------------------------------------------------------
+
+    def _segment_path(self, key: str) -> Path:
+        return self.directory / f"{SEGMENT_PREFIX}{key}{SEGMENT_SUFFIX}"
+
+    def _index_path(self, key: str) -> Path:
+        return self.directory / f"{SEGMENT_PREFIX}{key}{INDEX_SUFFIX}"
+
+    def _read_index(self, key: str) -> Optional[Dict[str, Any]]:
+        """ディスク上のインデックスを読み込み（ないか壊れている場合はNone）"""
+        try:
+            return json.loads(self._index_path(key).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def _rebuild_index(self, key: str) -> Dict[str, Any]:
+        """セグメントのエントリからインデックスを作成"""
+        index = _new_index(key)
+        for entry in self._read_segment(key):
+            self._update_index(index, entry)
+        return index
+
+    def _load_indexes(self) -> None:
+        """インデックスを読み込み（インデックスのないセグメントは再構築）"""
+        with self._directory_lock():
+            for path in self.directory.glob(f"{SEGMENT_PREFIX}*{SEGMENT_SUFFIX}"):
+                key = path.name[len(SEGMENT_PREFIX) : -len(SEGMENT_SUFFIX)]
+                if self._read_index(key) is None:
+                    self._write_index(key, self._rebuild_index(key))
+                    logger.info(f"Rebuilt log segment index: {key}")
+        self._refresh_indexes()
+
+    def _refresh_indexes(self) -> Dict[str, Dict[str, Any]]:
+        """
+        更新されたインデックスファイルを読み直す
+
+        他のプロセスが追記したセグメントのインデックスも反映する。
+
+        Returns:
+            Dict[str, Dict[str, Any]]: セグメントキーとインデックス
+        """
+        with self._lock:
+            cached = dict(self._indexes)
+            stats = dict(self._index_stats)
+
+        indexes: Dict[str, Dict[str, Any]] = {}
+        new_stats: Dict[str, Tuple[int, int]] = {}
+        for path in self.directory.glob(f"{SEGMENT_PREFIX}*{INDEX_SUFFIX}"):
+            key = path.name[len(SEGMENT_PREFIX) : -len(INDEX_SUFFIX)]
+            try:
+                signature = _file_signature(path)
+            except FileNotFoundError:
+                continue
+            if key in cached and stats.get(key) == signature:
+                indexes[key] = cached[key]
+                new_stats[key] = signature
+                continue
+            index = self._read_index(key)
+            if index is not None:
+                indexes[key] = index
+                new_stats[key] = signature
+
+        with self._lock:
+            self._indexes = indexes
+            self._index_stats = new_stats
+        return indexes
+
+    def _segments(
+        self, start: Optional[str] = None, end: Optional[str] = None
+    ) -> List[Tuple[str, Dict[str, Any]]]:
+        """期間に重なるセグメント（キー順）"""
+        items = sorted(self._refresh_indexes().items())
+        return [
+            (key, index)
+            for key, index in items
+            if index["count"]
+            and (start is None or index["end"] > start)
+            and (end is None or index["start"] <= end)
+        ]
+
+    def _read_segment(self, key: str) -> Iterator[Dict[str, Any]]:
+        """セグメントのエントリを読み込み"""
+        try:
+            with open(self._segment_path(key), encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        continue
+        except FileNotFoundError:
+            return
+
+    # ------------------------------------------------------------------
+    # 読み出し
+    # ------------------------------------------------------------------
+
+    def summarize(self, since: str) -> Dict[str, Any]:
+        """
+        指定時刻以降の統計を集計
+
+        期間内に完全に含まれるセグメントはインデックスのみを使い、
+        境界にかかるセグメントのみエントリを読み込む。
+
+        Args:
+            since: 開始時刻（ISO形式、この時刻より後のエントリが対象）
+
+        Returns:
+            Dict[str, Any]: count, levels, event_types, error_event_types,
+                recent_errors（古い順）
+        """
+        self.flush()
+        totals = _new_index("summary")
+        for key, index in self._segments(start=since):
+            if index["start"] <= since:
+                # 境界のセグメントは期間内のエントリからインデックスを作成
+                index = _new_index(key)
+                for entry in self._read_segment(key):
+                    if entry["timestamp"] > since:
+                        self._update_index(index, entry)
+
+            totals["count"] += index["count"]
+            for field in ("levels", "event_types", "error_event_types"):
+                for name, count in index[field].items():
+                    totals[field][name] = totals[field].get(name, 0) + count
+            totals["recent_errors"].extend(index["recent_errors"])
+
+        totals["recent_errors"] = totals["recent_errors"][
+            -self.recent_errors_per_segment :
+        ]
+        return totals
+
+    def search(
+        self,
+        search_term: str,
+        since: str,
+        level: Optional[str] = None,
+        event_type: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        メッセージの部分一致検索
+
+        期間・レベル・イベントタイプに該当するエントリを含むセグメントのみを読み込む。
+
+        Args:
+            search_term: 検索語（大文字小文字を区別しない）
+            since: 開始時刻（ISO形式）
+            level: ログレベル
+            event_type: イベントタイプ
+
+        Returns:
+            List[Dict[str, Any]]: 該当エントリ（古い順）
+        """
+        self.flush()
+        term = search_term.lower()
+        results = []
+        for key, index in self._segments(start=since):
+            if level and not index["levels"].get(level):
+                continue
+            if event_type and not index["event_types"].get(event_type):
+                continue
+
+            for entry in self._read_segment(key):
+                if entry["timestamp"] <= since:
+                    continue
+                if level and entry["level"] != level:
+                    continue
+                if event_type and entry["event_type"] != event_type:
+                    continue
+                if term in entry["message"].lower():
+                    results.append(entry)
+        return results
+
+    def read_entries(self, start: str, end: str) -> List[Dict[str, Any]]:
+        """
+        期間内のエントリを取得
+
+        Args:
+            start: 開始時刻（ISO形式、含む）
+            end: 終了時刻（ISO形式、含む）
+
+        Returns:
+            List[Dict[str, Any]]: エントリ（古い順）
+        """
+        self.flush()
+        return [
+            entry
+            for key, _ in self._segments(end=end)
+            if key >= segment_key(start)
+            for entry in self._read_segment(key)
+            if start <= entry["timestamp"] <= end
+        ]
+
+    def delete_before(self, cutoff: str) -> int:
+        """
+        指定時刻より前に終わるセグメントを削除
+
+        Args:
+            cutoff: 基準時刻（ISO形式）
+
+        Returns:
+            int: 削除したセグメント数
+        """
+        self.flush()
+        with self._directory_lock():
+            expired = [
+                key
+                for key, index in self._refresh_indexes().items()
+                if index["end"] is None or index["end"] < cutoff
+            ]
+            for key in expired:
+                self._segment_path(key).unlink(missing_ok=True)
+                self._index_path(key).unlink(missing_ok=True)
+
+        with self._lock:
+            for key in expired:
+                self._indexes.pop(key, None)
+                self._index_stats.pop(key, None)
+        return len(expired)
+
+    def get_segment_info(self) -> Dict[str, Any]:
+        """
+        セグメントの情報を取得
+
+        Returns:
+            Dict[str, Any]: ディレクトリ、セグメント数、合計サイズ、期間
+        """
+        indexes = sorted(self._refresh_indexes().items())
+        total_bytes = sum(
+            self._segment_path(key).stat().st_size
+            for key, _ in indexes
+            if self._segment_path(key).exists()
+        )
+        return {
+            "directory": str(self.directory),
+            "segments": len(indexes),
+            "total_entries": sum(index["count"] for _, index in indexes),
+            "total_size_bytes": total_bytes,
+            "oldest": indexes[0][1]["start"] if indexes else None,
+            "newest": indexes[-1][1]["end"] if indexes else None,
+            "pending_writes": self._queue.qsize(),
+        }
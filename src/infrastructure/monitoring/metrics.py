@@ -0,0 +1,279 @@
+"""
+Prometheus Metrics
+処理パイプラインの統一メトリクスレジストリ
+
+責任:
+- パイプラインステージ（取得・集計・指標・パターン・通知）のレイテンシ
+- リポジトリメソッド別のDBクエリレイテンシ
+- キャッシュ層別のヒット/ミス
+- 外部API呼び出し・レート制限の回数
+
+特徴:
+- 全メトリクスを1つのレジストリに登録（FastAPI の /metrics と
+  スケジューラーデーモンの HTTP サーバーの両方から同じ形式で公開）
+- 記録関数は例外を送出しない（計測が本処理を妨げない）
+"""
+
+import functools
+import time
+from typing import Any, Callable, Optional, Tuple, TypeVar
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    start_http_server,
+)
+from prometheus_client import gc_collector, platform_collector, process_collector
+
+from ...utils.logging_config import get_infrastructure_logger
+from .tracing import get_tracer
+
+logger = get_infrastructure_logger()
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+NAMESPACE = "exchange_analytics"
+
+# 5分足パイプラインのステージ・サイクル用（秒）
+STAGE_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+# DBクエリ・API呼び出し用（秒）
+QUERY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+REGISTRY = CollectorRegistry()
+process_collector.ProcessCollector(registry=REGISTRY)
+platform_collector.PlatformCollector(registry=REGISTRY)
+gc_collector.GCCollector(registry=REGISTRY)
+
+PIPELINE_STAGE_SECONDS = Histogram(
+    "pipeline_stage_duration_seconds",
+    "パイプラインステージの処理時間",
+    ["stage"],
+    namespace=NAMESPACE,
+    buckets=STAGE_BUCKETS,
+    registry=REGISTRY,
+)
+PIPELINE_STAGE_ERRORS = Counter(
+    "pipeline_stage_errors",
+    "パイプラインステージのエラー数",
+    ["stage"],
+    namespace=NAMESPACE,
+    registry=REGISTRY,
+)
+PIPELINE_CYCLE_SECONDS = Histogram(
+    "pipeline_cycle_duration_seconds",
+    "パイプライン1サイクルの処理時間",
+    ["pipeline"],
+    namespace=NAMESPACE,
+    buckets=STAGE_BUCKETS,
+    registry=REGISTRY,
+)
+PIPELINE_TICK_LAG_SECONDS = Gauge(
+    "pipeline_tick_lag_seconds",
+    "5分境界からのサイクル開始遅延",
+    namespace=NAMESPACE,
+    registry=REGISTRY,
+)
+DB_QUERY_SECONDS = Histogram(
+    "db_query_duration_seconds",
+    "リポジトリメソッド別のDBクエリ時間",
+    ["repository", "method"],
+    namespace=NAMESPACE,
+    buckets=QUERY_BUCKETS,
+    registry=REGISTRY,
+)
+DB_QUERY_ERRORS = Counter(
+    "db_query_errors",
+    "リポジトリメソッド別のDBクエリエラー数",
+    ["repository", "method"],
+    namespace=NAMESPACE,
+    registry=REGISTRY,
+)
+CACHE_REQUESTS = Counter(
+    "cache_requests",
+    "キャッシュ層別の参照数（result: hit / miss）",
+    ["tier", "result"],
+    namespace=NAMESPACE,
+    registry=REGISTRY,
+)
+API_CALLS = Counter(
+    "api_calls",
+    "外部API呼び出し数（outcome: success / error / rate_limited）",
+    ["client", "outcome"],
+    namespace=NAMESPACE,
+    registry=REGISTRY,
+)
+API_CALL_SECONDS = Histogram(
+    "api_call_duration_seconds",
+    "外部API呼び出し時間",
+    ["client"],
+    namespace=NAMESPACE,
+    buckets=QUERY_BUCKETS,
+    registry=REGISTRY,
+)
+API_RATE_LIMIT_WAITS = Counter(
+    "api_rate_limit_waits",
+    "共有レート制限で待機した回数",
+    ["client"],
+    namespace=NAMESPACE,
+    registry=REGISTRY,
+)
+API_RATE_LIMIT_WAIT_SECONDS = Counter(
+    "api_rate_limit_wait_seconds",
+    "共有レート制限で待機した合計時間",
+    ["client"],
+    namespace=NAMESPACE,
+    registry=REGISTRY,
+)
+
+
+def observe_stage(stage: str, seconds: float, error: bool = False) -> None:
+    """
+    パイプラインステージの処理時間を記録
+
+    Args:
+        stage: ステージ名（fetch, aggregate, indicators, patterns, notify）
+        seconds: 処理時間（秒）
+        error: ステージが失敗した場合True
+    """
+    try:
+        PIPELINE_STAGE_SECONDS.labels(stage=stage).observe(seconds)
+        if error:
+            PIPELINE_STAGE_ERRORS.labels(stage=stage).inc()
+    except Exception as e:
+        logger.debug(f"Failed to record stage metric: {e}")
+
+
+def observe_cycle(
+    pipeline: str, seconds: float, tick_lag_seconds: Optional[float] = None
+) -> None:
+    """
+    パイプライン1サイクルの処理時間を記録
+
+    Args:
+        pipeline: パイプライン名
+        seconds: 処理時間（秒）
+        tick_lag_seconds: 予定時刻からの開始遅延（秒）
+    """
+    try:
+        PIPELINE_CYCLE_SECONDS.labels(pipeline=pipeline).observe(seconds)
+        if tick_lag_seconds is not None:
+            PIPELINE_TICK_LAG_SECONDS.set(tick_lag_seconds)
+    except Exception as e:
+        logger.debug(f"Failed to record cycle metric: {e}")
+
+
+def record_cache_lookup(tier: str, hit: bool) -> None:
+    """
+    キャッシュ参照結果を記録
+
+    Args:
+        tier: キャッシュ層（memory, file, database, redis）
+        hit: ヒットした場合True
+    """
+    try:
+        CACHE_REQUESTS.labels(tier=tier, result="hit" if hit else "miss").inc()
+    except Exception as e:
+        logger.debug(f"Failed to record cache metric: {e}")
+
+
+def record_api_call(client: str, outcome: str, seconds: float) -> None:
+    """
+    外部API呼び出しを記録
+
+    Args:
+        client: クライアント名
+        outcome: 結果（success, error, rate_limited）
+        seconds: 呼び出し時間（秒）
+    """
+    try:
+        API_CALLS.labels(client=client, outcome=outcome).inc()
+        API_CALL_SECONDS.labels(client=client).observe(seconds)
+    except Exception as e:
+        logger.debug(f"Failed to record API metric: {e}")
+
+
+def record_rate_limit_wait(client: str, seconds: float) -> None:
+    """
+    共有レート制限での待機を記録
+
+    Args:
+        client: クライアント名
+        seconds: 待機時間（秒）
+    """
+    try:
+        API_RATE_LIMIT_WAITS.labels(client=client).inc()
+        API_RATE_LIMIT_WAIT_SECONDS.labels(client=client).inc(seconds)
+    except Exception as e:
+        logger.debug(f"Failed to record rate limit metric: {e}")
+
+
+def observe_query(func: F) -> F:
+    """
+    リポジトリメソッドのDBクエリ時間を記録するデコレーター
+
+    ラベルの repository はインスタンスのクラス名（基底クラスのメソッドも
+    呼び出し元のリポジトリ名で集計される）、method は関数名。
+    トレースが有効な場合は同じ名前のスパンも記録する。
+
+    Args:
+        func: リポジトリの非同期メソッド
+
+    Returns:
+        F: 計測付きのメソッド
+    """
+    method = func.__name__
+
+    @functools.wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        repository = type(self).__name__
+        span_name = f"{repository}.{method}"
+        start = time.perf_counter()
+        try:
+            with get_tracer().span(span_name, kind="repository") as span:
+                result = await func(self, *args, **kwargs)
+                if span is not None:
+                    span.record_rows(result)
+                return result
+        except Exception:
+            DB_QUERY_ERRORS.labels(repository=repository, method=method).inc()
+            raise
+        finally:
+            DB_QUERY_SECONDS.labels(repository=repository, method=method).observe(
+                time.perf_counter() - start
+            )
+
+    return wrapper
+
+
+def render_latest() -> Tuple[bytes, str]:
+    """
+    レジストリの内容を Prometheus テキスト形式で出力
+
+    Returns:
+        Tuple[bytes, str]: (本文, Content-Type)
+    """
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+
+
+def start_metrics_server(port: int, addr: str = "0.0.0.0") -> bool:
+    """
+    メトリクス公開用の HTTP サーバーを起動（デーモンプロセス用）
+
+    Args:
+        port: ポート番号
+        addr: バインドアドレス
+
+    Returns:
+        bool: 起動成功の場合True
+    """
+    try:
+        start_http_server(port, addr=addr, registry=REGISTRY)
+        logger.info(f"📈 Metrics server started on {addr}:{port}/metrics")
+        return True
+    except Exception as e:
+        logger.error(f"Failed to start metrics server on port {port}: {e}")
+        return False
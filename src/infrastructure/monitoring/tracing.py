@@ -0,0 +1,630 @@
+"""
+Tracing
+リポジトリ・サービスのホットパス用スパン/トレース
+
+責任:
+- 呼び出しごとの処理時間・行数・SQLフィンガープリントの記録
+- 5分足パイプライン1サイクル内のスパンのネスト（contextvars で親子を伝播）
+- インプロセスのリングバッファへの保存と、任意の OTLP エクスポート
+
+特徴:
+- オプトイン（TRACING_ENABLED=true の場合のみ記録、無効時はほぼゼロコスト）
+- サンプリングはルートスパンで判定し、子スパンは親の判定を引き継ぐ
+- SQL はスパン内で発行されたもののみ記録（SQLAlchemy のカーソルイベント）
+- OTLP エクスポートは opentelemetry-sdk / opentelemetry-exporter-otlp が
+  インストールされ、OTEL_EXPORTER_OTLP_ENDPOINT が設定されている場合のみ
+
+環境変数:
+- TRACING_ENABLED: トレースを有効化（デフォルト: false）
+- TRACING_SAMPLE_RATE: ルートスパンのサンプリング率 0.0〜1.0（デフォルト: 1.0）
+- TRACING_BUFFER_SIZE: リングバッファのスパン数（デフォルト: 5000）
+- TRACING_EXPORT_PATH: 直近サイクルのトレース出力先（CLI の monitor trace が読み込む）
+- OTEL_EXPORTER_OTLP_ENDPOINT: OTLP コレクターのエンドポイント
+"""
+
+import asyncio
+import contextvars
+import functools
+import hashlib
+import json
+import os
+import random
+import re
+import threading
+import time
+import uuid
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+from ...utils.logging_config import get_infrastructure_logger
+
+logger = get_infrastructure_logger()
+
+DEFAULT_EXPORT_PATH = "/app/data/traces/last_cycle.json"
+
+# SQLフィンガープリント用（リテラル・パラメータ・IN/VALUES の繰り返しを正規化）
+_SQL_STRING = re.compile(r"'(?:[^']|'')*'")
+_SQL_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_SQL_PARAM = re.compile(r"\$\d+|%\(\w+\)s|%s|(?<!:):\w+|\?")
+_SQL_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_SQL_ROWS = re.compile(r"\(\?\+\)(?:\s*,\s*\(\?\+\))+")
+_SQL_SPACE = re.compile(r"\s+")
+
+# サンプリング対象外のトレース内であることを示す
+_UNSAMPLED = object()
+_current_span: contextvars.ContextVar = contextvars.ContextVar(
+    "current_span", default=None
+)
+
+
+def fingerprint_sql(statement: str, max_length: int = 500) -> str:
+    """
+    SQL文をフィンガープリント化（値を ? に置き換えて同一クエリを集約可能にする）
+
+    Args:
+        statement: SQL文
+        max_length: 最大文字数
+
+    Returns:
+        str: 正規化されたSQL
+    """
+    sql = _SQL_SPACE.sub(" ", statement).strip()
+    sql = _SQL_STRING.sub("?", sql)
+    sql = _SQL_PARAM.sub("?", sql)
+    sql = _SQL_NUMBER.sub("?", sql)
+    sql = _SQL_LIST.sub("(?+)", sql)
+    sql = _SQL_ROWS.sub("(?+), ...", sql)
+    return sql[:max_length]
+
+
+def _count_rows(result: Any) -> Optional[int]:
+    """戻り値の行数（リスト・DataFrame・件数辞書など）"""
+    if isinstance(result, tuple):
+        # (件数, データ) 形式は先頭の要素で判定
+        return _count_rows(result[0]) if result else None
+    if isinstance(result, dict):
+        if "inserted" in result:
+            return result.get("inserted")
+        return None
+    if hasattr(result, "__len__") and not isinstance(result, (str, bytes)):
+        try:
+            return len(result)
+        except TypeError:
+            return None
+    return None
+
+
+@dataclass
+class Span:
+    """トレースのスパン"""
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str]
+    kind: str = "function"
+    start_time: float = field(default_factory=time.time)
+    duration_ms: float = 0.0
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+    _started: float = field(default_factory=time.perf_counter, repr=False)
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """属性を設定"""
+        self.attributes[key] = value
+
+    def record_rows(self, result: Any) -> None:
+        """戻り値から行数を記録"""
+        rows = _count_rows(result)
+        if rows is not None:
+            self.attributes["rows"] = rows
+
+    def to_dict(self) -> Dict[str, Any]:
+        """辞書に変換"""
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "kind": self.kind,
+            "start_time": self.start_time,
+            "duration_ms": round(self.duration_ms, 3),
+            "attributes": dict(self.attributes),
+            "error": self.error,
+        }
+
+
+class OTLPExporter:
+    """
+    OTLP エクスポーター
+
+    完了したトレースのスパンを開始・終了時刻付きで OpenTelemetry のスパンとして
+    再生し、BatchSpanProcessor 経由でコレクターへ送信する。
+    """
+
+    def __init__(self, service_name: str = "exchange-analytics"):
+        """
+        初期化
+
+        Args:
+            service_name: OpenTelemetry のサービス名
+
+        Raises:
+            ImportError: opentelemetry がインストールされていない場合
+        """
+        from opentelemetry import trace
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+            OTLPSpanExporter,
+        )
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+
+        # エンドポイントは OTEL_EXPORTER_OTLP_ENDPOINT から読み込まれる
+        self._provider = TracerProvider(
+            resource=Resource.create({"service.name": service_name})
+        )
+        self._provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter()))
+        self._tracer = self._provider.get_tracer("exchange_analytics.tracing")
+        self._trace = trace
+
+    def export(self, spans: List[Span]) -> None:
+        """
+        トレースのスパンを送信
+
+        Args:
+            spans: 同一トレースのスパン
+        """
+        started: Dict[str, Any] = {}
+        for span in sorted(spans, key=lambda s: s.start_time):
+            parent = started.get(span.parent_id)
+            context = self._trace.set_span_in_context(parent) if parent else None
+            attributes = {
+                key: value
+                for key, value in span.attributes.items()
+                if isinstance(value, (str, bool, int, float))
+            }
+            attributes["span.kind"] = span.kind
+            otel_span = self._tracer.start_span(
+                span.name,
+                context=context,
+                start_time=int(span.start_time * 1e9),
+                attributes=attributes,
+            )
+            if span.error:
+                otel_span.set_status(
+                    self._trace.Status(self._trace.StatusCode.ERROR, span.error)
+                )
+            started[span.span_id] = otel_span
+
+        for span in spans:
+            end_time = span.start_time + span.duration_ms / 1000
+            started[span.span_id].end(end_time=int(end_time * 1e9))
+
+    def shutdown(self) -> None:
+        """未送信のスパンを送信して終了"""
+        self._provider.shutdown()
+
+
+class Tracer:
+    """
+    トレーサー
+
+    責任:
+    - スパンの開始・終了と親子関係の管理
+    - ルートスパンでのサンプリング判定
+    - リングバッファへの保存とエクスポート
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        sample_rate: float = 1.0,
+        buffer_size: int = 5000,
+        export_path: Optional[str] = None,
+        exporter: Optional[OTLPExporter] = None,
+    ):
+        """
+        初期化
+
+        Args:
+            enabled: トレースを記録する場合True
+            sample_rate: ルートスパンのサンプリング率（0.0〜1.0）
+            buffer_size: リングバッファのスパン数
+            export_path: save_trace の出力先（Noneで出力しない）
+            exporter: OTLP エクスポーター
+        """
+        self.enabled = enabled
+        self.sample_rate = max(0.0, min(1.0, sample_rate))
+        self.export_path = export_path
+        self.exporter = exporter
+        self.spans: Deque[Span] = deque(maxlen=buffer_size)
+        self.last_trace_id: Optional[str] = None
+        self._lock = threading.Lock()
+        self._instrumented_engines: set = set()
+
+    @classmethod
+    def from_env(cls) -> "Tracer":
+        """
+        環境変数から作成
+
+        Returns:
+            Tracer: トレーサー
+        """
+        enabled = os.getenv("TRACING_ENABLED", "false").lower() == "true"
+        exporter = None
+        if enabled and os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT"):
+            try:
+                exporter = OTLPExporter(
+                    os.getenv("OTEL_SERVICE_NAME", "exchange-analytics")
+                )
+            except ImportError:
+                logger.warning(
+                    "opentelemetryがインストールされていません。OTLPエクスポートを無効化します"
+                )
+        return cls(
+            enabled=enabled,
+            sample_rate=float(os.getenv("TRACING_SAMPLE_RATE", "1.0")),
+            buffer_size=int(os.getenv("TRACING_BUFFER_SIZE", "5000")),
+            export_path=os.getenv("TRACING_EXPORT_PATH", DEFAULT_EXPORT_PATH),
+            exporter=exporter,
+        )
+
+    @staticmethod
+    def current_span() -> Optional[Span]:
+        """
+        現在のスパンを取得
+
+        Returns:
+            Optional[Span]: 現在のスパン（トレース外・サンプリング対象外はNone）
+        """
+        span = _current_span.get()
+        return span if isinstance(span, Span) else None
+
+    @contextmanager
+    def span(
+        self, name: str, kind: str = "function", **attributes
+    ) -> Iterator[Optional[Span]]:
+        """
+        スパンを開始
+
+        親スパンがない場合は新しいトレースを開始し、サンプリングを判定する。
+
+        Args:
+            name: スパン名
+            kind: スパン種別（cycle, stage, service, repository, function）
+            **attributes: スパン属性
+
+        Yields:
+            Optional[Span]: スパン（無効・サンプリング対象外の場合はNone）
+        """
+        parent = _current_span.get() if self.enabled else _UNSAMPLED
+        if parent is _UNSAMPLED:
+            yield None
+            return
+
+        if parent is None and random.random() >= self.sample_rate:
+            token = _current_span.set(_UNSAMPLED)
+            try:
+                yield None
+            finally:
+                _current_span.reset(token)
+            return
+
+        span = Span(
+            name=name,
+            trace_id=parent.trace_id if parent else uuid.uuid4().hex,
+            span_id=uuid.uuid4().hex[:16],
+            parent_id=parent.span_id if parent else None,
+            kind=kind,
+            attributes=attributes,
+        )
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.error = f"{type(e).__name__}: {e}"[:200]
+            raise
+        finally:
+            _current_span.reset(token)
+            self._finish(span)
+
+    def _finish(self, span: Span) -> None:
+        """スパンを終了してリングバッファに保存"""
+        span.duration_ms = (time.perf_counter() - span._started) * 1000
+        with self._lock:
+            self.spans.append(span)
+
+        if span.parent_id is None:
+            self.last_trace_id = span.trace_id
+            if self.exporter:
+                try:
+                    self.exporter.export(self.get_trace(span.trace_id))
+                except Exception as e:
+                    logger.warning(f"OTLPエクスポートに失敗しました: {e}")
+
+    def record_sql(
+        self,
+        statement: str,
+        started_at: float,
+        duration_ms: float,
+        rowcount: Optional[int],
+        executemany: bool,
+    ) -> None:
+        """
+        現在のスパンの子として SQL 実行を記録
+
+        Args:
+            statement: SQL文
+            started_at: 開始時刻（UNIX時刻）
+            duration_ms: 実行時間（ミリ秒）
+            rowcount: 影響行数（不明な場合はNone）
+            executemany: executemany の場合True
+        """
+        parent = self.current_span()
+        if parent is None:
+            return
+
+        sql = fingerprint_sql(statement)
+        span = Span(
+            name=f"SQL {sql.split(' ', 1)[0].upper()}",
+            trace_id=parent.trace_id,
+            span_id=uuid.uuid4().hex[:16],
+            parent_id=parent.span_id,
+            kind="sql",
+            start_time=started_at,
+            duration_ms=duration_ms,
+            attributes={
+                "sql": sql,
+                "sql_id": hashlib.sha1(sql.encode()).hexdigest()[:12],
+                "executemany": executemany,
+            },
+        )
+        if rowcount is not None and rowcount >= 0:
+            span.attributes["rows"] = rowcount
+
+        parent.attributes["sql_count"] = parent.attributes.get("sql_count", 0) + 1
+        parent.attributes["sql_ms"] = round(
+            parent.attributes.get("sql_ms", 0.0) + duration_ms, 3
+        )
+        with self._lock:
+            self.spans.append(span)
+
+    def instrument_engine(self, engine: Any) -> None:
+        """
+        SQLAlchemy エンジンにカーソルイベントを登録
+
+        Args:
+            engine: Engine または AsyncEngine
+        """
+        if not self.enabled:
+            return
+
+        from sqlalchemy import event
+
+        sync_engine = getattr(engine, "sync_engine", engine)
+        if id(sync_engine) in self._instrumented_engines:
+            return
+        self._instrumented_engines.add(id(sync_engine))
+
+        @event.listens_for(sync_engine, "before_cursor_execute")
+        def _before_cursor_execute(
+            conn, cursor, statement, parameters, context, executemany
+        ):
+            if self.current_span() is not None:
+                context._trace_started = (time.time(), time.perf_counter())
+
+        @event.listens_for(sync_engine, "after_cursor_execute")
+        def _after_cursor_execute(
+            conn, cursor, statement, parameters, context, executemany
+        ):
+            started = getattr(context, "_trace_started", None)
+            if started is None:
+                return
+            context._trace_started = None
+            self.record_sql(
+                statement,
+                started[0],
+                (time.perf_counter() - started[1]) * 1000,
+                getattr(cursor, "rowcount", None),
+                executemany,
+            )
+
+        logger.info("SQLAlchemy エンジンのトレースを有効化しました")
+
+    def get_trace(self, trace_id: str) -> List[Span]:
+        """
+        トレースのスパンを取得
+
+        Args:
+            trace_id: トレースID
+
+        Returns:
+            List[Span]: スパン（開始時刻順）
+        """
+        with self._lock:
+            spans = [span for span in self.spans if span.trace_id == trace_id]
+        return sorted(spans, key=lambda s: s.start_time)
+
+    def slowest_spans(
+        self, trace_id: Optional[str] = None, limit: int = 10
+    ) -> List[Span]:
+        """
+        処理時間の長いスパンを取得
+
+        Args:
+            trace_id: トレースID（Noneで直近のトレース）
+            limit: 件数
+
+        Returns:
+            List[Span]: 処理時間の降順
+        """
+        trace_id = trace_id or self.last_trace_id
+        if trace_id is None:
+            return []
+        spans = self.get_trace(trace_id)
+        return sorted(spans, key=lambda s: s.duration_ms, reverse=True)[:limit]
+
+    def save_trace(self, trace_id: str, path: Optional[str] = None) -> bool:
+        """
+        トレースをJSONファイルに保存（CLI の monitor trace 用）
+
+        Args:
+            trace_id: トレースID
+            path: 出力先（Noneで export_path）
+
+        Returns:
+            bool: 保存成功の場合True
+        """
+        path = path or self.export_path
+        if not path:
+            return False
+
+        spans = self.get_trace(trace_id)
+        root = next((span for span in spans if span.parent_id is None), None)
+        payload = {
+            "trace_id": trace_id,
+            "name": root.name if root else None,
+            "start_time": root.start_time if root else None,
+            "duration_ms": round(root.duration_ms, 3) if root else None,
+            "spans": [span.to_dict() for span in spans],
+        }
+        try:
+            target = Path(path)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = target.with_suffix(target.suffix + ".tmp")
+            tmp_path.write_text(json.dumps(payload, ensure_ascii=False, default=str))
+            tmp_path.replace(target)
+            return True
+        except Exception as e:
+            logger.warning(f"トレースの保存に失敗しました: {e}")
+            return False
+
+
+_tracer: Optional[Tracer] = None
+
+
+def get_tracer() -> Tracer:
+    """
+    プロセス共有のトレーサーを取得（初回は環境変数から作成）
+
+    Returns:
+        Tracer: トレーサー
+    """
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer.from_env()
+    return _tracer
+
+
+def configure_tracing(**kwargs) -> Tracer:
+    """
+    プロセス共有のトレーサーを再設定
+
+    Args:
+        **kwargs: Tracer の初期化引数
+
+    Returns:
+        Tracer: トレーサー
+    """
+    global _tracer
+    _tracer = Tracer(**kwargs)
+    return _tracer
+
+
+def traced(name: Optional[str] = None, kind: str = "service"):
+    """
+    関数呼び出しをスパンとして記録するデコレーター
+
+    Args:
+        name: スパン名（Noneで関数の修飾名）
+        kind: スパン種別
+    """
+
+    def decorator(func: Callable):
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            tracer = get_tracer()
+            if not tracer.enabled:
+                return await func(*args, **kwargs)
+            with tracer.span(span_name, kind=kind) as span:
+                result = await func(*args, **kwargs)
+                if span is not None:
+                    span.record_rows(result)
+                return result
+
+        @functools.wraps(func)
+        def sync_wrapper(*args, **kwargs):
+            tracer = get_tracer()
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            with tracer.span(span_name, kind=kind) as span:
+                result = func(*args, **kwargs)
+                if span is not None:
+                    span.record_rows(result)
+                return result
+
+        # 関数が非同期かどうかを判定
+        if asyncio.iscoroutinefunction(func):
+            return async_wrapper
+        else:
+            return sync_wrapper
+
+    return decorator
+
+
+def load_trace_file(path: str) -> Dict[str, Any]:
+    """
+    save_trace で保存したトレースを読み込み
+
+    Args:
+        path: ファイルパス
+
+    Returns:
+        Dict[str, Any]: トレース（spans に各スパンの辞書）
+    """
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compute_self_times(spans: List[Dict[str, Any]]) -> Dict[str, float]:
+    """
+    スパンごとの自己時間（子スパンを除いた処理時間）を計算
+
+    子スパンが覆う区間の和集合を親の処理時間から除く（並行実行された子スパンの
+    重なりは1回だけ数え、親の区間外の部分は数えない）。
+
+    Args:
+        spans: スパンの辞書
+
+    Returns:
+        Dict[str, float]: span_id → 自己時間（ミリ秒）
+    """
+    children: Dict[str, List[Tuple[float, float]]] = {}
+    for span in spans:
+        parent_id = span.get("parent_id")
+        if parent_id:
+            start_ms = span["start_time"] * 1000
+            children.setdefault(parent_id, []).append(
+                (start_ms, start_ms + span["duration_ms"])
+            )
+
+    self_times = {}
+    for span in spans:
+        start_ms = span["start_time"] * 1000
+        end_ms = start_ms + span["duration_ms"]
+        covered = 0.0
+        cursor = start_ms
+        for child_start, child_end in sorted(children.get(span["span_id"], [])):
+            child_start = max(child_start, cursor)
+            child_end = min(child_end, end_ms)
+            if child_end > child_start:
+                covered += child_end - child_start
+                cursor = child_end
+        self_times[span["span_id"]] = max(0.0, span["duration_ms"] - covered)
+    return self_times
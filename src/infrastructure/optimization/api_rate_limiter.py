@@ -10,10 +10,11 @@ API制限の管理と回避戦略
 
 import asyncio
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, Optional
 
 from ...utils.logging_config import get_infrastructure_logger
 from ...utils.optimization_utils import calculate_backoff_delay
+from ...utils.rate_limit_utils import SlidingWindowRateLimiter, get_shared_rate_limiter
 
 logger = get_infrastructure_logger()
 
@@ -25,6 +26,9 @@ class RateLimitInfo:
     責任:
     - API制限の詳細情報を管理
     - 制限状態の追跡
+
+    呼び出し数は分・時・日のスライディングウィンドウカウンターで管理し、
+    同じAPI名・同じ制限の RateLimitInfo 間で共有する。
     """
 
     def __init__(
@@ -34,6 +38,7 @@ class RateLimitInfo:
         calls_per_day: int = 10000,
         backoff_multiplier: float = 2.0,
         max_retries: int = 5,
+        api_name: Optional[str] = None,
     ):
         """
         初期化
@@ -44,6 +49,7 @@ class RateLimitInfo:
             calls_per_day: 1日あたりの最大呼び出し数
             backoff_multiplier: バックオフ倍率
             max_retries: 最大リトライ回数
+            api_name: API名（指定時は同じAPIの呼び出し数を共有、Noneで単独）
         """
         self.calls_per_minute = calls_per_minute
         self.calls_per_hour = calls_per_hour
@@ -51,8 +57,17 @@ class RateLimitInfo:
         self.backoff_multiplier = backoff_multiplier
         self.max_retries = max_retries
 
-        # 呼び出し履歴
-        self.call_history: List[datetime] = []
+        # 呼び出し数カウンター
+        limits = [
+            (calls_per_minute, 60),
+            (calls_per_hour, 3600),
+            (calls_per_day, 86400),
+        ]
+        self.limiter: SlidingWindowRateLimiter = (
+            get_shared_rate_limiter(api_name, limits)
+            if api_name
+            else SlidingWindowRateLimiter(limits)
+        )
         self.retry_count = 0
         self.last_rate_limit_error: Optional[datetime] = None
         self.current_backoff_seconds = 0
@@ -64,14 +79,7 @@ class RateLimitInfo:
         Returns:
             None
         """
-        now = datetime.utcnow()
-        self.call_history.append(now)
-
-        # 古い履歴を削除（24時間前より古いもの）
-        cutoff_time = now - timedelta(hours=24)
-        self.call_history = [
-            call_time for call_time in self.call_history if call_time > cutoff_time
-        ]
+        self.limiter.record()
 
     def get_calls_in_period(self, period_minutes: int) -> int:
         """
@@ -83,10 +91,7 @@ class RateLimitInfo:
         Returns:
             int: 呼び出し数
         """
-        cutoff_time = datetime.utcnow() - timedelta(minutes=period_minutes)
-        return len(
-            [call_time for call_time in self.call_history if call_time > cutoff_time]
-        )
+        return self.limiter.count(period_minutes * 60)
 
     def is_rate_limited(self) -> bool:
         """
@@ -95,32 +100,29 @@ class RateLimitInfo:
         Returns:
             bool: レート制限されている場合True
         """
-        now = datetime.utcnow()
-
-        # 1分間の制限チェック
-        calls_last_minute = self.get_calls_in_period(1)
-        if calls_last_minute >= self.calls_per_minute:
-            return True
-
-        # 1時間の制限チェック
-        calls_last_hour = self.get_calls_in_period(60)
-        if calls_last_hour >= self.calls_per_hour:
-            return True
+        return self._backoff_remaining_seconds() > 0 or self.limiter.wait_time() > 0
 
-        # 1日の制限チェック
-        calls_last_day = self.get_calls_in_period(24 * 60)
-        if calls_last_day >= self.calls_per_day:
-            return True
+    def _backoff_remaining_seconds(self) -> float:
+        """バックオフ期間の残り時間（秒）"""
+        if not self.last_rate_limit_error or self.current_backoff_seconds <= 0:
+            return 0.0
+        backoff_until = self.last_rate_limit_error + timedelta(
+            seconds=self.current_backoff_seconds
+        )
+        return max(0.0, (backoff_until - datetime.utcnow()).total_seconds())
 
-        # バックオフ期間チェック
-        if self.last_rate_limit_error and self.current_backoff_seconds > 0:
-            backoff_until = self.last_rate_limit_error + timedelta(
-                seconds=self.current_backoff_seconds
-            )
-            if now < backoff_until:
-                return True
+    async def acquire(self) -> None:
+        """
+        呼び出し枠を確保して記録（バックオフ中・制限中は解除まで待機）
 
-        return False
+        Returns:
+            None
+        """
+        backoff = self._backoff_remaining_seconds()
+        if backoff > 0:
+            logger.info(f"Backing off for {backoff:.2f}s")
+            await asyncio.sleep(backoff)
+        await self.limiter.acquire()
 
     def record_rate_limit_error(self) -> None:
         """
@@ -162,38 +164,11 @@ class RateLimitInfo:
         Returns:
             float: 待機時間（秒）
         """
-        if not self.is_rate_limited():
-            return 0.0
-
-        # バックオフ期間の残り時間
-        if self.last_rate_limit_error and self.current_backoff_seconds > 0:
-            backoff_until = self.last_rate_limit_error + timedelta(
-                seconds=self.current_backoff_seconds
-            )
-            remaining = (backoff_until - datetime.utcnow()).total_seconds()
-            if remaining > 0:
-                return remaining
-
-        # 制限の解除を待つ時間
-        now = datetime.utcnow()
-
-        # 1分間の制限
-        calls_last_minute = self.get_calls_in_period(1)
-        if calls_last_minute >= self.calls_per_minute:
-            # 最も古い呼び出しから1分後まで待機
-            oldest_call = min(self.call_history)
-            wait_until = oldest_call + timedelta(minutes=1)
-            return max(0, (wait_until - now).total_seconds())
-
-        # 1時間の制限
-        calls_last_hour = self.get_calls_in_period(60)
-        if calls_last_hour >= self.calls_per_hour:
-            # 最も古い呼び出しから1時間後まで待機
-            oldest_call = min(self.call_history)
-            wait_until = oldest_call + timedelta(hours=1)
-            return max(0, (wait_until - now).total_seconds())
-
-        return 0.0
+        # バックオフ期間の残り時間を優先し、なければ次の呼び出し枠までの時間
+        backoff = self._backoff_remaining_seconds()
+        if backoff > 0:
+            return backoff
+        return self.limiter.wait_time()
 
     def get_statistics(self) -> Dict[str, any]:
         """
@@ -283,7 +258,7 @@ class ApiRateLimiter:
         if max_retries is not None:
             config["max_retries"] = max_retries
 
-        self.rate_limits[api_name] = RateLimitInfo(**config)
+        self.rate_limits[api_name] = RateLimitInfo(**config, api_name=api_name)
 
         logger.info(
             f"Registered API: {api_name}, "
@@ -397,17 +372,8 @@ class ApiRateLimiter:
 
         while retry_count <= max_retry_attempts:
             try:
-                # レート制限チェック
-                if rate_limit_info.is_rate_limited():
-                    wait_time = rate_limit_info.get_wait_time_seconds()
-                    if wait_time > 0:
-                        logger.info(
-                            f"Rate limited for {api_name}, " f"waiting {wait_time:.2f}s"
-                        )
-                        await asyncio.sleep(wait_time)
-
-                # 呼び出しを記録
-                rate_limit_info.add_call()
+                # 呼び出し枠を確保（制限中は次の枠まで待機）して記録
+                await rate_limit_info.acquire()
 
                 # 関数を実行
                 result = await func(*args, **kwargs)
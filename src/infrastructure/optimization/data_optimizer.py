@@ -10,7 +10,7 @@ Data Optimizer System
 
 import asyncio
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
 import pandas as pd
 
@@ -33,6 +33,7 @@ class DataOptimizer:
     - キャッシュ統合
     - 効率的な履歴データ取得
     - API制限対応
+    - 同一データの同時取得の集約と期限切れデータの即時提供
     """
 
     def __init__(
@@ -44,6 +45,7 @@ class DataOptimizer:
         default_cache_ttl_minutes: int = 60,
         max_historical_days: int = 30,
         enable_smart_caching: bool = True,
+        stale_while_revalidate_minutes: int = 5,
     ):
         """
         初期化
@@ -56,6 +58,8 @@ class DataOptimizer:
             default_cache_ttl_minutes: デフォルトキャッシュTTL（分）
             max_historical_days: 最大履歴日数
             enable_smart_caching: スマートキャッシュを有効にするか
+            stale_while_revalidate_minutes: TTL経過後もキャッシュを返しつつ
+                バックグラウンドで再取得する期間（分、0で無効）
         """
         self.cache_manager = cache_manager
         self.api_rate_limiter = api_rate_limiter
@@ -64,6 +68,7 @@ class DataOptimizer:
         self.default_cache_ttl_minutes = default_cache_ttl_minutes
         self.max_historical_days = max_historical_days
         self.enable_smart_caching = enable_smart_caching
+        self.stale_while_revalidate_minutes = stale_while_revalidate_minutes
 
         # 統計情報
         self.cache_hits = 0
@@ -105,6 +110,51 @@ class DataOptimizer:
         }
         return f"data_{hash(str(sorted(components.items())))}"
 
+    async def _get_with_cache(
+        self,
+        cache_key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        cache_ttl_minutes: Optional[int] = None,
+    ) -> Any:
+        """
+        キャッシュ経由でデータを取得
+
+        同じキーの同時キャッシュミスは CacheManager.get_or_load で1回の取得に
+        集約される。
+
+        Args:
+            cache_key: キャッシュキー
+            fetch: APIから取得する関数（引数なしのコルーチン関数）
+            cache_ttl_minutes: キャッシュTTL（分）
+
+        Returns:
+            Any: キャッシュされたデータまたは取得したデータ
+        """
+        fetched = False
+
+        async def _load():
+            nonlocal fetched
+            fetched = True
+            self.api_calls += 1
+            return await fetch()
+
+        ttl_minutes = cache_ttl_minutes or self.default_cache_ttl_minutes
+        data = await self.cache_manager.get_or_load(
+            "data",
+            {"cache_key": cache_key},
+            _load,
+            ttl_seconds=ttl_minutes * 60,
+            stale_ttl_seconds=self.stale_while_revalidate_minutes * 60,
+        )
+
+        # 自身の読み込みで取得した場合のみミス（集約・期限切れ提供はヒット）
+        if fetched:
+            self.cache_misses += 1
+        elif data is not None:
+            self.cache_hits += 1
+            logger.debug(f"Cache hit: {cache_key}")
+        return data
+
     async def get_exchange_rate_data(
         self,
         currency_pair: str,
@@ -125,42 +175,22 @@ class DataOptimizer:
         start_time, _ = measure_performance()
 
         try:
-            # キャッシュから取得を試行
+
+            async def _fetch():
+                return await self.api_rate_limiter.execute_with_retry(
+                    "yahoo_finance",
+                    self.yahoo_finance_client.get_exchange_rate,
+                    currency_pair,
+                )
+
             if use_cache:
                 cache_key = self._generate_cache_key("exchange_rate", currency_pair)
-                cached_data = await self.cache_manager.get(
-                    "data", {"cache_key": cache_key}
-                )
-                if cached_data:
-                    self.cache_hits += 1
-                    logger.debug(f"Cache hit for exchange rate: {currency_pair}")
-                    return cached_data
+                return await self._get_with_cache(cache_key, _fetch, cache_ttl_minutes)
 
             # APIから取得
             self.cache_misses += 1
             self.api_calls += 1
-
-            data = await self.api_rate_limiter.execute_with_retry(
-                "yahoo_finance",
-                self.yahoo_finance_client.get_exchange_rate,
-                currency_pair,
-            )
-
-            # キャッシュに保存
-            if use_cache and data:
-                ttl_seconds = (
-                    cache_ttl_minutes * 60
-                    if cache_ttl_minutes
-                    else self.default_cache_ttl_minutes * 60
-                )
-                await self.cache_manager.set(
-                    "data",
-                    {"cache_key": cache_key},
-                    data,
-                    ttl_seconds=ttl_seconds,
-                )
-
-            return data
+            return await _fetch()
 
         except Exception as e:
             logger.error(
@@ -197,47 +227,24 @@ class DataOptimizer:
             # 日数制限を適用
             days = min(days, self.max_historical_days)
 
-            # キャッシュから取得を試行
+            async def _fetch():
+                return await self.api_rate_limiter.execute_with_retry(
+                    "yahoo_finance",
+                    self.yahoo_finance_client.get_historical_data,
+                    currency_pair,
+                    days,
+                )
+
             if use_cache:
                 cache_key = self._generate_cache_key(
                     "historical", currency_pair, days=days
                 )
-                cached_data = await self.cache_manager.get(
-                    "data", {"cache_key": cache_key}
-                )
-                if cached_data:
-                    self.cache_hits += 1
-                    logger.debug(
-                        f"Cache hit for historical data: {currency_pair} ({days} days)"
-                    )
-                    return cached_data
+                return await self._get_with_cache(cache_key, _fetch, cache_ttl_minutes)
 
             # APIから取得
             self.cache_misses += 1
             self.api_calls += 1
-
-            data = await self.api_rate_limiter.execute_with_retry(
-                "yahoo_finance",
-                self.yahoo_finance_client.get_historical_data,
-                currency_pair,
-                days,
-            )
-
-            # キャッシュに保存
-            if use_cache and data:
-                ttl_seconds = (
-                    cache_ttl_minutes * 60
-                    if cache_ttl_minutes
-                    else self.default_cache_ttl_minutes * 60
-                )
-                await self.cache_manager.set(
-                    "data",
-                    {"cache_key": cache_key},
-                    data,
-                    ttl_seconds=ttl_seconds,
-                )
-
-            return data
+            return await _fetch()
 
         except Exception as e:
             logger.error(f"Failed to get historical data for {currency_pair}: {str(e)}")
@@ -247,6 +254,59 @@ class DataOptimizer:
             execution_time = time.time() - start_time
             self.total_optimization_time += execution_time
 
+    @staticmethod
+    def _dataframe_to_cache(data: pd.DataFrame) -> Dict[str, Any]:
+        """
+        DataFrameをキャッシュ保存用の形式に変換
+
+        インデックス（DatetimeIndex）も列として保存し、JSONファイルキャッシュに
+        保存できるよう日時はISO形式の文字列にする。
+
+        Args:
+            data: 変換するDataFrame
+
+        Returns:
+            Dict[str, Any]: インデックス列名・タイムゾーン・レコード
+        """
+        frame = data.reset_index()
+        index_column = frame.columns[0]
+        index = data.index
+        tz = None
+        if isinstance(index, pd.DatetimeIndex):
+            tz = str(index.tz) if index.tz is not None else None
+            frame[index_column] = [value.isoformat() for value in index]
+        return {
+            "index_column": index_column,
+            "index_name": index.name,
+            "datetime_index": isinstance(index, pd.DatetimeIndex),
+            "tz": tz,
+            "records": frame.to_dict("records"),
+        }
+
+    @staticmethod
+    def _dataframe_from_cache(cached: Any) -> pd.DataFrame:
+        """
+        キャッシュ保存用の形式からDataFrameを復元
+
+        Args:
+            cached: _dataframe_to_cache の戻り値（旧形式のレコードのリストも可）
+
+        Returns:
+            pd.DataFrame: インデックスを復元したDataFrame
+        """
+        if isinstance(cached, list):
+            return pd.DataFrame(cached)
+
+        frame = pd.DataFrame(cached["records"])
+        index_column = cached["index_column"]
+        if cached.get("datetime_index"):
+            tz = cached.get("tz")
+            values = pd.to_datetime(frame[index_column], utc=tz is not None)
+            frame[index_column] = values.dt.tz_convert(tz) if tz else values
+        frame = frame.set_index(index_column)
+        frame.index.name = cached.get("index_name")
+        return frame
+
     async def get_historical_dataframe(
         self,
         currency_pair: str,
@@ -271,50 +331,41 @@ class DataOptimizer:
         start_time = time.time()
 
         try:
-            # キャッシュから取得を試行
-            if use_cache:
-                cache_key = self._generate_cache_key(
-                    "historical_dataframe",
+
+            async def _fetch():
+                return await self.api_rate_limiter.execute_with_retry(
+                    "yahoo_finance",
+                    self.yahoo_finance_client.get_historical_data,
                     currency_pair,
-                    timeframe=f"{period}_{interval}",
+                    period,
+                    interval,
                 )
-                cached_data = await self.cache_manager.get(
-                    "data", {"cache_key": cache_key}
-                )
-                if cached_data:
-                    self.cache_hits += 1
-                    logger.debug(
-                        f"Cache hit for historical dataframe: {currency_pair} ({period}, {interval})"
-                    )
-                    return pd.DataFrame(cached_data)
 
-            # APIから取得
-            self.cache_misses += 1
-            self.api_calls += 1
-
-            data = await self.api_rate_limiter.execute_with_retry(
-                "yahoo_finance",
-                self.yahoo_finance_client.get_historical_data,
+            if not use_cache:
+                # APIから取得
+                self.cache_misses += 1
+                self.api_calls += 1
+                return await _fetch()
+
+            async def _fetch_records():
+                # キャッシュにはレコード形式で保存し、待機中の呼び出し元と共有する
+                # 空のDataFrameはキャッシュされず、そのまま呼び出し元に返る
+                data = await _fetch()
+                if data is None or data.empty:
+                    return data
+                return self._dataframe_to_cache(data)
+
+            cache_key = self._generate_cache_key(
+                "historical_dataframe",
                 currency_pair,
-                period,
-                interval,
+                timeframe=f"{period}_{interval}",
             )
-
-            # キャッシュに保存
-            if use_cache and data is not None and not data.empty:
-                ttl_seconds = (
-                    cache_ttl_minutes * 60
-                    if cache_ttl_minutes
-                    else self.default_cache_ttl_minutes * 60
-                )
-                await self.cache_manager.set(
-                    "data",
-                    {"cache_key": cache_key},
-                    data.to_dict("records"),
-                    ttl_seconds=ttl_seconds,
-                )
-
-            return data
+            cached = await self._get_with_cache(
+                cache_key, _fetch_records, cache_ttl_minutes
+            )
+            if cached is None or isinstance(cached, pd.DataFrame):
+                return cached
+            return self._dataframe_from_cache(cached)
 
         except Exception as e:
             logger.error(
@@ -562,6 +613,8 @@ class DataOptimizer:
             (self.cache_hits / total_requests * 100) if total_requests > 0 else 0
         )
 
+        single_flight_stats = self.cache_manager.single_flight.get_statistics()
+
         return {
             "cache_hits": self.cache_hits,
             "cache_misses": self.cache_misses,
@@ -576,6 +629,9 @@ class DataOptimizer:
             "default_cache_ttl_minutes": self.default_cache_ttl_minutes,
             "max_historical_days": self.max_historical_days,
             "smart_caching_enabled": self.enable_smart_caching,
+            "stale_while_revalidate_minutes": self.stale_while_revalidate_minutes,
+            "coalesced_requests": single_flight_stats["coalesced_requests"],
+            "in_flight_requests": single_flight_stats["in_flight"],
         }
 
     async def clear_optimization_cache(
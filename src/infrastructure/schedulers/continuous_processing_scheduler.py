@@ -24,7 +24,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from scripts.cron.advanced_technical.enhanced_unified_technical_calculator import (
     EnhancedUnifiedTechnicalCalculator,
 )
+from src.infrastructure.database.models.price_data_model import PriceDataModel
 from src.infrastructure.database.services.data_fetcher_service import DataFetcherService
+from src.infrastructure.database.services.technical_indicator_service import (
+    TechnicalIndicatorService,
+)
 from src.infrastructure.database.services.timeframe_aggregator_service import (
     TimeframeAggregatorService,
 )
@@ -49,6 +53,7 @@ class ContinuousProcessingScheduler:
         # 依存サービス初期化（必要最小限）
         self.data_fetcher = DataFetcherService(session)
         self.timeframe_aggregator = TimeframeAggregatorService(session)
+        self.indicator_service = TechnicalIndicatorService(session)
         self.enhanced_calculator = None  # 必要時に初期化
 
         # 設定
@@ -71,7 +76,9 @@ class ContinuousProcessingScheduler:
                 logger.info(f"✅ データ集計完了: {aggregation_result}")
 
                 # 3. テクニカル指標計算
-                technical_result = await self._process_technical_indicators()
+                technical_result = await self._process_technical_indicators(
+                    result["price_data"]
+                )
                 logger.info(f"✅ テクニカル指標計算完了: {technical_result}")
 
                 # 4. 結果の統合
@@ -157,10 +164,15 @@ class ContinuousProcessingScheduler:
             logger.error(f"❌ タイムフレーム集計でエラー: {str(e)}")
             raise
 
-    async def _process_technical_indicators(self) -> Dict[str, Any]:
+    async def _process_technical_indicators(
+        self, price_data: PriceDataModel
+    ) -> Dict[str, Any]:
         """
         マルチタイムフレームでのテクニカル指標計算
 
+        Args:
+            price_data: 今回取得した5分足データ
+
         Returns:
             Dict[str, Any]: テクニカル指標計算結果
         """
@@ -175,10 +187,25 @@ class ContinuousProcessingScheduler:
             technical_results = {}
             for timeframe in self.timeframes:
                 try:
-                    # データ取得とテクニカル指標計算
-                    result = await self._calculate_technical_indicators_for_timeframe(
-                        timeframe
-                    )
+                    if timeframe == "M5":
+                        # 5分足は新しい足1本分だけインクリメンタルに更新
+                        service = self.indicator_service
+                        indicators = await service.update_indicators_incrementally(
+                            price_data, "5m"
+                        )
+                        result = {
+                            "timeframe": timeframe,
+                            "currency_pair": self.currency_pair,
+                            "calculated_at": datetime.now().isoformat(),
+                            "indicators": indicators,
+                        }
+                    else:
+                        # データ取得とテクニカル指標計算
+                        result = (
+                            await self._calculate_technical_indicators_for_timeframe(
+                                timeframe
+                            )
+                        )
                     technical_results[timeframe] = result
                     logger.info(f"✅ {timeframe}テクニカル指標計算完了")
                 except Exception as e:
@@ -11,16 +11,27 @@ USD/JPY特化の5分おきデータ取得システム用の統合スケジュー
 - パターン検出の実行
 - Discord通知の送信
 - エラーハンドリングとリトライ
+
+常駐デーモンとして起動し、DBエンジン・HTTPセッション・指標状態・
+直近の足キャッシュを保持したまま、5分境界に揃えて
+取得 → 集計 → 指標 → パターン → 通知 を1本のパイプラインで実行する。
 """
 
 import asyncio
 import logging
+import os
 import signal
 import sys
+import time
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
+from src.infrastructure.cache.bar_store import get_bar_store
 from src.infrastructure.database.connection import get_async_session
+from src.infrastructure.database.repositories.price_data_repository_impl import (
+    PriceDataRepositoryImpl,
+)
 from src.infrastructure.database.services.efficient_pattern_detection_service import (
     EfficientPatternDetectionService,
 )
@@ -30,7 +41,20 @@ from src.infrastructure.database.services.multi_timeframe_data_fetcher_service i
 from src.infrastructure.database.services.multi_timeframe_technical_indicator_service import (
     MultiTimeframeTechnicalIndicatorService,
 )
-from src.infrastructure.discord_webhook_sender import DiscordWebhookSender
+from src.infrastructure.database.services.technical_indicator_service import (
+    TechnicalIndicatorService,
+)
+from src.infrastructure.database.services.timeframe_aggregator_service import (
+    TimeframeAggregatorService,
+)
+from src.infrastructure.external_apis.yahoo_finance_client import YahooFinanceClient
+from src.infrastructure.messaging.delivery_queue import DiscordDeliveryQueue
+from src.infrastructure.monitoring.metrics import (
+    observe_cycle,
+    observe_stage,
+    start_metrics_server,
+)
+from src.infrastructure.monitoring.tracing import get_tracer
 from src.utils.logging_config import get_infrastructure_logger
 
 
@@ -47,23 +71,52 @@ class IntegratedScheduler:
 
     def __init__(self):
         self.logger = get_infrastructure_logger()
+        self.tracer = get_tracer()
+        self.currency_pair = "USD/JPY"
         self.session = None
         self.data_fetcher = None
+        self.price_repo = None
+        self.yahoo_client = None
+        self.bar_store = None
         self.technical_indicator_service = None
         self.pattern_detection_service = None
-        self.discord_sender = None
+        self.discord_queue = None
+        self.aggregator = None
+        self.incremental_indicator_service = None
 
         # スケジューラー状態
         self.is_running = False
         self.tasks = []
 
         # 設定
-        self.data_fetch_interval = 300  # 5分（秒）
         self.d1_fetch_interval = 86400  # 24時間（秒）
-        self.pattern_detection_interval = 300  # 5分（秒）
         self.retry_attempts = 3
         self.retry_delay = 60  # 1分（秒）
 
+        # パイプライン設定
+        self.pipeline_interval = 300  # 5分境界（秒）
+        self.pipeline_offset = 10  # 足確定後の取得待ち（秒）
+        self.pipeline_stages = [
+            "fetch",
+            "aggregate",
+            "indicators",
+            "patterns",
+            "notify",
+        ]
+        self.active_weekdays = range(0, 5)  # 平日（月〜金）のみ実行
+        self.metrics_port = int(os.getenv("SCHEDULER_METRICS_PORT", "9108"))  # 0で無効
+
+        # ステージ別レイテンシ
+        self.stage_metrics: Dict[str, Dict[str, float]] = {
+            stage: self._new_stage_metrics() for stage in self.pipeline_stages
+        }
+        self.cycle_metrics: Dict[str, Any] = {
+            "cycles": 0,
+            "last_started_at": None,
+            "last_duration_ms": 0.0,
+            "last_tick_lag_ms": 0.0,
+        }
+
     async def setup(self):
         """
         スケジューラーの初期化
@@ -76,18 +129,33 @@ class IntegratedScheduler:
 
             # 各サービスを初期化
             self.data_fetcher = MultiTimeframeDataFetcherService(self.session)
+            self.price_repo = PriceDataRepositoryImpl(self.session)
+            self.yahoo_client = YahooFinanceClient()
             self.technical_indicator_service = MultiTimeframeTechnicalIndicatorService(
                 self.session
             )
             self.pattern_detection_service = EfficientPatternDetectionService(
                 self.session
             )
+            self.aggregator = TimeframeAggregatorService(self.session)
+            self.incremental_indicator_service = TechnicalIndicatorService(self.session)
 
-            # Discord送信者を初期化
-            import os
-
+            # Discord送信キューを初期化（未送信の通知は再起動後に再送）
             webhook_url = os.getenv("DISCORD_ECONOMICINDICATORS_WEBHOOK_URL", "")
-            self.discord_sender = DiscordWebhookSender(webhook_url)
+            self.discord_queue = DiscordDeliveryQueue(
+                webhook_url,
+                spool_path=os.getenv(
+                    "DISCORD_DELIVERY_SPOOL", "/app/data/discord_delivery_queue.jsonl"
+                ),
+            )
+            await self.discord_queue.start()
+
+            # 直近の足キャッシュ（プロセス共有のバーストア）を温める
+            # 以降は保存した確定足を直接反映し、パターン検出はDBを読み直さない
+            self.bar_store = get_bar_store()
+            await self.bar_store.sync(
+                self.session, self.currency_pair, "5m", force=True
+            )
 
             self.logger.info("統合スケジューラーの初期化が完了しました")
 
@@ -95,34 +163,6 @@ class IntegratedScheduler:
             self.logger.error(f"統合スケジューラーの初期化に失敗しました: {e}")
             raise
 
-    async def start_data_collection(self):
-        """
-        データ取得サービスを開始
-        """
-        self.logger.info("データ取得サービスを開始します")
-
-        # 5分足データ取得タスク
-        task_5m = asyncio.create_task(self._schedule_5m_data_fetch())
-        self.tasks.append(task_5m)
-
-        # 日足データ取得タスク
-        task_d1 = asyncio.create_task(self._schedule_d1_data_fetch())
-        self.tasks.append(task_d1)
-
-        self.logger.info("データ取得サービスが開始されました")
-
-    async def start_pattern_detection(self):
-        """
-        パターン検出サービスを開始
-        """
-        self.logger.info("パターン検出サービスを開始します")
-
-        # パターン検出タスク
-        task_pattern = asyncio.create_task(self._schedule_pattern_detection())
-        self.tasks.append(task_pattern)
-
-        self.logger.info("パターン検出サービスが開始されました")
-
     async def start_notification_service(self):
         """
         通知サービスを開始
@@ -135,29 +175,6 @@ class IntegratedScheduler:
 
         self.logger.info("通知サービスが開始されました")
 
-    async def _schedule_5m_data_fetch(self):
-        """
-        5分足データ取得のスケジューリング
-        """
-        self.logger.info("5分足データ取得スケジューラーを開始します")
-
-        while self.is_running:
-            try:
-                self.logger.info("5分足データを取得中...")
-
-                # 5分足データを取得
-                await self._fetch_5m_data_with_retry()
-
-                # 次の実行まで待機
-                await asyncio.sleep(self.data_fetch_interval)
-
-            except asyncio.CancelledError:
-                self.logger.info("5分足データ取得スケジューラーが停止されました")
-                break
-            except Exception as e:
-                self.logger.error(f"5分足データ取得でエラーが発生しました: {e}")
-                await asyncio.sleep(self.retry_delay)
-
     async def _schedule_d1_data_fetch(self):
         """
         日足データ取得のスケジューリング
@@ -181,28 +198,215 @@ class IntegratedScheduler:
                 self.logger.error(f"日足データ取得でエラーが発生しました: {e}")
                 await asyncio.sleep(self.retry_delay)
 
-    async def _schedule_pattern_detection(self):
+    async def start_pipeline(self):
+        """
+        5分足パイプライン（取得→集計→指標→パターン→通知）を開始
+        """
+        self.logger.info("5分足パイプラインを開始します")
+
+        task_pipeline = asyncio.create_task(self._schedule_5m_pipeline())
+        self.tasks.append(task_pipeline)
+
+        task_d1 = asyncio.create_task(self._schedule_d1_data_fetch())
+        self.tasks.append(task_d1)
+
+        self.logger.info("5分足パイプラインが開始されました")
+
+    def _seconds_until_next_tick(self, now: Optional[float] = None) -> float:
         """
-        パターン検出のスケジューリング
+        次の5分境界（+オフセット）までの秒数を計算
+
+        sleep(interval) の累積ずれを避けるため、毎回壁時計から求める。
+
+        Args:
+            now: 現在のUNIX時刻（デフォルト: time.time()）
+
+        Returns:
+            float: 待機秒数
         """
-        self.logger.info("パターン検出スケジューラーを開始します")
+        now = time.time() if now is None else now
+        elapsed = (now - self.pipeline_offset) % self.pipeline_interval
+        return self.pipeline_interval - elapsed
+
+    async def _schedule_5m_pipeline(self):
+        """
+        5分足パイプラインのスケジューリング（壁時計の5分境界に整列）
+        """
+        self.logger.info("5分足パイプラインスケジューラーを開始します")
 
         while self.is_running:
             try:
-                self.logger.info("パターン検出を実行中...")
+                wait_seconds = self._seconds_until_next_tick()
+                scheduled_at = time.time() + wait_seconds
+                await asyncio.sleep(wait_seconds)
 
-                # パターン検出を実行
-                await self._detect_patterns_with_retry()
+                if datetime.now().weekday() not in self.active_weekdays:
+                    continue
 
-                # 次の実行まで待機
-                await asyncio.sleep(self.pattern_detection_interval)
+                self.cycle_metrics["last_tick_lag_ms"] = (
+                    time.time() - scheduled_at
+                ) * 1000
+                await self._run_pipeline_cycle()
 
             except asyncio.CancelledError:
-                self.logger.info("パターン検出スケジューラーが停止されました")
+                self.logger.info("5分足パイプラインスケジューラーが停止されました")
                 break
             except Exception as e:
-                self.logger.error(f"パターン検出でエラーが発生しました: {e}")
-                await asyncio.sleep(self.retry_delay)
+                self.logger.error(f"5分足パイプラインでエラーが発生しました: {e}")
+                await self._rollback_session()
+
+    async def _run_pipeline_cycle(self) -> Dict[str, Any]:
+        """
+        パイプラインを1サイクル実行
+
+        トレースが有効な場合はサイクル全体を1トレースとして記録し、
+        終了後に monitor trace 用のファイルへ保存する。
+
+        Returns:
+            Dict[str, Any]: ステージ別の実行結果
+        """
+        with self.tracer.span("pipeline.cycle", kind="cycle") as cycle_span:
+            results = await self._run_pipeline_stages()
+        if cycle_span is not None:
+            self.tracer.save_trace(cycle_span.trace_id)
+        return results
+
+    async def _run_pipeline_stages(self) -> Dict[str, Any]:
+        """
+        パイプラインの各ステージを順に実行
+
+        取得に失敗した場合は以降のステージを実行しない。
+        それ以外のステージの失敗は記録して次のステージへ進む。
+
+        Returns:
+            Dict[str, Any]: ステージ別の実行結果
+        """
+        cycle_start = time.perf_counter()
+        self.cycle_metrics["last_started_at"] = datetime.now().isoformat()
+        results: Dict[str, Any] = {}
+
+        # 1. 取得
+        price_data = None
+        async with self._measure_stage("fetch"):
+            price_data = await self._fetch_5m_data_with_retry()
+        if price_data is None:
+            self.logger.warning("5分足データが取得できませんでした")
+            self._finish_cycle(cycle_start)
+            return results
+        results["fetch"] = price_data.timestamp
+
+        # 2. 集計
+        async with self._measure_stage("aggregate"):
+            results["aggregate"] = await self.aggregator.aggregate_all_timeframes()
+
+        # 3. 指標（5分足はインクリメンタル、上位足は足確定時のみ再計算）
+        async with self._measure_stage("indicators"):
+            incremental = self.incremental_indicator_service
+            results["indicators"] = (
+                await incremental.update_indicators_incrementally(price_data)
+            )
+            if price_data.timestamp.minute == 0:
+                indicator_service = self.technical_indicator_service
+                for timeframe in ("1h", "4h", "1d"):
+                    await indicator_service.calculate_timeframe_indicators(timeframe)
+
+        # 4. パターン
+        patterns: List[Any] = []
+        async with self._measure_stage("patterns"):
+            detected = await self.pattern_detection_service.detect_all_patterns()
+            if isinstance(detected, dict):
+                patterns = [p for found in detected.values() for p in found]
+            else:
+                patterns = list(detected or [])
+        results["patterns"] = len(patterns)
+
+        # 5. 通知
+        if patterns:
+            async with self._measure_stage("notify"):
+                await self._send_pattern_notifications(patterns)
+
+        self._finish_cycle(cycle_start)
+        self.logger.info(
+            f"5分足パイプライン完了: {self.cycle_metrics['last_duration_ms']:.0f}ms"
+        )
+        return results
+
+    def _finish_cycle(self, cycle_start: float):
+        """サイクル全体のメトリクスを更新"""
+        elapsed = time.perf_counter() - cycle_start
+        self.cycle_metrics["cycles"] += 1
+        self.cycle_metrics["last_duration_ms"] = elapsed * 1000
+        observe_cycle(
+            "integrated", elapsed, self.cycle_metrics["last_tick_lag_ms"] / 1000
+        )
+
+    @staticmethod
+    def _new_stage_metrics() -> Dict[str, float]:
+        """ステージメトリクスの初期値"""
+        return {
+            "count": 0,
+            "errors": 0,
+            "last_ms": 0.0,
+            "avg_ms": 0.0,
+            "max_ms": 0.0,
+            "total_ms": 0.0,
+        }
+
+    @asynccontextmanager
+    async def _measure_stage(self, stage: str):
+        """
+        ステージのレイテンシを計測
+
+        例外はログに記録して握りつぶし、後続ステージを継続させる。
+        全ステージが同じセッションを使うため、失敗したステージの
+        トランザクションはロールバックしてから後続ステージへ進む。
+
+        Args:
+            stage: ステージ名
+        """
+        metrics = self.stage_metrics.setdefault(stage, self._new_stage_metrics())
+        start = time.perf_counter()
+        failed = False
+        try:
+            with self.tracer.span(f"pipeline.{stage}", kind="stage"):
+                yield
+        except Exception as e:
+            failed = True
+            metrics["errors"] += 1
+            self.logger.error(f"パイプラインステージ {stage} でエラーが発生しました: {e}")
+            await self._rollback_session()
+        finally:
+            elapsed = time.perf_counter() - start
+            observe_stage(stage, elapsed, error=failed)
+            elapsed_ms = elapsed * 1000
+            metrics["count"] += 1
+            metrics["last_ms"] = elapsed_ms
+            metrics["total_ms"] += elapsed_ms
+            metrics["avg_ms"] = metrics["total_ms"] / metrics["count"]
+            metrics["max_ms"] = max(metrics["max_ms"], elapsed_ms)
+
+    async def _rollback_session(self):
+        """失敗したトランザクションを破棄（後続の処理を正常なセッションで実行）"""
+        if self.session is None:
+            return
+        try:
+            await self.session.rollback()
+        except Exception as e:
+            self.logger.error(f"セッションのロールバックに失敗しました: {e}")
+
+    def get_pipeline_metrics(self) -> Dict[str, Any]:
+        """
+        パイプラインのメトリクスを取得
+
+        Returns:
+            Dict[str, Any]: ステージ別レイテンシ、サイクル情報、足キャッシュ
+        """
+        return {
+            "stages": {stage: dict(m) for stage, m in self.stage_metrics.items()},
+            "cycle": dict(self.cycle_metrics),
+            "next_tick_in_seconds": self._seconds_until_next_tick(),
+            "bar_cache": self.bar_store.get_statistics() if self.bar_store else {},
+        }
 
     async def _monitor_notifications(self):
         """
@@ -224,109 +428,112 @@ class IntegratedScheduler:
 
     async def _fetch_5m_data_with_retry(self):
         """
-        5分足データ取得（リトライ機能付き）
+        確定済み5分足の取得・保存（リトライ機能付き）
+
+        取得に失敗した場合（例外・データなし）は retry_delay 秒待って
+        retry_attempts 回まで再試行する。
+
+        Returns:
+            PriceDataModel: 最新の確定済み5分足
         """
         for attempt in range(self.retry_attempts):
             try:
-                # 5分足データを取得
-                await self.data_fetcher.fetch_timeframe_data("5m")
+                price_data = await self._fetch_closed_5m_bars()
+                if price_data is not None:
+                    return price_data
+                error = "確定済みの5分足を取得できませんでした"
+            except Exception as e:
+                error = str(e)
 
-                # テクニカル指標を計算
-                await self.technical_indicator_service.calculate_all_timeframe_indicators()
+            self.logger.warning(
+                f"5分足データ取得試行 {attempt + 1}/{self.retry_attempts} "
+                f"が失敗しました: {error}"
+            )
+            if attempt < self.retry_attempts - 1:
+                await asyncio.sleep(self.retry_delay)
 
-                self.logger.info("5分足データ取得と指標計算が完了しました")
-                return
+        self.logger.error("5分足データ取得が最大試行回数に達しました")
+        raise RuntimeError(f"5分足データ取得に失敗しました: {error}")
 
-            except Exception as e:
-                self.logger.warning(
-                    f"5分足データ取得試行 {attempt + 1}/{self.retry_attempts} が失敗しました: {e}"
-                )
+    async def _fetch_closed_5m_bars(self):
+        """
+        Yahoo Finance から確定済みの5分足を取得して保存
 
-                if attempt < self.retry_attempts - 1:
-                    await asyncio.sleep(self.retry_delay)
-                else:
-                    self.logger.error("5分足データ取得が最大試行回数に達しました")
-                    raise
+        SimpleDataFetcher と同じく ingest_batch で既存キーとの差分のみ保存し、
+        形成中の足は保存しない。保存した足は足キャッシュにも差分同期する。
 
-    async def _fetch_d1_data_with_retry(self):
+        Returns:
+            Optional[PriceDataModel]: 最新の確定済み5分足（取得できない場合はNone）
         """
-        日足データ取得（リトライ機能付き）
-        """
-        for attempt in range(self.retry_attempts):
-            try:
-                # 日足データを取得
-                await self.data_fetcher.fetch_timeframe_data("1d")
+        data = await self.yahoo_client.get_historical_data(
+            self.currency_pair, "1d", "5m"
+        )
+        if data is None or data.empty:
+            return None
+
+        frame = PriceDataRepositoryImpl.ohlcv_to_ingest_frame(
+            data,
+            self.currency_pair,
+            "yahoo_finance_5m_continuous",
+            bar_duration=timedelta(minutes=5),
+        )
+        if frame.empty:
+            return None
 
-                self.logger.info("日足データ取得が完了しました")
-                return
+        counts = await self.price_repo.ingest_batch(frame)
+        if counts["failed"]:
+            self.logger.error(f"5分足の保存に失敗しました: {counts['failed']}件")
 
-            except Exception as e:
-                self.logger.warning(
-                    f"日足データ取得試行 {attempt + 1}/{self.retry_attempts} が失敗しました: {e}"
-                )
+        # 保存した足を足キャッシュへ差分同期（保持済みの最新足以降のみ読み込む）
+        await self.bar_store.sync(self.session, self.currency_pair, "5m", force=True)
 
-                if attempt < self.retry_attempts - 1:
-                    await asyncio.sleep(self.retry_delay)
-                else:
-                    self.logger.error("日足データ取得が最大試行回数に達しました")
-                    raise
+        # 指標状態の更新には保存済みの行を使う（リプレイ時と同じ値・時刻表記）
+        return await self.price_repo.find_by_timestamp_and_timeframe(
+            frame["timestamp"].iloc[-1].to_pydatetime(), self.currency_pair, "5m"
+        )
 
-    async def _detect_patterns_with_retry(self):
+    async def _fetch_d1_data_with_retry(self):
         """
-        パターン検出（リトライ機能付き）
+        日足データ取得（リトライ機能付き）
         """
         for attempt in range(self.retry_attempts):
             try:
-                # パターン検出を実行
-                detected_patterns = (
-                    await self.pattern_detection_service.detect_all_patterns()
-                )
-
-                if detected_patterns:
-                    self.logger.info(f"{len(detected_patterns)}個のパターンが検出されました")
-
-                    # Discord通知を送信
-                    await self._send_pattern_notifications(detected_patterns)
-                else:
-                    self.logger.info("検出されたパターンはありません")
+                # 日足データを取得（取得サービスは失敗時に例外ではなくNoneを返す）
+                if await self.data_fetcher.fetch_timeframe_data("1d") is None:
+                    raise RuntimeError("日足データを取得できませんでした")
 
+                self.logger.info("日足データ取得が完了しました")
                 return
 
             except Exception as e:
                 self.logger.warning(
-                    f"パターン検出試行 {attempt + 1}/{self.retry_attempts} が失敗しました: {e}"
+                    f"日足データ取得試行 {attempt + 1}/{self.retry_attempts} が失敗しました: {e}"
                 )
 
                 if attempt < self.retry_attempts - 1:
                     await asyncio.sleep(self.retry_delay)
                 else:
-                    self.logger.error("パターン検出が最大試行回数に達しました")
+                    self.logger.error("日足データ取得が最大試行回数に達しました")
                     raise
 
     async def _send_pattern_notifications(self, patterns):
         """
         パターン検出結果をDiscordに通知
         """
-        if not self.discord_sender.webhook_url:
+        if not self.discord_queue.webhook_url:
             self.logger.warning("Discord Webhook URLが設定されていません")
             return
 
         try:
-            async with self.discord_sender:
-                for pattern in patterns:
-                    # パターン情報をDiscord Embed形式で作成
-                    embed = self._create_pattern_embed(pattern)
-
-                    # Discord通知を送信
-                    success = await self.discord_sender.send_embed(embed)
-
-                    if success:
-                        self.logger.info(f"パターン通知を送信しました: {pattern.pattern_name}")
-                    else:
-                        self.logger.error(f"パターン通知の送信に失敗しました: {pattern.pattern_name}")
+            # 送信キューが埋め込みをまとめ、レート制限に合わせて送信する
+            embeds = [self._create_pattern_embed(pattern) for pattern in patterns]
+            results = await self.discord_queue.deliver(embeds)
 
-                    # 通知間隔を空ける
-                    await asyncio.sleep(1)
+            for pattern, message_id in zip(patterns, results):
+                if message_id:
+                    self.logger.info(f"パターン通知を送信しました: {pattern.pattern_name}")
+                else:
+                    self.logger.error(f"パターン通知の送信に失敗しました: {pattern.pattern_name}")
 
         except Exception as e:
             self.logger.error(f"パターン通知送信中にエラーが発生しました: {e}")
@@ -435,9 +642,12 @@ class IntegratedScheduler:
             # 実行フラグを設定
             self.is_running = True
 
-            # 各サービスを開始
-            await self.start_data_collection()
-            await self.start_pattern_detection()
+            # メトリクスを公開（Prometheus からスクレイプ）
+            if self.metrics_port:
+                start_metrics_server(self.metrics_port)
+
+            # 各サービスを開始（5分足の取得〜通知は1本のパイプライン）
+            await self.start_pipeline()
             await self.start_notification_service()
 
             # シグナルハンドラーを設定
@@ -473,6 +683,14 @@ class IntegratedScheduler:
         if self.tasks:
             await asyncio.gather(*self.tasks, return_exceptions=True)
 
+        # Discord送信キューを停止（未送信の通知はスプールに残る）
+        if self.discord_queue:
+            await self.discord_queue.stop()
+
+        # 未送信のトレースを送信
+        if self.tracer.exporter:
+            self.tracer.exporter.shutdown()
+
         # セッションを閉じる
         if self.session:
             await self.session.close()
@@ -19,6 +19,7 @@ from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.responses import JSONResponse
 
 from ...container import Container
+from ...infrastructure.monitoring.metrics import render_latest
 from ...utils.logging_config import get_presentation_logger, setup_logging_directories
 from .middleware.auth import AuthMiddleware
 from .middleware.error_handler import ErrorHandlerMiddleware
@@ -205,6 +206,18 @@ def setup_routes(app: FastAPI) -> None:
             "timestamp": time.time(),
         }
 
+    # Prometheus メトリクスエンドポイント
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics() -> Response:
+        """
+        Prometheus メトリクスエンドポイント
+
+        Returns:
+            Response: Prometheus テキスト形式のメトリクス
+        """
+        content, content_type = render_latest()
+        return Response(content=content, media_type=content_type)
+
     # API情報エンドポイント
     @app.get("/api", response_class=JSONResponse)
     async def api_info() -> Dict[str, Any]:
@@ -223,6 +236,7 @@ def setup_routes(app: FastAPI) -> None:
                 "ai_reports": "/api/v1/ai-reports",
                 "alerts": "/api/v1/alerts",
                 "plugins": "/api/v1/plugins",
+                "metrics": "/metrics",
             },
             "features": [
                 "Exchange rate data fetching",
@@ -67,6 +67,7 @@ class AuthMiddleware(BaseHTTPMiddleware):
             "/api/v1/health",
             "/api/v1/health/",
             "/favicon.ico",
+            "/metrics",
         }
 
         # 管理者権限が必要なエンドポイント
@@ -99,34 +99,9 @@ def list(
                         )
                     # source == "all" の場合はフィルタリングなし
 
-                    # 時間足フィルタリング（データソースから判定）
-                    if timeframe == "5m":
-                        query = query.where(
-                            (PriceDataModel.data_source.like("%5m%"))
-                            | (PriceDataModel.data_source.like("%M5%"))
-                            | (PriceDataModel.data_source == "yahoo_finance")
-                        )
-                    elif timeframe == "1h":
-                        query = query.where(
-                            (PriceDataModel.data_source.like("%1h%"))
-                            | (PriceDataModel.data_source.like("%H1%"))
-                            | (PriceDataModel.data_source.like("%1時間足%"))
-                            | (PriceDataModel.data_source == "yahoo_finance")
-                        )
-                    elif timeframe == "4h":
-                        query = query.where(
-                            (PriceDataModel.data_source.like("%4h%"))
-                            | (PriceDataModel.data_source.like("%H4%"))
-                            | (PriceDataModel.data_source.like("%4時間足%"))
-                            | (PriceDataModel.data_source == "yahoo_finance")
-                        )
-                    elif timeframe == "1d":
-                        query = query.where(
-                            (PriceDataModel.data_source.like("%1d%"))
-                            | (PriceDataModel.data_source.like("%D1%"))
-                            | (PriceDataModel.data_source.like("%日足%"))
-                            | (PriceDataModel.data_source == "yahoo_finance")
-                        )
+                    # 時間足フィルタリング
+                    if timeframe in ("5m", "1h", "4h", "1d"):
+                        query = query.where(PriceDataModel.timeframe == timeframe)
 
                     query = query.order_by(desc(PriceDataModel.timestamp)).limit(limit)
 
@@ -20,6 +20,11 @@ from rich.live import Live
 from rich.panel import Panel
 from rich.table import Table
 
+from ....infrastructure.monitoring.tracing import (
+    DEFAULT_EXPORT_PATH,
+    compute_self_times,
+    load_trace_file,
+)
 from ....utils.logging_config import get_presentation_logger
 
 logger = get_presentation_logger()
@@ -384,6 +389,99 @@ def _create_metrics_panel(metrics_data: dict) -> Panel:
     )
 
 
+@app.command()
+def trace(
+    file: Optional[str] = typer.Option(
+        None, "--file", "-f", help="トレースファイル（デフォルト: TRACING_EXPORT_PATH）"
+    ),
+    limit: int = typer.Option(15, "--limit", "-n", help="表示件数"),
+    kind: Optional[str] = typer.Option(
+        None, "--kind", "-k", help="スパン種別（stage, service, repository, sql）"
+    ),
+):
+    """
+    直近の5分足パイプラインサイクルで処理時間の長いスパンを表示
+
+    スケジューラーを TRACING_ENABLED=true で起動すると、各サイクルのトレースが
+    TRACING_EXPORT_PATH に保存される。
+
+    Examples:
+        exchange-analytics monitor trace
+        exchange-analytics monitor trace --kind sql --limit 20
+    """
+    import os
+
+    path = file or os.getenv("TRACING_EXPORT_PATH", DEFAULT_EXPORT_PATH)
+    try:
+        trace_data = load_trace_file(path)
+    except FileNotFoundError:
+        console.print(f"❌ トレースファイルが見つかりません: {path}")
+        console.print("💡 スケジューラーを TRACING_ENABLED=true で起動してください")
+        raise typer.Exit(1)
+    except Exception as e:
+        console.print(f"❌ トレース読み込みエラー: {e}")
+        raise typer.Exit(1)
+
+    _display_trace(trace_data, limit, kind)
+
+
+def _display_trace(trace_data: dict, limit: int, kind: Optional[str]):
+    """トレースの遅いスパンを表示"""
+    spans = trace_data.get("spans", [])
+    names = {span["span_id"]: span["name"] for span in spans}
+    self_times = compute_self_times(spans)
+
+    started_at = trace_data.get("start_time")
+    started_str = (
+        datetime.fromtimestamp(started_at).strftime("%Y-%m-%d %H:%M:%S")
+        if started_at
+        else "Unknown"
+    )
+    sql_spans = [span for span in spans if span["kind"] == "sql"]
+    console.print(
+        Panel.fit(
+            f"🧭 Trace: {trace_data.get('trace_id', '')}\n"
+            f"⏰ Started: {started_str}\n"
+            f"⏱️ Duration: {trace_data.get('duration_ms') or 0:.1f}ms\n"
+            f"📦 Spans: {len(spans)} (SQL: {len(sql_spans)}, "
+            f"{sum(span['duration_ms'] for span in sql_spans):.1f}ms)",
+            title=f"🔍 {trace_data.get('name') or 'trace'}",
+            border_style="blue",
+        )
+    )
+
+    if kind:
+        spans = [span for span in spans if span["kind"] == kind]
+    slowest = sorted(spans, key=lambda span: span["duration_ms"], reverse=True)
+
+    table = Table(title=f"🐢 Slowest Spans (top {limit})")
+    table.add_column("#", style="dim", justify="right")
+    table.add_column("Span", style="cyan")
+    table.add_column("Kind", style="magenta")
+    table.add_column("Total", style="bold green", justify="right")
+    table.add_column("Self", style="green", justify="right")
+    table.add_column("Rows", justify="right")
+    table.add_column("Parent", style="dim")
+    table.add_column("SQL", style="yellow")
+
+    for rank, span in enumerate(slowest[:limit], start=1):
+        attributes = span.get("attributes", {})
+        name = span["name"] if not span.get("error") else f"❌ {span['name']}"
+        sql = attributes.get("sql", "")
+        table.add_row(
+            str(rank),
+            name,
+            span["kind"],
+            f"{span['duration_ms']:.1f}ms",
+            f"{self_times.get(span['span_id'], 0.0):.1f}ms",
+            str(attributes.get("rows", "-")),
+            names.get(span.get("parent_id"), "-"),
+            sql[:60] + ("…" if len(sql) > 60 else ""),
+        )
+
+    console.print(table)
+
+
 @app.command()
 def logs(
     lines: int = typer.Option(50, "--lines", "-n", help="表示行数"),
@@ -11,6 +11,7 @@ from .optimization_utils import (
     calculate_rate_limit,
     measure_performance,
 )
+from .rate_limit_utils import SlidingWindowRateLimiter, get_shared_rate_limiter
 
 __all__ = [
     "generate_cache_key",
@@ -19,4 +20,6 @@ __all__ = [
     "batch_process_requests",
     "calculate_rate_limit",
     "measure_performance",
+    "SlidingWindowRateLimiter",
+    "get_shared_rate_limiter",
 ]
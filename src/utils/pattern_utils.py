@@ -6,6 +6,7 @@
 
 from typing import Any, Dict
 
+import numpy as np
 import pandas as pd
 
 
@@ -140,42 +141,65 @@ class PatternUtils:
         return False
 
     @staticmethod
-    def detect_divergence(
+    def detect_divergence_series(
         price_data: pd.Series, rsi_data: pd.Series, lookback: int = 10
-    ) -> Dict[str, bool]:
-        """ダイバージェンスを検出"""
-        if len(price_data) < lookback or len(rsi_data) < lookback:
-            return {"bullish": False, "bearish": False}
-
-        # 価格とRSIの高値・安値を取得
-        price_highs = price_data.rolling(window=5, center=True).max()
-        price_lows = price_data.rolling(window=5, center=True).min()
-        rsi_highs = rsi_data.rolling(window=5, center=True).max()
-        rsi_lows = rsi_data.rolling(window=5, center=True).min()
-
-        # 最新の高値・安値
-        current_price_high = price_highs.iloc[-1]
-        current_price_low = price_lows.iloc[-1]
-        current_rsi_high = rsi_highs.iloc[-1]
-        current_rsi_low = rsi_lows.iloc[-1]
-
-        # 過去の高値・安値
-        past_price_high = price_highs.iloc[-lookback:-1].max()
-        past_price_low = price_lows.iloc[-lookback:-1].min()
-        past_rsi_high = rsi_highs.iloc[-lookback:-1].max()
-        past_rsi_low = rsi_lows.iloc[-lookback:-1].min()
+    ) -> pd.DataFrame:
+        """
+        全バーのダイバージェンスを検出
+
+        各バーで、そのバーまでのデータのみを使って判定する。
+        高値・安値は直近5本の後方ウィンドウで求める。価格とRSIは同じ長さで、
+        位置で対応しているものとする。
+
+        Args:
+            price_data: 価格
+            rsi_data: RSI
+            lookback: 比較する過去の期間（現在のバーを含む）
+
+        Returns:
+            pd.DataFrame: bullish, bearish 列（bool）
+        """
+        # 価格とRSIは位置で対応させる
+        prices = pd.Series(np.asarray(price_data, dtype=np.float64))
+        rsi = pd.Series(np.asarray(rsi_data, dtype=np.float64))
+
+        price_highs = prices.rolling(window=5, min_periods=1).max()
+        price_lows = prices.rolling(window=5, min_periods=1).min()
+        rsi_highs = rsi.rolling(window=5, min_periods=1).max()
+        rsi_lows = rsi.rolling(window=5, min_periods=1).min()
+
+        # 現在のバーを除く直近 lookback-1 本の高値・安値
+        window = max(lookback - 1, 1)
+        past_price_high = price_highs.shift(1).rolling(window=window).max()
+        past_price_low = price_lows.shift(1).rolling(window=window).min()
+        past_rsi_high = rsi_highs.shift(1).rolling(window=window).max()
+        past_rsi_low = rsi_lows.shift(1).rolling(window=window).min()
 
         # ベアリッシュダイバージェンス: 価格新高値、RSI前回高値未達
-        bearish_divergence = (
-            current_price_high > past_price_high and current_rsi_high < past_rsi_high
-        )
+        bearish = (price_highs > past_price_high) & (rsi_highs < past_rsi_high)
 
         # ブルリッシュダイバージェンス: 価格新安値、RSI前回安値未達
-        bullish_divergence = (
-            current_price_low < past_price_low and current_rsi_low > past_rsi_low
+        bullish = (price_lows < past_price_low) & (rsi_lows > past_rsi_low)
+
+        return pd.DataFrame(
+            {"bullish": bullish.to_numpy(), "bearish": bearish.to_numpy()},
+            index=price_data.index,
         )
 
-        return {"bullish": bullish_divergence, "bearish": bearish_divergence}
+    @staticmethod
+    def detect_divergence(
+        price_data: pd.Series, rsi_data: pd.Series, lookback: int = 10
+    ) -> Dict[str, bool]:
+        """ダイバージェンスを検出（最新バー）"""
+        if len(price_data) < lookback or len(rsi_data) < lookback:
+            return {"bullish": False, "bearish": False}
+
+        # 5本の高値・安値の計算に必要な分だけ遡る
+        tail = lookback + 4
+        latest = PatternUtils.detect_divergence_series(
+            price_data.iloc[-tail:], rsi_data.iloc[-tail:], lookback
+        ).iloc[-1]
+        return {"bullish": bool(latest["bullish"]), "bearish": bool(latest["bearish"])}
 
     @staticmethod
     def check_candle_pattern(prices: pd.Series, pattern: str) -> bool:
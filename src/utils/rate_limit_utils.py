@@ -0,0 +1,323 @@
+"""
+Rate Limit Utilities
+レート制限ユーティリティ
+
+設計書参照:
+- api_optimization_design_2025.md
+
+固定バケットのリングカウンターによるスライディングウィンドウ型レート制限
+
+- 呼び出しはウィンドウを分割したバケットに集計し、合計値を差分更新する
+  （記録・判定は呼び出し履歴の走査なしで O(1)）
+- バケットはウィンドウより1つ多く保持し、実際のウィンドウより短く
+  数えることがないようにする（制限を超えない側に丸める）
+- 同じ提供元を使う複数のクライアントは get_shared_rate_limiter で
+  同じ制限状態を共有する
+"""
+
+import asyncio
+import math
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .logging_config import get_infrastructure_logger
+
+logger = get_infrastructure_logger()
+
+# ウィンドウあたりのバケット数
+BUCKETS_PER_WINDOW = 60
+
+
+class SlidingWindowCounter:
+    """
+    固定バケットのリングカウンター
+
+    ウィンドウ内の呼び出し数をバケット単位で保持する。
+    """
+
+    __slots__ = ("window_seconds", "bucket_seconds", "_counts", "_head", "_total")
+
+    def __init__(self, window_seconds: float, bucket_seconds: Optional[float] = None):
+        """
+        初期化
+
+        Args:
+            window_seconds: ウィンドウ（秒）
+            bucket_seconds: バケット幅（秒、Noneでウィンドウの1/60）
+        """
+        self.window_seconds = window_seconds
+        self.bucket_seconds = bucket_seconds or window_seconds / BUCKETS_PER_WINDOW
+        size = math.ceil(window_seconds / self.bucket_seconds) + 1
+        self._counts: List[int] = [0] * size
+        self._head: Optional[int] = None
+        self._total = 0
+
+    def _advance(self, now: float) -> None:
+        """現在時刻のバケットまで進め、ウィンドウ外のバケットを破棄"""
+        index = int(now // self.bucket_seconds)
+        if self._head is None:
+            self._head = index
+            return
+
+        gap = index - self._head
+        if gap <= 0:
+            return
+
+        size = len(self._counts)
+        if gap >= size:
+            self._counts = [0] * size
+            self._total = 0
+        else:
+            for bucket in range(self._head + 1, index + 1):
+                slot = bucket % size
+                self._total -= self._counts[slot]
+                self._counts[slot] = 0
+        self._head = index
+
+    def record(self, now: float, calls: int = 1) -> None:
+        """
+        呼び出しを記録
+
+        Args:
+            now: 現在時刻（monotonic）
+            calls: 呼び出し数
+        """
+        self._advance(now)
+        self._counts[self._head % len(self._counts)] += calls
+        self._total += calls
+
+    def count(self, now: float) -> int:
+        """
+        ウィンドウ内の呼び出し数
+
+        Args:
+            now: 現在時刻（monotonic）
+
+        Returns:
+            int: 呼び出し数
+        """
+        self._advance(now)
+        return self._total
+
+    def wait_time(self, now: float, limit: int, cost: int = 1) -> float:
+        """
+        次の呼び出しが制限内に収まるまでの待機時間
+
+        Args:
+            now: 現在時刻（monotonic）
+            limit: ウィンドウ内の最大呼び出し数
+            cost: 次の呼び出しの重み（上限は limit）
+
+        Returns:
+            float: 待機時間（秒、待機不要なら0）
+        """
+        self._advance(now)
+        excess = self._total + min(cost, limit) - limit
+        if excess <= 0:
+            return 0.0
+
+        # 古いバケットから順に、超過分が抜けるバケットを探す
+        size = len(self._counts)
+        released = 0
+        for bucket in range(self._head - size + 1, self._head + 1):
+            released += self._counts[bucket % size]
+            if released >= excess:
+                # 丸め誤差でバケット境界の手前にならないよう、境界を越える時刻まで待つ
+                release_at = (bucket + size) * self.bucket_seconds
+                while release_at // self.bucket_seconds < bucket + size:
+                    release_at = math.nextafter(release_at, math.inf)
+                return max(0.0, release_at - now)
+        return self.window_seconds
+
+
+class SlidingWindowRateLimiter:
+    """
+    複数ウィンドウのスライディングウィンドウ型レート制限
+
+    責任:
+    - 呼び出しの記録と制限判定（O(1)）
+    - 次に呼び出せる時刻までの正確な待機
+    """
+
+    def __init__(
+        self,
+        limits: Sequence[Tuple[int, float]],
+        name: str = "",
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        初期化
+
+        Args:
+            limits: (最大呼び出し数, ウィンドウ秒) のリスト
+            name: 制限名（ログ用）
+            clock: 時刻関数
+        """
+        self.name = name
+        self.limits = tuple((int(limit), float(window)) for limit, window in limits)
+        self._clock = clock
+        self._windows = [
+            (limit, SlidingWindowCounter(window)) for limit, window in self.limits
+        ]
+        self._lock = threading.Lock()
+        self._acquired = 0
+        self._throttled = 0
+        self._total_wait_seconds = 0.0
+
+    def wait_time(self, cost: int = 1) -> float:
+        """
+        次の呼び出しまでの待機時間
+
+        Args:
+            cost: 次の呼び出しの重み（トークン数など）
+
+        Returns:
+            float: 待機時間（秒、待機不要なら0）
+        """
+        with self._lock:
+            now = self._clock()
+            return max(
+                (
+                    counter.wait_time(now, limit, cost)
+                    for limit, counter in self._windows
+                ),
+                default=0.0,
+            )
+
+    def record(self, calls: int = 1) -> None:
+        """
+        呼び出しを記録（制限判定なし）
+
+        Args:
+            calls: 呼び出し数
+        """
+        with self._lock:
+            now = self._clock()
+            for _, counter in self._windows:
+                counter.record(now, calls)
+
+    def try_acquire(self, cost: int = 1) -> float:
+        """
+        制限内であれば呼び出しを記録
+
+        Args:
+            cost: 呼び出しの重み（トークン数など）
+
+        Returns:
+            float: 0なら記録済み、それ以外は次に呼び出せるまでの待機時間（秒）
+        """
+        with self._lock:
+            now = self._clock()
+            wait = max(
+                (
+                    counter.wait_time(now, limit, cost)
+                    for limit, counter in self._windows
+                ),
+                default=0.0,
+            )
+            if wait > 0:
+                return wait
+            for _, counter in self._windows:
+                counter.record(now, cost)
+            self._acquired += 1
+            return 0.0
+
+    async def acquire(self, cost: int = 1) -> float:
+        """
+        呼び出し枠を確保（必要なら次の枠まで待機）
+
+        Args:
+            cost: 呼び出しの重み（トークン数など）
+
+        Returns:
+            float: 待機した時間（秒）
+        """
+        waited = 0.0
+        while True:
+            wait = self.try_acquire(cost)
+            if wait <= 0:
+                if waited > 0:
+                    self._total_wait_seconds += waited
+                return waited
+            if waited == 0:
+                self._throttled += 1
+                logger.debug(f"Rate limit reached for {self.name}, waiting {wait:.2f}s")
+            await asyncio.sleep(wait)
+            waited += wait
+
+    def count(self, window_seconds: float) -> int:
+        """
+        ウィンドウ内の呼び出し数
+
+        Args:
+            window_seconds: ウィンドウ（秒、登録済みのウィンドウのうち
+                これ以上で最小のものを使用）
+
+        Returns:
+            int: 呼び出し数
+        """
+        candidates = [
+            counter
+            for _, counter in self._windows
+            if counter.window_seconds >= window_seconds
+        ] or [counter for _, counter in self._windows]
+        if not candidates:
+            return 0
+        counter = min(candidates, key=lambda c: abs(c.window_seconds - window_seconds))
+        with self._lock:
+            return counter.count(self._clock())
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        統計情報を取得
+
+        Returns:
+            Dict[str, Any]: ウィンドウごとの呼び出し数と待機統計
+        """
+        with self._lock:
+            now = self._clock()
+            windows = [
+                {
+                    "limit": limit,
+                    "window_seconds": counter.window_seconds,
+                    "calls": counter.count(now),
+                }
+                for limit, counter in self._windows
+            ]
+        return {
+            "name": self.name,
+            "windows": windows,
+            "acquired": self._acquired,
+            "throttled": self._throttled,
+            "total_wait_seconds": self._total_wait_seconds,
+        }
+
+
+_SharedLimiterKey = Tuple[str, Tuple[Tuple[int, float], ...]]
+_shared_limiters: Dict[_SharedLimiterKey, SlidingWindowRateLimiter] = {}
+_shared_lock = threading.Lock()
+
+
+def get_shared_rate_limiter(
+    name: str, limits: Sequence[Tuple[int, float]]
+) -> SlidingWindowRateLimiter:
+    """
+    提供元ごとに共有されるレート制限を取得
+
+    同じ名前・同じ制限で取得した呼び出し元は同じ制限状態を共有する。
+
+    Args:
+        name: 提供元の名前（API名やベースURL）
+        limits: (最大呼び出し数, ウィンドウ秒) のリスト
+
+    Returns:
+        SlidingWindowRateLimiter: 共有レート制限
+    """
+    key = (name, tuple((int(limit), float(window)) for limit, window in limits))
+    with _shared_lock:
+        limiter = _shared_limiters.get(key)
+        if limiter is None:
+            limiter = SlidingWindowRateLimiter(key[1], name=name)
+            _shared_limiters[key] = limiter
+        return limiter
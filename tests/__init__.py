@@ -0,0 +1 @@
+# テストパッケージ
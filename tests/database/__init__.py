@@ -0,0 +1 @@
+# データベーステスト
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+マイグレーション 008（ai_reports.content_hash）のテスト
+
+責任:
+- content_hash カラムとインデックスの追加
+- 再実行・テーブルがない場合のスキップ
+"""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+sa = pytest.importorskip("sqlalchemy")
+pytest.importorskip("alembic")
+
+from alembic.migration import MigrationContext  # noqa: E402
+from alembic.operations import Operations  # noqa: E402
+
+MIGRATION_PATH = (
+    Path(__file__).parents[2]
+    / "src/infrastructure/database/migrations/versions/008_ai_reports_content_hash.py"
+)
+
+
+def load_migration():
+    """マイグレーションモジュールを読み込み"""
+    spec = importlib.util.spec_from_file_location("migration_008", MIGRATION_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def run_upgrade(engine, migration):
+    """upgrade を1トランザクションで実行"""
+    with engine.connect() as conn:
+        context = MigrationContext.configure(conn, opts={"transactional_ddl": True})
+        with Operations.context(context), context.begin_transaction():
+            migration.upgrade()
+        conn.commit()
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """SQLite エンジン"""
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'reports.db'}")
+    yield engine
+    engine.dispose()
+
+
+class TestContentHashMigration:
+    """content_hash マイグレーションのテスト"""
+
+    def test_adds_column_and_index(self, engine):
+        """既存のレポートを残したままカラムとインデックスを追加"""
+        metadata = sa.MetaData()
+        reports = sa.Table(
+            "ai_reports",
+            metadata,
+            sa.Column("id", sa.Integer, primary_key=True),
+            sa.Column("report_content", sa.Text),
+        )
+        metadata.create_all(engine)
+        with engine.begin() as conn:
+            conn.execute(reports.insert(), [{"report_content": "existing"}])
+
+        migration = load_migration()
+        run_upgrade(engine, migration)
+        run_upgrade(engine, migration)
+
+        inspector = sa.inspect(engine)
+        columns = {c["name"] for c in inspector.get_columns("ai_reports")}
+        indexes = {i["name"] for i in inspector.get_indexes("ai_reports")}
+        with engine.connect() as conn:
+            rows = conn.execute(
+                sa.text("SELECT report_content, content_hash FROM ai_reports")
+            ).all()
+
+        assert "content_hash" in columns
+        assert migration.INDEX_NAME in indexes
+        assert rows == [("existing", None)]
+
+    def test_skips_missing_table(self, engine):
+        """ai_reports がない場合は何もしない"""
+        run_upgrade(engine, load_migration())
+
+        assert not sa.inspect(engine).has_table("ai_reports")
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+マイグレーション 005（pattern_detections.indicator_data の圧縮）のテスト
+
+責任:
+- 旧形式の indicator_data のエビデンス形式への変換
+- 変換結果が pattern_evidence と一致すること
+- テーブルがない場合のスキップ
+"""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+sa = pytest.importorskip("sqlalchemy")
+pytest.importorskip("alembic")
+
+from alembic.migration import MigrationContext  # noqa: E402
+from alembic.operations import Operations  # noqa: E402
+
+from src.infrastructure.analysis.pattern_evidence import (  # noqa: E402
+    build_pattern_evidence,
+    compact_indicator_data,
+)
+
+MIGRATION_PATH = (
+    Path(__file__).parents[2]
+    / "src/infrastructure/database/migrations/versions/005_compact_pattern_evidence.py"
+)
+
+LEGACY_DATA = {
+    "D1": {
+        "price_data": [
+            {
+                "timestamp": f"2026-10-{day:02d}T00:00:00",
+                "Open": 149.0 + day,
+                "High": 150.0 + day,
+                "Low": 148.0 + day,
+                "Close": 149.5 + day,
+            }
+            for day in range(1, 8)
+        ],
+        "indicators": {
+            "rsi": {"current_value": 55.2},
+            "macd": {"macd": [0.1, 0.2], "signal": [0.05, 0.15], "histogram": [0.05]},
+            "bollinger_bands": {
+                "upper": {"0": 151.0, "1": 152.0},
+                "middle": {"0": 150.0, "1": 151.0},
+                "lower": {"0": 149.0, "1": 150.0},
+            },
+        },
+    },
+    "H1": {
+        "price_data": {
+            "columns": ["close_price"],
+            "index": ["2026-10-07T10:00:00", "2026-10-07T11:00:00"],
+            "data": [[156.1], [156.3]],
+        },
+        "indicators": {},
+    },
+}
+
+
+def load_migration():
+    """マイグレーションモジュールを読み込み"""
+    spec = importlib.util.spec_from_file_location("migration_005", MIGRATION_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def run_upgrade(engine, migration):
+    """upgrade を1トランザクションで実行"""
+    with engine.connect() as conn:
+        context = MigrationContext.configure(conn, opts={"transactional_ddl": True})
+        with Operations.context(context), context.begin_transaction():
+            migration.upgrade()
+        conn.commit()
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """SQLite エンジン"""
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'patterns.db'}")
+    yield engine
+    engine.dispose()
+
+
+class TestCompactPatternEvidenceMigration:
+    """indicator_data 圧縮マイグレーションのテスト"""
+
+    def test_compacts_legacy_rows(self, engine):
+        """旧形式の行のみ変換し、変換済み・NULL の行はそのまま残す"""
+        metadata = sa.MetaData()
+        detections = sa.Table(
+            "pattern_detections",
+            metadata,
+            sa.Column("id", sa.Integer, primary_key=True),
+            sa.Column("currency_pair", sa.String(10)),
+            sa.Column("indicator_data", sa.JSON),
+        )
+        metadata.create_all(engine)
+        evidence = build_pattern_evidence({}, "EUR/USD")
+        with engine.begin() as conn:
+            conn.execute(
+                detections.insert(),
+                [
+                    {"currency_pair": "USD/JPY", "indicator_data": LEGACY_DATA},
+                    {"currency_pair": "EUR/USD", "indicator_data": evidence},
+                    {"currency_pair": "GBP/USD", "indicator_data": None},
+                ],
+            )
+
+        run_upgrade(engine, load_migration())
+
+        with engine.connect() as conn:
+            rows = conn.execute(
+                sa.select(detections.c.indicator_data).order_by(detections.c.id)
+            ).scalars().all()
+
+        assert rows[0] == compact_indicator_data(LEGACY_DATA, "USD/JPY")
+        assert rows[0]["timeframes"]["D1"]["bars"] == 7
+        assert rows[0]["timeframes"]["H1"]["close"] == 156.3
+        assert rows[1] == evidence
+        assert rows[2] is None
+
+    def test_matches_pattern_evidence(self):
+        """マイグレーション内の変換は pattern_evidence と同じ結果になる"""
+        migration = load_migration()
+
+        for data in (LEGACY_DATA, {}, None, ["unexpected"]):
+            assert migration.compact_indicator_data(
+                data, "USD/JPY"
+            ) == compact_indicator_data(data, "USD/JPY")
+
+    def test_skips_missing_table(self, engine):
+        """pattern_detections がない場合は何もしない"""
+        run_upgrade(engine, load_migration())
+
+        assert not sa.inspect(engine).has_table("pattern_detections")
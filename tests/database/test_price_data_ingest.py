@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+PriceDataRepositoryImpl.ingest_batch のテスト
+
+責任:
+- 既存キー・バッチ内重複のスキップとバリデーション失敗の集計
+- 差分取得後に他の書き込みと衝突した行を ON CONFLICT でスキップすること
+- ingest_batch_returning が実際に INSERT した行だけを id 付きで返すこと
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pandas as pd
+import pytest
+
+sa = pytest.importorskip("sqlalchemy")
+pytest.importorskip("aiosqlite")
+pytest.importorskip("prometheus_client")
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine  # noqa: E402
+from sqlalchemy.sql.sqltypes import NullType  # noqa: E402
+
+from src.infrastructure.database.models.price_data_model import (  # noqa: E402
+    PriceDataModel,
+)
+from src.infrastructure.database.repositories.price_data_repository_impl import (  # noqa: E402,E501
+    PriceDataRepositoryImpl,
+)
+
+START = datetime(2026, 1, 5, 9, 0)
+STEP = timedelta(minutes=5)
+
+
+def make_frame(positions, timeframe="5m", data_source="yahoo_finance_5m"):
+    """positions 番目の5分足からなる取り込み用DataFrame"""
+    frame = pd.DataFrame(
+        {
+            "timestamp": [START + STEP * i for i in positions],
+            "currency_pair": "USD/JPY",
+            "open_price": [150.0 + i * 0.01 for i in positions],
+            "high_price": [150.1 + i * 0.01 for i in positions],
+            "low_price": [149.9 + i * 0.01 for i in positions],
+            "close_price": [150.05 + i * 0.01 for i in positions],
+            "volume": 100,
+            "data_source": data_source,
+        }
+    )
+    if timeframe is not None:
+        frame["timeframe"] = timeframe
+    return frame
+
+
+def create_price_table(sync_conn):
+    """price_data を作成（型未指定のカラムは SQLite で DDL を生成できないため補う）"""
+    metadata = sa.MetaData()
+    table = PriceDataModel.__table__.to_metadata(metadata)
+    for column in table.columns:
+        if isinstance(column.type, NullType):
+            column.type = (
+                sa.Boolean() if column.name.endswith("_calculated") else sa.Integer()
+            )
+    metadata.create_all(sync_conn)
+
+
+def run(scenario):
+    """一時的な SQLite データベース上でシナリオを実行"""
+
+    async def main():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(create_price_table)
+        try:
+            async with AsyncSession(engine, expire_on_commit=False) as session:
+                return await scenario(session, PriceDataRepositoryImpl(session))
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(main())
+
+
+async def stored_keys(session):
+    """保存済みの (id, timestamp, timeframe)"""
+    result = await session.execute(
+        sa.select(
+            PriceDataModel.id, PriceDataModel.timestamp, PriceDataModel.timeframe
+        ).order_by(PriceDataModel.timestamp)
+    )
+    return result.all()
+
+
+class TestIngestBatch:
+    """ingest_batch の差分取り込み"""
+
+    def test_inserts_new_rows_and_skips_existing(self):
+        """既存キーはスキップし、新規行のみ保存する"""
+
+        async def scenario(session, repo):
+            first = await repo.ingest_batch(make_frame(range(0, 6)))
+            second = await repo.ingest_batch(make_frame(range(3, 10)))
+            return first, second, await stored_keys(session)
+
+        first, second, rows = run(scenario)
+
+        assert first == {"inserted": 6, "skipped": 0, "failed": 0}
+        assert second == {"inserted": 4, "skipped": 3, "failed": 0}
+        assert [row.timestamp for row in rows] == [START + STEP * i for i in range(10)]
+        assert len({row.id for row in rows}) == 10
+
+    def test_duplicates_within_batch_are_skipped(self):
+        """バッチ内の同一キーは最初の1行のみ保存する"""
+
+        async def scenario(session, repo):
+            frame = make_frame([0, 1, 1, 2, 2, 2])
+            return await repo.ingest_batch(frame), await stored_keys(session)
+
+        counts, rows = run(scenario)
+
+        assert counts == {"inserted": 3, "skipped": 3, "failed": 0}
+        assert len(rows) == 3
+
+    def test_same_timestamp_in_other_timeframe_is_inserted(self):
+        """時間足が異なれば同じ時刻でも別の行として保存する"""
+
+        async def scenario(session, repo):
+            await repo.ingest_batch(make_frame(range(3)))
+            counts = await repo.ingest_batch(
+                make_frame([0], timeframe=None, data_source="yahoo_finance_1h")
+            )
+            return counts, await stored_keys(session)
+
+        counts, rows = run(scenario)
+
+        assert counts == {"inserted": 1, "skipped": 0, "failed": 0}
+        assert sorted(row.timeframe for row in rows if row.timestamp == START) == [
+            "1h",
+            "5m",
+        ]
+
+    def test_invalid_rows_are_counted_as_failed(self):
+        """バリデーションに通らない行は保存せず failed に数える"""
+
+        async def scenario(session, repo):
+            frame = make_frame(range(4))
+            frame.loc[1, "high_price"] = 149.0
+            frame.loc[2, "close_price"] = float("nan")
+            frame.loc[3, "currency_pair"] = "EUR/USD"
+            return await repo.ingest_batch(frame), await stored_keys(session)
+
+        counts, rows = run(scenario)
+
+        assert counts == {"inserted": 1, "skipped": 0, "failed": 3}
+        assert [row.timestamp for row in rows] == [START]
+
+    def test_conflict_after_existing_key_lookup_is_skipped(self):
+        """差分取得後に他の書き込みが保存した行は ON CONFLICT でスキップする"""
+
+        async def scenario(session, repo):
+            execute = session.execute
+            calls = []
+
+            async def execute_then_race(statement, *args, **kwargs):
+                result = await execute(statement, *args, **kwargs)
+                if not calls:
+                    # 既存キー取得の直後に同じキーの行が保存される
+                    calls.append(statement)
+                    await execute(
+                        sa.insert(PriceDataModel.__table__),
+                        repo._frame_to_rows(make_frame([1])),
+                    )
+                return result
+
+            session.execute = execute_then_race
+            counts, inserted = await repo.ingest_batch_returning(make_frame(range(3)))
+            session.execute = execute
+            return counts, inserted, await stored_keys(session)
+
+        counts, inserted, rows = run(scenario)
+
+        assert counts == {"inserted": 2, "skipped": 1, "failed": 0}
+        assert [row.timestamp for row in rows] == [START + STEP * i for i in range(3)]
+        ids = {row.timestamp: row.id for row in rows}
+        assert [(row["timestamp"], row["id"]) for row in inserted] == [
+            (START, ids[START]),
+            (START + STEP * 2, ids[START + STEP * 2]),
+        ]
+
+
+class TestIngestBatchReturning:
+    """ingest_batch_returning の戻り値"""
+
+    def test_returns_only_inserted_rows(self):
+        """INSERT した行だけを、保存した値と id 付きで返す"""
+
+        async def scenario(session, repo):
+            await repo.ingest_batch(make_frame(range(0, 3)))
+            counts, inserted = await repo.ingest_batch_returning(
+                make_frame(range(2, 5))
+            )
+            stored = await session.execute(
+                sa.select(PriceDataModel).where(PriceDataModel.timestamp >= START)
+            )
+            return counts, inserted, stored.scalars().all()
+
+        counts, inserted, stored = run(scenario)
+
+        assert counts == {"inserted": 2, "skipped": 1, "failed": 0}
+        assert [row["timestamp"] for row in inserted] == [
+            START + STEP * 3,
+            START + STEP * 4,
+        ]
+        by_timestamp = {model.timestamp: model for model in stored}
+        for row in inserted:
+            model = by_timestamp[row["timestamp"]]
+            assert row["id"] == model.id
+            assert model.timeframe == row["timeframe"] == "5m"
+            assert float(model.close_price) == pytest.approx(row["close_price"])
+            assert model.volume == row["volume"] == 100
+
+    def test_empty_frame(self):
+        """空のDataFrameでは何もしない"""
+
+        async def scenario(session, repo):
+            return await repo.ingest_batch_returning(make_frame([]))
+
+        assert run(scenario) == ({"inserted": 0, "skipped": 0, "failed": 0}, [])
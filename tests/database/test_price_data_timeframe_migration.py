@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+マイグレーション 007（price_data.timeframe）のテスト
+
+責任:
+- データソース名・バー間隔からの時間足の推定
+- 時間足・時刻が衝突する場合に行を削除せず中止すること
+"""
+
+import importlib.util
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+sa = pytest.importorskip("sqlalchemy")
+pytest.importorskip("alembic")
+
+from alembic.migration import MigrationContext  # noqa: E402
+from alembic.operations import Operations  # noqa: E402
+
+MIGRATION_PATH = (
+    Path(__file__).parents[2]
+    / "src/infrastructure/database/migrations/versions/007_price_data_timeframe.py"
+)
+
+START = datetime(2026, 1, 5, 0, 0)
+
+
+def load_migration():
+    """マイグレーションモジュールを読み込み"""
+    spec = importlib.util.spec_from_file_location("migration_007", MIGRATION_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def create_legacy_table(engine):
+    """timeframe カラム導入前の price_data を作成"""
+    metadata = sa.MetaData()
+    table = sa.Table(
+        "price_data",
+        metadata,
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("currency_pair", sa.String(10)),
+        sa.Column("timestamp", sa.DateTime),
+        sa.Column("open_price", sa.Float),
+        sa.Column("high_price", sa.Float),
+        sa.Column("low_price", sa.Float),
+        sa.Column("close_price", sa.Float),
+        sa.Column("volume", sa.Integer),
+        sa.Column("data_source", sa.String(80)),
+        sa.Column("technical_indicators_calculated", sa.Boolean),
+        sa.UniqueConstraint(
+            "currency_pair",
+            "timestamp",
+            "data_source",
+            name="idx_price_data_currency_timestamp_source",
+        ),
+    )
+    metadata.create_all(engine)
+    return table
+
+
+def bars(source, start, step, count):
+    """一定間隔のバー"""
+    return [
+        {
+            "currency_pair": "USD/JPY",
+            "timestamp": start + step * i,
+            "open_price": 150.0,
+            "high_price": 150.1,
+            "low_price": 149.9,
+            "close_price": 150.0,
+            "volume": 0,
+            "data_source": source,
+            "technical_indicators_calculated": False,
+        }
+        for i in range(count)
+    ]
+
+
+def run_upgrade(engine, migration):
+    """upgrade を1トランザクションで実行"""
+    with engine.connect() as conn:
+        context = MigrationContext.configure(
+            conn, opts={"transactional_ddl": True}
+        )
+        with Operations.context(context), context.begin_transaction():
+            migration.upgrade()
+        conn.commit()
+
+
+def timeframes_by_source(engine):
+    """データソース別の時間足と件数"""
+    with engine.connect() as conn:
+        rows = conn.execute(
+            sa.text(
+                "SELECT data_source, timeframe, COUNT(*) FROM price_data "
+                "GROUP BY data_source, timeframe"
+            )
+        ).all()
+    return {(source, timeframe): count for source, timeframe, count in rows}
+
+
+class TestPriceDataTimeframeMigration:
+    """マイグレーション 007 のテスト"""
+
+    @pytest.fixture
+    def engine(self):
+        """SQLite エンジン"""
+        return sa.create_engine("sqlite://")
+
+    @pytest.fixture
+    def migration(self):
+        """マイグレーションモジュール"""
+        return load_migration()
+
+    def test_infers_timeframe_from_bar_spacing(self, engine, migration):
+        """時間足を含まないデータソースはバー間隔から推定される"""
+        table = create_legacy_table(engine)
+        rows = (
+            bars("Yahoo Finance", START, timedelta(minutes=5), 48)
+            # 同じデータソース名で期間を分けて保存された複数時間足
+            + bars(
+                "Yahoo Finance Initial Load",
+                START - timedelta(days=60),
+                timedelta(days=1),
+                20,
+            )
+            + bars(
+                "Yahoo Finance Initial Load",
+                START - timedelta(days=30),
+                timedelta(hours=4),
+                30,
+            )
+            + bars("Yahoo Finance Initial Load", START, timedelta(hours=1), 24)
+            + bars("Aggregated from 5m", START, timedelta(hours=4), 6)
+            + bars(
+                "Yahoo Finance (H1) Aggregated from 5m - ",
+                START + timedelta(days=2),
+                timedelta(hours=1),
+                3,
+            )
+        )
+        with engine.begin() as conn:
+            conn.execute(table.insert(), rows)
+
+        run_upgrade(engine, migration)
+
+        assert timeframes_by_source(engine) == {
+            ("Yahoo Finance", "5m"): 48,
+            ("Yahoo Finance Initial Load", "1d"): 20,
+            ("Yahoo Finance Initial Load", "4h"): 30,
+            ("Yahoo Finance Initial Load", "1h"): 24,
+            ("Aggregated from 5m", "4h"): 6,
+            ("Yahoo Finance (H1) Aggregated from 5m - ", "1h"): 3,
+        }
+
+    def test_weekend_gap_keeps_timeframe(self, engine, migration):
+        """週末の欠損があっても隣接バーの短い方の間隔で判定される"""
+        table = create_legacy_table(engine)
+        friday = datetime(2026, 1, 9, 20, 0)
+        monday = friday + timedelta(days=2, hours=4)
+        rows = bars("Yahoo Finance", friday, timedelta(hours=1), 3) + bars(
+            "Yahoo Finance", monday, timedelta(hours=1), 3
+        )
+        with engine.begin() as conn:
+            conn.execute(table.insert(), rows)
+
+        run_upgrade(engine, migration)
+
+        assert timeframes_by_source(engine) == {("Yahoo Finance", "1h"): 6}
+
+    def test_collision_aborts_without_deleting(self, engine, migration):
+        """同一時間足・同一時刻のバーがある場合は削除せずに中止する"""
+        table = create_legacy_table(engine)
+        rows = bars("Yahoo Finance", START, timedelta(minutes=5), 12) + bars(
+            "yahoo_finance_5m_continuous", START, timedelta(minutes=5), 2
+        )
+        with engine.begin() as conn:
+            conn.execute(table.insert(), rows)
+
+        with pytest.raises(RuntimeError, match="more than one bar"):
+            run_upgrade(engine, migration)
+
+        with engine.connect() as conn:
+            count = conn.execute(sa.text("SELECT COUNT(*) FROM price_data")).scalar()
+        assert count == 14
+
+    def test_rerun_keeps_manual_timeframe(self, engine, migration):
+        """中止後に手動で設定した時間足は再実行で上書きされない"""
+        table = create_legacy_table(engine)
+        with engine.begin() as conn:
+            conn.execute(
+                table.insert(),
+                bars("Yahoo Finance", START, timedelta(minutes=5), 12)
+                + bars("Sample Data", START, timedelta(0), 1),
+            )
+
+        with pytest.raises(RuntimeError, match="no neighbouring bar"):
+            run_upgrade(engine, migration)
+
+        with engine.begin() as conn:
+            conn.execute(
+                sa.text(
+                    "UPDATE price_data SET timeframe = '1d' "
+                    "WHERE data_source = 'Sample Data'"
+                )
+            )
+        run_upgrade(engine, migration)
+
+        assert timeframes_by_source(engine) == {
+            ("Yahoo Finance", "5m"): 12,
+            ("Sample Data", "1d"): 1,
+        }
+
+    def test_isolated_bar_aborts(self, engine, migration):
+        """隣接バーがなく時間足を判定できない行がある場合は中止する"""
+        table = create_legacy_table(engine)
+        with engine.begin() as conn:
+            conn.execute(table.insert(), bars("Sample Data", START, timedelta(0), 1))
+
+        with pytest.raises(RuntimeError, match="no neighbouring bar"):
+            run_upgrade(engine, migration)
+
+    def test_skips_missing_table(self, engine, migration):
+        """price_data がない場合は何もしない"""
+        run_upgrade(engine, migration)
+
+        with engine.connect() as conn:
+            assert not sa.inspect(conn).has_table("price_data")
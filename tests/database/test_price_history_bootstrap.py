@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+PriceHistoryBootstrapService のスナップショット書き出し・復元のテスト
+
+責任:
+- export_snapshot → load_snapshot で全時間軸の価格データが復元されること
+- seed_path 指定時は Yahoo Finance を使わずにスナップショットから復元すること
+- 時間足の別名の正規化・不足列の補完と既存データのスキップ
+"""
+
+import asyncio
+from datetime import timedelta
+
+import pandas as pd
+import pytest
+
+sa = pytest.importorskip("sqlalchemy")
+pytest.importorskip("aiosqlite")
+pytest.importorskip("prometheus_client")
+pytest.importorskip("yfinance")
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine  # noqa: E402
+from sqlalchemy.sql.sqltypes import NullType  # noqa: E402
+
+from src.infrastructure.database.models.price_data_model import (  # noqa: E402
+    PriceDataModel,
+)
+from src.infrastructure.database.repositories.price_data_repository_impl import (  # noqa: E402,E501
+    PriceDataRepositoryImpl,
+)
+from src.infrastructure.database.services.price_history_bootstrap_service import (  # noqa: E402,E501
+    SNAPSHOT_COLUMNS,
+    PriceHistoryBootstrapService,
+)
+
+STEPS = {"5m": timedelta(minutes=5), "1h": timedelta(hours=1)}
+TIMEFRAME_CONFIG = {
+    "5m": {"period": "7d", "interval": "5m", "description": "5分足", "days": 7},
+    "1h": {"period": "30d", "interval": "1h", "description": "1時間足", "days": 30},
+}
+
+
+def recent_start():
+    """書き出し対象期間（直近7日）に入る開始時刻"""
+    return pd.Timestamp.now().floor("h").to_pydatetime() - timedelta(days=2)
+
+
+def price_rows(start, timeframe, count):
+    """ingest_batch 用のDataFrame"""
+    step = STEPS[timeframe]
+    return pd.DataFrame(
+        {
+            "timestamp": [start + step * i for i in range(count)],
+            "currency_pair": "USD/JPY",
+            "timeframe": timeframe,
+            "open_price": [150.0 + i * 0.25 for i in range(count)],
+            "high_price": [150.5 + i * 0.25 for i in range(count)],
+            "low_price": [149.5 + i * 0.25 for i in range(count)],
+            "close_price": [150.125 + i * 0.25 for i in range(count)],
+            "volume": [100 + i for i in range(count)],
+            "data_source": f"yahoo_finance_{timeframe}",
+        }
+    )
+
+
+class OfflineYahooClient:
+    """呼び出されたらテストを失敗させる Yahoo Finance クライアント"""
+
+    async def get_historical_data(self, *args, **kwargs):
+        raise AssertionError("スナップショット復元でネットワークを使用した")
+
+
+def create_price_table(sync_conn):
+    """price_data を作成（型未指定のカラムは SQLite で DDL を生成できないため補う）"""
+    metadata = sa.MetaData()
+    table = PriceDataModel.__table__.to_metadata(metadata)
+    for column in table.columns:
+        if isinstance(column.type, NullType):
+            column.type = (
+                sa.Boolean() if column.name.endswith("_calculated") else sa.Integer()
+            )
+    metadata.create_all(sync_conn)
+
+
+async def open_database():
+    """一時的な SQLite データベース"""
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(create_price_table)
+    return engine
+
+
+def make_service(session):
+    return PriceHistoryBootstrapService(
+        session,
+        yahoo_client=OfflineYahooClient(),
+        timeframe_config=TIMEFRAME_CONFIG,
+    )
+
+
+async def stored_frames(session):
+    """時間足別の保存済み OHLCV"""
+    repo = PriceDataRepositoryImpl(session)
+    return {
+        timeframe: await repo.find_ohlcv_frame(None, None, "USD/JPY", timeframe)
+        for timeframe in TIMEFRAME_CONFIG
+    }
+
+
+class TestSnapshotRoundTrip:
+    """書き出したスナップショットからの復元"""
+
+    @pytest.mark.parametrize("suffix", [".csv", ".csv.gz", ".parquet"])
+    def test_export_then_load_restores_all_timeframes(self, tmp_path, suffix):
+        """別のデータベースに復元した OHLCV が書き出し元と一致する"""
+        if suffix == ".parquet":
+            pytest.importorskip("pyarrow")
+        path = tmp_path / f"price_seed{suffix}"
+        start = recent_start()
+
+        async def scenario():
+            source = await open_database()
+            target = await open_database()
+            try:
+                async with AsyncSession(source, expire_on_commit=False) as session:
+                    repo = PriceDataRepositoryImpl(session)
+                    await repo.ingest_batch(price_rows(start, "5m", 30))
+                    await repo.ingest_batch(price_rows(start, "1h", 12))
+                    exported = await make_service(session).export_snapshot(str(path))
+                    expected = await stored_frames(session)
+                async with AsyncSession(target, expire_on_commit=False) as session:
+                    loaded = await make_service(session).load_snapshot(str(path))
+                    restored = await stored_frames(session)
+                return exported, loaded, expected, restored
+            finally:
+                await source.dispose()
+                await target.dispose()
+
+        exported, loaded, expected, restored = asyncio.run(scenario())
+
+        assert exported == 42
+        assert loaded == {"5m": 30, "1h": 12}
+        for timeframe, frame in expected.items():
+            assert len(frame) == len(restored[timeframe])
+            assert list(restored[timeframe].index) == list(frame.index)
+            pd.testing.assert_frame_equal(
+                restored[timeframe].astype(float), frame.astype(float)
+            )
+
+    def test_export_empty_database_writes_header_only(self, tmp_path):
+        """データがない場合は列のみのスナップショットを書き出す"""
+        path = tmp_path / "empty.csv"
+
+        async def scenario():
+            engine = await open_database()
+            try:
+                async with AsyncSession(engine, expire_on_commit=False) as session:
+                    return await make_service(session).export_snapshot(str(path))
+            finally:
+                await engine.dispose()
+
+        assert asyncio.run(scenario()) == 0
+        assert list(pd.read_csv(path).columns) == SNAPSHOT_COLUMNS
+
+
+class TestSeedPath:
+    """seed_path 指定時の初期化"""
+
+    def test_bootstrap_with_seed_path_loads_snapshot_offline(self, tmp_path):
+        """seed_path 指定時は取得せずに復元し、再実行では既存行をスキップする"""
+        path = tmp_path / "seed.csv"
+        start = recent_start()
+        # 時間足の別名を使い、通貨ペア・データソース列を含まないスナップショット
+        pd.DataFrame(
+            {
+                "timestamp": [start + STEPS["5m"] * i for i in range(4)]
+                + [start + STEPS["1h"] * i for i in range(3)],
+                "timeframe": ["M5"] * 4 + ["H1"] * 3,
+                "open": 150.0,
+                "high": 150.5,
+                "low": 149.5,
+                "close": 150.25,
+                "volume": [10.0, None, 30.0, 40.0, 1.0, 2.0, 3.0],
+            }
+        ).to_csv(path, index=False)
+
+        async def scenario():
+            engine = await open_database()
+            try:
+                async with AsyncSession(engine, expire_on_commit=False) as session:
+                    service = make_service(session)
+                    first = await service.bootstrap(seed_path=str(path))
+                    second = await service.bootstrap(seed_path=str(path))
+                    rows = await session.execute(
+                        sa.select(
+                            PriceDataModel.timeframe,
+                            PriceDataModel.currency_pair,
+                            PriceDataModel.data_source,
+                            PriceDataModel.volume,
+                        ).order_by(PriceDataModel.timeframe, PriceDataModel.timestamp)
+                    )
+                    return first, second, rows.all()
+            finally:
+                await engine.dispose()
+
+        first, second, rows = asyncio.run(scenario())
+
+        assert first == {"5m": 4, "1h": 3}
+        assert second == {"5m": 0, "1h": 0}
+        assert [row.timeframe for row in rows] == ["1h"] * 3 + ["5m"] * 4
+        assert {row.currency_pair for row in rows} == {"USD/JPY"}
+        assert {row.data_source for row in rows} == {"Snapshot Seed"}
+        assert [row.volume for row in rows if row.timeframe == "5m"] == [10, 0, 30, 40]
+
+    def test_empty_snapshot_loads_nothing(self, tmp_path):
+        """空のスナップショットでは何も保存しない"""
+        path = tmp_path / "empty.csv"
+        pd.DataFrame(columns=SNAPSHOT_COLUMNS).to_csv(path, index=False)
+
+        async def scenario():
+            engine = await open_database()
+            try:
+                async with AsyncSession(engine, expire_on_commit=False) as session:
+                    return await make_service(session).bootstrap(seed_path=str(path))
+            finally:
+                await engine.dispose()
+
+        assert asyncio.run(scenario()) == {}
@@ -0,0 +1 @@
+# 指標テスト
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+IncrementalIndicatorEngine の単体テスト
+
+責任:
+- リプレイ結果と TA-Lib バッチ計算の一致（PARITY_TOLERANCE 以内）
+- 状態の保存・復元後もビット単位で同じ計算を継続すること
+- 適用済みの足の再適用を無視すること
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("talib")
+
+from src.infrastructure.analysis.incremental_indicators import (  # noqa: E402
+    PARITY_TOLERANCE,
+    IncrementalIndicatorEngine,
+    IndicatorStateStore,
+)
+
+
+def price_frame(bars: int = 2000, seed: int = 7) -> pd.DataFrame:
+    """USD/JPY の価格帯のランダムウォーク（5分足）"""
+    rng = np.random.default_rng(seed)
+    close = 150 + rng.normal(0, 0.02, bars).cumsum()
+    spread = np.abs(rng.normal(0, 0.01, bars))
+    index = pd.date_range("2026-01-05", periods=bars, freq="5min")
+    return pd.DataFrame(
+        {"high": close + spread, "low": close - spread, "close": close},
+        index=index,
+    )
+
+
+class TestIncrementalIndicatorEngine:
+    """IncrementalIndicatorEngine のテスト"""
+
+    def test_replay_matches_batch_within_tolerance(self):
+        """全指標のリプレイ結果が TA-Lib と許容誤差以内で一致する"""
+        results = IncrementalIndicatorEngine.verify_parity(price_frame())
+
+        assert results
+        assert all(results.values()), {k: v for k, v in results.items() if not v}
+
+    def test_replay_max_error_is_small(self):
+        """許容誤差は実際の誤差に対して十分小さい値で、NaN の位置も一致する"""
+        df = price_frame()
+        engine = IncrementalIndicatorEngine()
+        replayed = engine.replay(df)
+        reference = engine.batch_reference(df)
+
+        pd.testing.assert_frame_equal(
+            replayed.isna(), reference.isna(), check_dtype=False
+        )
+        max_error = np.nanmax(np.abs(replayed.to_numpy() - reference.to_numpy()))
+        assert max_error <= PARITY_TOLERANCE
+
+    def test_restored_state_continues_bit_for_bit(self, tmp_path):
+        """保存・復元したエンジンは中断しなかった場合と同じ値を出力する"""
+        df = price_frame(600)
+        first, second = df.iloc[:400], df.iloc[400:]
+
+        continuous = IncrementalIndicatorEngine()
+        expected = continuous.replay(df).iloc[400:]
+
+        store = IndicatorStateStore(str(tmp_path))
+        engine = IncrementalIndicatorEngine()
+        engine.replay(first)
+        assert store.save(engine)
+
+        restored = store.load("USD/JPY", "5m")
+        assert restored is not None
+        actual = restored.replay(second)
+
+        np.testing.assert_array_equal(actual.to_numpy(), expected.to_numpy())
+
+    def test_already_applied_bar_is_ignored(self):
+        """適用済みの足は再適用されない"""
+        df = price_frame(50)
+        engine = IncrementalIndicatorEngine()
+        engine.replay(df)
+        bar_count = engine.bar_count
+
+        row = df.iloc[-1]
+        outputs = engine.update(df.index[-1], row["high"], row["low"], row["close"])
+
+        assert outputs == {}
+        assert engine.bar_count == bar_count
+
+    def test_default_timeframe_label(self):
+        """既定の時間足表記は price_data・technical_indicators と同じ 5m"""
+        assert IncrementalIndicatorEngine().timeframe == "5m"
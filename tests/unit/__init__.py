@@ -0,0 +1 @@
+# ユニットテスト
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+AIAnalysisService の一括レポート生成の単体テスト
+
+責任:
+- 同じ入力のレポートを再生成しないこと
+- キャッシュ・保存済みのレポートで保存・通知コールバックを呼ばないこと
+- 保存済みレポートの content_hash による重複排除
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+from src.domain.entities import AIReport
+from src.domain.services.ai_analysis.ai_analysis_service import AIAnalysisService
+
+
+class FakeOpenAIClient:
+    """テスト用 OpenAI クライアント"""
+
+    max_tokens = 100
+
+
+class FakePromptBuilder:
+    """テスト用プロンプトビルダー"""
+
+    TEMPLATE_VERSION = "test"
+
+
+class CountingReportService(AIAnalysisService):
+    """OpenAI 呼び出し（事前レポートの作成）の回数を数える AIAnalysisService"""
+
+    def __init__(self):
+        super().__init__(FakeOpenAIClient(), prompt_builder=FakePromptBuilder())
+        self.calls = 0
+
+    async def _build_pre_event_report(self, event):
+        self.calls += 1
+        await asyncio.sleep(0)
+        return AIReport(
+            report_type="pre_event",
+            report_content=f"report {event.event_id} {self.calls}",
+        )
+
+
+def create_event(event_id, forecast="1.0"):
+    """テスト用経済イベント"""
+    return SimpleNamespace(
+        event_id=event_id, forecast_value=forecast, actual_value=None
+    )
+
+
+class FakeReportStore:
+    """content_hash で検索できる保存先"""
+
+    def __init__(self):
+        self.reports = {}
+        self.saved = []
+
+    async def on_report(self, report):
+        self.saved.append(report)
+        self.reports[report.content_hash] = report
+
+    async def find_by_content_hash(self, content_hash):
+        return self.reports.get(content_hash)
+
+
+class TestBulkReportCache:
+    """一括レポート生成のキャッシュのテスト"""
+
+    def test_cache_hit_is_not_saved_again(self):
+        """同じ入力のレポートはプロセス内のキャッシュを使い、再保存・再通知しない"""
+        service = CountingReportService()
+        store = FakeReportStore()
+        events = [create_event("a"), create_event("b")]
+
+        async def run():
+            first = await service.generate_bulk_reports(
+                events, on_report=store.on_report
+            )
+            second = await service.generate_bulk_reports(
+                events, on_report=store.on_report
+            )
+            return first, second
+
+        first, second = asyncio.run(run())
+
+        assert service.calls == 2
+        assert len(store.saved) == 2
+        assert [r.report_content for r in second] == [
+            r.report_content for r in first
+        ]
+
+    def test_duplicate_events_in_one_batch(self):
+        """同じバッチ内の重複イベントは1回だけ生成・保存"""
+        service = CountingReportService()
+        store = FakeReportStore()
+
+        reports = asyncio.run(
+            service.generate_bulk_reports(
+                [create_event("a"), create_event("a")], on_report=store.on_report
+            )
+        )
+
+        assert len(reports) == 2
+        assert service.calls == 1
+        assert len(store.saved) == 1
+
+    def test_saved_report_is_reused_by_new_process(self):
+        """別プロセス（新しいサービス）でも保存済みレポートは再生成しない"""
+        store = FakeReportStore()
+        events = [create_event("a")]
+
+        first_service = CountingReportService()
+        asyncio.run(
+            first_service.generate_bulk_reports(
+                events,
+                on_report=store.on_report,
+                find_existing=store.find_by_content_hash,
+            )
+        )
+        second_service = CountingReportService()
+        reports = asyncio.run(
+            second_service.generate_bulk_reports(
+                events,
+                on_report=store.on_report,
+                find_existing=store.find_by_content_hash,
+            )
+        )
+
+        assert first_service.calls == 1
+        assert second_service.calls == 0
+        assert len(store.saved) == 1
+        assert reports[0].content_hash == store.saved[0].content_hash
+
+    def test_changed_input_is_regenerated(self):
+        """予想値が変わったイベントは再生成して保存"""
+        service = CountingReportService()
+        store = FakeReportStore()
+
+        async def run():
+            await service.generate_bulk_reports(
+                [create_event("a", "1.0")],
+                on_report=store.on_report,
+                find_existing=store.find_by_content_hash,
+            )
+            await service.generate_bulk_reports(
+                [create_event("a", "2.0")],
+                on_report=store.on_report,
+                find_existing=store.find_by_content_hash,
+            )
+
+        asyncio.run(run())
+
+        assert service.calls == 2
+        assert len(store.saved) == 2
+        assert store.saved[0].content_hash != store.saved[1].content_hash
+
+    def test_lookup_failure_falls_back_to_generation(self):
+        """保存済みレポートの検索に失敗した場合は生成する"""
+        service = CountingReportService()
+        store = FakeReportStore()
+
+        async def failing_lookup(content_hash):
+            raise RuntimeError("database unavailable")
+
+        reports = asyncio.run(
+            service.generate_bulk_reports(
+                [create_event("a")],
+                on_report=store.on_report,
+                find_existing=failing_lookup,
+            )
+        )
+
+        assert service.calls == 1
+        assert len(reports) == 1
+        assert len(store.saved) == 1
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+バックテストカーネルの単体テスト
+
+責任:
+- 1バーずつ処理する従来の BacktestEngine のループとの結果の一致
+- 取引がない場合・欠損値を含む場合の扱い
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from src.domain.services.optimization.backtest_kernel import (
+    DEFAULT_STRATEGY_PARAMS,
+    EXIT_REASONS,
+    BacktestArrays,
+    run_backtest_kernel,
+    simulate_backtest,
+)
+
+INITIAL_BALANCE = 10000.0
+COMMISSION_RATE = 0.0001
+
+PARAM_SETS = [
+    {},
+    {"rsi_oversold": 20, "rsi_overbought": 80, "risk_reward_ratio": 1.5},
+    {"rsi_oversold": 35, "rsi_overbought": 65, "risk_reward_ratio": 3.0},
+    {"rsi_oversold": 25, "max_position_size": 0.15, "risk_reward_ratio": 0.5},
+]
+
+
+def make_records(n=3000, seed=0):
+    """テスト用の過去データ（欠損・出来高ゼロのバーを含む）"""
+    rng = np.random.default_rng(seed)
+    close = 150 + np.cumsum(rng.normal(0, 0.2, n))
+    sma = np.convolve(close, np.ones(20) / 20, "same")
+    rsi = np.clip(50 + rng.normal(0, 15, n), 1, 99)
+    macd_histogram = rng.normal(0, 0.05, n)
+    start = datetime(2024, 1, 1)
+    records = [
+        {
+            "timestamp": start + timedelta(hours=i),
+            "close": float(close[i]),
+            "RSI": float(rsi[i]),
+            "SMA_20": float(sma[i]),
+            "MACD_histogram": float(macd_histogram[i]),
+            "volume": 0 if i % 50 == 0 else 100,
+        }
+        for i in range(n)
+    ]
+    for i in range(25, n, 97):
+        records[i]["RSI"] = None
+    return records
+
+
+def reference_backtest(records, strategy_params):
+    """従来の BacktestEngine._execute_backtest と同じ1バーずつのループ"""
+    params = {**DEFAULT_STRATEGY_PARAMS, **strategy_params}
+    balance = INITIAL_BALANCE
+    equity = []
+    trades = []
+    position = None
+
+    def close_position(exit_price, reason, index):
+        nonlocal balance
+        if position["type"] == "BUY":
+            pnl = exit_price - position["entry_price"]
+        else:
+            pnl = position["entry_price"] - exit_price
+        commission = position["position_size"] * exit_price * COMMISSION_RATE
+        balance += pnl - commission
+        trades.append(
+            (position["entry_index"], index, position["type"], exit_price, reason)
+        )
+
+    for i, data in enumerate(records):
+        price = data["close"]
+        equity.append(balance + (position["value"] if position else 0))
+
+        if position:
+            reason = None
+            if position["type"] == "BUY":
+                if price <= position["stop_loss"]:
+                    reason = "stop_loss"
+                elif price >= position["take_profit"]:
+                    reason = "take_profit"
+            else:
+                if price >= position["stop_loss"]:
+                    reason = "stop_loss"
+                elif price <= position["take_profit"]:
+                    reason = "take_profit"
+            if reason:
+                close_position(position[reason], reason, i)
+                position = None
+
+        if position or i <= 20:
+            continue
+        rsi, sma = data["RSI"], data["SMA_20"]
+        macd_histogram, volume = data["MACD_histogram"], data["volume"]
+        if not all([rsi, sma, macd_histogram, volume]):
+            continue
+
+        rr = params["risk_reward_ratio"] * 0.01
+        if rsi < params["rsi_oversold"] and price > sma and macd_histogram > 0:
+            signal = ("BUY", sma * 0.995, price * (1 + rr))
+        elif rsi > params["rsi_overbought"] and price < sma and macd_histogram < 0:
+            signal = ("SELL", sma * 1.005, price * (1 - rr))
+        else:
+            continue
+        size = balance * params["max_position_size"] / price
+        position = {
+            "type": signal[0],
+            "stop_loss": signal[1],
+            "take_profit": signal[2],
+            "entry_price": price,
+            "entry_index": i,
+            "position_size": size,
+            "value": size * price,
+        }
+
+    if position and records:
+        close_position(records[-1]["close"], "end_of_period", len(records) - 1)
+
+    return trades, np.array(equity), balance
+
+
+def reference_metrics(equity):
+    """従来の最大ドローダウン・シャープレシオの計算"""
+    peak, drawdown = equity[0], 0.0
+    for value in equity:
+        if value > peak:
+            peak = value
+        else:
+            drawdown = max(drawdown, (peak - value) / peak * 100)
+
+    returns = [
+        (equity[i] - equity[i - 1]) / equity[i - 1]
+        for i in range(1, len(equity))
+        if equity[i - 1] > 0
+    ]
+    std = np.std(returns)
+    sharpe = (np.mean(returns) - 0.02 / 252) / std * np.sqrt(252) if std > 0 else 0.0
+    return drawdown, sharpe
+
+
+@pytest.fixture(scope="module")
+def records():
+    """テスト用の過去データ"""
+    return make_records()
+
+
+@pytest.fixture(scope="module")
+def arrays(records):
+    """列指向データ"""
+    return BacktestArrays.from_records(records)
+
+
+class TestKernelEquivalence:
+    """従来のループとの一致"""
+
+    @pytest.mark.parametrize("params", PARAM_SETS)
+    def test_trades_and_equity_match(self, records, arrays, params):
+        """取引・エクイティカーブ・最終残高が一致する"""
+        trades, equity, final_balance = reference_backtest(records, params)
+        strategy_params = {**DEFAULT_STRATEGY_PARAMS, **params}
+        result = run_backtest_kernel(
+            arrays, strategy_params, INITIAL_BALANCE, COMMISSION_RATE
+        )
+
+        kernel_trades = [
+            (
+                int(result.entry_index[k]),
+                int(result.exit_index[k]),
+                "BUY" if result.is_buy[k] else "SELL",
+                float(result.exit_price[k]),
+                EXIT_REASONS[int(result.exit_reason[k])],
+            )
+            for k in range(result.total_trades)
+        ]
+        assert len(trades) > 10
+        assert [t[:3] + t[4:] for t in kernel_trades] == [
+            t[:3] + t[4:] for t in trades
+        ]
+        np.testing.assert_allclose(
+            [t[3] for t in kernel_trades], [t[3] for t in trades], rtol=1e-12
+        )
+        np.testing.assert_allclose(result.equity, equity, rtol=1e-12)
+        assert result.final_balance == pytest.approx(final_balance, rel=1e-12)
+
+    @pytest.mark.parametrize("params", PARAM_SETS)
+    def test_metrics_match(self, records, arrays, params):
+        """最大ドローダウン・シャープレシオ・リターンが一致する"""
+        trades, equity, final_balance = reference_backtest(records, params)
+        drawdown, sharpe = reference_metrics(equity)
+
+        strategy_params = {**DEFAULT_STRATEGY_PARAMS, **params}
+        metrics = simulate_backtest(
+            arrays, strategy_params, INITIAL_BALANCE, COMMISSION_RATE
+        )
+
+        assert metrics["total_trades"] == len(trades)
+        assert metrics["max_drawdown"] == pytest.approx(drawdown, rel=1e-9)
+        assert metrics["sharpe_ratio"] == pytest.approx(sharpe, rel=1e-9)
+        assert metrics["total_return"] == pytest.approx(
+            (final_balance - INITIAL_BALANCE) / INITIAL_BALANCE * 100, rel=1e-9
+        )
+
+
+class TestKernelEdgeCases:
+    """取引がない場合・欠損値"""
+
+    def test_no_trades(self, records):
+        """エントリー条件を満たさない場合は指標を0とする"""
+        arrays = BacktestArrays.from_records(records)
+        params = {**DEFAULT_STRATEGY_PARAMS, "rsi_oversold": 0, "rsi_overbought": 100}
+
+        metrics = simulate_backtest(arrays, params)
+
+        assert metrics["total_trades"] == 0
+        assert metrics["sharpe_ratio"] == 0.0
+        assert metrics["max_drawdown"] == 0.0
+        assert metrics["final_balance"] == INITIAL_BALANCE
+
+    def test_missing_and_zero_values_block_entry(self, records):
+        """欠損・ゼロの指標を含むバーではエントリーしない"""
+        arrays = BacktestArrays.from_records(records)
+        result = run_backtest_kernel(arrays, DEFAULT_STRATEGY_PARAMS)
+
+        assert arrays.valid[result.entry_index].all()
+        assert not arrays.valid[[i for i in range(25, len(records), 97)]].any()
+        assert not arrays.valid[::50].any()
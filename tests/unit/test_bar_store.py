@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+BarSeries・OHLCVBarStore の単体テスト
+
+責任:
+- バー列の追加・形成中バーの上書き・容量拡張とビューの扱い
+- DBからのリードスルーと同期間隔内の SQL 省略
+- 書き込み側からの追加反映と invalidate による再同期
+- 読み込み範囲より古い期間の補完
+"""
+
+import asyncio
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sa = pytest.importorskip("sqlalchemy")
+pytest.importorskip("prometheus_client")
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine  # noqa: E402
+from sqlalchemy.sql.sqltypes import NullType  # noqa: E402
+
+from src.infrastructure.cache.bar_store import BarSeries, OHLCVBarStore  # noqa: E402
+from src.infrastructure.database.models.price_data_model import (  # noqa: E402
+    PriceDataModel,
+)
+from src.infrastructure.database.repositories.price_data_repository_impl import (  # noqa: E402,E501
+    PriceDataRepositoryImpl,
+)
+
+STEP = timedelta(minutes=5)
+BASE_NS = pd.Timestamp("2026-01-05 09:00").value
+
+
+def ns(index):
+    """index 本目の5分足のタイムスタンプ（ns）"""
+    return BASE_NS + index * pd.Timedelta(STEP).value
+
+
+def bar(price):
+    return (price, price + 0.1, price - 0.1, price + 0.05, 100.0)
+
+
+class TestBarSeries:
+    """単一のバー列"""
+
+    def test_append_grows_and_keeps_old_views(self):
+        """容量を超えて追加しても、既に返したビューの値は変わらない"""
+        series = BarSeries(capacity=2)
+        series.append(ns(0), bar(150.0))
+        series.append(ns(1), bar(151.0))
+        view = series.view(0, 2)
+
+        for i in range(2, 7):
+            assert series.append(ns(i), bar(150.0 + i))
+
+        assert len(series) == 7
+        assert series.last_ns == ns(6)
+        assert view["open"].tolist() == [150.0, 151.0]
+        assert series.view(0, 7)["open"].tolist() == [150.0 + i for i in range(7)]
+
+    def test_append_same_timestamp_updates_forming_bar(self):
+        """最新バーと同じ時刻は上書きし、それより古い時刻は無視する"""
+        series = BarSeries()
+        series.append(ns(0), bar(150.0))
+        series.append(ns(1), bar(151.0))
+
+        assert series.append(ns(1), bar(152.0))
+        assert not series.append(ns(0), bar(140.0))
+        assert len(series) == 2
+        assert series.view(0, 2)["open"].tolist() == [150.0, 152.0]
+
+    def test_extend_skips_held_bars_and_batch_duplicates(self):
+        """保持済みのバーを除き、同一時刻は後勝ちで追加する"""
+        series = BarSeries()
+        series.extend(np.array([ns(0), ns(1)]), np.array([bar(150.0), bar(151.0)]))
+
+        added = series.extend(
+            np.array([ns(0), ns(1), ns(2), ns(2), ns(3)]),
+            np.array([bar(1.0), bar(161.0), bar(2.0), bar(162.0), bar(163.0)]),
+        )
+
+        assert added == 2
+        assert series.view(0, len(series))["open"].tolist() == [
+            150.0,
+            161.0,
+            162.0,
+            163.0,
+        ]
+
+    def test_prepend_adds_only_older_bars(self):
+        """保持範囲より古いバーのみ先頭に追加する"""
+        series = BarSeries(capacity=1)
+        series.extend(np.array([ns(2), ns(3)]), np.array([bar(152.0), bar(153.0)]))
+
+        added = series.prepend(
+            np.array([ns(0), ns(1), ns(2)]),
+            np.array([bar(150.0), bar(151.0), bar(999.0)]),
+        )
+
+        assert added == 2
+        assert series.view(0, 4)["open"].tolist() == [150.0, 151.0, 152.0, 153.0]
+
+    def test_view_is_zero_copy_and_read_only_for_store(self):
+        """ビューは内部バッファを共有し、ビューへの書き込みはストアに波及しない"""
+        series = BarSeries()
+        for i in range(5):
+            series.append(ns(i), bar(150.0 + i))
+        lo, hi = series.bounds(ns(1), ns(3))
+        view = series.view(lo, hi)
+
+        assert (lo, hi) == (1, 4)
+        assert list(view.index.asi8) == [ns(1), ns(2), ns(3)]
+        assert np.shares_memory(view["close"].to_numpy(), series._values)
+
+        view.loc[view.index[0], "close"] = 0.0
+
+        assert series.view(1, 2)["close"].iloc[0] == pytest.approx(151.05)
+
+
+# ----------------------------------------------------------------------
+# DB連携
+# ----------------------------------------------------------------------
+
+
+def now_floor():
+    """直近の5分足の開始時刻（初回同期の読み込み範囲に入る時刻）"""
+    return pd.Timestamp.now().floor("5min").to_pydatetime() - timedelta(days=1)
+
+
+def price_rows(start, positions):
+    """ingest_batch 用のDataFrame"""
+    return pd.DataFrame(
+        {
+            "timestamp": [start + STEP * i for i in positions],
+            "currency_pair": "USD/JPY",
+            "open_price": [150.0 + i for i in positions],
+            "high_price": [150.5 + i for i in positions],
+            "low_price": [149.5 + i for i in positions],
+            "close_price": [150.2 + i for i in positions],
+            "volume": 10,
+            "data_source": "yahoo_finance_5m",
+            "timeframe": "5m",
+        }
+    )
+
+
+def create_price_table(sync_conn):
+    """price_data を作成（型未指定のカラムは SQLite で DDL を生成できないため補う）"""
+    metadata = sa.MetaData()
+    table = PriceDataModel.__table__.to_metadata(metadata)
+    for column in table.columns:
+        if isinstance(column.type, NullType):
+            column.type = (
+                sa.Boolean() if column.name.endswith("_calculated") else sa.Integer()
+            )
+    metadata.create_all(sync_conn)
+
+
+def run(scenario):
+    """一時的な SQLite データベース上でシナリオを実行"""
+    pytest.importorskip("aiosqlite")
+
+    async def main():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(create_price_table)
+        try:
+            async with AsyncSession(engine, expire_on_commit=False) as session:
+                return await scenario(session, PriceDataRepositoryImpl(session))
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(main())
+
+
+class TestOHLCVBarStore:
+    """DBからのリードスルー"""
+
+    def test_read_through_and_sql_skipped_within_interval(self):
+        """初回はDBから読み込み、同期間隔内の読み出しは SQL を発行しない"""
+        start = now_floor()
+
+        async def scenario(session, repo):
+            await repo.ingest_batch(price_rows(start, range(6)))
+            store = OHLCVBarStore(min_sync_interval=60)
+            first = await store.get_frame(session, "USD/JPY", "5m")
+            await repo.ingest_batch(price_rows(start, range(6, 8)))
+            second = await store.get_frame(session, "USD/JPY", "M5", limit=2)
+            return first, second, store.get_statistics()
+
+        first, second, stats = run(scenario)
+
+        assert list(first.columns) == ["open", "high", "low", "close", "volume"]
+        assert first["open"].tolist() == [150.0 + i for i in range(6)]
+        assert first.index[0] == pd.Timestamp(start)
+        assert second["open"].tolist() == [154.0, 155.0]
+        assert stats["syncs"] == 1
+        assert stats["sql_skipped"] == 1
+        assert stats["series"] == {"USD/JPY:5m": 6}
+
+    def test_invalidate_loads_only_new_bars(self):
+        """invalidate 後の読み出しで保持済み最新バー以降を差分同期する"""
+        start = now_floor()
+
+        async def scenario(session, repo):
+            await repo.ingest_batch(price_rows(start, range(6)))
+            store = OHLCVBarStore(min_sync_interval=60)
+            await store.get_frame(session, "USD/JPY", "5m")
+            await repo.ingest_batch(price_rows(start, range(6, 9)))
+            store.invalidate("USD/JPY", "M5")
+            frame = await store.get_frame(
+                session, "USD/JPY", "5m", start=start + STEP * 4
+            )
+            latest = await store.get_latest_bar(session, "USD/JPY", "5m")
+            return frame, latest, store.get_statistics()
+
+        frame, latest, stats = run(scenario)
+
+        assert frame["open"].tolist() == [154.0, 155.0, 156.0, 157.0, 158.0]
+        assert latest["timestamp"] == start + STEP * 8
+        assert latest["close"] == pytest.approx(158.2)
+        assert stats["syncs"] == 2
+        assert stats["rows_loaded"] == 9
+
+    def test_append_is_ignored_until_first_sync(self):
+        """DB未同期の列への追加は反映せず、同期後の追加は読み出しに反映する"""
+        start = now_floor()
+
+        async def scenario(session, repo):
+            await repo.ingest_batch(price_rows(start, range(3)))
+            store = OHLCVBarStore(min_sync_interval=60)
+            before_sync = store.append("USD/JPY", "5m", start, *bar(1.0))
+            await store.sync(session, "USD/JPY", "5m")
+            appended = store.append("USD/JPY", "5m", start + STEP * 3, *bar(153.0))
+            frame = await store.get_frame(session, "USD/JPY", "5m")
+            return before_sync, appended, frame
+
+        before_sync, appended, frame = run(scenario)
+
+        assert not before_sync
+        assert appended
+        assert frame["open"].tolist() == [150.0, 151.0, 152.0, 153.0]
+
+    def test_backfills_range_older_than_loaded(self):
+        """読み込み済み範囲より古い開始時刻を指定すると不足分を補う"""
+        start = now_floor() - timedelta(days=3)
+
+        async def scenario(session, repo):
+            await repo.ingest_batch(price_rows(start, range(0, 1000, 100)))
+            store = OHLCVBarStore(min_sync_interval=60, initial_lookback_days=2)
+            recent = await store.get_frame(session, "USD/JPY", "5m")
+            full = await store.get_frame(session, "USD/JPY", "5m", start=start)
+            return recent, full
+
+        recent, full = run(scenario)
+
+        assert len(recent) < 10
+        assert full["open"].tolist() == [150.0 + i for i in range(0, 1000, 100)]
+        assert full.index.is_monotonic_increasing
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+CacheManager.get_or_load の単体テスト
+
+責任:
+- 鮮度期限をエントリと一緒にファイルキャッシュへ保存すること
+- 別プロセスからも期限切れを判定してバックグラウンド更新すること
+- 直接保存したエントリの鮮度期限の扱い
+"""
+
+import asyncio
+
+import pytest
+
+from src.infrastructure.cache import cache_manager as cache_manager_module
+from src.infrastructure.cache.cache_manager import FRESH_UNTIL_SUFFIX, CacheManager
+
+
+def create_manager(cache_dir):
+    """ファイルキャッシュを共有する CacheManager（プロセスごとに1つ作られる想定）"""
+    return CacheManager(
+        analysis_cache_repository=None,
+        file_cache_dir=str(cache_dir),
+    )
+
+
+class CountingLoader:
+    """呼び出し回数を数える読み込み関数"""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        return {"version": self.calls}
+
+
+async def drain_background_tasks():
+    """バックグラウンド更新の完了を待つ"""
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+class TestGetOrLoadFreshness:
+    """get_or_load の鮮度期限のテスト"""
+
+    def test_fresh_entry_is_served_without_reload(self, tmp_path):
+        """鮮度期限内のエントリは再読み込みしない"""
+        loader = CountingLoader()
+
+        async def run():
+            manager = create_manager(tmp_path)
+            first = await manager.get_or_load(
+                "data", {"key": "a"}, loader, ttl_seconds=60, stale_ttl_seconds=600
+            )
+            second = await manager.get_or_load(
+                "data", {"key": "a"}, loader, ttl_seconds=60, stale_ttl_seconds=600
+            )
+            await drain_background_tasks()
+            return first, second
+
+        first, second = asyncio.run(run())
+
+        assert first == second == {"version": 1}
+        assert loader.calls == 1
+
+    def test_stale_entry_is_refreshed_by_new_process(self, tmp_path, monkeypatch):
+        """鮮度期限切れは別プロセス（新しい CacheManager）でも判定される"""
+        loader = CountingLoader()
+
+        async def load_first():
+            manager = create_manager(tmp_path)
+            await manager.get_or_load(
+                "data", {"key": "a"}, loader, ttl_seconds=60, stale_ttl_seconds=600
+            )
+
+        asyncio.run(load_first())
+
+        # 鮮度期限（60秒）経過後、ファイルキャッシュ上のエントリはまだ有効
+        now = cache_manager_module.time.time()
+        monkeypatch.setattr(cache_manager_module.time, "time", lambda: now + 120)
+
+        async def load_in_new_process():
+            manager = create_manager(tmp_path)
+            data = await manager.get_or_load(
+                "data", {"key": "a"}, loader, ttl_seconds=60, stale_ttl_seconds=600
+            )
+            await drain_background_tasks()
+            statistics = await manager.get_statistics()
+            return data, statistics["single_flight"]
+
+        data, statistics = asyncio.run(load_in_new_process())
+
+        assert data == {"version": 1}
+        assert loader.calls == 2
+        assert statistics["stale_hits"] == 1
+        assert statistics["background_refreshes"] == 1
+
+    def test_fresh_until_is_stored_with_entry(self, tmp_path):
+        """鮮度期限はメモリ上の辞書ではなくキャッシュ層に保存される"""
+        loader = CountingLoader()
+
+        async def run():
+            manager = create_manager(tmp_path)
+            await manager.get_or_load(
+                "data", {"key": "a"}, loader, ttl_seconds=60, stale_ttl_seconds=600
+            )
+            return manager
+
+        manager = asyncio.run(run())
+        cache_key = manager._generate_cache_key("data", {"key": "a"})
+
+        assert not hasattr(manager, "_fresh_until")
+        assert manager.file_cache.get(cache_key + FRESH_UNTIL_SUFFIX) is not None
+
+    def test_direct_set_clears_fresh_until(self, tmp_path):
+        """set で直接保存したエントリは TTL まで新鮮とみなす"""
+        loader = CountingLoader()
+
+        async def run():
+            manager = create_manager(tmp_path)
+            await manager.get_or_load(
+                "data", {"key": "a"}, loader, ttl_seconds=60, stale_ttl_seconds=600
+            )
+            await manager.set("data", {"key": "a"}, {"version": "direct"})
+            cache_key = manager._generate_cache_key("data", {"key": "a"})
+            return manager.file_cache.get(cache_key + FRESH_UNTIL_SUFFIX)
+
+        assert asyncio.run(run()) is None
+
+    @pytest.mark.parametrize("empty", [None, []])
+    def test_empty_result_is_not_cached(self, tmp_path, empty):
+        """None や空のデータはキャッシュしない"""
+        calls = []
+
+        async def loader():
+            calls.append(1)
+            return empty
+
+        async def run():
+            manager = create_manager(tmp_path)
+            for _ in range(2):
+                await manager.get_or_load("data", {"key": "a"}, loader)
+
+        asyncio.run(run())
+
+        assert len(calls) == 2
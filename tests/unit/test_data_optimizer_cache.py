@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+DataOptimizer の履歴データキャッシュの単体テスト
+
+責任:
+- キャッシュ経由で取得した DataFrame の DatetimeIndex の復元
+- JSON ファイルキャッシュに保存できる形式であること
+- 空の履歴データはキャッシュせずに空の DataFrame として返すこと
+"""
+
+import asyncio
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.infrastructure.cache.cache_manager import CacheManager
+from src.infrastructure.optimization.data_optimizer import DataOptimizer
+
+
+def ohlcv_frame(tz=None):
+    """テスト用 OHLCV DataFrame（yfinance と同じく日時インデックス）"""
+    index = pd.date_range("2026-01-05", periods=72, freq="h", tz=tz, name="Date")
+    close = 150 + np.random.default_rng(0).standard_normal(72).cumsum()
+    return pd.DataFrame(
+        {
+            "Open": close,
+            "High": close + 0.1,
+            "Low": close - 0.1,
+            "Close": close,
+            "Volume": np.arange(72, dtype=float),
+        },
+        index=index,
+    )
+
+
+class TestDataFrameCacheFormat:
+    """DataFrame のキャッシュ形式のテスト"""
+
+    @pytest.mark.parametrize("tz", [None, "UTC", "Asia/Tokyo"])
+    def test_round_trip_restores_datetime_index(self, tz):
+        """JSON 経由で保存・復元しても DatetimeIndex が保たれる"""
+        frame = ohlcv_frame(tz)
+
+        cached = json.loads(json.dumps(DataOptimizer._dataframe_to_cache(frame)))
+        restored = DataOptimizer._dataframe_from_cache(cached)
+
+        assert isinstance(restored.index, pd.DatetimeIndex)
+        assert restored.index.name == "Date"
+        assert str(restored.index.tz) == str(frame.index.tz)
+        pd.testing.assert_frame_equal(
+            restored, frame, check_index_type=False, check_freq=False
+        )
+        # 期間での絞り込み（integrated_reporter の時間足チャート）が使える
+        assert len(restored.loc[restored.index >= frame.index[24]]) == 48
+
+    def test_unnamed_index(self):
+        """名前のないインデックスも復元される"""
+        frame = ohlcv_frame()
+        frame.index.name = None
+
+        restored = DataOptimizer._dataframe_from_cache(
+            DataOptimizer._dataframe_to_cache(frame)
+        )
+
+        assert restored.index.name is None
+        assert list(restored.columns) == list(frame.columns)
+
+    def test_legacy_record_list(self):
+        """旧形式（レコードのリスト）のキャッシュも読み込める"""
+        records = [{"Close": 1.0}, {"Close": 2.0}]
+
+        restored = DataOptimizer._dataframe_from_cache(records)
+
+        assert restored["Close"].tolist() == [1.0, 2.0]
+
+
+class DirectRateLimiter:
+    """待機・リトライなしで呼び出すレート制限"""
+
+    async def execute_with_retry(self, api_name, func, *args, **kwargs):
+        return await func(*args, **kwargs)
+
+
+class HistoryClient:
+    """呼び出し回数を数える Yahoo Finance クライアント"""
+
+    def __init__(self, frame):
+        self.frame = frame
+        self.calls = 0
+
+    async def get_historical_data(self, currency_pair, period, interval):
+        self.calls += 1
+        await asyncio.sleep(0)
+        return self.frame
+
+
+def create_optimizer(cache_dir, client):
+    cache_manager = CacheManager(
+        analysis_cache_repository=None, file_cache_dir=str(cache_dir)
+    )
+    return DataOptimizer(cache_manager, DirectRateLimiter(), None, client)
+
+
+class TestHistoricalDataFrame:
+    """get_historical_dataframe のテスト"""
+
+    def test_cached_frame_is_served_without_refetch(self, tmp_path):
+        """2回目の取得はキャッシュから DatetimeIndex 付きで返す"""
+        client = HistoryClient(ohlcv_frame())
+        optimizer = create_optimizer(tmp_path, client)
+
+        async def run():
+            first = await optimizer.get_historical_dataframe("USD/JPY", "5d", "1h")
+            second = await optimizer.get_historical_dataframe("USD/JPY", "5d", "1h")
+            return first, second
+
+        first, second = asyncio.run(run())
+
+        assert client.calls == 1
+        assert isinstance(second.index, pd.DatetimeIndex)
+        pd.testing.assert_frame_equal(
+            second, first, check_index_type=False, check_freq=False
+        )
+
+    @pytest.mark.parametrize("use_cache", [True, False])
+    def test_empty_frame_is_returned_not_cached(self, tmp_path, use_cache):
+        """空の履歴データは None ではなく空の DataFrame を返し、キャッシュしない"""
+        client = HistoryClient(ohlcv_frame().iloc[:0])
+        optimizer = create_optimizer(tmp_path, client)
+
+        async def run():
+            return [
+                await optimizer.get_historical_dataframe(
+                    "USD/JPY", "5d", "1h", use_cache=use_cache
+                )
+                for _ in range(2)
+            ]
+
+        results = asyncio.run(run())
+
+        assert client.calls == 2
+        for result in results:
+            assert isinstance(result, pd.DataFrame) and result.empty
+
+    def test_concurrent_callers_share_empty_frame(self, tmp_path):
+        """同時に取得した呼び出し元は1回の取得結果（空の DataFrame）を共有する"""
+        client = HistoryClient(ohlcv_frame().iloc[:0])
+        optimizer = create_optimizer(tmp_path, client)
+
+        async def run():
+            return await asyncio.gather(
+                *[
+                    optimizer.get_historical_dataframe("USD/JPY", "5d", "1h")
+                    for _ in range(3)
+                ]
+            )
+
+        results = asyncio.run(run())
+
+        assert client.calls == 1
+        assert all(isinstance(result, pd.DataFrame) for result in results)
+        assert all(result.empty for result in results)
+
+    def test_fetch_failure_returns_none(self, tmp_path):
+        """取得できなかった場合は None を返す"""
+        client = HistoryClient(None)
+        optimizer = create_optimizer(tmp_path, client)
+
+        result = asyncio.run(optimizer.get_historical_dataframe("USD/JPY", "5d", "1h"))
+
+        assert result is None
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+DiscordDeliveryQueue の単体テスト
+
+責任:
+- 2xx 応答を本文に関係なく送信済みとして扱うこと
+- 想定外のエラーでもワーカーが止まらないこと
+- deliver() の待機タイムアウトと停止時の待機解除
+"""
+
+import asyncio
+import json
+
+from src.infrastructure.messaging.delivery_queue import DiscordDeliveryQueue
+
+WEBHOOK_URL = "https://discord.example/api/webhooks/1/token"
+
+
+class FakeResponse:
+    """aiohttp の応答の代わり"""
+
+    def __init__(self, status, body=None, text=None):
+        self.status = status
+        self.headers = {}
+        self._body = body
+        self._text = text if text is not None else json.dumps(body)
+
+    async def json(self, content_type="application/json"):
+        if self._body is None:
+            return json.loads(self._text)
+        return self._body
+
+    async def text(self):
+        return self._text
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class FakeSession:
+    """応答（または例外）を順に返すセッション"""
+
+    def __init__(self, responses, default=None):
+        self.responses = list(responses)
+        self.default = default
+        self.posts = []
+        self.closed = False
+
+    def post(self, url, params=None, json=None):
+        self.posts.append(json)
+        outcome = self.responses.pop(0) if self.responses else self.default
+        if isinstance(outcome, BaseException):
+            raise outcome
+        if callable(outcome):
+            return outcome()
+        return outcome
+
+
+def make_queue(session, **kwargs):
+    kwargs.setdefault("batch_window_seconds", 0)
+    kwargs.setdefault("retry_base_seconds", 0.001)
+    return DiscordDeliveryQueue(WEBHOOK_URL, session=session, **kwargs)
+
+
+class TestSuccessfulResponses:
+    """2xx 応答の扱い"""
+
+    def test_unreadable_200_body_is_not_resent(self):
+        """200 の本文が JSON でなくても再送しない"""
+
+        async def scenario():
+            session = FakeSession([FakeResponse(200, text="<html>ok</html>")])
+            queue = make_queue(session)
+            result = await queue.deliver([{"title": "a"}, {"title": "b"}])
+            await queue.stop()
+            return session, queue, result
+
+        session, queue, result = asyncio.run(scenario())
+
+        assert len(session.posts) == 1
+        assert all(message_id for message_id in result)
+        assert queue.embeds_delivered == 2
+        assert queue.retries == 0
+
+    def test_other_2xx_statuses_are_delivered(self):
+        """201・204 も送信済みとして扱う"""
+
+        async def scenario():
+            session = FakeSession(
+                [FakeResponse(201, {"id": "42"}), FakeResponse(204, text="")]
+            )
+            queue = make_queue(session)
+            first = await queue.deliver([{"title": "a"}])
+            second = await queue.deliver([{"title": "b"}])
+            await queue.stop()
+            return session, queue, first, second
+
+        session, queue, first, second = asyncio.run(scenario())
+
+        assert len(session.posts) == 2
+        assert first == ["42"]
+        assert second[0] is not None
+        assert queue.retries == 0
+
+
+class TestWorkerResilience:
+    """ワーカーの耐障害性"""
+
+    def test_unexpected_error_fails_batch_and_keeps_worker(self):
+        """想定外の例外でバッチは失敗扱いになり、後続は送信される"""
+
+        async def scenario():
+            session = FakeSession(
+                [FakeResponse(200, {"id": "1"})], default=FakeResponse(200, {"id": "2"})
+            )
+            queue = make_queue(session)
+
+            async def broken_send(url, batch):
+                queue._send_batch = original
+                raise RuntimeError("boom")
+
+            original = queue._send_batch
+            queue._send_batch = broken_send
+            failed = await queue.deliver([{"title": "a"}], timeout=1)
+            delivered = await queue.deliver([{"title": "b"}], timeout=1)
+            worker_alive = not queue._worker.done()
+            await queue.stop()
+            return queue, failed, delivered, worker_alive
+
+        queue, failed, delivered, worker_alive = asyncio.run(scenario())
+
+        assert failed == [None]
+        assert delivered == ["1"]
+        assert worker_alive
+        assert queue.embeds_failed == 1
+
+    def test_deliver_times_out_and_keeps_item_queued(self):
+        """送信が終わらなければ None を返し、通知はキューに残る"""
+
+        async def scenario():
+            release = asyncio.Event()
+
+            class SlowResponse(FakeResponse):
+                async def __aenter__(self):
+                    await release.wait()
+                    return self
+
+            session = FakeSession([], default=lambda: SlowResponse(200, {"id": "9"}))
+            queue = make_queue(session)
+            result = await queue.deliver([{"title": "a"}], timeout=0.05)
+            pending_after_timeout = queue.pending_count() + len(session.posts)
+            release.set()
+            flushed = await queue.flush(timeout=1)
+            await queue.stop()
+            return queue, result, pending_after_timeout, flushed
+
+        queue, result, pending_after_timeout, flushed = asyncio.run(scenario())
+
+        assert result == [None]
+        assert pending_after_timeout == 1
+        assert flushed
+        assert queue.embeds_delivered == 1
+        assert queue._waiters == {}
+
+    def test_stop_releases_waiters(self):
+        """停止すると待機中の deliver() に None が返る"""
+
+        async def scenario():
+            never = asyncio.Event()
+
+            class HangingResponse(FakeResponse):
+                async def __aenter__(self):
+                    await never.wait()
+                    return self
+
+            session = FakeSession([], default=lambda: HangingResponse(200, {}))
+            queue = make_queue(session, deliver_timeout_seconds=None)
+            waiting = asyncio.create_task(queue.deliver([{"title": "a"}]))
+            await asyncio.sleep(0.05)
+            await queue.stop(flush_timeout=0)
+            return await asyncio.wait_for(waiting, timeout=1)
+
+        assert asyncio.run(scenario()) == [None]
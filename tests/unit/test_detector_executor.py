@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+DetectorExecutor の単体テスト
+
+責任:
+- デフォルトの実行方式（thread）
+- タイムアウト・例外の検出器単位の分離
+- タイムアウトした検出器のスレッドを増やさないこと
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.infrastructure.analysis.detector_executor import (
+    STATUS_ERROR,
+    STATUS_OK,
+    STATUS_TIMEOUT,
+    DetectorExecutor,
+)
+
+
+class HitDetector:
+    """常に検出する検出器"""
+
+    def detect(self, data):
+        return {"pattern_name": "hit", "value": data["value"]}
+
+
+class FailingDetector:
+    """例外を送出する検出器"""
+
+    def detect(self, data):
+        raise ValueError("bad data")
+
+
+class BlockingDetector:
+    """解放されるまで終わらない検出器"""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.calls = 0
+
+    def detect(self, data):
+        self.calls += 1
+        self.release.wait(10)
+        return None
+
+
+def detector_threads():
+    """検出器スレッドの数"""
+    return sum(
+        thread.name.startswith("pattern-detector")
+        for thread in threading.enumerate()
+    )
+
+
+class TestDetectorExecutor:
+    """DetectorExecutor のテスト"""
+
+    def test_default_mode_is_thread(self):
+        """デフォルトはスレッドプール（マルチスレッドのプロセスから fork しない）"""
+        assert DetectorExecutor({}).mode == "thread"
+
+    def test_unknown_mode_is_rejected(self):
+        """未対応の実行方式はエラー"""
+        with pytest.raises(ValueError):
+            DetectorExecutor({}, mode="cluster")
+
+    @pytest.mark.parametrize("mode", ["thread", "inline"])
+    def test_errors_are_isolated(self, mode):
+        """例外は検出器単位で記録され、他の検出器の結果は返る"""
+        executor = DetectorExecutor(
+            {1: HitDetector(), 2: FailingDetector()}, mode=mode
+        )
+
+        outcomes = asyncio.run(executor.run({"value": 1}))
+        executor.close()
+
+        assert outcomes[1].status == STATUS_OK
+        assert outcomes[1].result == {"pattern_name": "hit", "value": 1}
+        assert outcomes[2].status == STATUS_ERROR
+        assert "bad data" in outcomes[2].error
+        assert executor.get_statistics()[2]["errors"] == 1
+
+    def test_timed_out_detector_does_not_leak_threads(self):
+        """タイムアウトした検出器は終わるまで再実行せず、スレッドが増えない"""
+        blocking = BlockingDetector()
+        executor = DetectorExecutor(
+            {1: HitDetector(), 2: blocking}, timeout_seconds=0.1
+        )
+
+        try:
+            runs = [asyncio.run(executor.run({"value": i})) for i in range(5)]
+            threads = detector_threads()
+        finally:
+            blocking.release.set()
+            executor.close()
+
+        assert [run[1].status for run in runs] == [STATUS_OK] * 5
+        assert [run[2].status for run in runs] == [STATUS_TIMEOUT] * 5
+        assert blocking.calls == 1
+        assert threads <= 2
+        assert executor.get_statistics()[2]["timeouts"] == 5
+
+    def test_detector_runs_again_after_slow_run_finishes(self):
+        """遅れていた実行が終われば次回は再び実行される"""
+        blocking = BlockingDetector()
+        executor = DetectorExecutor({1: blocking}, timeout_seconds=0.1)
+
+        try:
+            first = asyncio.run(executor.run({}))
+            blocking.release.set()
+            time.sleep(0.05)
+            second = asyncio.run(executor.run({}))
+        finally:
+            executor.close()
+
+        assert first[1].status == STATUS_TIMEOUT
+        assert second[1].status == STATUS_OK
+        assert blocking.calls == 2
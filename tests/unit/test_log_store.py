@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+SegmentedLogStore の単体テスト
+
+責任:
+- インデックスを使った統計・検索
+- 複数プロセスから同じディレクトリへ書き込んだ場合のインデックスの整合性
+- プロセス終了時のキューの書き切り
+"""
+
+import json
+import multiprocessing
+import subprocess
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from src.infrastructure.monitoring.log_store import INDEX_SUFFIX, SegmentedLogStore
+
+BASE_TIME = datetime(2026, 10, 1, 12, 0, 0)
+
+
+def make_entry(minutes: int, level: str = "INFO", event_type: str = "fetch"):
+    """テスト用ログエントリ"""
+    return {
+        "timestamp": (BASE_TIME + timedelta(minutes=minutes)).isoformat(),
+        "event_type": event_type,
+        "message": f"event {minutes}",
+        "level": level,
+        "additional_data": {},
+    }
+
+
+def write_entries(directory: str, offset: int, count: int) -> None:
+    """別プロセスからエントリを書き込む"""
+    store = SegmentedLogStore(directory, flush_interval=0.01, max_batch_size=7)
+    for i in range(count):
+        store.append(make_entry(offset + i * 2))
+    store.close()
+
+
+@pytest.fixture
+def store(tmp_path):
+    """SegmentedLogStore インスタンス"""
+    store = SegmentedLogStore(str(tmp_path), flush_interval=0.01)
+    yield store
+    store.close()
+
+
+class TestSegmentedLogStore:
+    """SegmentedLogStore のテスト"""
+
+    def test_summarize_and_search(self, store):
+        """インデックスとセグメントから統計・検索結果を作成"""
+        for minutes in range(0, 180, 10):
+            level = "ERROR" if minutes % 60 == 0 else "INFO"
+            store.append(make_entry(minutes, level=level))
+
+        since = (BASE_TIME + timedelta(minutes=30)).isoformat()
+        summary = store.summarize(since)
+
+        assert summary["count"] == 14
+        assert summary["levels"] == {"INFO": 12, "ERROR": 2}
+        assert summary["error_event_types"] == {"fetch": 2}
+        assert len(store.search("EVENT 1", since, level="ERROR")) == 1
+        assert store.get_segment_info()["segments"] == 3
+
+    def test_counts_from_other_instance_are_visible(self, tmp_path, store):
+        """別インスタンス（別プロセス相当）が書き込んだ件数も統計に含まれる"""
+        store.append(make_entry(0))
+        store.flush()
+
+        other = SegmentedLogStore(str(tmp_path), flush_interval=0.01)
+        other.append(make_entry(1))
+        other.close()
+        store.append(make_entry(2))
+        store.flush()
+
+        assert store.summarize(BASE_TIME.isoformat())["count"] == 2
+        assert store.summarize("2026-10-01T11:00:00")["count"] == 3
+        index = json.loads(
+            next(Path(tmp_path).glob(f"*{INDEX_SUFFIX}")).read_text(encoding="utf-8")
+        )
+        assert index["count"] == 3
+
+    def test_concurrent_processes_do_not_lose_counts(self, tmp_path):
+        """複数プロセスが同じセグメントに書き込んでもインデックスの件数が一致"""
+        context = multiprocessing.get_context("spawn")
+        processes = [
+            context.Process(target=write_entries, args=(str(tmp_path), offset, 50))
+            for offset in range(4)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(timeout=60)
+            assert process.exitcode == 0
+
+        reader = SegmentedLogStore(str(tmp_path))
+        try:
+            summary = reader.summarize("2026-10-01T00:00:00")
+            lines = sum(
+                len(path.read_text(encoding="utf-8").splitlines())
+                for path in Path(tmp_path).glob("*.jsonl")
+            )
+        finally:
+            reader.close()
+
+        assert lines == 200
+        assert summary["count"] == 200
+
+    def test_rebuilds_missing_index(self, tmp_path, store):
+        """インデックスのないセグメントは読み込み時に再構築"""
+        for minutes in range(5):
+            store.append(make_entry(minutes))
+        store.close()
+        for path in Path(tmp_path).glob(f"*{INDEX_SUFFIX}"):
+            path.unlink()
+
+        reopened = SegmentedLogStore(str(tmp_path))
+        try:
+            assert reopened.summarize("2026-10-01T00:00:00")["count"] == 5
+        finally:
+            reopened.close()
+
+    def test_queue_is_flushed_at_exit(self, tmp_path):
+        """close を呼ばずにプロセスが終了してもキューのエントリは保存される"""
+        script = (
+            "from src.infrastructure.monitoring.log_store import SegmentedLogStore\n"
+            f"store = SegmentedLogStore({str(tmp_path)!r}, flush_interval=5)\n"
+            "for i in range(100):\n"
+            "    store.append({'timestamp': '2026-10-01T12:00:%02d' % (i % 60),"
+            " 'event_type': 'fetch', 'message': 'm', 'level': 'INFO'})\n"
+        )
+        subprocess.run(
+            [sys.executable, "-c", script],
+            check=True,
+            cwd=Path(__file__).resolve().parents[2],
+        )
+
+        lines = (Path(tmp_path) / "events-2026100112.jsonl").read_text(
+            encoding="utf-8"
+        )
+        assert len(lines.splitlines()) == 100
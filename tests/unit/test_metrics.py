@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Prometheus メトリクスの単体テスト
+
+責任:
+- 記録関数・observe_query が共有レジストリ（REGISTRY）の値を更新すること
+- 記録関数が例外を送出しないこと
+- /metrics が認証なしで Prometheus テキスト形式を返すこと
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("prometheus_client")
+
+from src.infrastructure.monitoring import metrics  # noqa: E402
+from src.infrastructure.monitoring.metrics import (  # noqa: E402
+    REGISTRY,
+    observe_cycle,
+    observe_query,
+    observe_stage,
+    record_api_call,
+    record_cache_lookup,
+    record_rate_limit_wait,
+    render_latest,
+)
+
+
+def sample(name, **labels):
+    """REGISTRY のサンプル値（未記録は0）"""
+    return REGISTRY.get_sample_value(f"exchange_analytics_{name}", labels) or 0.0
+
+
+class TestMetricHelpers:
+    """記録関数"""
+
+    def test_observe_stage(self):
+        """ステージの処理時間とエラー数を記録する"""
+        before = sample("pipeline_stage_duration_seconds_count", stage="test_stage")
+        errors = sample("pipeline_stage_errors_total", stage="test_stage")
+        bucket = {"stage": "test_stage", "le": "0.25"}
+        fast = sample("pipeline_stage_duration_seconds_bucket", **bucket)
+
+        observe_stage("test_stage", 0.2)
+        observe_stage("test_stage", 0.7, error=True)
+
+        assert (
+            sample("pipeline_stage_duration_seconds_count", stage="test_stage")
+            == before + 2
+        )
+        assert sample("pipeline_stage_duration_seconds_bucket", **bucket) == fast + 1
+        assert sample("pipeline_stage_errors_total", stage="test_stage") == errors + 1
+
+    def test_observe_cycle_sets_tick_lag(self):
+        """サイクル時間を記録し、開始遅延を上書きする"""
+        before = sample("pipeline_cycle_duration_seconds_count", pipeline="test")
+
+        observe_cycle("test", 12.0, tick_lag_seconds=3.5)
+        observe_cycle("test", 8.0)
+
+        assert (
+            sample("pipeline_cycle_duration_seconds_count", pipeline="test")
+            == before + 2
+        )
+        assert sample("pipeline_tick_lag_seconds") == 3.5
+
+    def test_cache_and_api_counters(self):
+        """キャッシュ参照・API呼び出し・レート制限待機を記録する"""
+        hits = sample("cache_requests_total", tier="test_tier", result="hit")
+        misses = sample("cache_requests_total", tier="test_tier", result="miss")
+        calls = sample("api_calls_total", client="test_client", outcome="success")
+        waits = sample("api_rate_limit_waits_total", client="test_client")
+        waited = sample("api_rate_limit_wait_seconds_total", client="test_client")
+
+        record_cache_lookup("test_tier", True)
+        record_cache_lookup("test_tier", True)
+        record_cache_lookup("test_tier", False)
+        record_api_call("test_client", "success", 0.03)
+        record_rate_limit_wait("test_client", 1.5)
+
+        assert sample("cache_requests_total", tier="test_tier", result="hit") == (
+            hits + 2
+        )
+        assert sample("cache_requests_total", tier="test_tier", result="miss") == (
+            misses + 1
+        )
+        assert (
+            sample("api_calls_total", client="test_client", outcome="success")
+            == calls + 1
+        )
+        assert sample("api_rate_limit_waits_total", client="test_client") == waits + 1
+        assert sample(
+            "api_rate_limit_wait_seconds_total", client="test_client"
+        ) == pytest.approx(waited + 1.5)
+
+    def test_helpers_do_not_raise(self, monkeypatch):
+        """記録に失敗しても例外を送出しない"""
+
+        class BrokenMetric:
+            def labels(self, **labels):
+                raise ValueError("broken")
+
+        monkeypatch.setattr(metrics, "PIPELINE_STAGE_SECONDS", BrokenMetric())
+        monkeypatch.setattr(metrics, "CACHE_REQUESTS", BrokenMetric())
+
+        observe_stage("test_stage", 0.1)
+        record_cache_lookup("test_tier", True)
+
+    def test_observe_query_labels_by_repository_class(self):
+        """observe_query は呼び出し元のクラス名・メソッド名で時間とエラーを記録する"""
+
+        class TestMetricsRepository:
+            @observe_query
+            async def find_rows(self, fail=False):
+                if fail:
+                    raise RuntimeError("query failed")
+                return [1, 2, 3]
+
+        labels = {"repository": "TestMetricsRepository", "method": "find_rows"}
+        count = sample("db_query_duration_seconds_count", **labels)
+        errors = sample("db_query_errors_total", **labels)
+        repository = TestMetricsRepository()
+
+        assert asyncio.run(repository.find_rows()) == [1, 2, 3]
+        with pytest.raises(RuntimeError):
+            asyncio.run(repository.find_rows(fail=True))
+
+        assert sample("db_query_duration_seconds_count", **labels) == count + 2
+        assert sample("db_query_errors_total", **labels) == errors + 1
+
+    def test_render_latest_exposes_registry(self):
+        """render_latest は REGISTRY の内容をテキスト形式で返す"""
+        record_api_call("test_render", "error", 0.5)
+
+        content, content_type = render_latest()
+        text = content.decode()
+
+        assert content_type.startswith("text/plain")
+        assert "# TYPE exchange_analytics_api_calls_total counter" in text
+        assert (
+            'exchange_analytics_api_calls_total{client="test_render",outcome="error"}'
+            in text
+        )
+        assert "process_" in text
+
+
+@pytest.fixture(scope="module")
+def client():
+    """認証ミドルウェアを含む API アプリケーションのテストクライアント"""
+    pytest.importorskip("fastapi")
+    pytest.importorskip("httpx")
+    pytest.importorskip("dependency_injector")
+    from fastapi.testclient import TestClient
+
+    from src.presentation.api.app import create_app
+
+    return TestClient(create_app())
+
+
+class TestMetricsEndpoint:
+    """FastAPI の /metrics"""
+
+    def test_metrics_served_without_auth(self, client):
+        """認証なしで Prometheus テキスト形式のメトリクスを返す"""
+        observe_stage("test_endpoint", 0.1)
+
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert "version=0.0.4" in response.headers["content-type"]
+        assert (
+            "exchange_analytics_pipeline_stage_duration_seconds_count"
+            '{stage="test_endpoint"}' in response.text
+        )
+
+    def test_protected_endpoint_still_requires_auth(self, client):
+        """/metrics 以外の API は引き続き認証が必要"""
+        assert client.get("/api/v1/rates/latest").status_code == 401
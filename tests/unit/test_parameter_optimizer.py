@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+ParameterOptimizer の単体テスト
+
+責任:
+- 探索戦略の抽象基底クラス
+- 逐次実行でイベントループを塞がないこと・早期終了
+- 並列実行と逐次実行の結果の一致
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from src.domain.services.optimization.backtest_kernel import BacktestArrays
+from src.domain.services.optimization.parameter_optimizer import (
+    GridSearch,
+    ParameterOptimizer,
+    SearchStrategy,
+    SuccessiveHalvingSearch,
+)
+
+PARAM_RANGES = {
+    "rsi_oversold": [20, 30],
+    "rsi_overbought": [70, 80],
+    "volume_multiplier": [1.0],
+    "risk_reward_ratio": [1.5, 2.0, 3.0],
+    "max_position_size": [0.1],
+}
+
+
+@pytest.fixture(scope="module")
+def arrays():
+    """テスト用の過去データ"""
+    rng = np.random.default_rng(0)
+    n = 2000
+    close = 150 + np.cumsum(rng.normal(0, 0.2, n))
+    sma = np.convolve(close, np.ones(20) / 20, "same")
+    rsi = np.clip(50 + rng.normal(0, 15, n), 1, 99)
+    start = datetime(2024, 1, 1)
+    return BacktestArrays.from_records(
+        [
+            {
+                "timestamp": start + timedelta(hours=i),
+                "close": float(close[i]),
+                "RSI": float(rsi[i]),
+                "SMA_20": float(sma[i]),
+                "MACD_histogram": float(rng.normal(0, 0.05)),
+                "volume": 100,
+            }
+            for i in range(n)
+        ]
+    )
+
+
+async def collect(optimizer, **kwargs):
+    """stream の結果をすべて取得"""
+    return [result async for result in optimizer.stream(PARAM_RANGES, **kwargs)]
+
+
+class TestSearchStrategy:
+    """探索戦略のテスト"""
+
+    def test_base_class_is_abstract(self):
+        """rounds を実装しない探索戦略はインスタンス化できない"""
+        with pytest.raises(TypeError):
+            SearchStrategy()
+
+        class Incomplete(SearchStrategy):
+            name = "incomplete"
+
+        with pytest.raises(TypeError):
+            Incomplete()
+
+
+class TestParameterOptimizer:
+    """ParameterOptimizer のテスト"""
+
+    def test_serial_stream_does_not_block_event_loop(self, arrays):
+        """逐次実行中も他のタスクが実行される"""
+        ticks = []
+
+        async def ticker():
+            while True:
+                ticks.append(1)
+                await asyncio.sleep(0)
+
+        async def run():
+            task = asyncio.create_task(ticker())
+            results = await collect(ParameterOptimizer(arrays, max_workers=1))
+            task.cancel()
+            return results
+
+        results = asyncio.run(run())
+
+        assert len(results) == 12
+        assert len(ticks) >= len(results)
+
+    def test_serial_early_stopping_skips_remaining_trials(self, arrays):
+        """早期終了後は残りのパラメータセットを評価しない"""
+        optimizer = ParameterOptimizer(arrays, max_workers=1)
+
+        results = asyncio.run(collect(optimizer, early_stopping_rounds=2))
+
+        assert optimizer.stopped_early
+        assert len(results) < 12
+
+    def test_parallel_matches_serial(self, arrays):
+        """プロセスプールでの評価結果は逐次実行と一致"""
+
+        def by_params(results):
+            return {tuple(sorted(r["params"].items())): r for r in results}
+
+        serial = asyncio.run(collect(ParameterOptimizer(arrays, max_workers=1)))
+        parallel = asyncio.run(
+            collect(ParameterOptimizer(arrays, max_workers=2, chunk_size=3))
+        )
+
+        assert by_params(serial) == by_params(parallel)
+
+    def test_successive_halving_ends_with_full_budget(self, arrays):
+        """逐次半減探索の最終ラウンドは全データで評価"""
+        optimizer = ParameterOptimizer(arrays, max_workers=1)
+
+        results = asyncio.run(
+            collect(optimizer, strategy=SuccessiveHalvingSearch(eta=3))
+        )
+
+        assert results[0]["budget"] < 1.0
+        assert results[-1]["budget"] == 1.0
+        assert sum(r["budget"] == 1.0 for r in results) < 12
+
+    def test_optimize_returns_best_result(self, arrays):
+        """optimize は全データでの最良のシャープレシオを返す"""
+        optimizer = ParameterOptimizer(arrays, max_workers=1)
+
+        result = asyncio.run(optimizer.optimize(PARAM_RANGES, GridSearch()))
+        serial = asyncio.run(collect(ParameterOptimizer(arrays, max_workers=1)))
+
+        assert result["best_sharpe_ratio"] == max(r["sharpe_ratio"] for r in serial)
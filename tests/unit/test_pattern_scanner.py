@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+PatternScanner・PatternUtils.detect_divergence_series の単体テスト
+
+責任:
+- 1バーずつ detect() を再実行した結果とスキャン結果の一致
+- 上位足は確定済みのバーのみを参照すること（先読みしない）
+- ダイバージェンス判定が最新バーで発火すること（中心化ウィンドウの廃止）
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.infrastructure.analysis.pattern_scanner import (
+    MIN_HISTORY,
+    TIMEFRAME_DURATIONS,
+    TIMEFRAMES,
+    PatternScanner,
+)
+from src.utils.pattern_utils import PatternUtils
+
+M5 = TIMEFRAME_DURATIONS["M5"]
+
+
+def make_m5(n=30 * 288, seed=7):
+    """上昇トレンドに周期変動とノイズを重ねた M5 データ（固定シード）"""
+    rng = np.random.default_rng(seed)
+    t = np.arange(n)
+    close = 150 + 0.0004 * t + 0.6 * np.sin(t / 400) + np.cumsum(rng.normal(0, 0.06, n))
+    open_ = np.r_[close[0], close[:-1]]
+    high = np.maximum(open_, close) + np.abs(rng.normal(0, 0.03, n))
+    low = np.minimum(open_, close) - np.abs(rng.normal(0, 0.03, n))
+    index = pd.date_range("2026-01-05", periods=n, freq="5min")
+    return pd.DataFrame(
+        {"Open": open_, "High": high, "Low": low, "Close": close}, index=index
+    )
+
+
+# ----------------------------------------------------------------------
+# 検出器の detect() と同じ、最新バーのみを見る判定
+# ----------------------------------------------------------------------
+
+
+def near_upper_band(df):
+    upper = df["bb_upper"].iloc[-1]
+    return abs(df["Close"].iloc[-1] - upper) <= upper * 0.05
+
+
+def rising_last3(values):
+    return len(values) >= 3 and values.iloc[-1] > values.iloc[-2] > values.iloc[-3]
+
+
+def trend_reversal_m5(df):
+    if not df["rsi"].iloc[-1] > 65 or len(df) < 3:
+        return False
+    for _, row in df.tail(3).iterrows():
+        upper_shadow = row["High"] - max(row["Open"], row["Close"])
+        lower_shadow = min(row["Open"], row["Close"]) - row["Low"]
+        if upper_shadow > 0.05 or lower_shadow > 0.05:
+            return True
+    return False
+
+
+def rsi_battle_h1(df):
+    if len(df) < 10 or not 40 <= df["rsi"].iloc[-1] <= 60:
+        return False
+    prices = df["Close"].iloc[-3:].tolist()
+    changes = [
+        abs(prices[i] - prices[i - 1]) / prices[i - 1]
+        for i in range(1, len(prices))
+        if prices[i - 1] > 0
+    ]
+    return bool(changes) and sum(changes) / len(changes) >= 0.001
+
+
+def rsi_battle_m5(df):
+    values = df["rsi"].iloc[-5:].tolist()
+    if len(values) < 5 or not all(40 <= rsi <= 60 for rsi in values):
+        return False
+    return any(rsi < 50 for rsi in values[:3]) and any(rsi > 50 for rsi in values[-3:])
+
+
+REFERENCE_DETECTORS = {
+    # パターン1: トレンド転換
+    1: {
+        "D1": lambda df: df["rsi"].iloc[-1] > 65,
+        "H4": lambda df: df["rsi"].iloc[-1] > 65 and near_upper_band(df),
+        "H1": lambda df: df["rsi"].iloc[-1] > 65 and near_upper_band(df),
+        "M5": trend_reversal_m5,
+    },
+    # パターン4: ブレイクアウト
+    4: {
+        "D1": lambda df: 45 <= df["rsi"].iloc[-1] <= 75 and rising_last3(df["macd"]),
+        "H4": near_upper_band,
+        "H1": near_upper_band,
+        "M5": lambda df: len(df) >= 5 and rising_last3(df["Close"]),
+    },
+    # パターン5: RSI50ライン攻防
+    5: {
+        "D1": lambda df: (
+            40 <= df["rsi"].iloc[-1] <= 60
+            and abs(df["macd"].iloc[-1]) <= 0.2
+            and abs(df["macd_signal"].iloc[-1]) <= 0.2
+        ),
+        "H4": lambda df: (
+            40 <= df["rsi"].iloc[-1] <= 60
+            and abs(df["Close"].iloc[-1] - df["bb_middle"].iloc[-1])
+            / df["bb_middle"].iloc[-1]
+            <= 0.005
+        ),
+        "H1": rsi_battle_h1,
+        "M5": rsi_battle_m5,
+    },
+}
+
+# データ妥当性チェック（20本以上）を行うパターン
+VALIDATED_PATTERNS = {1, 4}
+
+
+def replay_detect(prepared, pattern_number, timestamp):
+    """M5 の timestamp 時点で参照できるデータだけを使って detect() を再現"""
+    conditions = {}
+    for timeframe in TIMEFRAMES:
+        df = prepared[timeframe]
+        available = df.index + TIMEFRAME_DURATIONS[timeframe] - M5
+        visible = df.iloc[: available.searchsorted(timestamp, side="right")]
+        if visible.empty:
+            conditions[timeframe] = False
+            continue
+        met = bool(REFERENCE_DETECTORS[pattern_number][timeframe](visible))
+        if pattern_number in VALIDATED_PATTERNS:
+            met = met and len(visible) >= MIN_HISTORY
+        conditions[timeframe] = met
+    return conditions
+
+
+def replay_positions(result, stride=17):
+    """再実行するバー（シグナル・条件の切り替わり前後と一定間隔のバー）"""
+    matrix = result.conditions.to_numpy()
+    changed = np.flatnonzero((matrix[1:] != matrix[:-1]).any(axis=1)) + 1
+    positions = np.concatenate(
+        [
+            np.flatnonzero(result.signal),
+            changed,
+            changed - 1,
+            np.arange(0, len(matrix), stride),
+        ]
+    )
+    return np.unique(positions)
+
+
+@pytest.fixture(scope="module")
+def m5():
+    """固定データ"""
+    return make_m5()
+
+
+@pytest.fixture(scope="module")
+def scanner():
+    return PatternScanner()
+
+
+@pytest.fixture(scope="module")
+def prepared(scanner, m5):
+    """指標列付きの時間軸別データ"""
+    return scanner.prepare({"M5": m5})
+
+
+@pytest.fixture(scope="module")
+def results(scanner, m5):
+    """全パターンのスキャン結果"""
+    return scanner.scan({"M5": m5})
+
+
+class TestScanMatchesReplay:
+    """1バーずつの detect() 再実行との一致"""
+
+    @pytest.mark.parametrize("pattern_number", sorted(REFERENCE_DETECTORS))
+    def test_conditions_and_signals_match(self, prepared, results, m5, pattern_number):
+        """時間軸別の条件・シグナル・信頼度が一致する"""
+        result = results[pattern_number]
+
+        for position in replay_positions(result):
+            timestamp = m5.index[position]
+            expected = replay_detect(prepared, pattern_number, timestamp)
+            actual = result.conditions.iloc[position].to_dict()
+            assert actual == expected, timestamp
+            assert result.signal[position] == all(expected.values()), timestamp
+            assert result.confidence[
+                position
+            ] == PatternUtils.get_pattern_confidence_score(expected)
+
+    def test_fixture_exercises_signals(self, results):
+        """固定データでシグナルと条件の成立・不成立が両方現れる"""
+        assert results[4].signal.sum() > 100
+        assert results[5].signal.any()
+        for pattern_number in REFERENCE_DETECTORS:
+            conditions = results[pattern_number].conditions
+            assert conditions.any().all() and not conditions.all().any()
+
+    def test_scan_frame_columns(self, scanner, m5, results):
+        """scan_frame は scan の結果を列にまとめる"""
+        frame = scanner.scan_frame({"M5": m5}, patterns=[4, 5])
+
+        assert list(frame.columns) == [
+            "pattern_4",
+            "pattern_4_confidence",
+            "pattern_5",
+            "pattern_5_confidence",
+        ]
+        np.testing.assert_array_equal(frame["pattern_4"], results[4].signal)
+        np.testing.assert_array_equal(
+            frame["pattern_5_confidence"], results[5].confidence
+        )
+
+
+class TestHigherTimeframeAlignment:
+    """上位足の参照タイミング"""
+
+    def test_h1_bar_visible_from_last_m5_bar(self, scanner, m5):
+        """H1 10:00 のバーは M5 10:55 から参照される"""
+        index = m5.index[:36]
+        h1_index = pd.date_range(index[0], periods=3, freq="h")
+        h1 = pd.DataFrame(index=h1_index)
+        values = np.array([True, False, True])
+
+        aligned = scanner._align(values, h1, "H1", index)
+
+        expected = np.zeros(len(index), dtype=bool)
+        expected[11:23] = True
+        expected[35:] = True
+        np.testing.assert_array_equal(aligned, expected)
+
+    def test_future_bars_do_not_change_past_results(self, scanner, m5):
+        """後続のバーを追加しても過去のバーの結果は変わらない"""
+        cutoff = 20 * 288 + 37
+        partial = scanner.scan({"M5": m5.iloc[:cutoff]})
+        full = scanner.scan({"M5": m5})
+
+        for pattern_number, result in partial.items():
+            np.testing.assert_array_equal(
+                result.signal, full[pattern_number].signal[:cutoff]
+            )
+            pd.testing.assert_frame_equal(
+                result.conditions, full[pattern_number].conditions.iloc[:cutoff]
+            )
+
+    def test_base_timeframe_required(self, scanner, m5):
+        """基準時間軸のデータが無い場合はエラー"""
+        with pytest.raises(ValueError):
+            scanner.scan({"H1": m5})
+
+
+class TestDivergence:
+    """ダイバージェンス判定"""
+
+    @staticmethod
+    def bearish_case():
+        """価格は高値更新、RSIは前回高値未達"""
+        prices = pd.Series(np.linspace(150.0, 151.3, 14))
+        rsi = pd.Series([55.0] * 14)
+        rsi.iloc[5] = 70.0
+        rsi.iloc[9:] = 60.0
+        return prices, rsi
+
+    def test_latest_bearish_divergence_fires(self):
+        """最新バーのベアリッシュダイバージェンスを検出する"""
+        prices, rsi = self.bearish_case()
+
+        assert PatternUtils.detect_divergence(prices, rsi) == {
+            "bullish": False,
+            "bearish": True,
+        }
+
+    def test_latest_bullish_divergence_fires(self):
+        """最新バーのブルリッシュダイバージェンスを検出する"""
+        prices, rsi = self.bearish_case()
+
+        assert PatternUtils.detect_divergence(-prices, 100 - rsi) == {
+            "bullish": True,
+            "bearish": False,
+        }
+
+    def test_short_series_returns_false(self):
+        """lookback 未満のデータでは検出しない"""
+        prices, rsi = self.bearish_case()
+
+        assert PatternUtils.detect_divergence(prices[-9:], rsi[-9:]) == {
+            "bullish": False,
+            "bearish": False,
+        }
+
+    def test_series_matches_latest_bar_replay(self, m5):
+        """全バー判定は各バーまでのデータで detect_divergence した結果と一致する"""
+        close = m5["Close"].iloc[:600]
+        rsi = PatternUtils.calculate_rsi(close)
+
+        series = PatternUtils.detect_divergence_series(close, rsi)
+
+        assert series.index.equals(close.index)
+        assert series["bullish"].any() and series["bearish"].any()
+        for end in range(10, len(close) + 1):
+            latest = PatternUtils.detect_divergence(close.iloc[:end], rsi.iloc[:end])
+            assert latest == {
+                "bullish": bool(series["bullish"].iloc[end - 1]),
+                "bearish": bool(series["bearish"].iloc[end - 1]),
+            }
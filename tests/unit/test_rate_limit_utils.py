@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+レート制限ユーティリティの単体テスト
+
+責任:
+- SlidingWindowCounter のバケットの繰り越しとウィンドウ外の破棄
+- 制限を超えない側に丸めた待機時間
+- SlidingWindowRateLimiter.acquire が次の枠まで待機すること
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.utils import rate_limit_utils
+from src.utils.rate_limit_utils import (
+    SlidingWindowCounter,
+    SlidingWindowRateLimiter,
+    get_shared_rate_limiter,
+)
+
+
+class FakeClock:
+    """asyncio.sleep で進む時刻"""
+
+    def __init__(self, now=0.0):
+        self.now = now
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestSlidingWindowCounter:
+    """リングカウンター（ウィンドウ10秒・バケット1秒）"""
+
+    def test_counts_roll_over_bucket_by_bucket(self):
+        """古いバケットはウィンドウ＋1バケット経過した時点で抜ける"""
+        counter = SlidingWindowCounter(10, bucket_seconds=1)
+        counter.record(0.5, 3)
+        counter.record(5.2, 2)
+
+        assert counter.count(9.9) == 5
+        # バケット0は t=11 まで保持する（実際のウィンドウより短く数えない）
+        assert counter.count(10.5) == 5
+        assert counter.count(11.0) == 2
+        assert counter.count(15.9) == 2
+        assert counter.count(16.0) == 0
+
+    def test_gap_longer_than_window_resets(self):
+        """ウィンドウより長い間隔が空くと全バケットを破棄する"""
+        counter = SlidingWindowCounter(10, bucket_seconds=1)
+        for now in range(10):
+            counter.record(now + 0.1)
+
+        assert counter.count(9.5) == 10
+        assert counter.count(100.0) == 0
+        counter.record(100.5, 4)
+        assert counter.count(101.0) == 4
+
+    def test_ring_slots_are_reused_after_wrap(self):
+        """一周したスロットに前回の呼び出し数が残らない"""
+        counter = SlidingWindowCounter(10, bucket_seconds=1)
+        for now in range(30):
+            counter.record(now + 0.5)
+
+        assert counter.count(29.9) == 11
+        assert counter.count(35.0) == 5
+
+    def test_wait_time_until_oldest_bucket_leaves(self):
+        """超過分を含むバケットがウィンドウから抜けるまで待つ"""
+        counter = SlidingWindowCounter(10, bucket_seconds=1)
+        counter.record(0.5, 3)
+        counter.record(5.2, 2)
+
+        assert counter.wait_time(6.0, limit=6) == 0.0
+        assert counter.wait_time(6.0, limit=5) == pytest.approx(5.0)
+        # 4件分の空きには t=5 のバケットも抜ける必要がある
+        assert counter.wait_time(6.0, limit=5, cost=4) == pytest.approx(10.0)
+        assert counter.wait_time(11.0, limit=5) == 0.0
+
+    def test_default_bucket_width(self):
+        """バケット幅の既定値はウィンドウの1/60"""
+        counter = SlidingWindowCounter(60)
+
+        assert counter.bucket_seconds == pytest.approx(1.0)
+        assert len(counter._counts) == 61
+
+
+class TestSlidingWindowRateLimiter:
+    """複数ウィンドウのレート制限"""
+
+    def test_try_acquire_checks_every_window(self):
+        """最も長く待つ必要のあるウィンドウの待機時間を返す"""
+        clock = FakeClock()
+        limiter = SlidingWindowRateLimiter([(2, 1.0), (3, 60.0)], clock=clock)
+
+        assert limiter.try_acquire() == 0.0
+        assert limiter.try_acquire() == 0.0
+        assert 0 < limiter.try_acquire() <= 1.1
+
+        clock.now = 1.5
+        assert limiter.try_acquire() == 0.0
+        clock.now = 3.0
+        assert limiter.try_acquire() == pytest.approx(58.0)
+        assert limiter.count(60) == 3
+
+    def test_acquire_blocks_until_next_slot(self, monkeypatch):
+        """制限に達した呼び出しは次の枠まで待機してから記録する"""
+        clock = FakeClock()
+        monkeypatch.setattr(rate_limit_utils.asyncio, "sleep", clock.sleep)
+        limiter = SlidingWindowRateLimiter([(2, 10.0)], name="test", clock=clock)
+
+        async def run():
+            return [await limiter.acquire() for _ in range(3)]
+
+        waits = asyncio.run(run())
+
+        assert waits[:2] == [0.0, 0.0]
+        assert waits[2] == pytest.approx(10 + 10 / 60)
+        assert clock.sleeps == [waits[2]]
+        assert clock.now == pytest.approx(waits[2])
+        assert limiter.count(10) == 1
+        stats = limiter.get_statistics()
+        assert stats["acquired"] == 3
+        assert stats["throttled"] == 1
+        assert stats["total_wait_seconds"] == pytest.approx(waits[2])
+
+    def test_concurrent_acquires_are_spaced_by_window(self):
+        """同時に枠を確保した呼び出しは制限数ごとにウィンドウ分ずつ待たされる"""
+        limiter = SlidingWindowRateLimiter([(2, 0.2)])
+
+        async def run():
+            start = time.monotonic()
+
+            async def call():
+                await limiter.acquire()
+                return time.monotonic() - start
+
+            return sorted(await asyncio.gather(*[call() for _ in range(4)]))
+
+        elapsed = asyncio.run(run())
+
+        assert elapsed[1] < 0.1
+        assert elapsed[2] >= 0.2
+        assert limiter.get_statistics()["throttled"] == 2
+
+    def test_shared_limiter_per_name_and_limits(self):
+        """同じ名前・制限では同じ制限状態を共有する"""
+        first = get_shared_rate_limiter("test_shared", [(5, 1)])
+
+        assert get_shared_rate_limiter("test_shared", [(5, 1.0)]) is first
+        assert get_shared_rate_limiter("test_shared", [(6, 1)]) is not first
+        assert get_shared_rate_limiter("test_other", [(5, 1)]) is not first
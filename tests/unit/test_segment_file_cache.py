@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+SegmentFileCache の単体テスト
+
+責任:
+- DataFrame・ndarray・JSON 互換データの保存と復元
+- 再起動後のインデックス再構築
+- ディレクトリの排他ロック
+- pickle を使わないレコード形式
+"""
+
+from datetime import date, datetime
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.infrastructure.cache.segment_file_cache import (
+    SegmentCacheLockedError,
+    SegmentFileCache,
+)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """SegmentFileCache インスタンス"""
+    cache = SegmentFileCache(cache_dir=str(tmp_path), max_size_mb=10)
+    yield cache
+    cache.close()
+
+
+def ohlcv_frame(tz=None):
+    """テスト用 OHLCV DataFrame"""
+    index = pd.date_range(
+        "2026-01-05", periods=50, freq="5min", tz=tz, name="timestamp"
+    )
+    rng = np.random.default_rng(0)
+    close = 150 + rng.standard_normal(50).cumsum()
+    return pd.DataFrame(
+        {
+            "open": close + 0.01,
+            "high": close + 0.05,
+            "low": close - 0.05,
+            "close": close,
+            "volume": np.arange(50, dtype=np.int64),
+            "source": ["yahoo"] * 50,
+        },
+        index=index,
+    )
+
+
+class TestSegmentFileCache:
+    """SegmentFileCache のテスト"""
+
+    @pytest.mark.parametrize("tz", [None, "Asia/Tokyo"])
+    def test_dataframe_round_trip(self, cache, tz):
+        """DataFrame は DatetimeIndex・列の型を保って復元される"""
+        frame = ohlcv_frame(tz)
+        assert cache.set("frame", frame)
+
+        restored = cache.get("frame")
+
+        pd.testing.assert_frame_equal(restored, frame, check_freq=False)
+
+    def test_json_compatible_values_round_trip(self, cache):
+        """JSON 互換データと日時・Decimal は同じ値で復元される"""
+        value = {
+            "pair": "USD/JPY",
+            "count": 3,
+            "ratio": 0.5,
+            "flags": [True, False, None],
+            "window": (1, 2),
+            "at": datetime(2026, 1, 5, 9, 30),
+            "day": date(2026, 1, 5),
+            "price": Decimal("150.123"),
+            5: "non-string key",
+        }
+        assert cache.set("value", value)
+
+        assert cache.get("value") == value
+
+    def test_ndarray_and_series_round_trip(self, cache):
+        """ndarray・Series はコピーせずに mmap から復元される"""
+        array = np.arange(12, dtype=np.float64).reshape(3, 4)
+        series = pd.Series([1.5, 2.5], index=["a", "b"], name="rsi")
+        cache.set("array", array)
+        cache.set("series", series)
+
+        np.testing.assert_array_equal(cache.get("array"), array)
+        pd.testing.assert_series_equal(cache.get("series"), series)
+
+    def test_unsupported_type_is_not_cached(self, cache):
+        """保存できない型は保存に失敗し、取得結果は None"""
+        assert cache.set("object", object()) is False
+        assert cache.get("object") is None
+
+    def test_entries_survive_reopen(self, tmp_path):
+        """再起動後もセグメントからエントリが復元される"""
+        first = SegmentFileCache(cache_dir=str(tmp_path))
+        first.set("a", {"v": 1})
+        first.set("b", {"v": 2})
+        first.delete("a")
+        first.close()
+
+        second = SegmentFileCache(cache_dir=str(tmp_path))
+        try:
+            assert second.get("a") is None
+            assert second.get("b") == {"v": 2}
+        finally:
+            second.close()
+
+    def test_directory_lock_rejects_second_instance(self, cache, tmp_path):
+        """同じディレクトリを2つ目のインスタンスが使うことはできない"""
+        cache.set("x3", {"v": 1})
+
+        with pytest.raises(SegmentCacheLockedError):
+            SegmentFileCache(cache_dir=str(tmp_path))
+
+        assert cache.get("x3") == {"v": 1}
+
+    def test_records_do_not_contain_pickle(self, cache, tmp_path):
+        """レコードの値は pickle ではなく JSON で保存される"""
+        cache.set("frame", ohlcv_frame())
+
+        segment = next(tmp_path.glob("*.seg")).read_bytes()
+        assert b'"t": "frame"' in segment
+        assert b"\x80\x05" not in segment[:256]
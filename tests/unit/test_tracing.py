@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+トレース（tracing）の単体テスト
+
+責任:
+- SQLフィンガープリントの正規化
+- contextvars によるスパンの親子関係の伝播とルートスパンでのサンプリング
+- save_trace → load_trace_file の往復
+- 並行実行された子スパンを含む自己時間の計算
+"""
+
+import asyncio
+
+import pytest
+
+from src.infrastructure.monitoring.tracing import (
+    Tracer,
+    compute_self_times,
+    fingerprint_sql,
+    load_trace_file,
+)
+
+
+class TestFingerprintSql:
+    """SQLフィンガープリント"""
+
+    @pytest.mark.parametrize(
+        "statement, expected",
+        [
+            (
+                "SELECT *  FROM t1\n WHERE a = 'x''y' AND b IN (1, 2, 3) AND c = :c",
+                "SELECT * FROM t1 WHERE a = ? AND b IN (?+) AND c = ?",
+            ),
+            (
+                "INSERT INTO t (a, b) VALUES ($1, $2), ($3, $4), ($5, $6)",
+                "INSERT INTO t (a, b) VALUES (?+), ...",
+            ),
+            (
+                "SELECT x::text FROM t WHERE id = %(id)s AND v > 1.5 LIMIT ?",
+                "SELECT x::text FROM t WHERE id = ? AND v > ? LIMIT ?",
+            ),
+            ("SELECT a FROM t WHERE b IN (%s)", "SELECT a FROM t WHERE b IN (?)"),
+        ],
+    )
+    def test_values_are_normalized(self, statement, expected):
+        """リテラル・パラメータ・IN/VALUES の繰り返しを ? にまとめる"""
+        assert fingerprint_sql(statement) == expected
+
+    def test_same_query_with_other_values_shares_fingerprint(self):
+        """値や件数だけが異なるクエリは同じフィンガープリントになる"""
+        first = fingerprint_sql("SELECT a FROM t WHERE id IN (1, 2) AND p = 'USD/JPY'")
+        second = fingerprint_sql(
+            "SELECT a FROM t WHERE id IN (5, 6, 7, 8) AND p = 'EUR/JPY'"
+        )
+
+        assert first == second
+
+    def test_truncated_to_max_length(self):
+        """最大文字数で切り詰める"""
+        assert len(fingerprint_sql("SELECT " + "a, " * 400, max_length=50)) == 50
+
+
+class TestSpanPropagation:
+    """スパンの親子関係とサンプリング"""
+
+    def test_nested_spans_share_trace_and_link_parent(self):
+        """ネストしたスパンは同じトレースで親のスパンIDを持つ"""
+        tracer = Tracer(enabled=True)
+
+        with tracer.span("cycle", kind="cycle") as root:
+            with tracer.span("stage", kind="stage") as stage:
+                with tracer.span("query", kind="repository") as query:
+                    assert Tracer.current_span() is query
+                assert Tracer.current_span() is stage
+        assert Tracer.current_span() is None
+
+        assert root.parent_id is None
+        assert stage.parent_id == root.span_id
+        assert query.parent_id == stage.span_id
+        assert {root.trace_id, stage.trace_id, query.trace_id} == {root.trace_id}
+        assert tracer.last_trace_id == root.trace_id
+        assert [span.name for span in tracer.get_trace(root.trace_id)] == [
+            "cycle",
+            "stage",
+            "query",
+        ]
+
+    def test_concurrent_tasks_inherit_parent(self):
+        """並行タスクのスパンはそれぞれ作成時のスパンを親とする"""
+        tracer = Tracer(enabled=True)
+
+        async def child(name):
+            with tracer.span(name) as span:
+                await asyncio.sleep(0)
+                with tracer.span(f"{name}.inner") as inner:
+                    await asyncio.sleep(0)
+                return span, inner
+
+        async def run():
+            with tracer.span("cycle", kind="cycle") as root:
+                results = await asyncio.gather(child("a"), child("b"))
+            return root, results
+
+        root, results = asyncio.run(run())
+
+        for span, inner in results:
+            assert span.parent_id == root.span_id
+            assert inner.parent_id == span.span_id
+            assert span.trace_id == inner.trace_id == root.trace_id
+        assert len(tracer.get_trace(root.trace_id)) == 5
+
+    def test_separate_roots_start_new_traces(self):
+        """親スパンのない呼び出しはそれぞれ新しいトレースを開始する"""
+        tracer = Tracer(enabled=True)
+
+        with tracer.span("first") as first:
+            pass
+        with tracer.span("second") as second:
+            pass
+
+        assert first.trace_id != second.trace_id
+        assert second.parent_id is None
+
+    def test_unsampled_root_disables_children(self, monkeypatch):
+        """サンプリング対象外のルートの子スパンは記録しない"""
+        tracer = Tracer(enabled=True, sample_rate=0.5)
+        monkeypatch.setattr("random.random", lambda: 0.9)
+
+        with tracer.span("cycle") as root:
+            with tracer.span("stage") as stage:
+                assert Tracer.current_span() is None
+                tracer.record_sql("SELECT 1", 0.0, 1.0, 1, False)
+
+        assert root is None and stage is None
+        assert len(tracer.spans) == 0
+
+        monkeypatch.setattr("random.random", lambda: 0.1)
+        with tracer.span("cycle") as sampled:
+            with tracer.span("stage") as stage:
+                pass
+
+        assert sampled is not None
+        assert stage.parent_id == sampled.span_id
+
+    def test_disabled_tracer_records_nothing(self):
+        """無効なトレーサーはスパンを作成しない"""
+        tracer = Tracer(enabled=False)
+
+        with tracer.span("cycle") as span:
+            assert Tracer.current_span() is None
+
+        assert span is None
+        assert len(tracer.spans) == 0
+
+    def test_error_and_sql_recorded_on_current_span(self):
+        """例外はスパンに記録して再送出し、SQL は現在のスパンの子として記録する"""
+        tracer = Tracer(enabled=True)
+
+        with pytest.raises(ValueError):
+            with tracer.span("cycle") as root:
+                tracer.record_sql("SELECT a FROM t WHERE id = 3", 0.0, 2.5, 1, False)
+                tracer.record_sql("SELECT a FROM t WHERE id = 4", 0.0, 1.5, 1, False)
+                raise ValueError("boom")
+
+        sql_spans = [span for span in tracer.spans if span.kind == "sql"]
+        assert root.error == "ValueError: boom"
+        assert root.attributes["sql_count"] == 2
+        assert root.attributes["sql_ms"] == pytest.approx(4.0)
+        assert {span.parent_id for span in sql_spans} == {root.span_id}
+        assert {span.attributes["sql"] for span in sql_spans} == {
+            "SELECT a FROM t WHERE id = ?"
+        }
+
+
+class TestTraceFile:
+    """トレースファイルの保存と読み込み"""
+
+    def test_save_then_load_round_trip(self, tmp_path):
+        """保存したトレースを読み込むとスパンの内容が一致する"""
+        path = tmp_path / "traces" / "last_cycle.json"
+        tracer = Tracer(enabled=True, export_path=str(path))
+
+        with tracer.span("cycle", kind="cycle", pipeline="5m") as root:
+            with tracer.span("query", kind="repository") as query:
+                query.record_rows([1, 2, 3])
+                tracer.record_sql("SELECT 1", 0.0, 1.0, 3, False)
+
+        assert tracer.save_trace(root.trace_id)
+        trace = load_trace_file(str(path))
+
+        assert trace["trace_id"] == root.trace_id
+        assert trace["name"] == "cycle"
+        assert trace["duration_ms"] == pytest.approx(root.duration_ms, abs=1e-3)
+        assert trace["spans"] == [
+            span.to_dict() for span in tracer.get_trace(root.trace_id)
+        ]
+        by_name = {span["name"]: span for span in trace["spans"]}
+        assert by_name["cycle"]["attributes"] == {"pipeline": "5m"}
+        assert by_name["query"]["attributes"]["rows"] == 3
+        assert by_name["SQL SELECT"]["parent_id"] == query.span_id
+        assert not list(path.parent.glob("*.tmp"))
+
+    def test_save_without_path(self):
+        """出力先がない場合は保存しない"""
+        tracer = Tracer(enabled=True)
+
+        with tracer.span("cycle") as root:
+            pass
+
+        assert not tracer.save_trace(root.trace_id)
+
+
+def span_dict(span_id, parent_id, start_ms, duration_ms):
+    return {
+        "span_id": span_id,
+        "parent_id": parent_id,
+        "start_time": 1_700_000_000 + start_ms / 1000,
+        "duration_ms": duration_ms,
+    }
+
+
+class TestComputeSelfTimes:
+    """自己時間"""
+
+    def test_sequential_children(self):
+        """直列の子スパンは処理時間の合計を除く"""
+        spans = [
+            span_dict("root", None, 0, 100),
+            span_dict("a", "root", 10, 30),
+            span_dict("b", "root", 50, 20),
+        ]
+
+        self_times = compute_self_times(spans)
+
+        assert self_times["root"] == pytest.approx(50)
+        assert self_times["a"] == pytest.approx(30)
+        assert self_times["b"] == pytest.approx(20)
+
+    def test_overlapping_children_counted_once(self):
+        """並行実行された子スパンの重なりは1回だけ除く"""
+        spans = [
+            span_dict("root", None, 0, 100),
+            span_dict("a", "root", 10, 60),
+            span_dict("b", "root", 20, 60),
+            span_dict("c", "root", 30, 10),
+            span_dict("a1", "a", 10, 20),
+        ]
+
+        self_times = compute_self_times(spans)
+
+        # 子スパンは 10〜80ms を覆う（合計130msでも自己時間は0にならない）
+        assert self_times["root"] == pytest.approx(30)
+        assert self_times["a"] == pytest.approx(40)
+        assert self_times["a1"] == pytest.approx(20)
+
+    def test_child_outside_parent_is_clipped(self):
+        """親の区間外にはみ出した子スパンの部分は除かない"""
+        spans = [
+            span_dict("root", None, 0, 50),
+            span_dict("late", "root", 40, 30),
+        ]
+
+        assert compute_self_times(spans)["root"] == pytest.approx(40)